@@ -115,10 +115,10 @@ class PyPegSubscribe:
                             ns):
         subinst=pywbem.CIMInstance('CIM_IndicationSubscription')
         subinst['Filter']=indfilter
-        subinst['Handler']=indhandler
+        subinst['Handler']=handler
         cop = pywbem.CIMInstanceName('CIM_IndicationSubscription')
         cop.keybindings = { 'Filter':indfilter,
-                            'Handler':indhandler }
+                            'Handler':handler }
         cop.namespace=ns
         subinst.path = cop
         subcop = self._conn.CreateInstance(subinst)
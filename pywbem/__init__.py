@@ -48,6 +48,20 @@ The WBEM client library API consists of the following elements:
 * :ref:`WBEM operations` - Class :class:`WBEMConnection` is the main class of
   the WBEM client library and its methods issue WBEM operations to a WBEM
   server.
+* :ref:`Transports` - The interface of the transports that send the
+  requests of a :class:`WBEMConnection` to the WBEM server, and the default
+  HTTP transport.
+* :ref:`Recording and replaying requests` - Transports for
+  :class:`WBEMConnection` that record the requests and responses exchanged
+  with WBEM servers into a file, and replay them without a WBEM server.
+* :ref:`Response cache` - A cache for the responses of the read-only
+  operations of a :class:`WBEMConnection`.
+* :ref:`Association traversal` - Breadth-first walks of the associations of
+  CIM instances.
+* :ref:`Instance snapshots` - Snapshots of CIM instances, and the differences
+  between them.
+* :ref:`Instance tables` - Property values of CIM instances stored by column,
+  in typed arrays.
 * :ref:`CIM objects` - Python classes for representing CIM objects (instances,
   classes, properties, etc.) that are used by the WBEM operations as input or
   output.
@@ -87,6 +101,13 @@ from .cim_obj import *
 from .tupleparse import *
 from .cim_http import *
 from .exceptions import *
+from .indication_batcher import *
+from .subscription_manager import *
+from .request_recorder import *
+from .response_cache import *
+from .association_traversal import *
+from .instance_snapshot import *
+from .instance_table import *
 
 from ._version import __version__
 
@@ -0,0 +1,94 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Internal utility for running functions concurrently in a bounded number of
+threads.
+
+This module is used instead of `concurrent.futures`, which is not available
+in Python 2 without installing the `futures` backport.
+"""
+
+from __future__ import absolute_import
+
+import sys
+import threading
+
+from six.moves import queue
+
+__all__ = []
+
+
+def run_concurrently(func, args_list, max_workers):
+    """
+    Invoke a function for each item of a list of argument tuples, using at
+    most `max_workers` threads at the same time.
+
+    Parameters:
+
+      func (callable):
+        The function to invoke, as ``func(*args)``.
+
+      args_list (list of tuple):
+        The argument tuples, one for each invocation.
+
+      max_workers (:term:`integer`):
+        Maximum number of threads. If 1, or if there is only one invocation,
+        the invocations happen in the calling thread.
+
+    Returns:
+
+      List of tuples ``(result, exc_info)``, in the order of `args_list`. For
+      successful invocations, `result` is the return value of the function and
+      `exc_info` is `None`. For failed invocations, `result` is `None` and
+      `exc_info` is the ``sys.exc_info()`` tuple of the exception.
+    """
+
+    results = [None] * len(args_list)
+
+    def invoke(index):
+        """Invoke the function for one argument tuple."""
+        try:
+            results[index] = (func(*args_list[index]), None)
+        except Exception:  # pylint: disable=broad-except
+            results[index] = (None, sys.exc_info())
+
+    num_workers = min(max_workers, len(args_list))
+    if num_workers <= 1:
+        for index in range(len(args_list)):
+            invoke(index)
+        return results
+
+    work = queue.Queue()
+    for index in range(len(args_list)):
+        work.put(index)
+
+    def worker():
+        """Process argument tuples until there are none left."""
+        while True:
+            try:
+                index = work.get_nowait()
+            except queue.Empty:
+                return
+            invoke(index)
+
+    threads = [threading.Thread(target=worker) for _ in range(num_workers)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
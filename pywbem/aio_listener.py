@@ -0,0 +1,401 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.aio_listener.AsyncIndicationListener` class is an
+indication listener based on :mod:`asyncio`. It accepts CIM-XML export
+requests (see :term:`DSP0200`) via HTTP and HTTPS, parses them with the
+CIM-XML parser of pywbem, and passes the received indications to an
+``async def`` handler function, without any thread hops.
+
+This module requires Python 3.5 or higher, and is therefore not imported into
+the ``pywbem`` namespace. It needs to be imported explicitly::
+
+    import asyncio
+    from pywbem.aio_listener import AsyncIndicationListener
+
+    async def handler(indication, host):
+        print('%s: %s' % (host, indication['Description']))
+
+    listener = AsyncIndicationListener(handler, http_port=5988,
+                                       max_concurrency=20)
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(listener.start())
+    loop.run_forever()
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import ssl
+from xml.parsers.expat import ExpatError
+
+from . import cim_xml
+from .cim_constants import CIM_ERR_NOT_SUPPORTED, CIM_ERR_INVALID_PARAMETER
+from .exceptions import ParseError
+from .tupleparse import parse_cim
+from .tupletree import xml_to_tupletree
+
+__all__ = ['AsyncIndicationListener']
+
+# Maximum size of the HTTP request header lines and body we accept.
+_MAX_HEADER_LINES = 100
+_MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+class _RequestError(Exception):
+    """
+    Internal exception for rejecting an export request at the HTTP level.
+    The arguments are the HTTP status, the reason phrase and the value for the
+    CIMError header (or `None`).
+    """
+    pass
+
+
+def _parse_export_request(body):
+    """
+    Parse the body of a CIM-XML export request.
+
+    Returns a tuple (message_id, method_name, params), where params is a
+    dictionary of the export parameter values by parameter name.
+
+    Raises _RequestError if the body is not a well-formed simple export
+    request.
+    """
+
+    try:
+        tup_tree = parse_cim(xml_to_tupletree(body))
+    except (ExpatError, ParseError) as exc:
+        raise _RequestError(400, 'Bad Request', 'request-not-well-formed',
+                            str(exc))
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        # Not all invalid values are detected as ParseError by the parser,
+        # e.g. invalid integer values in a VALUE.ARRAY element.
+        raise _RequestError(400, 'Bad Request', 'request-not-valid',
+                            str(exc))
+
+    # tup_tree is: ('CIM', attrs, ('MESSAGE', attrs, [messages]))
+    message = tup_tree[2]
+    if message[0] != 'MESSAGE':
+        raise _RequestError(400, 'Bad Request', 'request-not-valid',
+                            'Expecting MESSAGE element, got %s' % message[0])
+    messages = message[2]
+    if len(messages) != 1 or messages[0][0] != 'SIMPLEEXPREQ':
+        raise _RequestError(400, 'Bad Request', 'multiple-requests-unsupported',
+                            'Expecting a single SIMPLEEXPREQ element')
+
+    # SIMPLEEXPREQ is: ('SIMPLEEXPREQ', attrs, ('EXPMETHODCALL', attrs, params))
+    methodcall = messages[0][2]
+    try:
+        params = dict(methodcall[2])
+        return message[1]['ID'], methodcall[1]['NAME'], params
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        raise _RequestError(400, 'Bad Request', 'request-not-valid',
+                            'Invalid EXPMETHODCALL element: %s' % exc)
+
+
+def _export_response(message_id, method_name, error=None):
+    """
+    Return the CIM-XML export response (as UTF-8 encoded bytes) for an export
+    method.
+
+    error is a tuple (status_code, description), or `None` for success.
+    """
+
+    data = None
+    if error is not None:
+        data = cim_xml.ERROR(str(error[0]), error[1])
+    resp_xml = cim_xml.CIM(
+        cim_xml.MESSAGE(
+            cim_xml.SIMPLEEXPRSP(
+                cim_xml.EXPMETHODRESPONSE(method_name, data)),
+            message_id, '1.0'),
+        '2.0', '2.0')
+    resp = '<?xml version="1.0" encoding="utf-8" ?>\n' + resp_xml.toxml()
+    return resp.encode('utf-8')
+
+
+class AsyncIndicationListener(object):
+    """
+    An indication listener that runs in an :mod:`asyncio` event loop.
+
+    For each indication that is received, the handler is invoked as
+    ``handler(indication, host)``, where `indication` is the indication as a
+    :class:`~pywbem.CIMInstance` object, and `host` is the IP address of the
+    WBEM server that sent it. The handler must return an awaitable, i.e. it is
+    typically defined with ``async def``.
+
+    At most `max_concurrency` handlers run at the same time. When that limit
+    is reached, the listener delays its responses to further export requests
+    until a handler completes, so that the WBEM servers are slowed down instead
+    of the pending indications piling up in memory.
+
+    Exceptions raised by the handler are passed to the exception handler of
+    the event loop; they do not affect the response to the WBEM server.
+    """
+
+    def __init__(self, handler, host=None, http_port=5988, https_port=None,
+                 certfile=None, keyfile=None, max_concurrency=10):
+        """
+        :Parameters:
+
+          handler (coroutine function):
+            The function that is invoked for each received indication.
+
+          host (:term:`string`):
+            The host name or IP address to listen on. `None` means all
+            interfaces.
+
+          http_port (:term:`integer`):
+            The port number for HTTP, or `None` for no HTTP. 0 selects a free
+            port (see :attr:`ports`).
+
+          https_port (:term:`integer`):
+            The port number for HTTPS, or `None` for no HTTPS. 0 selects a free
+            port (see :attr:`ports`).
+
+          certfile (:term:`string`):
+            Path name of the PEM file with the certificate of the listener.
+            Required for HTTPS.
+
+          keyfile (:term:`string`):
+            Path name of the PEM file with the private key of the listener.
+            `None` means that the private key is contained in `certfile`.
+
+          max_concurrency (:term:`integer`):
+            Maximum number of handler invocations that are active at the same
+            time.
+        """
+
+        if https_port is not None and certfile is None:
+            raise ValueError("certfile is required for HTTPS")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1, but is %r" %
+                             max_concurrency)
+
+        self.handler = handler
+        self.host = host
+        self.http_port = http_port
+        self.https_port = https_port
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.max_concurrency = max_concurrency
+
+        self._servers = []
+        self._semaphore = None
+        self._tasks = set()        # active handler tasks
+        self._connections = {}     # writer -> future done at connection end
+
+    def __repr__(self):
+        return '%s(handler=%r, host=%r, http_port=%r, https_port=%r, ' \
+               'certfile=%r, keyfile=%r, max_concurrency=%r)' % \
+               (self.__class__.__name__, self.handler, self.host,
+                self.http_port, self.https_port, self.certfile, self.keyfile,
+                self.max_concurrency)
+
+    @property
+    def ports(self):
+        """
+        List of the port numbers the listener is actually listening on,
+        in the order HTTP, HTTPS. Empty if the listener is not started.
+        """
+        return [server.sockets[0].getsockname()[1]
+                for server in self._servers]
+
+    async def start(self):
+        """
+        Start listening. Returns once the listening sockets are bound.
+        """
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if self.http_port is not None:
+            server = await asyncio.start_server(
+                self._handle_connection, self.host, self.http_port)
+            self._servers.append(server)
+
+        if self.https_port is not None:
+            ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            ssl_context.load_cert_chain(self.certfile, self.keyfile)
+            server = await asyncio.start_server(
+                self._handle_connection, self.host, self.https_port,
+                ssl=ssl_context)
+            self._servers.append(server)
+
+    async def stop(self):
+        """
+        Stop listening, and wait for the active handler invocations to
+        complete.
+        """
+
+        servers = self._servers
+        self._servers = []
+        for server in servers:
+            server.close()
+        for server in servers:
+            await server.wait_closed()
+
+        # Close the connections that are kept alive and are idle. Requests
+        # that are being processed complete before their connection closes.
+        for writer in list(self._connections):
+            writer.transport.close()
+        if self._connections:
+            await asyncio.wait(list(self._connections.values()))
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    async def _handle_connection(self, reader, writer):
+        """
+        Handle the HTTP requests on a client connection, until the client
+        closes it or requests it to be closed.
+        """
+
+        peer = writer.get_extra_info('peername')
+        host = peer[0] if peer else None
+        done = asyncio.Future()
+        self._connections[writer] = done
+        try:
+            keep_alive = True
+            while keep_alive:
+                keep_alive = await self._handle_request(reader, writer, host)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            del self._connections[writer]
+            done.set_result(None)
+
+    async def _handle_request(self, reader, writer, host):
+        """
+        Handle a single HTTP request. Returns whether the connection is to be
+        kept open.
+        """
+
+        request_line = await reader.readline()
+        if not request_line:
+            return False
+        try:
+            method, _, version = request_line.decode('iso-8859-1').split()
+        except ValueError:
+            self._write_response(writer, 400, 'Bad Request', close=True)
+            return False
+
+        headers = {}
+        for _ in range(_MAX_HEADER_LINES):
+            line = await reader.readline()
+            line = line.decode('iso-8859-1').strip()
+            if not line:
+                break
+            hname, _, hvalue = line.partition(':')
+            headers[hname.strip().lower()] = hvalue.strip()
+        else:
+            self._write_response(writer, 400, 'Bad Request', close=True)
+            return False
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = version == 'HTTP/1.1' and connection != 'close' or \
+            connection == 'keep-alive'
+
+        body = None
+        try:
+            if method != 'POST':
+                raise _RequestError(405, 'Method Not Allowed', None,
+                                    'Method %s is not supported' % method)
+            try:
+                length = int(headers['content-length'])
+            except (KeyError, ValueError):
+                raise _RequestError(411, 'Length Required', None,
+                                    'Content-Length header is required')
+            if length > _MAX_BODY_SIZE:
+                raise _RequestError(413, 'Request Entity Too Large', None,
+                                    'Request body exceeds %d bytes' %
+                                    _MAX_BODY_SIZE)
+            body = await reader.readexactly(length)
+            if headers.get('cimexport', '').lower() != 'methodrequest':
+                raise _RequestError(400, 'Bad Request', 'header-mismatch',
+                                    'CIMExport header must be MethodRequest')
+            message_id, method_name, params = _parse_export_request(body)
+        except _RequestError as exc:
+            status, reason, cimerror, _ = exc.args
+            if body is None:
+                # We did not consume the body, so we cannot continue reading
+                # requests from this connection.
+                keep_alive = False
+            self._write_response(writer, status, reason, cimerror=cimerror,
+                                 close=not keep_alive)
+            await writer.drain()
+            return keep_alive
+
+        error = None
+        if method_name.lower() != 'exportindication':
+            error = (CIM_ERR_NOT_SUPPORTED,
+                     'Export method %s is not supported' % method_name)
+        elif params.get('NewIndication', None) is None:
+            error = (CIM_ERR_INVALID_PARAMETER,
+                     'Missing NewIndication parameter')
+        else:
+            # Waiting for a free slot before we respond is what slows down
+            # the WBEM server when the handlers cannot keep up.
+            await self._semaphore.acquire()
+            self._dispatch(params['NewIndication'], host)
+
+        body = _export_response(message_id, method_name, error)
+        self._write_response(writer, 200, 'OK', body=body,
+                             close=not keep_alive)
+        await writer.drain()
+        return keep_alive
+
+    def _dispatch(self, indication, host):
+        """
+        Run the handler for an indication as a task. Must be called with the
+        semaphore acquired; the task releases it.
+        """
+
+        task = asyncio.ensure_future(self._run_handler(indication, host))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_handler(self, indication, host):
+        """Invoke the handler, and report its exceptions to the loop."""
+
+        try:
+            await self.handler(indication, host)
+        except Exception as exc:  # pylint: disable=broad-except
+            asyncio.get_event_loop().call_exception_handler({
+                'message': 'Indication handler %r failed' % self.handler,
+                'exception': exc,
+            })
+        finally:
+            self._semaphore.release()
+
+    @staticmethod
+    def _write_response(writer, status, reason, body=None, cimerror=None,
+                        close=False):
+        """Write an HTTP response to the client."""
+
+        lines = ['HTTP/1.1 %d %s' % (status, reason)]
+        if body is not None:
+            lines.append('Content-Type: application/xml; charset="utf-8"')
+            lines.append('CIMExport: MethodResponse')
+        else:
+            body = b''
+        if cimerror is not None:
+            lines.append('CIMError: %s' % cimerror)
+        lines.append('Content-Length: %d' % len(body))
+        if close:
+            lines.append('Connection: close')
+        header = '\r\n'.join(lines) + '\r\n\r\n'
+        writer.write(header.encode('iso-8859-1') + body)
@@ -0,0 +1,303 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.AssociationTraversal` class walks the associations of CIM
+instances breadth-first, along a path specification that consists of a
+sequence of :class:`~pywbem.TraversalHop` objects.
+
+Each hop specifies the filters of the `Associators` or `AssociatorNames`
+operation (`AssocClass`, `ResultClass`, `Role` and `ResultRole`) that lead
+from the instances of one level of the walk to the instances of the next
+level. The operations for the instances of a level are performed
+concurrently, with a configurable maximum number of concurrent operations.
+Instances that have already been reached (in the same or in an earlier level)
+are not visited again.
+
+The instances are retrieved either with `Associators`, or with
+`AssociatorNames` followed by `GetInstance` for the instances that have not
+been reached before. The latter transfers less data when many instances are
+reached several times, for example in a mesh of storage volumes and extents.
+
+Example::
+
+    traversal = AssociationTraversal(
+        conn,
+        [TraversalHop(AssocClass='CIM_SystemDevice',
+                      ResultClass='CIM_StorageVolume'),
+         TraversalHop(AssocClass='CIM_BasedOn',
+                      ResultClass='CIM_StorageExtent')],
+        names_first=True)
+    result = traversal.run(system_path)
+    for volume in result.levels[1]:
+        extents = result.targets(volume)
+"""
+
+from __future__ import absolute_import
+
+from .cim_obj import CIMInstanceName
+from .response_cache import _normalize_path
+from ._threadpool import run_concurrently
+
+__all__ = ['AssociationTraversal', 'TraversalHop', 'TraversalResult']
+
+
+def _node_key(path):
+    """Return a hashable key for an instance path, that is the same for all
+    instance paths that are equal apart from their host."""
+    return ((path.namespace or '').strip('/').lower(),
+            _normalize_path(path))
+
+
+class TraversalHop(object):
+    # pylint: disable=invalid-name,too-few-public-methods
+    """
+    One hop of an association traversal.
+
+    The attributes are the filters of the `Associators` and `AssociatorNames`
+    operations; for their meaning, see
+    :meth:`~pywbem.WBEMConnection.Associators`. `None` means no filtering.
+    """
+
+    def __init__(self, AssocClass=None, ResultClass=None, Role=None,
+                 ResultRole=None):
+        self.AssocClass = AssocClass
+        self.ResultClass = ResultClass
+        self.Role = Role
+        self.ResultRole = ResultRole
+
+    def __repr__(self):
+        return '%s(AssocClass=%r, ResultClass=%r, Role=%r, ResultRole=%r)' % \
+               (self.__class__.__name__, self.AssocClass, self.ResultClass,
+                self.Role, self.ResultRole)
+
+    def filters(self):
+        """Return the filters as a :class:`py:dict` of keyword arguments for
+        the `Associators` and `AssociatorNames` operations."""
+        return dict([(name, getattr(self, name))
+                     for name in ('AssocClass', 'ResultClass', 'Role',
+                                  'ResultRole')
+                     if getattr(self, name) is not None])
+
+
+class TraversalResult(object):
+    """
+    The result of an association traversal.
+
+    Attributes:
+
+      levels (:class:`py:list`):
+        The instance paths (:class:`~pywbem.CIMInstanceName`) of each level
+        of the traversal. ``levels[0]`` are the start paths, and
+        ``levels[i]`` are the paths that have been reached for the first time
+        with hop ``i``.
+
+      instances (:class:`py:list`):
+        The instances (:class:`~pywbem.CIMInstance`) that have been
+        retrieved, in the order they have been reached. The instances of the
+        start paths are not retrieved.
+
+      edges (:class:`py:list`):
+        The associations that have been followed, as tuples ``(hop, source,
+        target)`` of the hop index (starting at 1) and the instance paths.
+
+      errors (:class:`py:list`):
+        The operations that failed, as tuples ``(hop, path, exc)`` of the hop
+        index, the instance path for which the operation failed, and the
+        exception. The hop index is `None` for failed `GetInstance`
+        operations. The instances reached from a failed instance are missing
+        from the result, but the traversal continues with the other
+        instances.
+    """
+
+    def __init__(self):
+        self.levels = []
+        self.instances = []
+        self.edges = []
+        self.errors = []
+        self._instances = {}
+
+    def __repr__(self):
+        return '%s(levels=%r, instances=%d, edges=%d, errors=%d)' % \
+               (self.__class__.__name__,
+                [len(level) for level in self.levels], len(self.instances),
+                len(self.edges), len(self.errors))
+
+    def _add_instance(self, inst):
+        """Add a retrieved instance."""
+        self.instances.append(inst)
+        self._instances[_node_key(inst.path)] = inst
+
+    def instance(self, path):
+        """
+        Return the retrieved instance with an instance path, or `None`.
+        """
+        return self._instances.get(_node_key(path))
+
+    def targets(self, path):
+        """
+        Return the instance paths that have been reached from an instance
+        path, in all hops.
+        """
+        key = _node_key(path)
+        return [target for dummy_hop, source, target in self.edges
+                if _node_key(source) == key]
+
+
+class AssociationTraversal(object):
+    """
+    A breadth-first walk of the associations of CIM instances.
+    """
+
+    def __init__(self, conn, hops, names_first=False, instances=True,
+                 PropertyList=None, max_workers=10):
+        # pylint: disable=invalid-name
+        """
+        Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            Connection to the WBEM server. The connection is used
+            concurrently from multiple threads.
+
+          hops (:term:`py:iterable` of :class:`~pywbem.TraversalHop`):
+            The hops of the traversal.
+
+          names_first (:class:`py:bool`):
+            Retrieve the instances with `AssociatorNames`, followed by
+            `GetInstance` for each instance that has not been reached
+            before, instead of with `Associators`.
+
+          instances (:class:`py:bool`):
+            Retrieve the instances. If `False`, only the instance paths are
+            retrieved, with `AssociatorNames`.
+
+          PropertyList (:term:`py:iterable` of :term:`string`):
+            The properties of the retrieved instances, as in
+            :meth:`~pywbem.WBEMConnection.Associators`.
+
+          max_workers (:term:`integer`):
+            Maximum number of concurrent operations.
+        """
+        self.conn = conn
+        self.hops = list(hops)
+        self.names_first = names_first
+        self.instances = instances
+        self.PropertyList = PropertyList  # pylint: disable=invalid-name
+        self.max_workers = max_workers
+
+    def __repr__(self):
+        return '%s(conn=%r, hops=%r, names_first=%r, instances=%r, ' \
+               'PropertyList=%r, max_workers=%r)' % \
+               (self.__class__.__name__, self.conn, self.hops,
+                self.names_first, self.instances, self.PropertyList,
+                self.max_workers)
+
+    def run(self, start):
+        """
+        Perform the traversal.
+
+        Parameters:
+
+          start (:class:`~pywbem.CIMInstanceName` or list of them):
+            The instance path(s) to start from. Instance paths without a
+            namespace are in the default namespace of the connection.
+
+        Returns:
+
+          :class:`~pywbem.TraversalResult`: The result of the traversal.
+        """
+        if isinstance(start, CIMInstanceName):
+            start = [start]
+        result = TraversalResult()
+        visited = set()
+        level = []
+        for path in start:
+            if path.namespace is None:
+                path = path.copy()
+                path.namespace = self.conn.default_namespace
+            if _node_key(path) not in visited:
+                visited.add(_node_key(path))
+                level.append(path)
+        result.levels.append(level)
+
+        for hop_index, hop in enumerate(self.hops):
+            level = self._hop(hop_index + 1, hop, level, visited, result)
+            result.levels.append(level)
+            if not level:
+                # The remaining levels are empty as well
+                result.levels.extend([[] for dummy_hop in
+                                      self.hops[hop_index + 1:]])
+                break
+        return result
+
+    def _hop(self, hop_index, hop, sources, visited, result):
+        """Perform one hop from the instance paths in `sources`, and return
+        the instance paths that have not been visited before."""
+
+        filters = hop.filters()
+        with_instances = self.instances and not self.names_first
+        if with_instances:
+            def associators(source):
+                """Return the associated instances of a source."""
+                return self.conn.Associators(
+                    source, PropertyList=self.PropertyList, **filters)
+        else:
+            def associators(source):
+                """Return the associated instance paths of a source."""
+                return self.conn.AssociatorNames(source, **filters)
+
+        new_paths = []
+        new_insts = []
+        results = run_concurrently(associators,
+                                   [(source,) for source in sources],
+                                   self.max_workers)
+        for source, (targets, exc_info) in zip(sources, results):
+            if exc_info is not None:
+                result.errors.append((hop_index, source, exc_info[1]))
+                continue
+            for target in targets:
+                inst = None
+                if with_instances:
+                    inst = target
+                    target = inst.path
+                result.edges.append((hop_index, source, target))
+                key = _node_key(target)
+                if key not in visited:
+                    visited.add(key)
+                    new_paths.append(target)
+                    new_insts.append(inst)
+
+        if self.instances and self.names_first:
+            results = run_concurrently(
+                lambda path: self.conn.GetInstance(
+                    path, PropertyList=self.PropertyList),
+                [(path,) for path in new_paths], self.max_workers)
+            new_insts = []
+            for path, (inst, exc_info) in zip(new_paths, results):
+                if exc_info is not None:
+                    result.errors.append((None, path, exc_info[1]))
+                    inst = None
+                new_insts.append(inst)
+
+        level = []
+        for path, inst in zip(new_paths, new_insts):
+            if self.instances and inst is None:
+                # GetInstance failed, the instance is not followed
+                continue
+            if inst is not None:
+                result._add_instance(inst)  # pylint: disable=protected-access
+            level.append(path)
+        return level
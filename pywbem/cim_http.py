@@ -67,7 +67,7 @@ else:
     #pylint: disable=invalid-name
     SocketErrors = (socket.error,)
 
-__all__ = []
+__all__ = ['WBEMTransport', 'HTTPTransport']
 
 
 class HTTPTimeout(object):  # pylint: disable=too-few-public-methods
@@ -250,11 +250,162 @@ def get_default_ca_certs():
     return get_default_ca_certs._path
 
 # pylint: disable=too-many-branches,too-many-statements,too-many-arguments
+class HTTPBaseConnection:        # pylint: disable=no-init
+    """ Common base for specific connection classes. Implements
+        the send method
+    """
+    # pylint: disable=old-style-class,too-few-public-methods
+    def send(self, strng):
+        """ Same as httplib.HTTPConnection.send(), except we don't
+        check for sigpipe and close the connection.  If the connection
+        gets closed, getresponse() fails.
+        """
+
+        if self.sock is None:
+            if self.auto_open:
+                self.connect()
+            else:
+                raise httplib.NotConnected()
+        strng = _ensure_bytes(strng)
+        if self.debuglevel > 0:
+            print("send: %r" % strng)
+        self.sock.sendall(strng)
+
+
+class HTTPConnection(HTTPBaseConnection, httplib.HTTPConnection):
+    """ Execute client connection without ssl using httplib. """
+    def __init__(self, host, port=None, timeout=None):
+        # TODO AM: Should we set strict=True in the following call, for PY2?
+        httplib.HTTPConnection.__init__(self, host=host, port=port,
+                                        timeout=timeout)
+
+
+class HTTPSConnection(HTTPBaseConnection, httplib.HTTPSConnection):
+    """ Execute client connection with ssl using httplib."""
+    # pylint: disable=R0913,too-many-arguments
+    def __init__(self, host, port=None, key_file=None, cert_file=None,
+                 ca_certs=None, verify_callback=None, timeout=None):
+        # TODO AM: Should we set strict=True in the following call, for PY2?
+        httplib.HTTPSConnection.__init__(self, host=host, port=port,
+                                         key_file=key_file,
+                                         cert_file=cert_file,
+                                         timeout=timeout)
+        self.ca_certs = ca_certs
+        self.verify_callback = verify_callback
+
+    def connect(self):
+        # pylint: disable=too-many-branches
+        """Connect to a host on a given (SSL) port."""
+
+        # Calling httplib.HTTPSConnection.connect(self) does not work
+        # because of its ssl.wrap_socket() call. So we copy the code of
+        # that connect() method modulo the ssl.wrap_socket() call.
+        #
+        # Another change is that we do not pass the timeout value
+        # on to the socket call, because that does not work with M2Crypto.
+        #
+        # TODO AM: Check out whether we can pass the timeout for Python 3
+        #          again, given that we use the standard SSL support again.
+        if sys.version_info[0:2] >= (2, 7):
+            # the source_address argument was added in 2.7
+            self.sock = socket.create_connection(
+                (self.host, self.port), None, self.source_address)
+        else:
+            self.sock = socket.create_connection(
+                (self.host, self.port), None)
+
+        if self._tunnel_host:
+            self._tunnel()
+        # End of code from httplib.HTTPSConnection.connect(self).
+
+        if _HAVE_M2CRYPTO:
+            ctx = SSL.Context('sslv23')
+        else:
+            ctx = SSL.create_default_context()
+
+        if self.cert_file:
+            ctx.load_cert(self.cert_file, keyfile=self.key_file)
+        if self.ca_certs:
+            if _HAVE_M2CRYPTO:
+                ctx.set_verify(
+                    SSL.verify_peer | SSL.verify_fail_if_no_peer_cert,
+                    depth=9, callback=self.verify_callback)
+            else:
+                ctx.verify_flags |= SSL.VERIFY_CRL_CHECK_CHAIN
+            if os.path.isdir(self.ca_certs):
+                ctx.load_verify_locations(capath=self.ca_certs)
+            else:
+                ctx.load_verify_locations(cafile=self.ca_certs)
+        try:
+            if _HAVE_M2CRYPTO:
+                self.sock = SSL.Connection(ctx, self.sock)
+            else:
+                self.sock = ctx.wrap_socket(self.sock)
+
+            # Below is a body of SSL.Connection.connect() method
+            # except for the first line (socket connection). We want to
+            # preserve tunneling ability.
+
+            # Setting the timeout on the input socket does not work
+            # with M2Crypto, with such a timeout set it calls a different
+            # low level function (nbio instead of bio) that does not work.
+            # the symptom is that reading the response returns None.
+            # Therefore, we set the timeout at the level of the outer
+            # M2Crypto socket object.
+            # pylint: disable=using-constant-test
+            if False:
+                # TODO 2/16 AM: Currently disabled, figure out how to
+                #               reenable.
+                if self.timeout is not None:
+                    self.sock.set_socket_read_timeout(
+                        SSL.timeout(self.timeout))
+                    self.sock.set_socket_write_timeout(
+                        SSL.timeout(self.timeout))
+
+            self.sock.addr = (self.host, self.port)
+            self.sock.setup_ssl()
+            self.sock.set_connect_state()
+            ret = self.sock.connect_ssl()
+            if self.ca_certs:
+                check = getattr(self.sock, 'postConnectionCheck',
+                                self.sock.clientPostConnectionCheck)
+                if check is not None:
+                    if not check(self.sock.get_peer_cert(), self.host):
+                        raise ConnectionError(
+                            'SSL error: post connection check failed')
+            return ret
+
+        # TODO 2/16 AM: Verify whether the additional exceptions in the
+        #               Python 2 and M2Crypto code can really be omitted:
+        #               Err.SSLError, SSL.SSLError, SSL.Checker.WrongHost,
+        #               SSLTimeoutError
+        except SSLError as arg:
+            raise ConnectionError(
+                "SSL error %s: %s" % (arg.__class__, arg))
+
+
+class FileHTTPConnection(HTTPBaseConnection, httplib.HTTPConnection):
+    """Execute client connection based on a unix domain socket. """
+
+    def __init__(self, uds_path):
+        httplib.HTTPConnection.__init__(self, host='localhost')
+        self.uds_path = uds_path
+
+    def connect(self):
+        try:
+            socket_af = socket.AF_UNIX
+        except AttributeError:
+            raise ConnectionError(
+                'file URLs not supported on %s platform due '\
+                'to missing AF_UNIX support' % platform.system())
+        self.sock = socket.socket(socket_af, socket.SOCK_STREAM)
+        self.sock.connect(self.uds_path)
+
+
 def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
                  verify_callback=None, ca_certs=None,
                  no_verification=False, timeout=None):
     # pylint: disable=too-many-arguments,unused-argument
-    # pylint: disable=too-many-locals
     """
     Send an HTTP or HTTPS request to a WBEM server and return the response.
 
@@ -325,156 +476,53 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
         :exc:`~pywbem.TimeoutError`
     """
 
-    class HTTPBaseConnection:        # pylint: disable=no-init
-        """ Common base for specific connection classes. Implements
-            the send method
-        """
-        # pylint: disable=old-style-class,too-few-public-methods
-        def send(self, strng):
-            """ Same as httplib.HTTPConnection.send(), except we don't
-            check for sigpipe and close the connection.  If the connection
-            gets closed, getresponse() fails.
-            """
-
-            if self.sock is None:
-                if self.auto_open:
-                    self.connect()
-                else:
-                    raise httplib.NotConnected()
-            strng = _ensure_bytes(strng)
-            if self.debuglevel > 0:
-                print("send: %r" % strng)
-            self.sock.sendall(strng)
-
-    class HTTPConnection(HTTPBaseConnection, httplib.HTTPConnection):
-        """ Execute client connection without ssl using httplib. """
-        def __init__(self, host, port=None, timeout=None):
-            # TODO AM: Should we set strict=True in the following call, for PY2?
-            httplib.HTTPConnection.__init__(self, host=host, port=port,
-                                            timeout=timeout)
-
-    class HTTPSConnection(HTTPBaseConnection, httplib.HTTPSConnection):
-        """ Execute client connection with ssl using httplib."""
-        # pylint: disable=R0913,too-many-arguments
-        def __init__(self, host, port=None, key_file=None, cert_file=None,
-                     ca_certs=None, verify_callback=None, timeout=None):
-            # TODO AM: Should we set strict=True in the following call, for PY2?
-            httplib.HTTPSConnection.__init__(self, host=host, port=port,
-                                             key_file=key_file,
-                                             cert_file=cert_file,
-                                             timeout=timeout)
-            self.ca_certs = ca_certs
-            self.verify_callback = verify_callback
-
-        def connect(self):
-            # pylint: disable=too-many-branches
-            """Connect to a host on a given (SSL) port."""
-
-            # Calling httplib.HTTPSConnection.connect(self) does not work
-            # because of its ssl.wrap_socket() call. So we copy the code of
-            # that connect() method modulo the ssl.wrap_socket() call.
-            #
-            # Another change is that we do not pass the timeout value
-            # on to the socket call, because that does not work with M2Crypto.
-            #
-            # TODO AM: Check out whether we can pass the timeout for Python 3
-            #          again, given that we use the standard SSL support again.
-            if sys.version_info[0:2] >= (2, 7):
-                # the source_address argument was added in 2.7
-                self.sock = socket.create_connection(
-                    (self.host, self.port), None, self.source_address)
-            else:
-                self.sock = socket.create_connection(
-                    (self.host, self.port), None)
+    client, local = _create_client(url, x509=x509,
+                                   verify_callback=verify_callback,
+                                   ca_certs=ca_certs,
+                                   no_verification=no_verification,
+                                   timeout=timeout)
+    try:
+        body, dummy_auth = _send_request(client, local, data, creds, headers,
+                                         timeout=timeout)
+    finally:
+        client.close()
+    return body
 
-            if self._tunnel_host:
-                self._tunnel()
-            # End of code from httplib.HTTPSConnection.connect(self).
 
-            if _HAVE_M2CRYPTO:
-                ctx = SSL.Context('sslv23')
-            else:
-                ctx = SSL.create_default_context()
+def _is_uds_url(url):
+    """Return a boolean indicating whether a URL specifies the path name of a
+    Unix domain socket."""
+    return not url.startswith('http')
 
-            if self.cert_file:
-                ctx.load_cert(self.cert_file, keyfile=self.key_file)
-            if self.ca_certs:
-                if _HAVE_M2CRYPTO:
-                    ctx.set_verify(
-                        SSL.verify_peer | SSL.verify_fail_if_no_peer_cert,
-                        depth=9, callback=verify_callback)
-                else:
-                    ctx.verify_flags |= SSL.VERIFY_CRL_CHECK_CHAIN
-                if os.path.isdir(self.ca_certs):
-                    ctx.load_verify_locations(capath=self.ca_certs)
-                else:
-                    ctx.load_verify_locations(cafile=self.ca_certs)
-            try:
-                if _HAVE_M2CRYPTO:
-                    self.sock = SSL.Connection(ctx, self.sock)
-                else:
-                    self.sock = ctx.wrap_socket(self.sock)
-
-                # Below is a body of SSL.Connection.connect() method
-                # except for the first line (socket connection). We want to
-                # preserve tunneling ability.
-
-                # Setting the timeout on the input socket does not work
-                # with M2Crypto, with such a timeout set it calls a different
-                # low level function (nbio instead of bio) that does not work.
-                # the symptom is that reading the response returns None.
-                # Therefore, we set the timeout at the level of the outer
-                # M2Crypto socket object.
-                # pylint: disable=using-constant-test
-                if False:
-                    # TODO 2/16 AM: Currently disabled, figure out how to
-                    #               reenable.
-                    if self.timeout is not None:
-                        self.sock.set_socket_read_timeout(
-                            SSL.timeout(self.timeout))
-                        self.sock.set_socket_write_timeout(
-                            SSL.timeout(self.timeout))
-
-                self.sock.addr = (self.host, self.port)
-                self.sock.setup_ssl()
-                self.sock.set_connect_state()
-                ret = self.sock.connect_ssl()
-                if self.ca_certs:
-                    check = getattr(self.sock, 'postConnectionCheck',
-                                    self.sock.clientPostConnectionCheck)
-                    if check is not None:
-                        if not check(self.sock.get_peer_cert(), self.host):
-                            raise ConnectionError(
-                                'SSL error: post connection check failed')
-                return ret
-
-            # TODO 2/16 AM: Verify whether the additional exceptions in the
-            #               Python 2 and M2Crypto code can really be omitted:
-            #               Err.SSLError, SSL.SSLError, SSL.Checker.WrongHost,
-            #               SSLTimeoutError
-            except SSLError as arg:
-                raise ConnectionError(
-                    "SSL error %s: %s" % (arg.__class__, arg))
-
-    class FileHTTPConnection(HTTPBaseConnection, httplib.HTTPConnection):
-        """Execute client connection based on a unix domain socket. """
-
-        def __init__(self, uds_path):
-            httplib.HTTPConnection.__init__(self, host='localhost')
-            self.uds_path = uds_path
-
-        def connect(self):
-            try:
-                socket_af = socket.AF_UNIX
-            except AttributeError:
-                raise ConnectionError(
-                    'file URLs not supported on %s platform due '\
-                    'to missing AF_UNIX support' % platform.system())
-            self.sock = socket.socket(socket_af, socket.SOCK_STREAM)
-            self.sock.connect(self.uds_path)
 
-    if not headers:
-        headers = []
+def _uds_path(url):
+    """Return the path name of the Unix domain socket of a URL."""
+    if url.startswith('file:'):
+        return url[5:]
+    return url
+
+
+def _check_socket(path, url):
+    """Raise ConnectionError if a path name is not a Unix domain socket."""
+    try:
+        status = os.stat(path)
+    except OSError as exc:
+        raise ConnectionError('Error with file URL %s: %s' % (url, exc))
+    if not S_ISSOCK(status.st_mode):
+        raise ConnectionError('File URL is not a socket: %s' % url)
+
+
+def _create_client(url, x509=None, verify_callback=None, ca_certs=None,
+                   no_verification=False, timeout=None):
+    # pylint: disable=too-many-arguments
+    """
+    Create the httplib connection object for a URL.
+
+    The parameters are those of :func:`wbem_request`.
+
+    Returns a tuple ``(client, local)`` with the connection object and a
+    boolean indicating whether the WBEM server is on the local system.
+    """
 
     host, port, use_ssl = parse_url(_ensure_unicode(url))
 
@@ -485,18 +533,6 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
         cert_file = x509.get('cert_file')
         key_file = x509.get('key_file')
 
-    num_tries = 0
-    local_auth_header = None
-    try_limit = 5
-
-    # Make sure the data argument is converted to a UTF-8 encoded byte string.
-    # This is important because according to RFC2616, the Content-Length HTTP
-    # header must be measured in Bytes (and the Content-Type header will
-    # indicate UTF-8).
-    data = _ensure_bytes(data)
-
-    data = b'<?xml version="1.0" encoding="utf-8" ?>\n' + data
-
     if not no_verification and ca_certs is None:
         ca_certs = get_default_ca_certs()
     elif no_verification:
@@ -511,29 +547,92 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
                                  ca_certs=ca_certs,
                                  verify_callback=verify_callback,
                                  timeout=timeout)
+    elif not _is_uds_url(url):
+        client = HTTPConnection(host=host,  # pylint: disable=redefined-variable-type
+                                port=port,
+                                timeout=timeout)
     else:
-        if url.startswith('http'):
-            client = HTTPConnection(host=host,  # pylint: disable=redefined-variable-type
-                                    port=port,
-                                    timeout=timeout)
-        else:
-            if url.startswith('file:'):
-                url_ = url[5:]
-            else:
-                url_ = url
-            try:
-                status = os.stat(url_)
-                if S_ISSOCK(status.st_mode):
-                    client = FileHTTPConnection(url_)
-                    local = True
-                else:
-                    raise ConnectionError('File URL is not a socket: %s' % url)
-            except OSError as exc:
-                raise ConnectionError('Error with file URL %s: %s' % (url, exc))
+        path = _uds_path(url)
+        _check_socket(path, url)
+        client = FileHTTPConnection(path)
+        local = True
 
-    locallogin = None
     if host in ('localhost', 'localhost6', '127.0.0.1', '::1'):
         local = True
+    return client, local
+
+
+class _NoResponseError(ConnectionError):
+    """
+    A :exc:`~pywbem.ConnectionError` raised by :func:`_send_request` when
+    the WBEM server has not returned any response data: The request can be
+    repeated without being processed twice.
+    """
+    pass
+
+
+class _MultiReqUnsupportedError(ConnectionError):
+    """
+    A :exc:`~pywbem.ConnectionError` raised by :func:`_send_request` when
+    the WBEM server has rejected a multiple operation request with the
+    `CIMError: multiple-requests-unsupported` header.
+    """
+    pass
+
+
+def _send_request(client, local, data, creds, headers=None, timeout=None,
+                  local_auth_header=None):
+    # pylint: disable=too-many-arguments,too-many-locals
+    # pylint: disable=too-many-branches,too-many-statements
+    """
+    Send a CIM-XML request on an httplib connection object and return the
+    response, handling the local authentication challenges of the WBEM
+    server.
+
+    The connection object is left open, so that it can be used for further
+    requests.
+
+    Parameters:
+
+      client: The httplib connection object.
+
+      local (:class:`py:bool`): Whether the WBEM server is on the local
+        system, so that local authentication can be used.
+
+      data, creds, headers, timeout: See :func:`wbem_request`.
+
+      local_auth_header (:class:`py:tuple`): A local authentication header
+        (name, value) negotiated in an earlier request, to be sent instead of
+        the credentials, or `None`. If the WBEM server does not accept it,
+        the local authentication is negotiated again.
+
+    Returns:
+        A tuple ``(body, local_auth_header)`` with the CIM-XML formatted
+        response data, and the local authentication header that has been
+        accepted by the WBEM server, or `None`.
+
+    Raises:
+        :exc:`_NoResponseError` if the connection failed before the WBEM
+        server returned any response data, and other exceptions derived
+        from :exc:`~pywbem.Error`.
+    """
+
+    if not headers:
+        headers = []
+
+    num_tries = 0
+    try_limit = 5
+    reused_auth = local_auth_header is not None
+
+    # Make sure the data argument is converted to a UTF-8 encoded byte string.
+    # This is important because according to RFC2616, the Content-Length HTTP
+    # header must be measured in Bytes (and the Content-Type header will
+    # indicate UTF-8).
+    data = _ensure_bytes(data)
+
+    data = b'<?xml version="1.0" encoding="utf-8" ?>\n' + data
+
+    locallogin = None
     if local:
         try:
             locallogin = getpass.getuser()
@@ -545,6 +644,7 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
         while num_tries < try_limit:
             num_tries = num_tries + 1
 
+            response = None
             client.putrequest('POST', '/cimom')
 
             client.putheader('Content-type',
@@ -593,7 +693,7 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
                 except Exception as exc: # socket.error as exc:
                     # TODO AM: Verify these errno numbers on Windows vs. Linux.
                     if exc.args[0] != 104 and exc.args[0] != 32:
-                        raise ConnectionError("Socket error: %s" % exc)
+                        raise _NoResponseError("Socket error: %s" % exc)
 
                 response = client.getresponse()
 
@@ -603,6 +703,15 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
                             raise AuthError(response.reason)
                         if not local:
                             raise AuthError(response.reason)
+                        # Read the body, so that the connection can be used
+                        # for the next try.
+                        response.read()
+                        if reused_auth:
+                            # The local authentication header of an earlier
+                            # request is not accepted (anymore), start over.
+                            reused_auth = False
+                            local_auth_header = None
+                            continue
                         auth_chal = response.getheader('WWW-Authenticate', '')
                         if 'openwbem' in response.getheader('Server', ''):
                             if 'OWLocal' not in auth_chal:
@@ -670,6 +779,8 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
                             #pylint: disable=too-many-function-args
                             exc_str += ', PGErrorDetail: %s' %\
                                 urllib.parse.unquote(pgerrordetail_hdr)
+                        if cimerror_hdr == 'multiple-requests-unsupported':
+                            raise _MultiReqUnsupportedError(exc_str)
                         raise ConnectionError(exc_str)
 
                     raise ConnectionError('HTTP error: %s' % response.reason)
@@ -685,7 +796,7 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
                 # See http://bugs.python.org/issue8450.
                 if exc.line is None or exc.line.strip().strip("'") in \
                                        ('', 'None'):
-                    raise ConnectionError("The server closed the "\
+                    raise _NoResponseError("The server closed the "\
                         "connection without returning any data, or the "\
                         "client timed out")
                 else:
@@ -696,11 +807,192 @@ def wbem_request(url, data, creds, headers=None, debug=False, x509=None,
             except httplib.NotConnected as exc:
                 raise ConnectionError("HTTP not connected: %s" % exc)
             except SocketErrors as exc:
+                if response is None:
+                    raise _NoResponseError("Socket error: %s" % exc)
                 raise ConnectionError("Socket error: %s" % exc)
 
             break
 
-    return body
+    return body, local_auth_header
+
+
+class WBEMTransport(object):
+    """
+    Interface of the transports that send CIM-XML requests of a
+    :class:`~pywbem.WBEMConnection` to a WBEM server and return the responses.
+
+    A transport is specified in the `transport` parameter of
+    :class:`~pywbem.WBEMConnection`. If no transport is specified, the
+    connection uses a :class:`~pywbem.HTTPTransport` object of its own.
+
+    Derived classes must implement :meth:`send`, and may implement
+    :meth:`close` to release resources such as open sockets. A transport may
+    be used by several connections, also concurrently from multiple threads.
+    """
+
+    def send(self, url, data, headers, creds=None, x509=None,
+             verify_callback=None, ca_certs=None, no_verification=False,
+             timeout=None):
+        # pylint: disable=too-many-arguments
+        """
+        Send a CIM-XML request to a WBEM server and return the response.
+
+        Parameters:
+
+          url (:term:`string`):
+            URL of the WBEM server.
+            For details, see the ``url`` parameter of
+            :meth:`WBEMConnection.__init__`.
+
+          data (:term:`byte string`):
+            The CIM-XML formatted request data, without an XML declaration.
+
+          headers (:class:`py:list` of :term:`string`):
+            HTTP header fields specific to the operation, in the format
+            ``"name: value"`` (e.g. ``"CIMMethod: GetInstance"``).
+
+          creds, x509, verify_callback, ca_certs, no_verification, timeout:
+            The attributes of the same name of the
+            :class:`~pywbem.WBEMConnection` object.
+            For details, see :meth:`WBEMConnection.__init__`.
+
+        Returns:
+            A file-like object with a ``read()`` and a ``close()`` method,
+            from which the CIM-XML formatted response data is read as a
+            :term:`byte string`.
+
+        Raises:
+            :exc:`~pywbem.AuthError`
+            :exc:`~pywbem.ConnectionError`
+            :exc:`~pywbem.TimeoutError`
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release the resources held by the transport.
+        """
+        pass
+
+
+class HTTPTransport(WBEMTransport):
+    """
+    The default transport, that sends the requests to the WBEM server via
+    HTTP, HTTPS or a Unix domain socket, using Python's built-in `httplib`
+    module.
+
+    HTTP and HTTPS requests are sent on a new connection each.
+
+    The connections via a Unix domain socket (e.g. to a local CIMOM, see
+    :func:`~pywbem.PegasusUDSConnection`) are persistent: After a request,
+    the socket stays open and is used for subsequent requests to the same
+    socket path name with the same credentials. Whether the path name is a
+    socket is verified only for the first connection to it. If the WBEM
+    server has closed an idle connection without answering the request, the
+    request is repeated once on a new connection.
+
+    The local authentication header (OpenPegasus ``PegasusAuthorization:
+    Local`` or OpenWBEM ``OWLocal``) that has been negotiated on a persistent
+    connection is remembered with the connection and sent with the
+    subsequent requests on it, so that they do not need to go through the
+    authentication challenges again. If the WBEM server rejects the
+    remembered header with status 401, the local authentication is
+    negotiated again. The header is not used for other connections, because
+    the secret files of the local authentication can be used only once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Idle connections via Unix domain sockets, as lists of tuples
+        # (client, local_auth_header), by tuple (socket path name, creds)
+        self._idle_clients = {}
+        # Socket path names that have been verified to be sockets
+        self._socket_paths = set()
+
+    def send(self, url, data, headers, creds=None, x509=None,
+             verify_callback=None, ca_certs=None, no_verification=False,
+             timeout=None):
+        # pylint: disable=too-many-arguments
+        """
+        Send a CIM-XML request to a WBEM server and return the response.
+
+        For details, see :meth:`WBEMTransport.send`.
+        """
+        if not _is_uds_url(url):
+            return six.BytesIO(wbem_request(url, data, creds, headers,
+                                            x509=x509,
+                                            verify_callback=verify_callback,
+                                            ca_certs=ca_certs,
+                                            no_verification=no_verification,
+                                            timeout=timeout))
+
+        path = _uds_path(url)
+        key = (path, None if creds is None else tuple(creds))
+        retry = True
+        while True:
+            client, local_auth_header, reused = self._get_client(key, url)
+            try:
+                body, local_auth_header = _send_request(
+                    client, True, data, creds, headers, timeout=timeout,
+                    local_auth_header=local_auth_header)
+            except ConnectionError as exc:
+                client.close()
+                if reused and retry and isinstance(exc, _NoResponseError):
+                    # The WBEM server may have closed the idle connection
+                    # (e.g. because it has been restarted). The request is
+                    # only repeated if the server has not answered it.
+                    self._close_idle(key)
+                    retry = False
+                    continue
+                with self._lock:
+                    self._socket_paths.discard(path)
+                raise
+            except Exception:
+                client.close()
+                raise
+            with self._lock:
+                self._idle_clients.setdefault(key, []).append(
+                    (client, local_auth_header))
+            return six.BytesIO(body)
+
+    def _get_client(self, key, url):
+        """Return a tuple (client, local_auth_header, reused) with an idle
+        connection to a Unix domain socket for a tuple (socket path name,
+        creds), or a new one."""
+        path = key[0]
+        with self._lock:
+            idle = self._idle_clients.get(key)
+            if idle:
+                client, local_auth_header = idle.pop()
+                return client, local_auth_header, True
+            verified = path in self._socket_paths
+        if not verified:
+            _check_socket(path, url)
+            with self._lock:
+                self._socket_paths.add(path)
+        return FileHTTPConnection(path), None, False
+
+    def _close_idle(self, key=None):
+        """Close the idle connections for a tuple (socket path name, creds),
+        or all idle connections."""
+        with self._lock:
+            if key is None:
+                idle = [c for clients in self._idle_clients.values()
+                        for c in clients]
+                self._idle_clients.clear()
+            else:
+                idle = self._idle_clients.pop(key, [])
+        for client, dummy_auth in idle:
+            client.close()
+
+    def close(self):
+        """
+        Close the idle connections.
+        """
+        self._close_idle()
+
+    def __repr__(self):
+        return '%s()' % self.__class__.__name__
 
 
 def get_object_header(obj):
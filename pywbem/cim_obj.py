@@ -65,6 +65,9 @@ in detail in this documentation.
 
 from __future__ import print_function, absolute_import
 
+import json
+import math
+import hashlib
 from datetime import datetime, timedelta
 
 import six
@@ -117,6 +120,10 @@ class NocaseDict(object):
       * Determining length: `len(d)`
     """
 
+    # Number of changes of the dictionary, used to validate the cached
+    # fingerprints of the CIM objects that contain the dictionary.
+    _version = 0
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the new dictionary from at most one positional argument and
@@ -207,6 +214,7 @@ class NocaseDict(object):
                             'but is %s' %  (key, builtin_type(key)))
         k = key.lower()
         self._data[k] = (key, value)
+        self._version += 1
 
     def __delitem__(self, key):
         """
@@ -224,6 +232,7 @@ class NocaseDict(object):
             del self._data[k]
         except KeyError:
             raise KeyError('Key %s not found in %r' % (key, self))
+        self._version += 1
 
     def __len__(self):
         """
@@ -362,6 +371,7 @@ class NocaseDict(object):
         Remove all items from the dictionary.
         """
         self._data.clear()
+        self._version += 1
 
     def popitem(self):
         """
@@ -456,6 +466,119 @@ class NocaseDict(object):
         """
         return (self < other) or (self == other)
 
+
+class _LazyItem(tuple):
+    """
+    An item of a `_LazyItems` dictionary whose value has not been created
+    yet: A tuple of the original key and the raw data of the value.
+    """
+    __slots__ = ()
+
+
+class _LazyItems(dict):
+    """
+    The item dictionary (`_data`) of a `_LazyNocaseDict`, which creates the
+    values of `_LazyItem` items on first access.
+
+    Like the item dictionary of `NocaseDict`_, it maps the lower-cased keys
+    to tuples of the original key and the value. All methods that return
+    values replace `_LazyItem` items by such tuples, with the value returned
+    by `materialize(raw)`. Copies of the dictionary retain the items that
+    have not been created yet.
+    """
+
+    def __init__(self, materialize):
+        super(_LazyItems, self).__init__()
+        self.materialize = materialize
+
+    def __getitem__(self, key):
+        item = dict.__getitem__(self, key)
+        if item.__class__ is _LazyItem:
+            item = (item[0], self.materialize(item[1]))
+            dict.__setitem__(self, key, item)
+        return item
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def iteritems(self):
+        for key in self.keys():
+            yield (key, self[key])
+
+    def itervalues(self):
+        for key in self.keys():
+            yield self[key]
+
+    def copy(self):
+        result = _LazyItems(self.materialize)
+        for key in self.keys():
+            dict.__setitem__(result, key, dict.__getitem__(self, key))
+        return result
+
+
+class _LazyNocaseDict(NocaseDict):
+    """
+    A `NocaseDict`_ whose values can be added in a raw form, from which they
+    are created by a function on first access.
+
+    Apart from `set_lazy()`, it behaves like `NocaseDict`_, and creating the
+    values does not count as a change of the dictionary.
+    """
+
+    def __init__(self, materialize, *args, **kwargs):
+        super(_LazyNocaseDict, self).__init__(*args, **kwargs)
+        data = _LazyItems(materialize)
+        data.update(self._data)
+        self._data = data
+
+    def set_lazy(self, key, raw):
+        """
+        Add or replace the item for a key, with a value that is created by
+        calling the `materialize` function of the dictionary with `raw`,
+        when the value is first accessed.
+        """
+        if not isinstance(key, six.string_types):
+            raise TypeError('NocaseDict key %s must be string type, ' \
+                            'but is %s' %  (key, builtin_type(key)))
+        dict.__setitem__(self._data, key.lower(), _LazyItem((key, raw)))
+        self._version += 1
+
+    def is_materialized(self, key):
+        """
+        Return a boolean indicating whether the value for a key (which must
+        exist) has been created.
+        """
+        k = key
+        if isinstance(key, six.string_types):
+            k = k.lower()
+        return dict.__getitem__(self._data, k).__class__ is not _LazyItem
+
+    def iterkeys(self):
+        """
+        Return an iterator through the dictionary keys in their original
+        case, without creating any values.
+        """
+        for item in dict.values(self._data):
+            yield item[0]
+
+    def copy(self):
+        """
+        Return a shallow copy of the dictionary, in which the values that
+        have not been created yet are created independently.
+        """
+        result = _LazyNocaseDict(self._data.materialize)
+        result._data = self._data.copy() # pylint: disable=protected-access
+        return result
+
+
 def _intended_value(intended, unspecified, actual, name, msg):
     """
     Return the intended value if the actual value is unspecified or has
@@ -550,6 +673,207 @@ def cmpitem(item1, item2):
     except TypeError:
         return -1  # if non-orderable, return arbitrary result
 
+def _fingerprint_name(name):
+    """
+    Return the representation of a CIM name in a content fingerprint.
+    CIM names are compared case-insensitively.
+    """
+    if name is None:
+        return None
+    return _ensure_unicode(name).lower()
+
+def _fingerprint_value(value):
+    # pylint: disable=too-many-return-statements
+    """
+    Return a JSON-serializable representation of a value (CIM value or
+    other attribute of a CIM object) in a content fingerprint.
+
+    Values that are equal must have the same representation; for example,
+    integer values of different CIM data types that are equal are
+    represented as the same integer. Values that are not equal may have the
+    same representation, in which case their CIM objects are compared with
+    `_cmp()`.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, six.integer_types):
+        return int(value)
+    if isinstance(value, float):
+        if math.isinf(value) or math.isnan(value):
+            return {'float': repr(value)}
+        if value == int(value):
+            return int(value)
+        return {'float': '%.17g' % value}
+    if isinstance(value, six.string_types):
+        return _ensure_unicode(value)
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint_value(item) for item in value]
+    if isinstance(value, NocaseDict):
+        return sorted([[key.lower(), _fingerprint_value(item)]
+                       for key, (dummy_key, item) in value._data.items()]) # pylint: disable=protected-access
+    if isinstance(value, _CIMFingerprintMixin):
+        return {'fingerprint': value.fingerprint()}
+    if isinstance(value, CIMDateTime):
+        if value.datetime is not None:
+            utc = value.datetime - value.datetime.utcoffset()
+            return {'datetime': utc.replace(tzinfo=None).isoformat()}
+        delta = value.timedelta
+        return {'interval': [delta.days, delta.seconds, delta.microseconds]}
+    if isinstance(value, CIMProperty):
+        return ['property', _fingerprint_name(value.name),
+                _fingerprint_value(value.value), value.type,
+                _fingerprint_name(value.reference_class),
+                _fingerprint_value(value.is_array),
+                _fingerprint_value(value.array_size),
+                _fingerprint_value(value.propagated),
+                _fingerprint_value(value.class_origin),
+                _fingerprint_value(value.qualifiers)]
+    if isinstance(value, CIMQualifier):
+        return ['qualifier', _fingerprint_name(value.name), value.type,
+                _fingerprint_value(value.value),
+                _fingerprint_value(value.propagated),
+                _fingerprint_value(value.overridable),
+                _fingerprint_value(value.tosubclass),
+                _fingerprint_value(value.toinstance),
+                _fingerprint_value(value.translatable)]
+    if isinstance(value, CIMMethod):
+        return ['method', _fingerprint_name(value.name),
+                _fingerprint_value(value.qualifiers),
+                _fingerprint_value(value.parameters), value.return_type,
+                _fingerprint_value(value.class_origin),
+                _fingerprint_value(value.propagated)]
+    if isinstance(value, CIMParameter):
+        return ['parameter', _fingerprint_name(value.name), value.type,
+                _fingerprint_name(value.reference_class),
+                _fingerprint_value(value.is_array),
+                _fingerprint_value(value.array_size),
+                _fingerprint_value(value.qualifiers),
+                _fingerprint_value(value.value)]
+    # Values of other types all have the same representation
+    return {'other': None}
+
+class _CIMFingerprintMixin(object):
+    """
+    Mixin class providing a cached content fingerprint for CIM objects.
+
+    Subclasses define `_fingerprint_attrs`, the names of the attributes
+    that the fingerprint depends on, and implement `_fingerprint_content()`,
+    which returns the JSON-serializable content that is hashed.
+
+    The cached fingerprint is valid as long as these attributes, and those
+    of all contained CIM objects, reference the same objects, the contained
+    lists have the same items, and the contained `NocaseDict` dictionaries
+    have not been changed. This check compares object identities only, so
+    it is much faster than computing the fingerprint, but it visits all
+    contained objects.
+    """
+
+    _fingerprint_cache = None
+
+    def fingerprint(self):
+        """
+        Return the content fingerprint of the CIM object, as a
+        :term:`unicode string` of 40 hexadecimal digits.
+
+        Two CIM objects that are equal have the same fingerprint. The
+        fingerprint does not depend on the Python version or process, so it
+        can be persisted as a key for detecting changes of the CIM object.
+
+        The fingerprint is computed on first use and then cached. The cached
+        fingerprint is invalidated by any change of the CIM object, including
+        changes of the attributes of contained CIM objects (for example,
+        ``inst.properties[name].value = value``) and changes of list values in
+        place.
+
+        Once both objects have a valid cached fingerprint, the `==` and `!=`
+        operators use them to detect objects that are not equal without
+        comparing their content.
+        """
+        state = self._fingerprint_state()
+        cache = self._fingerprint_cache
+        if cache is not None and _same_state(cache[0], state):
+            return cache[1]
+        data = json.dumps([self.__class__.__name__,
+                           self._fingerprint_content()],
+                          sort_keys=True, separators=(',', ':'))
+        fingerprint = _ensure_unicode(
+            hashlib.sha1(_ensure_bytes(data)).hexdigest())
+        self._fingerprint_cache = (state, fingerprint)
+        return fingerprint
+
+
+    def _fingerprint_state(self):
+        """Return the objects and dictionary versions that the fingerprint
+        depends on, as a tuple of two lists."""
+        objs = []
+        versions = []
+        _add_fingerprint_state(self, objs, versions)
+        return (objs, versions)
+
+    def _cached_fingerprint(self):
+        """Return the cached fingerprint if it is valid, or `None`."""
+        cache = self._fingerprint_cache
+        if cache is not None and \
+                _same_state(cache[0], self._fingerprint_state()):
+            return cache[1]
+        return None
+
+    def _fingerprints_differ(self, other):
+        """Return a boolean indicating whether the objects are known to be
+        unequal because their cached fingerprints differ."""
+        # pylint: disable=protected-access
+        if not isinstance(other, self.__class__) or \
+                self._fingerprint_cache is None or \
+                other._fingerprint_cache is None:
+            return False
+        mine = self._cached_fingerprint()
+        theirs = other._cached_fingerprint()
+        return mine is not None and theirs is not None and mine != theirs
+
+    def __eq__(self, other):
+        if self._fingerprints_differ(other):
+            return False
+        return self._cmp(other) == 0
+
+    def __ne__(self, other):
+        if self._fingerprints_differ(other):
+            return True
+        return self._cmp(other) != 0
+
+
+def _add_fingerprint_state(value, objs, versions):
+    """
+    Add the objects and dictionary versions that the fingerprint of a value
+    depends on to the lists `objs` and `versions`: The value itself, and
+    recursively the items of lists, the values of `NocaseDict` dictionaries
+    and the `_fingerprint_attrs` attributes of CIM objects.
+    """
+    objs.append(value)
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _add_fingerprint_state(item, objs, versions)
+    elif isinstance(value, NocaseDict):
+        versions.append(value._version) # pylint: disable=protected-access
+        for dummy_key, item in value._data.values(): # pylint: disable=protected-access
+            _add_fingerprint_state(item, objs, versions)
+    else:
+        for name in getattr(value, '_fingerprint_attrs', ()):
+            _add_fingerprint_state(getattr(value, name), objs, versions)
+
+def _same_state(state1, state2):
+    """Return a boolean indicating whether two fingerprint states (lists
+    of objects and of dictionary versions) are the same."""
+    objs1, versions1 = state1
+    objs2, versions2 = state2
+    if versions1 != versions2 or len(objs1) != len(objs2):
+        return False
+    for obj1, obj2 in zip(objs1, objs2):
+        if obj1 is not obj2:
+            return False
+    return True
+
 def _convert_unicode(obj):
     """
     Convert the input object into a Unicode string (`unicode`for Python 2,
@@ -774,7 +1098,7 @@ def moftype(cim_type, refclass):
     return (refclass + ' REF') if cim_type == 'reference' else cim_type
 
 
-class CIMInstanceName(_CIMComparisonMixin):
+class CIMInstanceName(_CIMFingerprintMixin, _CIMComparisonMixin):
     """
     A CIM instance path (aka *instance name*).
 
@@ -809,6 +1133,9 @@ class CIMInstanceName(_CIMComparisonMixin):
         `None` means that the namespace is unspecified.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('classname', 'host', 'namespace', 'keybindings')
+
     def __init__(self, classname, keybindings=None, host=None, namespace=None):
         """
         Parameters:
@@ -877,6 +1204,13 @@ class CIMInstanceName(_CIMComparisonMixin):
                 cmpname(self.classname, other.classname) or
                 cmpitem(self.keybindings, other.keybindings))
 
+    def _fingerprint_content(self):
+        """Return the content of the fingerprint."""
+        return [_fingerprint_name(self.host),
+                _fingerprint_name(self.namespace),
+                _fingerprint_name(self.classname),
+                _fingerprint_value(self.keybindings)]
+
     def __str__(self):
         """Return the untyped WBEM URI of the CIM instance path represented
         by the :class:`~pywbem.CIMInstanceName` object.
@@ -1105,7 +1439,7 @@ class CIMInstanceName(_CIMComparisonMixin):
 
         return instancename_xml
 
-class CIMInstance(_CIMComparisonMixin):
+class CIMInstance(_CIMFingerprintMixin, _CIMComparisonMixin):
     """
     A CIM instance, optionally including its instance path.
 
@@ -1145,6 +1479,9 @@ class CIMInstance(_CIMComparisonMixin):
         `None` means that the properties are not filtered.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('classname', 'path', 'properties', 'qualifiers')
+
     # pylint: disable=too-many-arguments
     def __init__(self, classname, properties=None, qualifiers=None,
                  path=None, property_list=None):
@@ -1229,6 +1566,13 @@ class CIMInstance(_CIMComparisonMixin):
                 cmpitem(self.properties, other.properties) or
                 cmpitem(self.qualifiers, other.qualifiers))
 
+    def _fingerprint_content(self):
+        """Return the content of the fingerprint."""
+        return [_fingerprint_name(self.classname),
+                _fingerprint_value(self.path),
+                _fingerprint_value(self.properties),
+                _fingerprint_value(self.qualifiers)]
+
     def __str__(self):
         """Return a short string representation of the
         :class:`~pywbem.CIMInstance` object for human consumption."""
@@ -1640,7 +1984,7 @@ class CIMClassName(_CIMComparisonMixin):
         return cim_xml.CLASSNAME(self.classname)
 
 
-class CIMClass(_CIMComparisonMixin):
+class CIMClass(_CIMFingerprintMixin, _CIMComparisonMixin):
     """A CIM class.
 
     Attributes:
@@ -1672,6 +2016,10 @@ class CIMClass(_CIMComparisonMixin):
         constructor parameter.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('classname', 'superclass', 'qualifiers',
+                          'properties', 'methods')
+
     # pylint: disable=too-many-arguments
     def __init__(self, classname, properties=None, methods=None,
                  superclass=None, qualifiers=None):
@@ -1748,6 +2096,14 @@ class CIMClass(_CIMComparisonMixin):
                 cmpitem(self.properties, other.properties) or
                 cmpitem(self.methods, other.methods))
 
+    def _fingerprint_content(self):
+        """Return the content of the fingerprint."""
+        return [_fingerprint_name(self.classname),
+                _fingerprint_name(self.superclass),
+                _fingerprint_value(self.qualifiers),
+                _fingerprint_value(self.properties),
+                _fingerprint_value(self.methods)]
+
     def __str__(self):
         """Return a short string representation of the
         :class:`~pywbem.CIMClass` object for human consumption."""
@@ -1929,6 +2285,11 @@ class CIMProperty(_CIMComparisonMixin):
         constructor parameter.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('name', 'value', 'type', 'reference_class',
+                          'is_array', 'array_size', 'propagated',
+                          'class_origin', 'qualifiers')
+
     # pylint: disable=too-many-statements
     def __init__(self, name, value, type=None,
                  class_origin=None, array_size=None, propagated=None,
@@ -2455,6 +2816,10 @@ class CIMMethod(_CIMComparisonMixin):
         constructor parameter.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('name', 'qualifiers', 'parameters', 'return_type',
+                          'class_origin', 'propagated')
+
     # pylint: disable=too-many-arguments
     def __init__(self, methodname, return_type=None, parameters=None,
                  class_origin=None, propagated=False, qualifiers=None):
@@ -2656,6 +3021,10 @@ class CIMParameter(_CIMComparisonMixin):
         invocations. Parameter declarations do not have a default value.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('name', 'type', 'reference_class', 'is_array',
+                          'array_size', 'qualifiers', 'value')
+
     # pylint: disable=too-many-arguments
     def __init__(self, name, type, reference_class=None, is_array=None,
                  array_size=None, qualifiers=None, value=None):
@@ -2919,6 +3288,11 @@ class CIMQualifier(_CIMComparisonMixin):
         `None` means that this information is not available.
     """
 
+    # Attributes that the fingerprint depends on
+    _fingerprint_attrs = ('name', 'type', 'value', 'propagated',
+                          'overridable', 'tosubclass', 'toinstance',
+                          'translatable')
+
     #pylint: disable=too-many-arguments
     def __init__(self, name, value, type=None, propagated=None,
                  overridable=None, tosubclass=None, toinstance=None,
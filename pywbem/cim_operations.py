@@ -79,6 +79,9 @@ WBEMConnection method                                   Purpose
 from __future__ import absolute_import
 
 import re
+import copy
+import functools
+import threading
 from datetime import datetime, timedelta
 from xml.dom import minidom
 from xml.parsers.expat import ExpatError
@@ -89,17 +92,28 @@ from . import cim_xml
 from .cim_constants import DEFAULT_NAMESPACE
 from .cim_types import CIMType, CIMDateTime, atomic_to_cim_xml
 from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, \
-                     CIMClassName, NocaseDict, _ensure_unicode, tocimxml, \
-                     tocimobj
-from .cim_http import get_object_header, wbem_request
-from .tupleparse import parse_cim
+                     CIMClassName, NocaseDict, _ensure_unicode, \
+                     _ensure_bytes, tocimxml, tocimobj
+from .cim_http import get_object_header, HTTPTransport, \
+    _MultiReqUnsupportedError
+from .tupleparse import parse_cim, parse_cim_columns
 from .tupletree import dom_to_tupletree
+from .instance_table import _InstanceTableBuilder
+from ._threadpool import run_concurrently
 from .exceptions import Error, ParseError, AuthError, ConnectionError, \
                         TimeoutError, CIMError
 
 __all__ = ['WBEMConnection', 'PegasusUDSConnection', 'SFCBUDSConnection',
            'OpenWBEMUDSConnection']
 
+# Intrinsic operations that do not modify CIM objects
+_READ_ONLY_OPERATIONS = set(['GetClass', 'EnumerateClasses',
+                             'EnumerateClassNames', 'GetInstance',
+                             'EnumerateInstances', 'EnumerateInstanceNames',
+                             'Associators', 'AssociatorNames', 'References',
+                             'ReferenceNames', 'ExecQuery', 'GetQualifier',
+                             'EnumerateQualifiers'])
+
 
 if len(u'\U00010122') == 2:
     # This is a "narrow" Unicode build of Python (the normal case).
@@ -291,6 +305,68 @@ def check_utf8_xml_chars(utf8_xml, meaning):
     return utf8_xml
 
 
+def _imethodcall_element(methodname, namespace, params):
+    """Return the IMETHODCALL element for an intrinsic method call."""
+
+    # Create parameter list
+
+    plist = [cim_xml.IPARAMVALUE(x[0], tocimxml(x[1])) \
+             for x in params.items() if x[1] is not None]
+
+    return cim_xml.IMETHODCALL(
+        methodname,
+        cim_xml.LOCALNAMESPACEPATH(
+            [cim_xml.NAMESPACE(ns) for ns in namespace.split('/')]),
+        plist)
+
+
+def _imethodresponse_result(simplersp, methodname):
+    """Return the IRETURNVALUE element of a parsed SIMPLERSP element of an
+    intrinsic method call, or `None` if the IMETHODRESPONSE element is empty.
+    Raise CIMError if the response is an ERROR element."""
+
+    tup_tree = simplersp[2]
+
+    if tup_tree[0] != 'IMETHODRESPONSE':
+        raise ParseError('Expecting IMETHODRESPONSE element, got %s' %\
+                         tup_tree[0])
+
+    if tup_tree[1]['NAME'] != methodname:
+        raise ParseError('Expecting attribute NAME=%s, got %s' %\
+                         (methodname, tup_tree[1]['NAME']))
+    tup_tree = tup_tree[2]
+
+    # At this point we either have a IRETURNVALUE, ERROR element
+    # or None if there was no child nodes of the IMETHODRESPONSE
+    # element.
+
+    if tup_tree is None:
+        return None
+
+    if tup_tree[0] == 'ERROR':
+        code = int(tup_tree[1]['CODE'])
+        if 'DESCRIPTION' in tup_tree[1]:
+            raise CIMError(code, tup_tree[1]['DESCRIPTION'])
+        raise CIMError(code, 'Error code %s' % tup_tree[1]['CODE'])
+
+    if tup_tree[0] != 'IRETURNVALUE':
+        raise ParseError('Expecting IRETURNVALUE element, got %s' \
+                         % tup_tree[0])
+
+    return tup_tree
+
+
+class _InFlightCall(object):
+    """An operation that is in progress in one thread, for the threads that
+    wait for its result."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.exc = None
+
+
 class WBEMConnection(object):
     """
     A client's connection to a WBEM server. This is the main class of the
@@ -397,7 +473,9 @@ class WBEMConnection(object):
 
     def __init__(self, url, creds=None, default_namespace=DEFAULT_NAMESPACE,
                  x509=None, verify_callback=None, ca_certs=None,
-                 no_verification=False, timeout=None):
+                 no_verification=False, timeout=None, transport=None,
+                 response_cache=None, coalesce_requests=False,
+                 lazy_properties=False):
         """
         Parameters:
 
@@ -550,6 +628,39 @@ class WBEMConnection(object):
             Note that not all situations can be handled within this timeout, so
             for some issues, operations may take longer before raising an
             exception.
+
+          transport (:class:`~pywbem.WBEMTransport`):
+            The transport that sends the CIM-XML requests to the WBEM server
+            and returns the CIM-XML responses. For example, a
+            :class:`~pywbem.WBEMRecorder` or a :class:`~pywbem.WBEMReplayer`.
+
+            If `None`, a new :class:`~pywbem.HTTPTransport` object is used.
+
+          response_cache (:class:`~pywbem.ResponseCache`):
+            A cache for the responses of the read-only intrinsic operations
+            of the connection. The operations of the connection that modify
+            CIM objects invalidate the affected cache entries.
+
+            If `None`, the responses are not cached.
+
+          coalesce_requests (:class:`py:bool`):
+            Coalesce identical read-only intrinsic operations that are issued
+            concurrently by multiple threads: Only the first of them sends a
+            request to the WBEM server, and the others wait for its response
+            and return deep copies of its result (or raise the same
+            exception).
+
+          lazy_properties (:class:`py:bool`):
+            Parse the properties of the instances returned by the
+            EnumerateInstances, GetInstance, GetInstances, Associators and
+            References operations only when they are first accessed, and
+            discard the properties that are not in the `PropertyList`
+            argument of the operation, also if the WBEM server returns them.
+            This saves processing time and memory if only some of the
+            properties are used.
+
+            Note that errors in the representation of a property are then
+            raised as :exc:`~pywbem.ParseError` on its first access.
         """
 
         self.url = url
@@ -560,6 +671,16 @@ class WBEMConnection(object):
         self.no_verification = no_verification
         self.default_namespace = default_namespace
         self.timeout = timeout
+        if transport is None:
+            transport = HTTPTransport()
+        self.transport = transport
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
+        self.lazy_properties = lazy_properties
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        # Set when the WBEM server has rejected a multiple operation request
+        self._multireq_unsupported = False
 
         self.debug = False
         self.last_raw_request = None
@@ -597,10 +718,14 @@ class WBEMConnection(object):
             creds_repr = repr(self.creds)
         return "%s(url=%r, creds=%s, " \
                "default_namespace=%r, x509=%r, verify_callback=%r, " \
-               "ca_certs=%r, no_verification=%r, timeout=%r)" % \
+               "ca_certs=%r, no_verification=%r, timeout=%r, transport=%r, " \
+               "response_cache=%r, coalesce_requests=%r, " \
+               "lazy_properties=%r)" % \
                (self.__class__.__name__, self.url, creds_repr,
                 self.default_namespace, self.x509, self.verify_callback,
-                self.ca_certs, self.no_verification, self.timeout)
+                self.ca_certs, self.no_verification, self.timeout,
+                self.transport, self.response_cache, self.coalesce_requests,
+                self.lazy_properties)
 
     def imethodcall(self, methodname, namespace, **params):
         """
@@ -615,6 +740,13 @@ class WBEMConnection(object):
         For compatibility reasons, it has not been renamed to become a private
         member.
         """
+        return self._imethodcall(methodname, namespace, params)
+
+    def _imethodcall(self, methodname, namespace, params, parser=parse_cim):
+        """
+        Perform an intrinsic method call, and return the IRETURNVALUE element
+        of the response, as parsed from its tuple tree with `parser`.
+        """
 
         # Create HTTP headers
 
@@ -622,22 +754,12 @@ class WBEMConnection(object):
                    'CIMMethod: %s' % methodname,
                    get_object_header(namespace)]
 
-        # Create parameter list
-
-        plist = [cim_xml.IPARAMVALUE(x[0], tocimxml(x[1])) \
-                 for x in params.items() if x[1] is not None]
-
         # Build XML request
 
         req_xml = cim_xml.CIM(
             cim_xml.MESSAGE(
                 cim_xml.SIMPLEREQ(
-                    cim_xml.IMETHODCALL(
-                        methodname,
-                        cim_xml.LOCALNAMESPACEPATH(
-                            [cim_xml.NAMESPACE(ns)
-                             for ns in namespace.split('/')]),
-                        plist)),
+                    _imethodcall_element(methodname, namespace, params)),
                 '1001', '1.0'),
             '2.0', '2.0')
 
@@ -648,28 +770,92 @@ class WBEMConnection(object):
             self.last_raw_reply = None
             self.last_reply = None
 
+        # Only the results of parse_cim() can be shared; other parsers may
+        # return the state of the caller
+        if self.coalesce_requests and \
+                getattr(parser, 'func', parser) is parse_cim and \
+                methodname in _READ_ONLY_OPERATIONS:
+            return self._coalesce(
+                _ensure_bytes(req_xml.toxml()),
+                lambda: self._imethodcall_response(methodname, namespace,
+                                                   params, req_xml, headers,
+                                                   parser))
+        return self._imethodcall_response(methodname, namespace, params,
+                                          req_xml, headers, parser)
+
+    def _imethodcall_response(self, methodname, namespace, params, req_xml,
+                              headers, parser=parse_cim):
+        """
+        Send the request of an intrinsic method call (or look up its response
+        in the response cache), and return the IRETURNVALUE element of the
+        response, as parsed with `parser`.
+        """
+
+        # Look up the response in the response cache
+
+        cache = self.response_cache
+        cache_key = None
+        reply_xml = None
+        if cache is not None:
+            cache_key = cache.key(methodname, namespace, params)
+            if cache_key is not None:
+                generation = cache.generation
+                reply_xml = cache.get(cache_key)
+
         # Send request and receive response
 
-        try:
-            reply_xml = wbem_request(
-                self.url, req_xml.toxml(), self.creds, headers,
-                x509=self.x509,
-                verify_callback=self.verify_callback,
-                ca_certs=self.ca_certs,
-                no_verification=self.no_verification,
-                timeout=self.timeout)
-        except (AuthError, ConnectionError, TimeoutError, Error):
-            raise
-        # TODO 3/16 AM: Clean up exception handling. The next two lines are a
-        # workaround in order not to ignore TypeError and other exceptions
-        # that may be raised.
-        except Exception:
-            raise
+        if reply_xml is None:
+            try:
+                response = self.transport.send(
+                    self.url, _ensure_bytes(req_xml.toxml()), headers,
+                    creds=self.creds,
+                    x509=self.x509,
+                    verify_callback=self.verify_callback,
+                    ca_certs=self.ca_certs,
+                    no_verification=self.no_verification,
+                    timeout=self.timeout)
+                try:
+                    reply_xml = response.read()
+                finally:
+                    response.close()
+            except (AuthError, ConnectionError, TimeoutError, Error):
+                raise
+            # TODO 3/16 AM: Clean up exception handling. The next two lines
+            # are a workaround in order not to ignore TypeError and other
+            # exceptions that may be raised.
+            except Exception:
+                raise
+            finally:
+                # The operation may have modified CIM objects even if it
+                # failed
+                if cache is not None and cache_key is None:
+                    cache.invalidate(methodname, namespace, params)
+        else:
+            cache_key = None  # Already cached
 
         # Set the raw response before parsing (which can fail)
         if self.debug:
             self.last_raw_reply = reply_xml
 
+        messages = self._parse_reply(reply_xml, parser)
+        if len(messages) != 1 or messages[0][0] != 'SIMPLERSP':
+            raise ParseError('Expecting one SIMPLERSP element')
+        tup_tree = _imethodresponse_result(messages[0], methodname)
+        if tup_tree is None:
+            return None
+
+        if cache_key is not None:
+            cache.put(cache_key, reply_xml, params, generation)
+
+        return tup_tree
+
+    def _parse_reply(self, reply_xml, parser=parse_cim):
+        """
+        Parse the CIM-XML response data of an operation with `parser` (a
+        function that parses the tuple tree of the CIM element), and return
+        the list of its SIMPLERSP elements.
+        """
+
         try:
             reply_dom = minidom.parseString(reply_xml)
         except ParseError as exc:
@@ -714,7 +900,7 @@ class WBEMConnection(object):
 
         # Parse response
 
-        tup_tree = parse_cim(dom_to_tupletree(reply_dom))
+        tup_tree = parser(dom_to_tupletree(reply_dom))
 
         if tup_tree[0] != 'CIM':
             raise ParseError('Expecting CIM element, got %s' % tup_tree[0])
@@ -724,37 +910,113 @@ class WBEMConnection(object):
             raise ParseError('Expecting MESSAGE element, got %s' % tup_tree[0])
         tup_tree = tup_tree[2]
 
-        if len(tup_tree) != 1 or tup_tree[0][0] != 'SIMPLERSP':
-            raise ParseError('Expecting one SIMPLERSP element')
-        tup_tree = tup_tree[0][2]
+        return tup_tree
 
-        if tup_tree[0] != 'IMETHODRESPONSE':
-            raise ParseError('Expecting IMETHODRESPONSE element, got %s' %\
-                             tup_tree[0])
+    def _instance_parser(self, PropertyList):
+        # pylint: disable=invalid-name
+        """
+        Return the parser for the responses of the operations that return
+        instances with the properties in `PropertyList`, which parses their
+        properties lazily if the `lazy_properties` attribute is set.
+        """
+        if not self.lazy_properties:
+            return parse_cim
+        return functools.partial(parse_cim, lazy_properties=True,
+                                 property_list=PropertyList)
 
-        if tup_tree[1]['NAME'] != methodname:
-            raise ParseError('Expecting attribute NAME=%s, got %s' %\
-                             (methodname, tup_tree[1]['NAME']))
-        tup_tree = tup_tree[2]
+    def _coalesce(self, key, call):
+        """
+        Return the result of `call()`, sharing a single invocation among the
+        threads that request the same key concurrently.
+
+        The first thread invokes `call()`; the other threads wait for it and
+        receive deep copies of its result, or the exception it raised.
+        """
 
-        # At this point we either have a IRETURNVALUE, ERROR element
-        # or None if there was no child nodes of the IMETHODRESPONSE
-        # element.
+        with self._in_flight_lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _InFlightCall()
+            else:
+                flight.waiters += 1
+        if not leader:
+            flight.done.wait()
+            if flight.exc is not None:
+                raise flight.exc
+            return copy.deepcopy(flight.result)
 
-        if tup_tree is None:
-            return None
+        try:
+            flight.result = call()
+        except Exception as exc:
+            flight.exc = exc
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            flight.done.set()
+        # The waiters copy the result concurrently, so the caller must not
+        # get the original
+        if flight.waiters:
+            return copy.deepcopy(flight.result)
+        return flight.result
+
+    def _imethodcall_multi(self, methodname, calls, parser=parse_cim):
+        """
+        Perform several intrinsic method calls in a single multiple operation
+        request (MULTIREQ element), and return a list with the IRETURNVALUE
+        element (or `None`) or the :exc:`~pywbem.CIMError` exception of each
+        call, in the order of `calls`, as parsed with `parser`.
 
-        if tup_tree[0] == 'ERROR':
-            code = int(tup_tree[1]['CODE'])
-            if 'DESCRIPTION' in tup_tree[1]:
-                raise CIMError(code, tup_tree[1]['DESCRIPTION'])
-            raise CIMError(code, 'Error code %s' % tup_tree[1]['CODE'])
+        `calls` is a list of at least two tuples (namespace, params).
+        """
 
-        if tup_tree[0] != 'IRETURNVALUE':
-            raise ParseError('Expecting IRETURNVALUE element, got %s' \
-                             % tup_tree[0])
+        headers = ['CIMOperation: MethodCall',
+                   'CIMBatch:']
 
-        return tup_tree
+        req_xml = cim_xml.CIM(
+            cim_xml.MESSAGE(
+                cim_xml.MULTIREQ(
+                    [cim_xml.SIMPLEREQ(
+                        _imethodcall_element(methodname, namespace, params))
+                     for namespace, params in calls]),
+                '1001', '1.0'),
+            '2.0', '2.0')
+
+        if self.debug:
+            self.last_raw_request = req_xml.toxml()
+            self.last_request = req_xml.toprettyxml(indent='  ')
+            # Reset replies in case we fail before they are set
+            self.last_raw_reply = None
+            self.last_reply = None
+
+        response = self.transport.send(
+            self.url, _ensure_bytes(req_xml.toxml()), headers,
+            creds=self.creds,
+            x509=self.x509,
+            verify_callback=self.verify_callback,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout)
+        try:
+            reply_xml = response.read()
+        finally:
+            response.close()
+
+        if self.debug:
+            self.last_raw_reply = reply_xml
+
+        messages = self._parse_reply(reply_xml, parser)
+        if len(messages) != len(calls):
+            raise ParseError('Expecting %d SIMPLERSP elements, got %d' %
+                             (len(calls), len(messages)))
+        results = []
+        for simplersp in messages:
+            try:
+                results.append(_imethodresponse_result(simplersp, methodname))
+            except CIMError as exc:
+                results.append(exc)
+        return results
 
     # pylint: disable=invalid-name
     def methodcall(self, methodname, localobject, Params=None, **params):
@@ -870,13 +1132,18 @@ class WBEMConnection(object):
         # Send request and receive response
 
         try:
-            reply_xml = wbem_request(
-                self.url, req_xml.toxml(), self.creds, headers,
+            response = self.transport.send(
+                self.url, _ensure_bytes(req_xml.toxml()), headers,
+                creds=self.creds,
                 x509=self.x509,
                 verify_callback=self.verify_callback,
                 ca_certs=self.ca_certs,
                 no_verification=self.no_verification,
                 timeout=self.timeout)
+            try:
+                reply_xml = response.read()
+            finally:
+                response.close()
         except (AuthError, ConnectionError, TimeoutError, Error):
             raise
         # TODO 3/16 AM: Clean up exception handling. The next two lines are a
@@ -884,6 +1151,12 @@ class WBEMConnection(object):
         # that may be raised.
         except Exception:
             raise
+        finally:
+            # The method may have modified CIM objects even if it failed
+            if self.response_cache is not None:
+                self.response_cache.invalidate(
+                    'InvokeMethod',
+                    localobject.namespace or self.default_namespace)
 
         # Set the raw response before parsing and checking (which can fail)
         if self.debug:
@@ -1216,16 +1489,17 @@ class WBEMConnection(object):
         namespace = self._iparam_namespace_from(namespace)
         classname = self._iparam_classname(ClassName)
 
-        result = self.imethodcall(
+        result = self._imethodcall(
             'EnumerateInstances',
             namespace,
-            ClassName=classname,
-            LocalOnly=LocalOnly,
-            DeepInheritance=DeepInheritance,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            **extra)
+            dict(ClassName=classname,
+                 LocalOnly=LocalOnly,
+                 DeepInheritance=DeepInheritance,
+                 IncludeQualifiers=IncludeQualifiers,
+                 IncludeClassOrigin=IncludeClassOrigin,
+                 PropertyList=PropertyList,
+                 **extra),
+            self._instance_parser(PropertyList))
 
         instances = []
         if result is not None:
@@ -1236,6 +1510,90 @@ class WBEMConnection(object):
 
         return instances
 
+    def EnumerateInstanceTable(self, ClassName, PropertyList=None,
+                               namespace=None, LocalOnly=None,
+                               DeepInheritance=None, use_numpy=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the instances of a class (including instances of its
+        subclasses) in a namespace, and return their property values by
+        column, as an :class:`~pywbem.InstanceTable`.
+
+        This method performs the EnumerateInstances operation (see
+        :term:`DSP0200`), but parses the instances in the response directly
+        into the typed columns of the table, without creating
+        :class:`~pywbem.CIMInstance` or :class:`~pywbem.CIMProperty`
+        objects. The values of properties that are not in `PropertyList`
+        are not parsed, also if the WBEM server returns them. This is
+        intended for collecting metrics, for example from instances of
+        ``CIM_BlockStorageStatisticalData``.
+
+        Qualifiers and class origin information are not requested.
+
+        If the operation succeeds, this method returns.
+        Otherwise, this method raises an exception.
+
+        Parameters:
+
+          ClassName (:term:`string` or :class:`~pywbem.CIMClassName`):
+            Name of the class to be enumerated, as in
+            :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+          PropertyList (:term:`py:iterable` of :term:`string`):
+            The names of the properties that have a column, in any lexical
+            case, in the order of the columns.
+
+            `None` means that all properties returned by the WBEM server
+            have a column.
+
+          namespace (:term:`string`):
+            Name of the CIM namespace to be used, as in
+            :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+          LocalOnly (:class:`py:bool`):
+            As in :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+          DeepInheritance (:class:`py:bool`):
+            As in :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+          use_numpy (:class:`py:bool`):
+            Use NumPy arrays for the columns. `None` means that NumPy arrays
+            are used if NumPy is installed.
+
+          **extra :
+            Additional keyword arguments are passed as additional operation
+            parameters to the WBEM server.
+
+        Returns:
+
+            :class:`~pywbem.InstanceTable`: The property values, with the
+            instance paths of the instances.
+
+        Raises:
+
+            Exceptions described in :class:`~pywbem.WBEMConnection`.
+        """
+
+        namespace = self._iparam_namespace_from(namespace)
+        classname = self._iparam_classname(ClassName)
+        if PropertyList is not None:
+            PropertyList = list(PropertyList)
+
+        builder = _InstanceTableBuilder(PropertyList)
+        params = dict(ClassName=classname,
+                      LocalOnly=LocalOnly,
+                      DeepInheritance=DeepInheritance,
+                      PropertyList=PropertyList,
+                      **extra)
+        self._imethodcall(
+            'EnumerateInstances', namespace, params,
+            lambda tup_tree: parse_cim_columns(tup_tree, builder))
+
+        for path in builder.paths:
+            path.namespace = namespace
+
+        return builder.table(use_numpy)
+
     def GetInstance(self, InstanceName, LocalOnly=None, IncludeQualifiers=None,
                     IncludeClassOrigin=None, PropertyList=None, **extra):
         # pylint: disable=invalid-name,line-too-long
@@ -1320,15 +1678,16 @@ class WBEMConnection(object):
         namespace = self._iparam_namespace_from(InstanceName)
         instancename = self._iparam_instancename(InstanceName)
 
-        result = self.imethodcall(
+        result = self._imethodcall(
             'GetInstance',
             namespace,
-            InstanceName=instancename,
-            LocalOnly=LocalOnly,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            **extra)
+            dict(InstanceName=instancename,
+                 LocalOnly=LocalOnly,
+                 IncludeQualifiers=IncludeQualifiers,
+                 IncludeClassOrigin=IncludeClassOrigin,
+                 PropertyList=PropertyList,
+                 **extra),
+            self._instance_parser(PropertyList))
 
         instance = result[2][0]
         instance.path = instancename
@@ -1336,6 +1695,159 @@ class WBEMConnection(object):
 
         return instance
 
+    def GetInstances(self, InstanceNames, LocalOnly=None,
+                     IncludeQualifiers=None, IncludeClassOrigin=None,
+                     PropertyList=None, max_workers=10, multireq=False,
+                     batch_size=100, **extra):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instances for a list of instance paths.
+
+        This method performs a GetInstance operation (see :term:`DSP0200`)
+        for each instance path, concurrently. A failed operation does not
+        affect the other operations; its exception is returned in place of
+        the instance.
+
+        Optionally, the GetInstance operations for the instance paths in the
+        same namespace are sent in batches, each as a multiple operation
+        request (see :term:`DSP0200`). If the WBEM server rejects multiple
+        operation requests, this method and subsequent calls of it on the
+        connection fall back to single operations.
+
+        The operations are performed on a pool of at most `max_workers`
+        shallow copies of this connection, which share its transport, its
+        response cache and its coalesced requests. Each copy has its own
+        `last_request`, `last_raw_request`, `last_reply` and `last_raw_reply`
+        attributes (recorded if `debug` is set on this connection), so they
+        are not overwritten concurrently; these attributes of this
+        connection are not changed by this method.
+
+        Parameters:
+
+          InstanceNames (:term:`py:iterable` of CIMInstanceName):
+            Instance paths of the instances to be retrieved. Instance paths
+            without a namespace are in the default namespace of the
+            connection.
+
+          LocalOnly, IncludeQualifiers, IncludeClassOrigin, PropertyList:
+            See :meth:`~pywbem.WBEMConnection.GetInstance`.
+
+          max_workers (:term:`integer`):
+            Maximum number of concurrent requests.
+
+          multireq (:class:`py:bool`):
+            Send the operations in multiple operation requests.
+
+          batch_size (:term:`integer`):
+            Maximum number of operations in a multiple operation request.
+
+        Keyword Arguments:
+
+          extra :
+            Additional keyword arguments are passed as additional operation
+            parameters to the WBEM server.
+
+        Returns:
+
+            A list with a :class:`~pywbem.CIMInstance` object for each
+            instance path that has been retrieved successfully and the
+            exception for each other instance path, in the order of
+            `InstanceNames`.
+
+        Raises:
+
+            TypeError: An instance path is not a
+              :class:`~pywbem.CIMInstanceName` object.
+        """
+
+        paths = list(InstanceNames)
+        for path in paths:
+            if not isinstance(path, CIMInstanceName):
+                raise TypeError('Expecting a CIMInstanceName object, got: %s' %
+                                type(path))
+        params = dict(LocalOnly=LocalOnly,
+                      IncludeQualifiers=IncludeQualifiers,
+                      IncludeClassOrigin=IncludeClassOrigin,
+                      PropertyList=PropertyList, **extra)
+
+        def get_instance(conn, index):
+            """Return the instance of a single operation, or its
+            exception."""
+            try:
+                return conn.GetInstance(paths[index], **params)
+            except Exception as exc:  # pylint: disable=broad-except
+                return exc
+
+        # Batches of indexes into paths, with the same namespace. Without
+        # multiple operation requests, each batch has a single index.
+        if not multireq or self._multireq_unsupported:
+            batch_size = 1
+        by_namespace = {}
+        for index, path in enumerate(paths):
+            namespace = self._iparam_namespace_from(path)
+            by_namespace.setdefault(namespace, []).append(index)
+        batches = []
+        for namespace in sorted(by_namespace.keys()):
+            indexes = by_namespace[namespace]
+            for pos in range(0, len(indexes), batch_size):
+                batches.append(indexes[pos:pos + batch_size])
+
+        def get_conn_batch(conn, batch):
+            """Return the results of the operations for a batch of indexes,
+            as instances or exceptions, using a connection of the pool."""
+            # pylint: disable=protected-access
+            if len(batch) == 1 or self._multireq_unsupported:
+                return [get_instance(conn, index) for index in batch]
+            calls = []
+            for index in batch:
+                call_params = dict(params)
+                call_params['InstanceName'] = \
+                    self._iparam_instancename(paths[index])
+                calls.append((self._iparam_namespace_from(paths[index]),
+                              call_params))
+            try:
+                results = conn._imethodcall_multi(
+                    'GetInstance', calls, self._instance_parser(PropertyList))
+            except _MultiReqUnsupportedError:
+                self._multireq_unsupported = True
+                return get_conn_batch(conn, batch)
+            instances = []
+            for (namespace, call_params), result in zip(calls, results):
+                if isinstance(result, Error):
+                    instances.append(result)
+                    continue
+                instance = result[2][0]
+                instance.path = call_params['InstanceName']
+                instance.path.namespace = namespace
+                instances.append(instance)
+            return instances
+
+        # The pool of copies of this connection that are not in use
+        idle_conns = []
+        pool_lock = threading.Lock()
+
+        def get_batch(batch):
+            """Return the results of the operations for a batch of indexes,
+            as instances or exceptions."""
+            with pool_lock:
+                conn = idle_conns.pop() if idle_conns else copy.copy(self)
+            try:
+                return get_conn_batch(conn, batch)
+            finally:
+                with pool_lock:
+                    idle_conns.append(conn)
+
+        instances = [None] * len(paths)
+        for batch, (results, exc_info) in zip(
+                batches, run_concurrently(get_batch,
+                                          [(batch,) for batch in batches],
+                                          max_workers)):
+            if exc_info is not None:
+                results = [exc_info[1]] * len(batch)
+            for index, result in zip(batch, results):
+                instances[index] = result
+        return instances
+
     def ModifyInstance(self, ModifiedInstance, IncludeQualifiers=None,
                        PropertyList=None, **extra):
         # pylint: disable=invalid-name,line-too-long
@@ -1737,18 +2249,19 @@ class WBEMConnection(object):
         namespace = self._iparam_namespace_from(ObjectName)
         objectname = self._iparam_objectname(ObjectName)
 
-        result = self.imethodcall(
+        result = self._imethodcall(
             'Associators',
             namespace,
-            ObjectName=objectname,
-            AssocClass=self._iparam_classname(AssocClass),
-            ResultClass=self._iparam_classname(ResultClass),
-            Role=Role,
-            ResultRole=ResultRole,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            **extra)
+            dict(ObjectName=objectname,
+                 AssocClass=self._iparam_classname(AssocClass),
+                 ResultClass=self._iparam_classname(ResultClass),
+                 Role=Role,
+                 ResultRole=ResultRole,
+                 IncludeQualifiers=IncludeQualifiers,
+                 IncludeClassOrigin=IncludeClassOrigin,
+                 PropertyList=PropertyList,
+                 **extra),
+            self._instance_parser(PropertyList))
 
         if result is None:
             return []
@@ -1943,16 +2456,17 @@ class WBEMConnection(object):
         namespace = self._iparam_namespace_from(ObjectName)
         objectname = self._iparam_objectname(ObjectName)
 
-        result = self.imethodcall(
+        result = self._imethodcall(
             'References',
             namespace,
-            ObjectName=objectname,
-            ResultClass=self._iparam_classname(ResultClass),
-            Role=Role,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList,
-            **extra)
+            dict(ObjectName=objectname,
+                 ResultClass=self._iparam_classname(ResultClass),
+                 Role=Role,
+                 IncludeQualifiers=IncludeQualifiers,
+                 IncludeClassOrigin=IncludeClassOrigin,
+                 PropertyList=PropertyList,
+                 **extra),
+            self._instance_parser(PropertyList))
 
         if result is None:
             return []
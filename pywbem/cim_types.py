@@ -243,8 +243,9 @@ class MinutesFromUTC(tzinfo):
 class CIMType(object):       # pylint: disable=too-few-public-methods
     """Base type for all CIM data types defined in this package."""
 
-    # Note: __str__() is not needed; the inherited method is used,
-    # even though there is a __repr__() method here.
+    # Note: __str__() is not needed for CIMDateTime; the inherited method is
+    # used, even though there is a __repr__() method here. The integer and
+    # float types define __str__().
 
     def __repr__(self):
         """Return a string representation suitable for debugging."""
@@ -506,6 +507,12 @@ class CIMDateTime(CIMType, _CIMComparisonMixin):
 class CIMInt(CIMType, _Longint):
     """Base type for integer CIM data types."""
 
+    def __str__(self):
+        # Since Python 3.8, int no longer has its own __str__() method, and
+        # the inherited object.__str__() would invoke __repr__() of CIMType,
+        # which in turn uses __str__().
+        return str(_Longint(self))
+
 class Uint8(CIMInt):
     """A value of CIM data type uint8."""
     cimtype = 'uint8'
@@ -543,6 +550,10 @@ class Sint64(CIMInt):
 class CIMFloat(CIMType, float):
     """Base type for real (floating point) CIM data types."""
 
+    def __str__(self):
+        # See CIMInt.__str__()
+        return str(float(self))
+
 class Real32(CIMFloat):
     """A value of CIM data type real32."""
     cimtype = 'real32'
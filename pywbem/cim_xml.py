@@ -361,7 +361,12 @@ class SCOPE(CIMElement):
         Element.__init__(self, 'SCOPE')
         if not scopes:
             scopes = {}
-        elif 'any' in scopes and scopes['any']:
+        # ANY is not an attribute of SCOPE; the MOF compiler provides it in
+        # upper case.
+        any_scope = [v for k, v in scopes.items() if k.upper() == 'ANY']
+        scopes = dict([(k, v) for k, v in scopes.items()
+                       if k.upper() != 'ANY'])
+        if any_scope and any_scope[0]:
             scopes = {'CLASS': True,
                       'ASSOCIATION': True,
                       'REFERENCE': True,
@@ -0,0 +1,354 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.IndicationBatcher` class is a delivery layer that sits
+between an indication listener and the consumers of the received indications.
+
+An indication listener invokes its callback once for every indication it
+receives. When WBEM servers retry deliveries, or when several indication
+filters match the same event, the same indication arrives more than once.
+An :class:`~pywbem.IndicationBatcher` object can be used as the callback of a
+listener (it is callable with a single indication), and it:
+
+* drops duplicate indications that arrive within a sliding window, based on a
+  configurable deduplication key, and
+* collects the remaining indications into batches, and invokes the consumer
+  once per batch, when the batch reaches a maximum size or a maximum age.
+
+Example, using the experimental listener in the ``irecv`` directory::
+
+    def consumer(indications):
+        for ind in indications:
+            print(ind['IndicationTime'])
+
+    batcher = IndicationBatcher(consumer, max_batch_size=50,
+                                max_batch_delay=2.0)
+    listener = CIMListener(batcher, https_port=None)
+    listener.run()
+"""
+
+from __future__ import absolute_import
+
+import time
+import threading
+from collections import deque
+
+import six
+
+__all__ = ['IndicationBatcher']
+
+# Names of the properties of CIM_Indication that are used by default for
+# identifying duplicate indications, in order of preference. Each item is a
+# tuple of property names whose values together identify an indication.
+_DEFAULT_DEDUP_PROPERTIES = (
+    ('IndicationIdentifier',),
+    ('SequenceContext', 'SequenceNumber'),
+)
+
+
+def _hashable(value):
+    """Return a hashable representation of a CIM property value."""
+    if isinstance(value, list):
+        return tuple([_hashable(v) for v in value])
+    if isinstance(value, six.string_types):
+        return value
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _property_key(indication, propnames):
+    """
+    Return the tuple of values of the specified properties of an indication,
+    or `None` if any of the properties does not exist or is `NULL`.
+    """
+    properties = indication.properties
+    values = []
+    for propname in propnames:
+        if propname not in properties:
+            return None
+        value = properties[propname].value
+        if value is None:
+            return None
+        values.append(_hashable(value))
+    return tuple(values)
+
+
+def _default_dedup_key(indication):
+    """
+    Default deduplication key function of `IndicationBatcher`.
+
+    It uses the value of the `IndicationIdentifier` property if that is set,
+    and otherwise the combination of the values of the `SequenceContext` and
+    `SequenceNumber` properties. If neither is set, `None` is returned, and the
+    indication is not subject to deduplication.
+
+    :Parameters:
+
+      indication (:class:`~pywbem.CIMInstance`):
+        The indication instance.
+
+    :Returns:
+        A hashable object, or `None`.
+    """
+    for propnames in _DEFAULT_DEDUP_PROPERTIES:
+        key = _property_key(indication, propnames)
+        if key is not None:
+            return (indication.classname.lower(),) + key
+    return None
+
+
+class IndicationBatcher(object):
+    """
+    A delivery layer for indications that batches and deduplicates them before
+    they are passed on to a consumer.
+
+    Objects of this class are callable with a single indication
+    (:class:`~pywbem.CIMInstance`) as an argument, so they can be used
+    wherever an indication listener expects a callback function.
+
+    The consumer is invoked with a list of indications (in the order in which
+    they were received) whenever one of the following happens:
+
+    * The batch has reached `max_batch_size` indications. The consumer is then
+      invoked in the thread that delivered the last indication.
+    * The oldest indication in the batch has been waiting for
+      `max_batch_delay` seconds. The consumer is then invoked in a timer
+      thread.
+    * :meth:`flush` or :meth:`close` is called. The consumer is then invoked in
+      the calling thread.
+
+    Batches are passed to the consumer one at a time, so the consumer does not
+    need to be reentrant. Exceptions raised by the consumer are propagated to
+    the thread in which it was invoked.
+
+    Objects of this class are thread-safe.
+    """
+
+    def __init__(self, consumer, max_batch_size=100, max_batch_delay=1.0,
+                 dedup_key=_default_dedup_key, dedup_window=60.0,
+                 dedup_max_entries=10000):
+        """
+        :Parameters:
+
+          consumer (callable):
+            Function that is invoked with a list of
+            :class:`~pywbem.CIMInstance` objects for each batch of indications.
+
+          max_batch_size (:term:`integer`):
+            Maximum number of indications in a batch. A value of 1 disables
+            batching (but not deduplication).
+
+          max_batch_delay (:term:`number`):
+            Maximum time in seconds that an indication waits in a batch before
+            the batch is passed to the consumer. `None` means that batches are
+            only passed on when they are full or when they are flushed
+            explicitly.
+
+          dedup_key (callable or list of :term:`string`):
+            Defines how duplicate indications are identified.
+
+            If callable, it is invoked with an indication, and must return a
+            hashable key, or `None` if the indication is not subject to
+            deduplication.
+
+            If a list of property names, the key is the tuple of the values of
+            these properties. Indications that do not have all of these
+            properties set are not subject to deduplication.
+
+            `None` disables deduplication.
+
+            By default, the key is the value of the `IndicationIdentifier`
+            property if that is set, and otherwise the combination of the
+            values of the `SequenceContext` and `SequenceNumber` properties
+            (both together with the class name of the indication).
+
+          dedup_window (:term:`number`):
+            Time in seconds during which a key is remembered. An indication
+            whose key has been seen in the past `dedup_window` seconds is a
+            duplicate and is dropped.
+
+          dedup_max_entries (:term:`integer`):
+            Maximum number of keys that are remembered. When this number is
+            exceeded, the oldest keys are forgotten even if their window has
+            not expired yet. This bounds the memory used for deduplication.
+            Must be at least 1; use `dedup_key=None` to disable
+            deduplication.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1, but is %r" %
+                             max_batch_size)
+        if dedup_max_entries < 1:
+            raise ValueError("dedup_max_entries must be at least 1, but is "
+                             "%r" % dedup_max_entries)
+
+        self.consumer = consumer
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.dedup_window = dedup_window
+        self.dedup_max_entries = dedup_max_entries
+
+        if dedup_key is None or callable(dedup_key):
+            self.dedup_key = dedup_key
+        else:
+            propnames = tuple(dedup_key)
+            self.dedup_key = lambda ind: _property_key(ind, propnames)
+
+        #: Number of indications delivered to this object.
+        self.received_count = 0
+        #: Number of indications that were dropped as duplicates.
+        self.duplicate_count = 0
+        #: Number of batches that were passed to the consumer.
+        self.batch_count = 0
+
+        self._batch = []
+        self._timer = None
+        self._closed = False
+
+        self._seen = {}          # key -> time the key was first seen
+        self._seen_order = deque()  # (time, key) in the order keys were seen
+
+        # Protects the state of this object.
+        self._lock = threading.Lock()
+        # Serializes the invocations of the consumer. Reentrant so that a
+        # consumer can deliver indications to this object itself.
+        self._deliver_lock = threading.RLock()
+
+    def __repr__(self):
+        return '%s(consumer=%r, max_batch_size=%r, max_batch_delay=%r, ' \
+               'dedup_key=%r, dedup_window=%r, dedup_max_entries=%r, ' \
+               'received_count=%r, duplicate_count=%r, batch_count=%r)' % \
+               (self.__class__.__name__, self.consumer, self.max_batch_size,
+                self.max_batch_delay, self.dedup_key, self.dedup_window,
+                self.dedup_max_entries, self.received_count,
+                self.duplicate_count, self.batch_count)
+
+    def __call__(self, indication):
+        """
+        Deliver an indication to this object.
+
+        This is the method an indication listener invokes for each indication
+        it receives.
+
+        :Parameters:
+
+          indication (:class:`~pywbem.CIMInstance`):
+            The received indication.
+
+        :Returns:
+            `True` if the indication was accepted, or `False` if it was dropped
+            as a duplicate.
+
+        :Raises:
+            ValueError: This object has been closed.
+        """
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("Delivery to closed %s" %
+                                 self.__class__.__name__)
+            self.received_count += 1
+            if self._is_duplicate(indication):
+                self.duplicate_count += 1
+                return False
+            self._batch.append(indication)
+            full = len(self._batch) >= self.max_batch_size
+            if not full and self._timer is None and \
+                    self.max_batch_delay is not None:
+                self._timer = threading.Timer(self.max_batch_delay,
+                                              self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self.flush()
+        return True
+
+    deliver = __call__
+
+    def flush(self):
+        """
+        Pass the current batch to the consumer, if it is not empty.
+
+        :Returns:
+            The number of indications that were passed to the consumer.
+        """
+
+        with self._deliver_lock:
+            with self._lock:
+                batch = self._batch
+                self._batch = []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if batch:
+                    self.batch_count += 1
+            if batch:
+                self.consumer(batch)
+        return len(batch)
+
+    def close(self):
+        """
+        Flush the current batch and stop accepting indications.
+
+        Closing an object that is already closed has no effect.
+        """
+
+        with self._lock:
+            self._closed = True
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _is_duplicate(self, indication):
+        """
+        Check whether an indication is a duplicate, and remember its key
+        otherwise. Must be called with the lock held.
+        """
+
+        if self.dedup_key is None:
+            return False
+        key = self.dedup_key(indication)
+        if key is None:
+            return False
+
+        now = time.time()
+
+        # Forget the keys that have left the sliding window
+        seen_order = self._seen_order
+        horizon = now - self.dedup_window
+        while seen_order and seen_order[0][0] <= horizon:
+            _, old_key = seen_order.popleft()
+            del self._seen[old_key]
+
+        if key in self._seen:
+            return True
+
+        while len(seen_order) >= self.dedup_max_entries:
+            _, old_key = seen_order.popleft()
+            del self._seen[old_key]
+        self._seen[key] = now
+        seen_order.append((now, key))
+        return False
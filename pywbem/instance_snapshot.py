@@ -0,0 +1,495 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Snapshots of CIM instances (for example the results of periodic
+`EnumerateInstances` operations), and the differences between two snapshots.
+
+A snapshot indexes the instances by their instance paths, and stores a
+content digest of each instance and of each of its property values. The
+digests are computed over normalized property values, so that for example
+the lexical case of property names and the Python types used for integer
+values do not matter. Qualifiers are not considered.
+
+The difference between two snapshots consists of the added, removed and
+modified instances, and for modified instances the names of the properties
+whose values have changed. It is computed by comparing the digests, in time
+proportional to the number of instances (apart from sorting the instance
+paths).
+
+Snapshots are either held in memory (:class:`~pywbem.InstanceSnapshot`), or
+written to a snapshot file with :func:`~pywbem.write_snapshot_file`, which
+processes the instances in chunks of bounded size and keeps only the digests,
+so that snapshots that do not fit in memory can be compared. An in-memory
+snapshot can also be saved into a snapshot file.
+
+Example::
+
+    snapshot = InstanceSnapshot(conn.EnumerateInstances('CIM_StorageVolume'))
+    ...
+    new_snapshot = InstanceSnapshot(
+        conn.EnumerateInstances('CIM_StorageVolume'))
+    diff = diff_snapshots(snapshot, new_snapshot)
+    for change in diff.modified:
+        print(change.path, change.properties)
+"""
+
+from __future__ import absolute_import
+
+import os
+import gzip
+import json
+import heapq
+import hashlib
+import tempfile
+
+import six
+
+from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, \
+                     _ensure_bytes, _ensure_unicode
+from .cim_types import CIMDateTime
+from .tupleparse import parse_any
+from .tupletree import xml_to_tupletree
+from .response_cache import _normalize_path
+
+__all__ = ['InstanceSnapshot', 'InstanceChange', 'SnapshotDiff',
+           'write_snapshot_file', 'diff_snapshots', 'iter_snapshot_diff']
+
+_MAGIC = b'PYWBEM-SNAPSHOT 1\n'
+
+
+def _digest(obj):
+    """Return a short digest of a JSON-serializable object."""
+    data = json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(_ensure_bytes(data)).hexdigest()[:16]
+
+
+def _path_key(path):
+    """Return a JSON-serializable, case-normalized representation of an
+    instance path, without its host."""
+    return [(path.namespace or '').strip('/').lower(), _normalize_path(path)]
+
+
+def _normalize_value(value):
+    """Return a JSON-serializable representation of a property value."""
+    # pylint: disable=too-many-return-statements
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, six.string_types):
+        return _ensure_unicode(value)
+    if isinstance(value, six.integer_types):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, list):
+        return [_normalize_value(v) for v in value]
+    if isinstance(value, CIMDateTime):
+        return {'datetime': str(value)}
+    if isinstance(value, CIMInstanceName):
+        return {'reference': _path_key(value)}
+    if isinstance(value, CIMInstance):
+        return {'instance': [value.classname.lower(),
+                             sorted(_property_digests(value).values())]}
+    if isinstance(value, CIMClass):
+        return {'class': _ensure_unicode(value.tocimxml().toxml())}
+    return _ensure_unicode(str(value))
+
+
+def _property_digests(instance):
+    """Return a dictionary of the digests of the property values of an
+    instance, by lower-cased property name."""
+    return dict([(prop.name.lower(),
+                  _digest([prop.name.lower(), prop.type,
+                           _normalize_value(prop.value)]))
+                 for prop in instance.properties.values()])
+
+
+def _record(instance, keep_instance):
+    """Return the snapshot record of an instance, as a tuple (key, path,
+    digest, property digests, property names, instance)."""
+    if instance.path is None:
+        raise ValueError('Instance without path: %r' % instance.classname)
+    props = _property_digests(instance)
+    names = dict([(prop.name.lower(), prop.name)
+                  for prop in instance.properties.values()])
+    return (json.dumps(_path_key(instance.path)), instance.path,
+            _digest(sorted(props.items())), props, names,
+            instance if keep_instance else None)
+
+
+def _record_line(record):
+    """Return the line of a record in a snapshot file, as a unicode
+    string."""
+    key, path, digest, props, names, dummy_instance = record
+    return u'%s\t%s\n' % (key, json.dumps(
+        [_ensure_unicode(path.tocimxml().toxml()), digest,
+         sorted([[names[name], props[name]] for name in props])]))
+
+
+def _parse_record_line(line):
+    """Return the record for a line of a snapshot file."""
+    key, data = _ensure_unicode(line).rstrip('\n').split('\t', 1)
+    path_xml, digest, props = json.loads(data)
+    path = parse_any(xml_to_tupletree(_ensure_bytes(path_xml)))
+    return (key, path, digest,
+            dict([(name.lower(), prop_digest) for name, prop_digest in props]),
+            dict([(name.lower(), name) for name, dummy_digest in props]),
+            None)
+
+
+class InstanceSnapshot(object):
+    """
+    A snapshot of CIM instances in memory.
+
+    The instances are indexed by their instance paths, ignoring the host.
+    An instance with the same path as an instance already in the snapshot
+    replaces that instance.
+    """
+
+    def __init__(self, instances=None, keep_instances=True):
+        """
+        Parameters:
+
+          instances (:term:`py:iterable` of :class:`~pywbem.CIMInstance`):
+            The initial instances of the snapshot. The instances must have a
+            path.
+
+          keep_instances (:class:`py:bool`):
+            Keep the instances in the snapshot, so that they are available
+            with :meth:`get` and in the result of :func:`diff_snapshots`.
+            If `False`, only the instance paths and the digests are kept.
+
+        Raises:
+
+          ValueError: An instance does not have a path.
+        """
+        self.keep_instances = keep_instances
+        self._records = {}
+        if instances is not None:
+            self.update(instances)
+
+    def __repr__(self):
+        return '%s(instances=%d, keep_instances=%r)' % \
+               (self.__class__.__name__, len(self._records),
+                self.keep_instances)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, path):
+        return json.dumps(_path_key(path)) in self._records
+
+    def add(self, instance):
+        """
+        Add an instance to the snapshot.
+
+        Raises:
+
+          ValueError: The instance does not have a path.
+        """
+        record = _record(instance, self.keep_instances)
+        self._records[record[0]] = record
+
+    def update(self, instances):
+        """
+        Add instances to the snapshot.
+
+        Raises:
+
+          ValueError: An instance does not have a path.
+        """
+        for instance in instances:
+            self.add(instance)
+
+    def get(self, path):
+        """
+        Return the instance with an instance path, or `None` if the
+        snapshot does not contain it or does not keep the instances.
+        """
+        record = self._records.get(json.dumps(_path_key(path)))
+        return record[5] if record is not None else None
+
+    def digest(self, path):
+        """
+        Return the content digest of the instance with an instance path, as
+        a :term:`unicode string`, or `None` if the snapshot does not contain
+        it.
+        """
+        record = self._records.get(json.dumps(_path_key(path)))
+        return record[2] if record is not None else None
+
+    def records(self):
+        """Return an iterator for the records of the snapshot, sorted by
+        instance path."""
+        for key in sorted(self._records.keys()):
+            yield self._records[key]
+
+    def save(self, filename):
+        """
+        Write the snapshot into a snapshot file. The instances are not
+        written, only their instance paths and digests.
+        """
+        _write_file(filename, (_record_line(record)
+                               for record in self.records()))
+
+
+def _write_file(filename, lines):
+    """Write sorted record lines into a snapshot file."""
+    snapshot_file = gzip.open(filename, 'wb')
+    try:
+        snapshot_file.write(_MAGIC)
+        for line in lines:
+            snapshot_file.write(_ensure_bytes(line))
+    finally:
+        snapshot_file.close()
+
+
+def write_snapshot_file(filename, instances, chunk_size=100000):
+    """
+    Write a snapshot of CIM instances into a snapshot file, keeping at most
+    `chunk_size` instances in memory.
+
+    The instance paths and digests of each chunk of instances are sorted and
+    written into a temporary file, and the temporary files are merged into
+    the snapshot file. The snapshot file is a gzip-compressed text file.
+
+    Parameters:
+
+      filename (:term:`string`):
+        Path name of the snapshot file. An existing file is overwritten.
+
+      instances (:term:`py:iterable` of :class:`~pywbem.CIMInstance`):
+        The instances of the snapshot, for example a generator that performs
+        `EnumerateInstances` operations for several classes. The instances
+        must have a path. If several instances have the same path, the first
+        one is used.
+
+      chunk_size (:term:`integer`):
+        Number of instances that are sorted in memory.
+
+    Raises:
+
+      ValueError: An instance does not have a path.
+    """
+    run_files = []
+    try:
+        chunk = []
+        for instance in instances:
+            chunk.append(_record_line(_record(instance, False)))
+            if len(chunk) >= chunk_size:
+                run_files.append(_write_run(chunk))
+                chunk = []
+        if not run_files:
+            chunk.sort()
+            lines = chunk
+        else:
+            if chunk:
+                run_files.append(_write_run(chunk))
+            lines = heapq.merge(*[_read_run(run_file)
+                                  for run_file in run_files])
+        _write_file(filename, _unique_lines(lines))
+    finally:
+        for run_file in run_files:
+            run_file.close()
+
+
+def _write_run(lines):
+    """Sort record lines into a new temporary file, and return the open
+    file."""
+    lines.sort()
+    run_file = tempfile.TemporaryFile()
+    for line in lines:
+        run_file.write(_ensure_bytes(line))
+    run_file.seek(0)
+    return run_file
+
+
+def _read_run(run_file):
+    """Return an iterator for the record lines in a temporary file."""
+    for line in run_file:
+        yield _ensure_unicode(line)
+
+
+def _unique_lines(lines):
+    """Return an iterator for sorted record lines, with only the first line
+    for each instance path."""
+    last_key = None
+    for line in lines:
+        key = line.split('\t', 1)[0]
+        if key != last_key:
+            yield line
+            last_key = key
+
+
+def _file_records(filename):
+    """Return an iterator for the records of a snapshot file."""
+    snapshot_file = gzip.open(filename, 'rb')
+    try:
+        if snapshot_file.readline() != _MAGIC:
+            raise ValueError('Not a snapshot file: %s' % filename)
+        for line in snapshot_file:
+            yield _parse_record_line(line)
+    finally:
+        snapshot_file.close()
+
+
+def _records(snapshot):
+    """Return an iterator for the sorted records of a snapshot or snapshot
+    file."""
+    if isinstance(snapshot, InstanceSnapshot):
+        return snapshot.records()
+    if isinstance(snapshot, six.string_types):
+        if not os.path.exists(snapshot):
+            raise IOError('Snapshot file not found: %s' % snapshot)
+        return _file_records(snapshot)
+    raise TypeError('Expecting an InstanceSnapshot object or a file name, '
+                    'got: %s' % type(snapshot))
+
+
+class InstanceChange(object):
+    # pylint: disable=too-few-public-methods
+    """
+    The change of an instance between two snapshots.
+
+    Attributes:
+
+      kind (:term:`string`): ``'added'``, ``'removed'`` or ``'modified'``.
+
+      path (:class:`~pywbem.CIMInstanceName`): The instance path, from the
+        newer snapshot if the instance is in it.
+
+      properties (:class:`py:list`): For modified instances, the names of
+        the properties whose values have changed or that have been added or
+        removed, sorted case-insensitively; otherwise an empty list.
+
+      old (:class:`~pywbem.CIMInstance`): The instance in the older
+        snapshot, or `None` if it is not in it or the snapshot does not keep
+        the instances.
+
+      new (:class:`~pywbem.CIMInstance`): The instance in the newer
+        snapshot, or `None` if it is not in it or the snapshot does not keep
+        the instances.
+    """
+
+    def __init__(self, kind, path, properties=None, old=None, new=None):
+        self.kind = kind
+        self.path = path
+        self.properties = properties or []
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return '%s(kind=%r, path=%r, properties=%r)' % \
+               (self.__class__.__name__, self.kind, self.path,
+                self.properties)
+
+
+class SnapshotDiff(object):
+    # pylint: disable=too-few-public-methods
+    """
+    The differences between two snapshots, as returned by
+    :func:`diff_snapshots`.
+
+    Attributes:
+
+      added (:class:`py:list`): :class:`~pywbem.InstanceChange` objects for
+        the instances that are only in the newer snapshot.
+
+      removed (:class:`py:list`): :class:`~pywbem.InstanceChange` objects
+        for the instances that are only in the older snapshot.
+
+      modified (:class:`py:list`): :class:`~pywbem.InstanceChange` objects
+        for the instances whose property values differ.
+    """
+
+    def __init__(self, changes):
+        self.added = []
+        self.removed = []
+        self.modified = []
+        for change in changes:
+            getattr(self, change.kind).append(change)
+
+    def __repr__(self):
+        return '%s(added=%d, removed=%d, modified=%d)' % \
+               (self.__class__.__name__, len(self.added), len(self.removed),
+                len(self.modified))
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+
+def iter_snapshot_diff(old, new):
+    """
+    Return an iterator for the changes between two snapshots, in the order
+    of the (normalized) instance paths.
+
+    The snapshots are processed in a single pass, so that snapshot files of
+    any size can be compared.
+
+    Parameters:
+
+      old (:class:`~pywbem.InstanceSnapshot` or :term:`string`):
+        The older snapshot, or the path name of a snapshot file.
+
+      new (:class:`~pywbem.InstanceSnapshot` or :term:`string`):
+        The newer snapshot, or the path name of a snapshot file.
+
+    Returns:
+
+      An iterator for :class:`~pywbem.InstanceChange` objects.
+    """
+    old_records = _records(old)
+    new_records = _records(new)
+    old_record = next(old_records, None)
+    new_record = next(new_records, None)
+    while old_record is not None or new_record is not None:
+        if new_record is None or \
+                old_record is not None and old_record[0] < new_record[0]:
+            yield InstanceChange('removed', old_record[1], old=old_record[5])
+            old_record = next(old_records, None)
+        elif old_record is None or old_record[0] > new_record[0]:
+            yield InstanceChange('added', new_record[1], new=new_record[5])
+            new_record = next(new_records, None)
+        else:
+            if old_record[2] != new_record[2]:
+                old_props, new_props = old_record[3], new_record[3]
+                names = dict(old_record[4])
+                names.update(new_record[4])
+                changed = [names[name] for name in sorted(names.keys())
+                           if old_props.get(name) != new_props.get(name)]
+                yield InstanceChange('modified', new_record[1], changed,
+                                     old=old_record[5], new=new_record[5])
+            old_record = next(old_records, None)
+            new_record = next(new_records, None)
+
+
+def diff_snapshots(old, new):
+    """
+    Return the differences between two snapshots.
+
+    Parameters:
+
+      old (:class:`~pywbem.InstanceSnapshot` or :term:`string`):
+        The older snapshot, or the path name of a snapshot file.
+
+      new (:class:`~pywbem.InstanceSnapshot` or :term:`string`):
+        The newer snapshot, or the path name of a snapshot file.
+
+    Returns:
+
+      :class:`~pywbem.SnapshotDiff`: The differences.
+    """
+    return SnapshotDiff(iter_snapshot_diff(old, new))
@@ -0,0 +1,587 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+An :class:`~pywbem.InstanceTable` stores the property values of a list of
+CIM instances (for example the result of an `EnumerateInstances` operation)
+by column, with one :class:`~pywbem.InstanceColumn` per property.
+
+The values of a column of a numeric or boolean CIM data type are stored in a
+typed array: a :class:`py:array.array`, or a NumPy array if NumPy is
+installed. Values of CIM data type datetime are converted into numbers: points
+in time into seconds since the epoch (1970-01-01 00:00:00 UTC), and time
+intervals into seconds. Columns of other CIM data types (strings, references)
+and of array properties are stored in lists.
+
+Null values (properties that are NULL or that are missing in an instance)
+are stored as 0 in typed arrays, and are indicated by the null mask of the
+column.
+
+Example::
+
+    insts = conn.EnumerateInstances('CIM_BlockStorageStatisticalData')
+    table = InstanceTable.from_instances(
+        insts, PropertyList=['KBytesRead', 'StatisticTime'])
+    kbytes = table['KBytesRead'].values
+
+With pandas, a data frame can be created with
+``pandas.DataFrame(table.to_dict())``.
+"""
+
+from __future__ import absolute_import
+
+import array
+from datetime import date
+
+from .cim_obj import NocaseDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['InstanceTable', 'InstanceColumn']
+
+# Days from 0001-01-01 (ordinal 1) to 1970-01-01
+_EPOCH_ORDINAL = 719163
+
+
+def _typecode(candidates, itemsize):
+    """Return the first of the array type codes that is supported and has
+    at least the item size, or `None`."""
+    for code in candidates:
+        try:
+            if array.array(code).itemsize >= itemsize:
+                return code
+        except ValueError:
+            pass  # Type code not supported by this Python version
+    return None
+
+# Type codes of the array module for the CIM data types
+_TYPECODES = {
+    'boolean': 'B',
+    'uint8': 'B',
+    'sint8': 'b',
+    'uint16': 'H',
+    'sint16': 'h',
+    'uint32': _typecode('IL', 4),
+    'sint32': _typecode('il', 4),
+    'uint64': _typecode('LQ', 8),
+    'sint64': _typecode('lq', 8),
+    'real32': 'f',
+    'real64': 'd',
+    'datetime': 'd',
+}
+
+# NumPy data types for the CIM data types
+_DTYPES = {
+    'boolean': 'bool',
+    'uint8': 'uint8',
+    'sint8': 'int8',
+    'uint16': 'uint16',
+    'sint16': 'int16',
+    'uint32': 'uint32',
+    'sint32': 'int32',
+    'uint64': 'uint64',
+    'sint64': 'int64',
+    'real32': 'float32',
+    'real64': 'float64',
+    'datetime': 'float64',
+}
+
+
+def _use_numpy(use_numpy):
+    """Return a boolean indicating whether NumPy arrays are used."""
+    if use_numpy is None:
+        return numpy is not None
+    if use_numpy and numpy is None:
+        raise ImportError('NumPy is not installed')
+    return bool(use_numpy)
+
+
+def _epoch_seconds(values):
+    """
+    Convert a list of CIMDateTime values (or `None`) into a list of seconds
+    since the epoch (points in time) or seconds (time intervals), with
+    `None` replaced by 0.
+    """
+    result = []
+    for value in values:
+        if value is None:
+            result.append(0.0)
+        elif value.datetime is not None:
+            dt = value.datetime
+            offset = dt.utcoffset()
+            days = dt.toordinal() - _EPOCH_ORDINAL - offset.days
+            seconds = dt.hour * 3600 + dt.minute * 60 + dt.second - \
+                offset.seconds
+            result.append(days * 86400 + seconds + dt.microsecond / 1e6)
+        else:
+            delta = value.timedelta
+            result.append(delta.days * 86400 + delta.seconds +
+                          delta.microseconds / 1e6)
+    return result
+
+
+def _epoch_seconds_numpy(values):
+    """
+    Convert a list of CIMDateTime values (or `None`) like `_epoch_seconds()`,
+    into a NumPy array. The points in time and the time intervals are
+    converted as NumPy datetime64 and timedelta64 arrays, instead of one
+    value at a time.
+    """
+    result = numpy.zeros(len(values), dtype='float64')
+    points = [i for i, value in enumerate(values)
+              if value is not None and value.datetime is not None]
+    intervals = [i for i, value in enumerate(values)
+                 if value is not None and value.datetime is None]
+    if points:
+        stamps = numpy.array(
+            [values[i].datetime.replace(tzinfo=None) for i in points],
+            dtype='datetime64[us]')
+        offsets = numpy.array([values[i].minutes_from_utc for i in points],
+                              dtype='int64')
+        result[points] = (stamps.astype('int64') -
+                          offsets * 60000000) / 1e6
+    if intervals:
+        deltas = numpy.array([values[i].timedelta for i in intervals],
+                             dtype='timedelta64[us]')
+        result[intervals] = deltas.astype('int64') / 1e6
+    return result
+
+
+def _datetime_string_seconds(text):
+    """
+    Convert a value of CIM data type datetime in CIM datetime format into
+    seconds since the epoch (point in time) or seconds (time interval),
+    without creating a CIMDateTime object.
+    """
+    text = text.strip()
+    if len(text) != 25 or text[14] != '.':
+        raise ValueError('Invalid CIM datetime value: %r' % text)
+    sign = text[21]
+    microseconds = int(text[15:21])
+    seconds = int(text[8:10]) * 3600 + int(text[10:12]) * 60 + \
+              int(text[12:14])
+    if sign == ':':
+        days = int(text[0:8])
+    elif sign in '+-':
+        days = date(int(text[0:4]), int(text[4:6]),
+                    int(text[6:8])).toordinal() - _EPOCH_ORDINAL
+        offset = int(text[22:25]) * 60
+        seconds = seconds - offset if sign == '+' else seconds + offset
+    else:
+        raise ValueError('Invalid CIM datetime value: %r' % text)
+    return days * 86400 + seconds + microseconds / 1e6
+
+
+def _boolean_string(text):
+    """Convert a value of CIM data type boolean in CIM-XML into 1 or 0."""
+    text = text.strip().lower()
+    if text == 'true':
+        return 1
+    if text == 'false':
+        return 0
+    raise ValueError('Invalid boolean value: %r' % text)
+
+# Conversions of the CIM-XML values of the CIM data types with type codes
+_STRING_CONVERTERS = {
+    'boolean': _boolean_string,
+    'uint8': int,
+    'sint8': int,
+    'uint16': int,
+    'sint16': int,
+    'uint32': int,
+    'sint32': int,
+    'uint64': int,
+    'sint64': int,
+    'real32': float,
+    'real64': float,
+    'datetime': _datetime_string_seconds,
+}
+
+
+class InstanceColumn(object):
+    """
+    A column of an :class:`~pywbem.InstanceTable`, with the values of one
+    property.
+
+    Attributes:
+
+      name (:term:`unicode string`): Name of the property, as specified in
+        the `PropertyList` argument or in the lexical case of its first
+        occurrence.
+
+      type (:term:`unicode string`): CIM data type name of the property, or
+        `None` if the property does not occur in any instance.
+
+      is_array (:class:`py:bool`): Indicates that the property is an array.
+
+      values: The values, as a :class:`py:array.array` or NumPy array for
+        numeric, boolean and datetime CIM data types, or as a
+        :class:`py:list` otherwise. Null values are 0 in typed arrays and
+        `None` in lists.
+
+      mask: The null mask, as a :class:`py:array.array` of type code ``'B'``
+        or as a boolean NumPy array. A true item indicates that the value is
+        null.
+    """
+
+    def __init__(self, name, type, is_array, values, mask):
+        # pylint: disable=redefined-builtin,too-many-arguments
+        self.name = name
+        self.type = type
+        self.is_array = is_array
+        self.values = values
+        self.mask = mask
+
+    @classmethod
+    def from_values(cls, name, type, is_array, values, use_numpy=None):
+        # pylint: disable=redefined-builtin,too-many-arguments
+        """
+        Return a new column for a list of property values.
+
+        Parameters:
+
+          name (:term:`string`): Name of the property.
+
+          type (:term:`string`): CIM data type name of the property, or
+            `None`.
+
+          is_array (:class:`py:bool`): Indicates that the property is an
+            array.
+
+          values (:class:`py:list`): The property values (CIM data type
+            objects or `None`).
+
+          use_numpy (:class:`py:bool`): Use NumPy arrays. `None` means that
+            NumPy arrays are used if NumPy is installed.
+
+        Raises:
+
+          ImportError: `use_numpy` is `True` and NumPy is not installed.
+        """
+        use_numpy = _use_numpy(use_numpy)
+        mask = [value is None for value in values]
+        typecode = _TYPECODES.get(type)
+        if is_array or typecode is None:
+            data = list(values)
+        else:
+            if type == 'datetime':
+                if use_numpy:
+                    data = _epoch_seconds_numpy(values)
+                else:
+                    data = _epoch_seconds(values)
+            elif type in ('real32', 'real64'):
+                data = [0.0 if value is None else float(value)
+                        for value in values]
+            else:
+                data = [0 if value is None else int(value)
+                        for value in values]
+            if use_numpy:
+                data = numpy.asarray(data, dtype=_DTYPES[type])
+            else:
+                data = array.array(typecode, data)
+        if use_numpy:
+            mask = numpy.array(mask, dtype='bool')
+        else:
+            mask = array.array('B', mask)
+        return cls(name, type, is_array, data, mask)
+
+    def __repr__(self):
+        return '%s(name=%r, type=%r, is_array=%r, len=%d)' % \
+               (self.__class__.__name__, self.name, self.type, self.is_array,
+                len(self))
+
+    def __len__(self):
+        return len(self.mask)
+
+    @property
+    def null_count(self):
+        """The number of null values in the column."""
+        return int(sum(self.mask))
+
+    def tolist(self):
+        """
+        Return the values of the column as a :class:`py:list`, with `None`
+        for null values.
+        """
+        return [None if null else value
+                for value, null in zip(self.values, self.mask)]
+
+
+class InstanceTable(object):
+    """
+    A table of the property values of CIM instances, stored by column.
+
+    The columns can be accessed by property name (case-insensitively), as in
+    ``table['KBytesRead']``, and the table can be iterated to get its
+    columns.
+
+    Attributes:
+
+      columns (:class:`py:list`): The columns
+        (:class:`~pywbem.InstanceColumn` objects), in the order of the
+        `PropertyList` argument, or of the first occurrence of the properties.
+
+      paths (:class:`py:list`): The instance paths
+        (:class:`~pywbem.CIMInstanceName` or `None`) of the rows.
+    """
+
+    def __init__(self, columns, paths):
+        """
+        Parameters:
+
+          columns (:term:`py:iterable` of :class:`~pywbem.InstanceColumn`):
+            The columns of the table. All columns must have one value per
+            row.
+
+          paths (:class:`py:list`): The instance paths of the rows.
+
+        Raises:
+
+          ValueError: A column does not have one value per row.
+        """
+        self.columns = list(columns)
+        self.paths = paths
+        self._columns = NocaseDict()
+        for column in self.columns:
+            if len(column) != len(paths):
+                raise ValueError('Column %r has %d values for %d rows' %
+                                 (column.name, len(column), len(paths)))
+            self._columns[column.name] = column
+
+    @classmethod
+    def from_instances(cls, instances, PropertyList=None, use_numpy=None):
+        # pylint: disable=invalid-name
+        """
+        Return a new table for CIM instances.
+
+        Parameters:
+
+          instances (:term:`py:iterable` of :class:`~pywbem.CIMInstance`):
+            The instances, one per row.
+
+          PropertyList (:term:`py:iterable` of :term:`string`):
+            The names of the properties that have a column. `None` means
+            all properties of the instances.
+
+          use_numpy (:class:`py:bool`): Use NumPy arrays. `None` means that
+            NumPy arrays are used if NumPy is installed.
+
+        Raises:
+
+          ValueError: A property has different CIM data types in different
+            instances.
+          ImportError: `use_numpy` is `True` and NumPy is not installed.
+        """
+        use_numpy = _use_numpy(use_numpy)
+        # Per lower-cased property name: [name, type, is_array, values]
+        columns = NocaseDict()
+        order = []
+        if PropertyList is not None:
+            for name in PropertyList:
+                if name not in columns:
+                    columns[name] = [name, None, False, []]
+                    order.append(columns[name])
+        paths = []
+        for inst in instances:
+            row = len(paths)
+            paths.append(inst.path)
+            for prop in inst.properties.values():
+                column = columns.get(prop.name)
+                if column is None:
+                    if PropertyList is not None:
+                        continue
+                    column = [prop.name, None, False, [None] * row]
+                    columns[prop.name] = column
+                    order.append(column)
+                if column[1] is None:
+                    column[1] = prop.type
+                    column[2] = prop.is_array
+                elif column[1] != prop.type or column[2] != prop.is_array:
+                    raise ValueError(
+                        'Property %r has CIM data type %r%s and %r%s in '
+                        'different instances' %
+                        (prop.name, column[1], '[]' if column[2] else '',
+                         prop.type, '[]' if prop.is_array else ''))
+                column[3].append(prop.value)
+            for column in columns.values():
+                if len(column[3]) == row:
+                    column[3].append(None)
+        return cls([InstanceColumn.from_values(name, type_, is_array, values,
+                                               use_numpy)
+                    for name, type_, is_array, values in order], paths)
+
+    def __repr__(self):
+        return '%s(columns=%r, rows=%d)' % \
+               (self.__class__.__name__, self.column_names, len(self))
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    @property
+    def column_names(self):
+        """The property names of the columns, as a :class:`py:list`."""
+        return [column.name for column in self.columns]
+
+    def to_dict(self):
+        """
+        Return the columns as a :class:`py:dict` of :class:`py:list` objects
+        by property name, with `None` for null values, for example for
+        creating a pandas data frame.
+        """
+        return dict([(column.name, column.tolist())
+                     for column in self.columns])
+
+
+class _ColumnBuffer(object):
+    """
+    The values of one property, collected while parsing CIM-XML.
+
+    Values of CIM data types with a type code are added as their CIM-XML
+    strings and are converted into the typed array right away; other values
+    are added as Python objects.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.type = None
+        self.is_array = False
+        self.values = []
+        self.mask = array.array('B')
+        self._convert = None
+
+    def add(self, type_, is_array, value):
+        """
+        Add the value of the property in the next row.
+
+        Raises:
+
+          ValueError: The value is invalid for its CIM data type, or the
+            property has a different CIM data type in an earlier row.
+        """
+        if self.type is None:
+            self.type = type_
+            self.is_array = is_array
+            typecode = None if is_array else _TYPECODES.get(type_)
+            if typecode is not None:
+                # The rows so far are null
+                self.values = array.array(typecode, [0] * len(self.mask))
+                self._convert = _STRING_CONVERTERS[type_]
+        elif self.type != type_ or self.is_array != is_array:
+            raise ValueError('Property %r has CIM data type %r%s and %r%s in '
+                             'different instances' %
+                             (self.name, self.type,
+                              '[]' if self.is_array else '', type_,
+                              '[]' if is_array else ''))
+        if value is None:
+            self.add_null()
+            return
+        if self._convert is not None:
+            value = self._convert(value)
+        self.values.append(value)
+        self.mask.append(0)
+
+    def add_null(self):
+        """Add a null value in the next row."""
+        if self._convert is not None:
+            self.values.append(0)
+        else:
+            self.values.append(None)
+        self.mask.append(1)
+
+    def column(self, use_numpy):
+        """Return the :class:`~pywbem.InstanceColumn` for the values."""
+        values = self.values
+        mask = self.mask
+        if use_numpy:
+            if self._convert is not None:
+                values = numpy.array(values, dtype=_DTYPES[self.type])
+            mask = numpy.array(mask, dtype='bool')
+        return InstanceColumn(self.name, self.type, self.is_array, values,
+                              mask)
+
+
+class _InstanceTableBuilder(object):
+    """
+    Collects the instance paths and the property values of instances while
+    parsing CIM-XML, and creates an :class:`~pywbem.InstanceTable` for them.
+
+    The parser calls `add_row()` for each instance, `buffer()` for each of
+    its properties and `add()` on the buffer if one is returned, and then
+    `end_row()`.
+    """
+
+    def __init__(self, PropertyList=None):
+        # pylint: disable=invalid-name
+        self.paths = []
+        self._all = PropertyList is None
+        self._buffers = NocaseDict()
+        self._order = []
+        for name in PropertyList or []:
+            if name not in self._buffers:
+                self._add_buffer(name)
+
+    def _add_buffer(self, name):
+        """Add a buffer for a property, with nulls for the rows so far."""
+        buf = _ColumnBuffer(name)
+        for dummy_row in range(len(self.paths) - 1):
+            buf.add_null()
+        self._buffers[name] = buf
+        self._order.append(buf)
+        return buf
+
+    def add_row(self, path):
+        """Start the row for an instance."""
+        self.paths.append(path)
+
+    def buffer(self, name):
+        """Return the buffer for a property, or `None` if the property has
+        no column."""
+        buf = self._buffers.get(name)
+        if buf is None and self._all:
+            buf = self._add_buffer(name)
+        return buf
+
+    def end_row(self):
+        """End the row for an instance, adding null values for the
+        properties that the instance does not have."""
+        rows = len(self.paths)
+        for buf in self._order:
+            if len(buf.mask) < rows:
+                buf.add_null()
+
+    def table(self, use_numpy=None):
+        """
+        Return the :class:`~pywbem.InstanceTable`.
+
+        Raises:
+
+          ImportError: `use_numpy` is `True` and NumPy is not installed.
+        """
+        use_numpy = _use_numpy(use_numpy)
+        return InstanceTable([buf.column(use_numpy) for buf in self._order],
+                             self.paths)
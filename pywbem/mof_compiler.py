@@ -47,8 +47,15 @@ from getpass import getpass
 import argparse
 from abc import ABCMeta, abstractmethod
 import re
+import gzip
+import hashlib
+import tempfile
+import copy
+import threading
+import multiprocessing
 
 import six
+from six.moves import cPickle as pickle
 from ply import yacc, lex
 
 from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, \
@@ -58,6 +65,9 @@ from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, \
 from .cim_operations import CIMError, WBEMConnection, Error
 from .cim_constants import *  # pylint: disable=wildcard-import
 from ._cliutils import SmartFormatter
+from ._version import __version__
+from ._threadpool import run_concurrently
+from .response_cache import _normalize_path
 
 __all__ = ['MOFParseError', 'MOFWBEMConnection', 'MOFCompiler']
 
@@ -440,26 +450,7 @@ def p_mp_createClass(p):
                     if not p.parser.qualcache[ns]:
                         # can't find qualifiers
                         raise
-                    objects = list(cc.properties.values())
-                    for meth in cc.methods.values():
-                        objects += list(meth.parameters.values())
-                    dep_classes = []
-                    for obj in objects:
-                        if obj.type not in ['reference', 'string']:
-                            continue
-                        if obj.type == 'reference':
-                            if obj.reference_class.lower() not in dep_classes:
-                                dep_classes.append(obj.reference_class.lower())
-                            continue
-                        # else obj.type is 'string'
-                        try:
-                            embedded_inst = obj.qualifiers['embeddedinstance']
-                        except KeyError:
-                            continue
-                        embedded_inst = embedded_inst.value.lower()
-                        if embedded_inst not in dep_classes:
-                            dep_classes.append(embedded_inst)
-                        continue
+                    dep_classes = _class_dependencies(cc)
                     for klass in dep_classes:
                         if klass in p.parser.classnames[ns]:
                             continue
@@ -495,59 +486,182 @@ def p_mp_createClass(p):
             p.parser.log('Error Modifying class %s: %s, %s' % \
                          (cc.classname, ce.args[0], ce.args[1]))
 
+
+def _class_dependencies(cc):
+    """Return the lower-cased names of the classes that a class depends on
+    through its reference properties and parameters, and through
+    EmbeddedInstance qualifiers on its string properties and parameters.
+    The superclass is not included."""
+
+    objects = list(cc.properties.values())
+    for meth in cc.methods.values():
+        objects += list(meth.parameters.values())
+    dep_classes = []
+    for obj in objects:
+        if obj.type not in ['reference', 'string']:
+            continue
+        if obj.type == 'reference':
+            if obj.reference_class.lower() not in dep_classes:
+                dep_classes.append(obj.reference_class.lower())
+            continue
+        # else obj.type is 'string'
+        try:
+            embedded_inst = obj.qualifiers['embeddedinstance']
+        except KeyError:
+            continue
+        embedded_inst = embedded_inst.value.lower()
+        if embedded_inst not in dep_classes:
+            dep_classes.append(embedded_inst)
+    return dep_classes
+
+
+def _has_references(inst):
+    """Return whether an instance has reference properties."""
+    for prop in inst.properties.values():
+        if prop.type == 'reference':
+            return True
+    return False
+
+
+def _sort_classes(classes):
+    """Return a list of the classes in an iterable of CIMClass objects, sorted
+    such that each class comes after its superclass and after the classes it
+    depends on (see _class_dependencies()), as far as these are in the
+    iterable.
+
+    Otherwise, the original order is retained. Cycles of dependencies (which
+    can be caused only by references and embedded instances) are broken by
+    placing the class that comes first in the original order, first.
+    Classes with the same name are returned only once."""
+
+    by_name = {}
+    for cc in classes:
+        by_name[cc.classname.lower()] = cc
+
+    def dependencies(cc):
+        """Return the dependencies of a class, superclass first."""
+        deps = _class_dependencies(cc)
+        if cc.superclass:
+            deps.insert(0, cc.superclass.lower())
+        return iter(deps)
+
+    # Iterative depth-first search, to not be limited by the recursion limit
+    # for long chains of dependencies.
+    visited = set()
+    sorted_classes = []
+    for cc in classes:
+        if cc.classname.lower() in visited:
+            continue
+        visited.add(cc.classname.lower())
+        stack = [(cc, dependencies(cc))]
+        while stack:
+            cc, deps = stack[-1]
+            for dep in deps:
+                if dep in by_name and dep not in visited:
+                    visited.add(dep)
+                    stack.append((by_name[dep], dependencies(by_name[dep])))
+                    break
+            else:
+                stack.pop()
+                sorted_classes.append(cc)
+    return sorted_classes
+
+
+def _set_qualifier(handle, qualdecl, verbose, log):
+    """Create a qualifier type in the repository of a connection, or replace
+    it if it already exists and cannot be modified."""
+
+    if verbose:
+        log('Setting qualifier %s' % qualdecl.name)
+    try:
+        handle.SetQualifier(qualdecl)
+    except CIMError as ce:
+        if ce.args[0] != CIM_ERR_NOT_SUPPORTED:
+            raise
+        if verbose:
+            log('Qualifier %s already exists.  Deleting...' % qualdecl.name)
+        handle.DeleteQualifier(qualdecl.name)
+        if verbose:
+            log('Setting qualifier %s' % qualdecl.name)
+        handle.SetQualifier(qualdecl)
+
+
+def _create_class(handle, cc, verbose, log):
+    """Create a class in the repository of a connection, or modify it if it
+    already exists. Return whether the class was created."""
+
+    ns = handle.default_namespace
+    if verbose:
+        log('Creating class %s:%s' % (ns, cc.classname))
+    try:
+        handle.CreateClass(cc)
+    except CIMError as ce:
+        if ce.args[0] != CIM_ERR_ALREADY_EXISTS:
+            raise
+        if verbose:
+            log('Class %s already exist.  Modifying...' % cc.classname)
+        try:
+            handle.ModifyClass(cc, ns)
+        except CIMError as ce:
+            log('Error Modifying class %s: %s, %s' % \
+                (cc.classname, ce.args[0], ce.args[1]))
+        return False
+    return True
+
+
+def _create_instance(handle, inst, verbose, log):
+    """Create an instance in the repository of a connection, or modify it (or
+    replace it, if modification is not supported) if it already exists.
+    Return whether the instance was created."""
+
+    if verbose:
+        log('Creating instance of %s.' % inst.classname)
+    try:
+        handle.CreateInstance(inst)
+    except CIMError as ce:
+        if ce.args[0] != CIM_ERR_ALREADY_EXISTS:
+            raise
+        if verbose:
+            log('Instance of class %s already exist.  ' \
+                'Modifying...' % inst.classname)
+        try:
+            handle.ModifyInstance(inst)
+        except CIMError as ce:
+            if ce.args[0] == CIM_ERR_NOT_SUPPORTED:
+                if verbose:
+                    log('ModifyInstance not supported.  ' \
+                        'Deleting instance of %s: %s' % \
+                        (inst.classname, inst.path))
+                handle.DeleteInstance(inst.path)
+                if verbose:
+                    log('Creating instance of %s.' % inst.classname)
+                handle.CreateInstance(inst)
+        return False
+    return True
+
+
 def p_mp_createInstance(p):
     """mp_createInstance : instanceDeclaration"""
-    inst = p[1]
-    if p.parser.verbose:
-        p.parser.log('Creating instance of %s.' % inst.classname)
     try:
-        p.parser.handle.CreateInstance(inst)
+        _create_instance(p.parser.handle, p[1], p.parser.verbose, p.parser.log)
     except CIMError as ce:
-        if ce.args[0] == CIM_ERR_ALREADY_EXISTS:
-            if p.parser.verbose:
-                p.parser.log('Instance of class %s already exist.  ' \
-                             'Modifying...' % inst.classname)
-            try:
-                p.parser.handle.ModifyInstance(inst)
-            except CIMError as ce:
-                if ce.args[0] == CIM_ERR_NOT_SUPPORTED:
-                    if p.parser.verbose:
-                        p.parser.log('ModifyInstance not supported.  ' \
-                                     'Deleting instance of %s: %s' % \
-                                     (inst.classname, inst.path))
-                    p.parser.handle.DeleteInstance(inst.path)
-                    if p.parser.verbose:
-                        p.parser.log('Creating instance of %s.' % \
-                                     inst.classname)
-                    p.parser.handle.CreateInstance(inst)
-        else:
-            ce.file_line = (p.parser.file, p.lexer.lineno)
-            raise
+        ce.file_line = (p.parser.file, p.lexer.lineno)
+        raise
 
 def p_mp_setQualifier(p):
     """mp_setQualifier : qualifierDeclaration"""
     qualdecl = p[1]
     ns = p.parser.handle.default_namespace
-    if p.parser.verbose:
-        p.parser.log('Setting qualifier %s' % qualdecl.name)
     try:
-        p.parser.handle.SetQualifier(qualdecl)
+        _set_qualifier(p.parser.handle, qualdecl, p.parser.verbose,
+                       p.parser.log)
     except CIMError as ce:
         if ce.args[0] == CIM_ERR_INVALID_NAMESPACE:
             if p.parser.verbose:
                 p.parser.log('Creating namespace ' + ns)
             _create_ns(p, p.parser.handle, ns)
-            if p.parser.verbose:
-                p.parser.log('Setting qualifier %s' % qualdecl.name)
-            p.parser.handle.SetQualifier(qualdecl)
-        elif ce.args[0] == CIM_ERR_NOT_SUPPORTED:
-            if p.parser.verbose:
-                p.parser.log('Qualifier %s already exists.  Deleting...' % \
-                             qualdecl.name)
-            p.parser.handle.DeleteQualifier(qualdecl.name)
-            if p.parser.verbose:
-                p.parser.log('Setting qualifier %s' % qualdecl.name)
-            p.parser.handle.SetQualifier(qualdecl)
+            _set_qualifier(p.parser.handle, qualdecl, p.parser.verbose,
+                           p.parser.log)
         else:
             ce.file_line = (p.parser.file, p.lexer.lineno)
             raise
@@ -1369,7 +1483,10 @@ def p_instanceDeclaration(p):
         else:
             raise
     path = CIMInstanceName(cname, namespace=ns)
-    inst = CIMInstance(cname, properties=cc.properties,
+    # The instance gets copies of the properties, because their values are
+    # set below, and the class may be shared with other instances.
+    inst = CIMInstance(cname, properties=NocaseDict(
+        [(pname, prop.copy()) for pname, prop in cc.properties.items()]),
                        qualifiers=quals, path=path)
     for prop in props:
         pname = prop[1]
@@ -1661,6 +1778,30 @@ class BaseRepositoryConnection(object):
 BaseRepositoryConnection.register(WBEMConnection)
 
 
+def _reference_keys(inst):
+    """Return a list of tuples (lower-cased property name, key of the
+    referenced instance path) for the reference properties of a CIM
+    instance."""
+
+    return [(prop.name.lower(), _normalize_path(prop.value))
+            for prop in inst.properties.values()
+            if prop.type == 'reference' and
+            isinstance(prop.value, CIMInstanceName)]
+
+
+def _filter_properties(inst, property_list):
+    """Return a copy of a CIM instance that has only the properties in
+    `property_list`, or all properties if that is `None`."""
+
+    inst = inst.copy()
+    if property_list is not None:
+        names = set([name.lower() for name in property_list])
+        for name in list(inst.properties.keys()):
+            if name.lower() not in names:
+                del inst.properties[name]
+    return inst
+
+
 class MOFWBEMConnection(BaseRepositoryConnection):
     """
     A repository connection that handles the removal of CIM elements.
@@ -1674,6 +1815,23 @@ class MOFWBEMConnection(BaseRepositoryConnection):
     The :meth:`rollback` method is used at the end to delete the CIM elements
     through the underlying repository connection.
 
+    The local repository is indexed, so that it can also be used as a fast
+    in-memory stand-in for a WBEM server, e.g. for tests and for the offline
+    analysis of compiled MOF: Instances are stored by their instance paths,
+    classes are indexed by their superclasses, and the classes with their
+    inherited properties and methods that are returned by :meth:`GetClass`
+    with `LocalOnly=False` are cached. Besides the operations used by the MOF
+    compiler, the local repository supports :meth:`GetInstance`,
+    :meth:`EnumerateInstances`, :meth:`EnumerateInstanceNames`,
+    :meth:`EnumerateClassNames`, :meth:`Associators` and
+    :meth:`AssociatorNames`, for instances and classes in the local
+    repository and in the underlying repository (if any).
+
+    The content of the local repository is available in the `classes`,
+    `class_names`, `qualifiers` and `instances` instance variables, but must
+    be changed only through the operation methods, in order to keep the
+    indexes up to date.
+
     This class implements the
     :class:`~pywbem.mof_compiler.BaseRepositoryConnection` interface.
 
@@ -1699,6 +1857,7 @@ class MOFWBEMConnection(BaseRepositoryConnection):
         self.qualifiers = {}
         self.instances = {}
         self.classes = {}
+        self._build_indexes()
         if conn is None:
             # This instance variable is used only to make get/set
             # of 'default_namespace' behave as it should, in the case
@@ -1725,15 +1884,150 @@ class MOFWBEMConnection(BaseRepositoryConnection):
         """The default repository namespace, as a string (readable and
         writeable).""")
 
-    def EnumerateInstanceNames(self, *args, **kwargs):
-        """This method is used by the MOF compiler only when it creates a
-        namespace in the course of handling CIM_ERR_NAMESPACE_NOT_FOUND.
-        Because the operations of this class silently create every namespace
-        that is needed and never return that error, this method is never
-        called, and is therefore not implemented.
+    def _build_indexes(self):
+        """Build the indexes of the local repository from its content."""
+
+        # {ns: {lower-cased class name: {path key: CIMInstance}}}
+        self._instance_index = {}
+        # {ns: {path key of referenced instance: [CIMInstance]}}
+        self._reference_index = {}
+        # {ns: {lower-cased superclass name or None:
+        #       {lower-cased class name: class name}}}
+        self._subclass_index = {}
+        # {ns: {lower-cased class name: CIMClass with inherited elements}}
+        self._resolved_classes = {}
+
+        for ns, ns_classes in self.classes.items():
+            for cc in ns_classes.values():
+                self._index_class(ns, cc)
+        for ns, insts in self.instances.items():
+            index = self._instance_index.setdefault(ns, {})
+            for inst in insts:
+                if inst.path is not None:
+                    key = _normalize_path(inst.path)
+                    index.setdefault(key[0], {})[key] = inst
+                self._index_instance(ns, inst)
+
+    def _index_class(self, ns, cc, add=True):
+        """Add a class to the subclass index, or remove it from that index.
+        This invalidates the cached classes with inherited elements."""
+
+        superclass = cc.superclass.lower() if cc.superclass else None
+        subclasses = self._subclass_index.setdefault(ns, {}).setdefault(
+            superclass, {})
+        if add:
+            subclasses[cc.classname.lower()] = cc.classname
+        else:
+            subclasses.pop(cc.classname.lower(), None)
+        self._resolved_classes.pop(ns, None)
+
+    def _index_instance(self, ns, inst, add=True):
+        """Add an instance to the reference index, or remove it from that
+        index."""
+
+        index = self._reference_index.setdefault(ns, {})
+        for dummy_name, key in _reference_keys(inst):
+            if add:
+                index.setdefault(key, []).append(inst)
+            else:
+                insts = index.get(key, [])
+                for i, other in enumerate(insts):
+                    if other is inst:
+                        del insts[i]
+                        break
+
+    def _add_class(self, cc, created=True):
+        """Store a class in the local repository, replacing a class with the
+        same name. `created` indicates whether the class was created, as
+        opposed to retrieved from the underlying repository."""
+
+        ns = self.default_namespace
+        ns_classes = self.classes.setdefault(ns, NocaseDict())
+        if cc.classname in ns_classes:
+            self._index_class(ns, ns_classes[cc.classname], add=False)
+        ns_classes[cc.classname] = cc
+        self._index_class(ns, cc)
+        if created:
+            self.class_names.setdefault(ns, []).append(cc.classname)
+
+    def _subclass_names(self, ns, classname):
+        """Return the lower-cased names of a class and of all of its subclasses
+        in the local repository."""
+
+        index = self._subclass_index.get(ns, {})
+        names = [classname.lower()]
+        for name in names:
+            names.extend(index.get(name, {}).keys())
+        return names
+
+    def _get_instance(self, ns, key):
+        """Return the instance with a path key from the local repository, or
+        `None`."""
+
+        return self._instance_index.get(ns, {}).get(key[0], {}).get(key)
+
+    def GetInstance(self, InstanceName, PropertyList=None, **extra):
+        """Retrieve a CIM instance from the local repository of this class.
+
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.GetInstance`. For instances in the local
+        repository, only the `PropertyList` parameter is used.
         """
 
-        raise CIMError(CIM_ERR_FAILED, 'This should not happen!')
+        ns = InstanceName.namespace or self.default_namespace
+        inst = self._get_instance(ns, _normalize_path(InstanceName))
+        if inst is None:
+            if self.conn is None:
+                raise CIMError(CIM_ERR_NOT_FOUND, str(InstanceName))
+            return self.conn.GetInstance(InstanceName,
+                                         PropertyList=PropertyList, **extra)
+        return _filter_properties(inst, PropertyList)
+
+    def EnumerateInstances(self, ClassName, namespace=None, PropertyList=None,
+                           **extra):
+        """Enumerate the CIM instances of a class and its subclasses in the
+        local repository of this class.
+
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.EnumerateInstances`. For instances in the
+        local repository, only the `PropertyList` parameter is used.
+        """
+
+        ns = namespace or self.default_namespace
+        index = self._instance_index.get(ns, {})
+        rv = []
+        keys = set()
+        for cname in self._subclass_names(ns, ClassName):
+            for key, inst in index.get(cname, {}).items():
+                rv.append(_filter_properties(inst, PropertyList))
+                keys.add(key)
+        if self.conn is not None:
+            rv += [inst for inst in self.conn.EnumerateInstances(
+                ClassName, namespace, PropertyList=PropertyList, **extra)
+                   if _normalize_path(inst.path) not in keys]
+        return rv
+
+    def EnumerateInstanceNames(self, ClassName, namespace=None, **extra):
+        """Enumerate the instance paths of the CIM instances of a class and
+        its subclasses in the local repository of this class.
+
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.EnumerateInstanceNames`.
+        """
+
+        ns = namespace or self.default_namespace
+        index = self._instance_index.get(ns, {})
+        rv = []
+        keys = set()
+        for cname in self._subclass_names(ns, ClassName):
+            for key, inst in index.get(cname, {}).items():
+                rv.append(inst.path.copy())
+                keys.add(key)
+        if self.conn is not None:
+            rv += [path for path in self.conn.EnumerateInstanceNames(
+                ClassName, namespace, **extra)
+                   if _normalize_path(path) not in keys]
+        return rv
 
     def ModifyInstance(self, *args, **kwargs):
         """This method is used by the MOF compiler only in the course of
@@ -1747,45 +2041,177 @@ class MOFWBEMConnection(BaseRepositoryConnection):
     def CreateInstance(self, *args, **kwargs):
         """Create a CIM instance in the local repository of this class.
 
+        An existing instance with the same instance path is overwritten.
+
         For a description of the parameters, see
         :meth:`pywbem.WBEMConnection.CreateInstance`.
         """
 
         inst = len(args) > 0 and args[0] or kwargs['NewInstance']
-        try:
-            self.instances[self.default_namespace].append(inst)
-        except KeyError:
-            self.instances[self.default_namespace] = [inst]
+        ns = self.default_namespace
+        insts = self.instances.setdefault(ns, [])
+        if inst.path is None:
+            insts.append(inst)
+            self._index_instance(ns, inst)
+            return None
+        key = _normalize_path(inst.path)
+        class_insts = self._instance_index.setdefault(ns, {}).setdefault(
+            key[0], {})
+        old_inst = class_insts.get(key)
+        if old_inst is None:
+            insts.append(inst)
+        else:
+            self._index_instance(ns, old_inst, add=False)
+            for i, other in enumerate(insts):
+                if other is old_inst:
+                    insts[i] = inst
+                    break
+        class_insts[key] = inst
+        self._index_instance(ns, inst)
         return inst.path
 
-    def DeleteInstance(self, *args, **kwargs):
-        """This method is only invoked by :meth:`rollback` (on the underlying
-        repository), and never by the MOF compiler, and is therefore not
-        implemented."""
+    def DeleteInstance(self, InstanceName, **extra):
+        """Delete a CIM instance from the local repository of this class.
 
-        raise CIMError(CIM_ERR_FAILED, 'This should not happen!')
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.DeleteInstance`.
+        """
+
+        ns = InstanceName.namespace or self.default_namespace
+        key = _normalize_path(InstanceName)
+        class_insts = self._instance_index.get(ns, {}).get(key[0], {})
+        if key not in class_insts:
+            raise CIMError(CIM_ERR_NOT_FOUND, str(InstanceName))
+        inst = class_insts.pop(key)
+        self._index_instance(ns, inst, add=False)
+        insts = self.instances[ns]
+        for i, other in enumerate(insts):
+            if other is inst:
+                del insts[i]
+                break
+
+    def _associators(self, ObjectName, AssocClass, ResultClass, Role,
+                     ResultRole):
+        """Return the instances in the local repository that are associated
+        with an instance, for :meth:`Associators` and
+        :meth:`AssociatorNames`."""
+
+        ns = ObjectName.namespace or self.default_namespace
+        key = _normalize_path(ObjectName)
+        assoc_classes = AssocClass and set(self._subclass_names(ns,
+                                                                AssocClass))
+        result_classes = ResultClass and set(self._subclass_names(ns,
+                                                                  ResultClass))
+        role = Role and Role.lower()
+        result_role = ResultRole and ResultRole.lower()
+        rv = []
+        keys = set()
+        for assoc in self._reference_index.get(ns, {}).get(key, []):
+            if assoc_classes and assoc.classname.lower() not in assoc_classes:
+                continue
+            refs = _reference_keys(assoc)
+            sources = [name for name, ref_key in refs
+                       if ref_key == key and (not role or name == role)]
+            if not sources:
+                continue
+            for name, ref_key in refs:
+                if name in sources or ref_key in keys or \
+                        (result_role and name != result_role) or \
+                        (result_classes and ref_key[0] not in result_classes):
+                    continue
+                inst = self._get_instance(ns, ref_key)
+                if inst is not None:
+                    rv.append(inst)
+                    keys.add(ref_key)
+        return rv, keys
+
+    def Associators(self, ObjectName, AssocClass=None, ResultClass=None,
+                    Role=None, ResultRole=None, PropertyList=None, **extra):
+        """Retrieve the CIM instances that are associated with a CIM instance
+        in the local repository of this class.
+
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.Associators`. For instances in the local
+        repository, the `IncludeQualifiers` and `IncludeClassOrigin`
+        parameters are not used, and class level usage is not supported.
+        """
+
+        if not isinstance(ObjectName, CIMInstanceName):
+            if self.conn is None:
+                raise CIMError(CIM_ERR_NOT_SUPPORTED,
+                               'Class level Associators is not supported')
+            return self.conn.Associators(
+                ObjectName, AssocClass=AssocClass, ResultClass=ResultClass,
+                Role=Role, ResultRole=ResultRole, PropertyList=PropertyList,
+                **extra)
+        insts, keys = self._associators(ObjectName, AssocClass, ResultClass,
+                                        Role, ResultRole)
+        rv = [_filter_properties(inst, PropertyList) for inst in insts]
+        if self.conn is not None:
+            rv += [inst for inst in self.conn.Associators(
+                ObjectName, AssocClass=AssocClass, ResultClass=ResultClass,
+                Role=Role, ResultRole=ResultRole, PropertyList=PropertyList,
+                **extra) if _normalize_path(inst.path) not in keys]
+        return rv
+
+    def AssociatorNames(self, ObjectName, AssocClass=None, ResultClass=None,
+                        Role=None, ResultRole=None, **extra):
+        """Retrieve the instance paths of the CIM instances that are
+        associated with a CIM instance in the local repository of this class.
+
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.AssociatorNames`. For instances in the
+        local repository, class level usage is not supported.
+        """
+
+        if not isinstance(ObjectName, CIMInstanceName):
+            if self.conn is None:
+                raise CIMError(CIM_ERR_NOT_SUPPORTED,
+                               'Class level AssociatorNames is not supported')
+            return self.conn.AssociatorNames(
+                ObjectName, AssocClass=AssocClass, ResultClass=ResultClass,
+                Role=Role, ResultRole=ResultRole, **extra)
+        insts, keys = self._associators(ObjectName, AssocClass, ResultClass,
+                                        Role, ResultRole)
+        rv = [inst.path.copy() for inst in insts]
+        if self.conn is not None:
+            rv += [path for path in self.conn.AssociatorNames(
+                ObjectName, AssocClass=AssocClass, ResultClass=ResultClass,
+                Role=Role, ResultRole=ResultRole, **extra)
+                   if _normalize_path(path) not in keys]
+        return rv
 
     def GetClass(self, *args, **kwargs):
         """Retrieve a CIM class from the local repository of this class.
 
+        With `LocalOnly=False`, the class is returned with the properties and
+        methods inherited from its superclasses. Such classes are cached until
+        the classes in the namespace change, and must not be modified.
+
         For a description of the parameters, see
         :meth:`pywbem.WBEMConnection.GetClass`.
         """
 
         cname = len(args) > 0 and args[0] or kwargs['ClassName']
-        try:
-            cc = self.classes[self.default_namespace][cname]
-        except KeyError:
+        ns = self.default_namespace
+        resolve = 'LocalOnly' in kwargs and not kwargs['LocalOnly']
+        if resolve:
+            try:
+                return self._resolved_classes[ns][cname.lower()]
+            except KeyError:
+                pass
+        # Check for the class before getting it, because the KeyError of
+        # NocaseDict includes the representation of all classes.
+        ns_classes = self.classes.get(ns, {})
+        if cname in ns_classes:
+            cc = ns_classes[cname]
+        else:
             if self.conn is None:
                 ce = CIMError(CIM_ERR_NOT_FOUND, cname)
                 raise ce
             cc = self.conn.GetClass(*args, **kwargs)
-            try:
-                self.classes[self.default_namespace][cc.classname] = cc
-            except KeyError:
-                self.classes[self.default_namespace] = \
-                        NocaseDict({cc.classname:cc})
-        if 'LocalOnly' in kwargs and not kwargs['LocalOnly']:
+            self._add_class(cc, created=False)
+        if resolve:
             if cc.superclass:
                 try:
                     del kwargs['ClassName']
@@ -1794,14 +2220,47 @@ class MOFWBEMConnection(BaseRepositoryConnection):
                 if len(args) > 0:
                     args = args[1:]
                 super_ = self.GetClass(cc.superclass, *args, **kwargs)
+                # Merge the inherited elements into a copy, so that the class
+                # in the local repository keeps its own definition.
+                cc = cc.copy()
                 for prop in super_.properties.values():
                     if prop.name not in cc.properties:
                         cc.properties[prop.name] = prop
                 for meth in super_.methods.values():
                     if meth.name not in cc.methods:
                         cc.methods[meth.name] = meth
+            self._resolved_classes.setdefault(ns, {})[cname.lower()] = cc
         return cc
 
+    def EnumerateClassNames(self, namespace=None, ClassName=None,
+                            DeepInheritance=None, **extra):
+        """Enumerate the names of the subclasses of a CIM class, or of the
+        top-level classes, in the local repository of this class.
+
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.EnumerateClassNames`.
+        """
+
+        ns = namespace or self.default_namespace
+        if ClassName is not None and self.conn is None and \
+                ClassName not in self.classes.get(ns, {}):
+            raise CIMError(CIM_ERR_INVALID_CLASS, ClassName)
+        index = self._subclass_index.get(ns, {})
+        superclasses = [ClassName.lower() if ClassName else None]
+        rv = []
+        for superclass in superclasses:
+            subclasses = index.get(superclass, {})
+            rv.extend(subclasses.values())
+            if DeepInheritance:
+                superclasses.extend(subclasses.keys())
+        if self.conn is not None:
+            names = set([cname.lower() for cname in rv])
+            rv += [cname for cname in self.conn.EnumerateClassNames(
+                namespace=namespace, ClassName=ClassName,
+                DeepInheritance=DeepInheritance, **extra)
+                   if cname.lower() not in names]
+        return rv
+
     def ModifyClass(self, *args, **kwargs): #pylint: disable=no-self-use
         """This method is used by the MOF compiler only in the course of
         handling CIM_ERR_ALREADY_EXISTS after trying to create a class.
@@ -1831,26 +2290,32 @@ class MOFWBEMConnection(BaseRepositoryConnection):
                 else:
                     raise
 
-        try:
-            self.classes[self.default_namespace][cc.classname] = cc
-        except KeyError:
-            self.classes[self.default_namespace] = \
-                    NocaseDict({cc.classname:cc})
-
         # TODO: should we see if it exists first with
         # self.conn.GetClass()?  Do we want to create a class
         # that already existed?
-        try:
-            self.class_names[self.default_namespace].append(cc.classname)
-        except KeyError:
-            self.class_names[self.default_namespace] = [cc.classname]
+        self._add_class(cc)
 
-    def DeleteClass(self, *args, **kwargs):
-        """This method is only invoked by :meth:`rollback` (on the underlying
-        repository), and never by the MOF compiler, and is therefore not
-        implemented."""
+    def DeleteClass(self, ClassName, namespace=None, **extra):
+        """Delete a CIM class from the local repository of this class.
 
-        raise CIMError(CIM_ERR_FAILED, 'This should not happen!')
+        For a description of the parameters, see
+        :meth:`pywbem.WBEMConnection.DeleteClass`. A class that has subclasses
+        or instances in the local repository cannot be deleted.
+        """
+
+        ns = namespace or self.default_namespace
+        ns_classes = self.classes.get(ns, {})
+        if ClassName not in ns_classes:
+            raise CIMError(CIM_ERR_NOT_FOUND, ClassName)
+        if self._subclass_index.get(ns, {}).get(ClassName.lower()):
+            raise CIMError(CIM_ERR_CLASS_HAS_CHILDREN, ClassName)
+        if self._instance_index.get(ns, {}).get(ClassName.lower()):
+            raise CIMError(CIM_ERR_CLASS_HAS_INSTANCES, ClassName)
+        self._index_class(ns, ns_classes[ClassName], add=False)
+        del ns_classes[ClassName]
+        cnames = self.class_names.get(ns, [])
+        cnames[:] = [cname for cname in cnames
+                     if cname.lower() != ClassName.lower()]
 
     def EnumerateQualifiers(self, *args, **kwargs):
         """Enumerate the qualifier types in the local repository of this class.
@@ -1907,6 +2372,173 @@ class MOFWBEMConnection(BaseRepositoryConnection):
 
         raise CIMError(CIM_ERR_FAILED, 'This should not happen!')
 
+    def _get_state(self):
+        """Return the content of the local repository of this class, as a
+        picklable object."""
+
+        return {'class_names': self.class_names,
+                'qualifiers': self.qualifiers,
+                'instances': self.instances,
+                'classes': self.classes}
+
+    def _set_state(self, state):
+        """Replace the content of the local repository of this class with
+        an object returned by :meth:`_get_state`."""
+
+        self.class_names = state['class_names']
+        self.qualifiers = state['qualifiers']
+        self.instances = state['instances']
+        self.classes = state['classes']
+        self._build_indexes()
+
+    def upload(self, conn=None, max_workers=10, progress=None, rollback=True,
+               verbose=False, log_func=None):
+        """
+        Create the qualifier types, classes and instances of the local
+        repository of this class in a repository, using concurrent
+        operations.
+
+        The qualifier types of a namespace are created first, then its
+        classes, then its instances. A class is created only after its
+        superclass and the classes it depends on through references and
+        embedded instances have been created, as far as these are in the local
+        repository. Instances with reference properties are created after the
+        other instances. Apart from that, the operations run concurrently in
+        up to `max_workers` threads.
+
+        Existing classes and instances are modified, as by the MOF compiler.
+
+        If an operation fails, no further operations are started. If
+        `rollback` is `True`, the classes and instances created so far are
+        then deleted again, in the manner of :meth:`rollback`. Qualifier types
+        and modified classes and instances are not restored. Then, the
+        exception of the failed operation is raised.
+
+        Parameters:
+
+          conn (BaseRepositoryConnection):
+            The connection to the repository to be updated. `None` means to
+            use the underlying repository connection of this object.
+
+            Each additional thread uses its own copy of the connection,
+            made using :func:`py:copy.copy`. The `default_namespace`
+            attribute of the connection is restored when the method returns.
+
+          max_workers (:term:`integer`):
+            Maximum number of concurrent operations. If `conn` is a
+            :class:`MOFWBEMConnection` (whose copies share its local
+            repository, which is not thread-safe), the operations are
+            performed one after the other.
+
+          progress (:term:`callable`):
+            A function that is invoked after each operation with two
+            :term:`integer` parameters: the number of operations done so
+            far, and the total number of operations. `None` means no progress
+            reporting. The function is invoked from the worker threads, but
+            never concurrently.
+
+          rollback (:class:`py:bool`):
+            Indicates whether the created classes and instances are deleted
+            again if an operation fails.
+
+          verbose (:class:`py:bool`):
+            Indicates whether to log each operation.
+
+          log_func (:term:`callable`):
+            A logger function that is invoked for each message. `None` means
+            to print to stdout.
+
+        Raises:
+
+          : Any exceptions that are raised by the repository connection class.
+        """
+
+        if conn is None:
+            conn = self.conn
+        if log_func is None:
+            log_func = print
+        if isinstance(conn, MOFWBEMConnection):
+            max_workers = 1
+
+        # Each namespace is done in steps of operations that can run
+        # concurrently: the qualifier types, the classes by their depth in the
+        # dependency graph, the instances without and with references.
+        steps = []
+        namespaces = set(self.qualifiers.keys())
+        namespaces.update(self.class_names.keys())
+        namespaces.update(self.instances.keys())
+        for ns in sorted(namespaces):
+            steps.append([(ns, _set_qualifier, qualdecl) for qualdecl in
+                          self.qualifiers.get(ns, {}).values()])
+            classes = [self.classes[ns][cname]
+                       for cname in self.class_names.get(ns, [])]
+            classes = _sort_classes(classes)
+            levels = {}
+            for cc in classes:
+                deps = _class_dependencies(cc)
+                if cc.superclass:
+                    deps.append(cc.superclass.lower())
+                level = 1 + max([levels.get(dep, -1) for dep in deps] + [-1])
+                levels[cc.classname.lower()] = level
+            class_steps = {}
+            for cc in classes:
+                class_steps.setdefault(levels[cc.classname.lower()], []).append(
+                    (ns, _create_class, cc))
+            steps.extend([class_steps[level]
+                          for level in sorted(class_steps.keys())])
+            insts = self.instances.get(ns, [])
+            steps.append([(ns, _create_instance, inst) for inst in insts
+                          if not _has_references(inst)])
+            steps.append([(ns, _create_instance, inst) for inst in insts
+                          if _has_references(inst)])
+
+        total = sum([len(step) for step in steps])
+        created = MOFWBEMConnection(conn=conn)
+        lock = threading.Lock()
+        done = [0]
+        failed = [False]
+        local = threading.local()
+
+        def operation(ns, create_func, obj):
+            """Perform one operation in a connection of the current thread."""
+            if failed[0]:
+                return
+            if max_workers <= 1:
+                thread_conn = conn
+            else:
+                try:
+                    thread_conn = local.conn
+                except AttributeError:
+                    thread_conn = local.conn = copy.copy(conn)
+            thread_conn.default_namespace = ns
+            try:
+                was_created = create_func(thread_conn, obj, verbose, log_func)
+            except Exception:
+                failed[0] = True
+                raise
+            with lock:
+                if was_created and create_func is _create_class:
+                    created.class_names.setdefault(ns, []).append(
+                        obj.classname)
+                elif was_created and create_func is _create_instance:
+                    created.instances.setdefault(ns, []).append(obj)
+                done[0] += 1
+                if progress is not None:
+                    progress(done[0], total)
+
+        saved_namespace = conn.default_namespace
+        try:
+            for step in steps:
+                results = run_concurrently(operation, step, max_workers)
+                errors = [exc_info for _, exc_info in results
+                          if exc_info is not None]
+                if errors:
+                    if rollback:
+                        created.rollback(verbose=verbose)
+                    six.reraise(*errors[0])
+        finally:
+            conn.default_namespace = saved_namespace
+
     def rollback(self, verbose=False):
         """
         Remove classes and instances from the underlying repository, that have
@@ -1972,6 +2604,70 @@ def _print_logger(msg):
     print(msg)
 
 
+class _MOFFileIndex(object):
+    """
+    A case-insensitive index of the MOF files in a directory tree, mapping
+    the base part of the file names (i.e. the CIM class names) to the path
+    names of the files.
+
+    The index remembers the modification times of the directories it was
+    built from, so that it can detect when it needs to be rebuilt.
+    """
+
+    def __init__(self, search_path):
+        self.search_path = search_path
+        self.files = {}       # lower-cased class name -> MOF file path name
+        self.dir_mtimes = {}  # directory path name -> mtime, or None
+        self.dir_mtimes[search_path] = _get_mtime(search_path)
+        for root, dummy_dirs, files in os.walk(search_path):
+            self.dir_mtimes[root] = _get_mtime(root)
+            for file_ in files:
+                if file_.endswith('.mof'):
+                    # Keep the first occurrence in os.walk() order, which is
+                    # what the former directory walk on each lookup returned.
+                    key = file_[:-4].lower()
+                    if key not in self.files:
+                        self.files[key] = root + '/' + file_
+
+    def is_current(self):
+        """
+        Check whether none of the indexed directories has been modified (or
+        removed) since the index was built.
+        """
+        for dir_path, mtime in six.iteritems(self.dir_mtimes):
+            if _get_mtime(dir_path) != mtime:
+                return False
+        return True
+
+    def find(self, classname):
+        """
+        Return the path name of the MOF file for a lower-cased class name,
+        or `None`.
+        """
+        return self.files.get(classname, None)
+
+
+def _get_mtime(path):
+    """Return the modification time of a path, or `None` if it does not
+    exist."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+# Indexes of the search paths used by any MOF compiler, by search path.
+_mof_file_indexes = {}
+
+
+def _get_mof_file_index(search_path):
+    """Return an up-to-date index of the MOF files in a search path."""
+    index = _mof_file_indexes.get(search_path, None)
+    if index is None or not index.is_current():
+        index = _MOFFileIndex(search_path)
+        _mof_file_indexes[search_path] = index
+    return index
+
+
 class MOFCompiler(object):
     """
     A MOF compiler.
@@ -1989,7 +2685,7 @@ class MOFCompiler(object):
     """
 
     def __init__(self, handle, search_paths=None, verbose=False,
-                 log_func=_print_logger):
+                 log_func=_print_logger, fast_lexer=True):
         """
         Parameters:
 
@@ -2012,13 +2708,18 @@ class MOFCompiler(object):
             A logger function that is invoked for each compiler message.
             The logger function must take one parameter of string type.
             The default logger prints to stdout.
+
+          fast_lexer (:class:`py:bool`):
+            Indicates whether to use the faster LEX analyzer of this module
+            instead of the LEX analyzer of the PLY package. Both produce the
+            same tokens.
         """
 
-        self.parser = _yacc(verbose)
+        self.parser = _get_parser(verbose)
         self.parser.search_paths = search_paths if search_paths else []
         self.handle = handle
         self.parser.handle = handle
-        self.lexer = _lex(verbose)
+        self.lexer = _MOFLexer() if fast_lexer else _get_lexer(verbose)
         self.lexer.parser = self.parser
         self.parser.qualcache = {}
         self.parser.classnames = {}
@@ -2030,6 +2731,9 @@ class MOFCompiler(object):
         self.parser.verbose = verbose
         self.parser.log = log_func
         self.parser.aliases = {}
+        # Content digests of the MOF files compiled, by absolute path name.
+        # Only recorded while compile_file_cached() compiles.
+        self._input_digests = None
 
     def compile_string(self, mof, ns, filename=None):
         """
@@ -2127,8 +2831,333 @@ class MOFCompiler(object):
         mof = f.read()
         f.close()
 
+        if self._input_digests is not None:
+            self._input_digests[os.path.abspath(filename)] = _mof_digest(mof)
+
         return self.compile_string(mof, ns, filename=filename)
 
+    def compile_file_cached(self, filename, ns, cache_dir):
+        """
+        Compile a MOF file into a namespace of the associated CIM repository,
+        using a cache of the compilation result.
+
+        If a valid cache file exists for the MOF file, the content of the
+        associated CIM repository is replaced with the content of the cache
+        file, instead of compiling the MOF file. Otherwise, the MOF file is
+        compiled and a cache file is written with the resulting content of the
+        CIM repository (classes, qualifier types and instances of all
+        namespaces).
+
+        The cache file name is derived from the path name and content of the
+        MOF file, the namespace, the search paths and the content of the
+        associated CIM repository before the compilation, so that content that
+        already exists in the repository is retained. A cache file is valid
+        only if the content of every MOF file that was read when it was
+        written (including files processed via ``#pragma include`` and files
+        found in the search paths) is still the same.
+
+        The associated CIM repository must be a :class:`MOFWBEMConnection`
+        object without an underlying repository connection, because only then
+        its content is completely defined by the compilation.
+
+        Parameters:
+
+          filename (:term:`string`):
+            The path name of the MOF file containing the MOF statements to be
+            compiled.
+
+          ns (:term:`string`):
+            The name of the CIM namespace in the associated CIM repository
+            that is used for lookup of any dependent CIM elements, and that
+            is also the target of the compilation.
+
+          cache_dir (:term:`string`):
+            The path name of the directory for the cache files. It is created
+            if it does not exist.
+
+        Returns:
+
+          `True` if the content was loaded from the cache file, `False` if the
+          MOF file was compiled.
+
+        Raises:
+
+          ValueError: The associated CIM repository is not suitable.
+
+          MOFParseError: Syntax error in the MOF.
+
+          : Any exceptions that are raised by the repository connection class.
+        """
+
+        if not isinstance(self.handle, MOFWBEMConnection) or \
+                self.handle.conn is not None:
+            raise ValueError('compile_file_cached() requires a '
+                             'MOFWBEMConnection without underlying connection '
+                             'as repository, not %r' % self.handle)
+
+        f = open(filename, 'r')
+        mof = f.read()
+        f.close()
+        initial_state = pickle.dumps(self.handle._get_state(), 2)
+        key = _mof_digest('\0'.join(
+            [_CACHE_FORMAT, __version__, str(sys.version_info[0]),
+             os.path.abspath(filename), ns, _mof_digest(mof),
+             _mof_digest(initial_state)] +
+            [os.path.abspath(path) for path in self.parser.search_paths]))
+        cache_file = os.path.join(cache_dir, 'mofcache-%s.pickle.gz' % key)
+
+        state = _load_cache_file(cache_file)
+        if state is not None:
+            if self.parser.verbose:
+                self.parser.log('Loaded compiled MOF from cache file %s' %
+                                cache_file)
+            self.handle._set_state(state)
+            self.handle.default_namespace = ns
+            return True
+
+        self._input_digests = {}
+        try:
+            self.compile_file(filename, ns)
+            inputs = sorted(self._input_digests.items())
+        finally:
+            self._input_digests = None
+
+        _write_cache_file(cache_file, inputs, self.handle._get_state())
+        if self.parser.verbose:
+            self.parser.log('Wrote compiled MOF to cache file %s' % cache_file)
+        return False
+
+    def compile_file_ordered(self, filename, ns, max_workers=1,
+                             progress=None):
+        """
+        Compile a MOF file into a namespace of the associated CIM repository,
+        in two phases.
+
+        In the first phase, the MOF file is compiled into a local
+        :class:`MOFWBEMConnection` repository on top of the associated CIM
+        repository. Dependent CIM elements are looked up in the local
+        repository and in the associated CIM repository, and missing ones are
+        compiled from the MOF files in the search paths. This includes the
+        classes used in reference properties and parameters, and in
+        EmbeddedInstance qualifiers.
+
+        In the second phase, the qualifier types, classes and instances of the
+        local repository are created in the associated CIM repository, using
+        :meth:`MOFWBEMConnection.upload`. The classes are created in an order
+        in which every class comes after its superclass and after the classes
+        it depends on. If creating an element fails, the classes and instances
+        created so far are removed again.
+
+        In contrast to :meth:`compile_file`, this avoids create operations
+        that fail because of missing dependent CIM elements. This matters if
+        the associated CIM repository is a remote WBEM server, where every
+        failed operation costs a round trip.
+
+        Parameters:
+
+          filename (:term:`string`):
+            The path name of the MOF file containing the MOF statements to be
+            compiled.
+
+          ns (:term:`string`):
+            The name of the CIM namespace in the associated CIM repository
+            that is used for lookup of any dependent CIM elements, and that
+            is also the target of the compilation.
+
+          max_workers (:term:`integer`):
+            Maximum number of concurrent create operations in the second
+            phase. If greater than 1, the associated CIM repository is copied
+            using :func:`py:copy.copy` for each additional thread.
+
+          progress (:term:`callable`):
+            Progress reporting function for the second phase, see
+            :meth:`MOFWBEMConnection.upload`.
+
+        Returns:
+
+          :class:`MOFWBEMConnection`: The local repository with the CIM
+          elements that were created in the associated CIM repository.
+
+        Raises:
+
+          ValueError: No CIM repository is associated with the MOF compiler.
+
+          MOFParseError: Syntax error in the MOF.
+
+          : Any exceptions that are raised by the repository connection class.
+        """
+
+        target = self.handle
+        if target is None:
+            raise ValueError('compile_file_ordered() requires an associated '
+                             'CIM repository')
+
+        staging = MOFWBEMConnection(conn=target)
+        self.handle = self.parser.handle = staging
+        try:
+            self.compile_file(filename, ns)
+            self._compile_dependencies(staging)
+        finally:
+            self.handle = self.parser.handle = target
+
+        try:
+            staging.upload(max_workers=max_workers, progress=progress,
+                           verbose=self.parser.verbose, log_func=self.parser.log)
+        finally:
+            target.default_namespace = ns
+        return staging
+
+    def compile_file_parallel(self, filename, ns, max_workers=None):
+        """
+        Compile a MOF file that includes other MOF files into a namespace of
+        the associated CIM repository, compiling the included MOF files in
+        multiple processes.
+
+        This is intended for MOF files like the top-level file of the DMTF CIM
+        schema, that consist of ``#pragma include`` directives for many other
+        MOF files. Other MOF files are compiled using :meth:`compile_file`.
+
+        The included MOF files that declare qualifier types are compiled
+        first, in this process. The remaining included MOF files are
+        distributed across worker processes, in chunks of consecutive files.
+        Each worker process parses its chunk into classes and instances, using
+        a local repository that knows the qualifier types. The resulting
+        classes and instances are then created in the associated CIM
+        repository in this process, the classes in an order in which every
+        class comes after its superclass and after the classes it depends on.
+        Superclasses that are not defined in the included MOF files are
+        compiled from the MOF files in the search paths.
+
+        Instances in the included MOF files must not depend on instance
+        aliases defined in other included MOF files, and their classes must
+        be defined in the included MOF files or in the search paths. If
+        compiling a chunk fails in its worker process, the remaining included
+        MOF files are compiled in this process using :meth:`compile_file`,
+        which reports the error as usual.
+
+        Parameters:
+
+          filename (:term:`string`):
+            The path name of the MOF file containing the MOF statements to be
+            compiled.
+
+          ns (:term:`string`):
+            The name of the CIM namespace in the associated CIM repository
+            that is used for lookup of any dependent CIM elements, and that
+            is also the target of the compilation.
+
+          max_workers (:term:`integer`):
+            Maximum number of worker processes. `None` means to use the number
+            of CPUs.
+
+        Raises:
+
+          MOFParseError: Syntax error in the MOF.
+
+          : Any exceptions that are raised by the repository connection class.
+        """
+
+        includes = _get_includes(filename)
+        if includes is None:
+            self.compile_file(filename, ns)
+            return
+        if self.parser.verbose:
+            self.parser.log('Compiling file %s in parallel' % filename)
+
+        class_files = []
+        for fname in includes:
+            if _QUALIFIER_FILE_PATTERN.search(_read_file(fname)):
+                self.compile_file(fname, ns)
+            else:
+                class_files.append(fname)
+
+        if ns in self.parser.qualcache and self.parser.qualcache[ns]:
+            qualifiers = list(self.parser.qualcache[ns].values())
+        else:
+            qualifiers = self.handle.EnumerateQualifiers()
+
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count()
+        # More chunks than processes, to even out the load
+        num_chunks = min(len(class_files), max_workers * 4) or 1
+        chunk_size = -(-len(class_files) // num_chunks)
+        args_list = [(class_files[i:i + chunk_size], ns,
+                      self.parser.search_paths, qualifiers)
+                     for i in range(0, len(class_files), chunk_size)]
+        if max_workers > 1 and len(args_list) > 1:
+            pool = multiprocessing.Pool(processes=max_workers)
+            try:
+                states = pool.map(_compile_files_in_process, args_list,
+                                  chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            states = [_compile_files_in_process(args) for args in args_list]
+
+        if None in states:
+            if self.parser.verbose:
+                self.parser.log('Compiling in worker process failed, '
+                                'compiling the remaining files sequentially')
+            for fname in class_files:
+                self.compile_file(fname, ns)
+            return
+
+        classes = []
+        for state in states:
+            chunk_classes = state['classes'].get(ns, {})
+            for cname in state['class_names'].get(ns, []):
+                classes.append(chunk_classes[cname])
+        self.handle.default_namespace = ns
+        verbose = self.parser.verbose
+        log = self.parser.log
+        for cc in _sort_classes(classes):
+            try:
+                _create_class(self.handle, cc, verbose, log)
+            except CIMError as ce:
+                # The superclass is not in the included MOF files, so we
+                # compile it from the search paths as in compile_file()
+                moffile = ce.args[0] == CIM_ERR_INVALID_SUPERCLASS and \
+                          self.find_mof(cc.superclass)
+                if not moffile:
+                    raise
+                self.compile_file(moffile, ns)
+                _create_class(self.handle, cc, verbose, log)
+            self.parser.classnames[ns].append(cc.classname.lower())
+        for state in states:
+            for inst in state['instances'].get(ns, []):
+                _create_instance(self.handle, inst, verbose, log)
+
+    def _compile_dependencies(self, staging):
+        """Compile the classes that the classes in the local repository
+        `staging` depend on through references and embedded instances, if
+        they exist neither in the local repository nor in the underlying
+        repository."""
+
+        checked = set()
+        compiled = True
+        while compiled:
+            compiled = False
+            for ns, cnames in list(staging.class_names.items()):
+                staging.default_namespace = ns
+                for cname in list(cnames):
+                    cc = staging.classes[ns][cname]
+                    for klass in _class_dependencies(cc):
+                        if (ns, klass) in checked or \
+                                klass in staging.classes[ns]:
+                            continue
+                        checked.add((ns, klass))
+                        try:
+                            staging.GetClass(klass, LocalOnly=False,
+                                             IncludeQualifiers=True)
+                        except CIMError as ce:
+                            if ce.args[0] != CIM_ERR_NOT_FOUND:
+                                raise
+                            moffile = self.find_mof(klass)
+                            if moffile:
+                                self.compile_file(moffile, ns)
+                                compiled = True
+
     def find_mof(self, classname):
         """
         Find the MOF file that defines a particular CIM class, in the search
@@ -2137,6 +3166,10 @@ class MOFCompiler(object):
         The MOF file is found based on its file name: It is assumed that the
         base part of the file name is the CIM class name.
 
+        The lookup uses an index of the MOF files in each search path that is
+        built on first use, and is rebuilt when the modification time of any
+        directory in the search path has changed.
+
         Example: The class "CIM_ComputerSystem" is expected to be in a file
         "CIM_ComputerSystem.mof".
 
@@ -2153,11 +3186,9 @@ class MOFCompiler(object):
 
         classname = classname.lower()
         for search in self.parser.search_paths:
-            for root, dummy_dirs, files in os.walk(search):
-                for file_ in files:
-                    if file_.endswith('.mof') and \
-                            file_[:-4].lower() == classname:
-                        return root + '/' + file_
+            file_path = _get_mof_file_index(search).find(classname)
+            if file_path is not None:
+                return file_path
         return None
 
     def rollback(self, verbose=False):
@@ -2170,6 +3201,148 @@ class MOFCompiler(object):
         self.handle.rollback(verbose=verbose)
 
 
+# Version of the format of the cache files written by compile_file_cached().
+_CACHE_FORMAT = '1'
+
+# Pattern for MOF files that declare qualifier types.
+_QUALIFIER_FILE_PATTERN = re.compile(r'^\s*qualifier\s+\w+',
+                                     re.IGNORECASE | re.MULTILINE)
+
+# Patterns for MOF files that consist of compiler directives.
+_COMMENT_PATTERN = re.compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+_PRAGMA_PATTERN = re.compile(r'\s*#\s*pragma\s+(\w+)\s*\(\s*"([^"]*)"\s*\)',
+                             re.IGNORECASE)
+
+
+def _read_file(filename):
+    """Return the content of a file."""
+    f = open(filename, 'r')
+    content = f.read()
+    f.close()
+    return content
+
+
+def _get_includes(filename):
+    """Return the path names of the files included by a MOF file, if the MOF
+    file consists only of include and locale directives and comments.
+    Otherwise, return `None`."""
+
+    mof = _COMMENT_PATTERN.sub('', _read_file(filename))
+    includes = []
+    pos = 0
+    while True:
+        m = _PRAGMA_PATTERN.match(mof, pos)
+        if m is None:
+            break
+        directive = m.group(1).lower()
+        if directive == 'include':
+            fname = m.group(2)
+            if len(os.path.dirname(filename)) != 0:
+                fname = os.path.dirname(filename) + '/' + fname
+            includes.append(fname)
+        elif directive != 'locale':
+            return None
+        pos = m.end()
+    if mof[pos:].strip():
+        return None
+    return includes
+
+
+class _UncheckedMOFWBEMConnection(MOFWBEMConnection):
+    """A MOFWBEMConnection that does not check for the superclass when
+    creating a class, for compiling MOF files in the worker processes of
+    MOFCompiler.compile_file_parallel(). The checks are done when the classes
+    are created in the target repository."""
+
+    def CreateClass(self, *args, **kwargs):
+        cc = len(args) > 0 and args[0] or kwargs['NewClass']
+        self._add_class(cc)
+
+
+def _compile_files_in_process(args):
+    """Compile MOF files into a new local repository, and return its content
+    (see MOFWBEMConnection._get_state()), or `None` if that failed.
+
+    This function is invoked in the worker processes of
+    MOFCompiler.compile_file_parallel(), with a tuple of the MOF file names,
+    the namespace, the search paths, and the qualifier types."""
+
+    filenames, ns, search_paths, qualifiers = args
+    repo = _UncheckedMOFWBEMConnection()
+    repo.default_namespace = ns
+    mofcomp = MOFCompiler(repo, search_paths=search_paths,
+                          log_func=lambda msg: None)
+    for qual in qualifiers:
+        repo.SetQualifier(qual)
+        mofcomp.parser.qualcache[ns][qual.name] = qual
+    try:
+        for fname in filenames:
+            mofcomp.compile_file(fname, ns)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return repo._get_state()  # pylint: disable=protected-access
+
+
+def _mof_digest(mof):
+    """Return the hex digest of a MOF string."""
+    if isinstance(mof, six.text_type):
+        mof = mof.encode('utf-8')
+    return hashlib.sha1(mof).hexdigest()
+
+
+def _load_cache_file(cache_file):
+    """Return the repository state from a cache file of
+    MOFCompiler.compile_file_cached(), or `None` if the cache file does not
+    exist, cannot be read, or is not valid because a MOF file it was
+    compiled from has changed."""
+
+    try:
+        f = gzip.open(cache_file, 'rb')
+        try:
+            inputs = pickle.load(f)
+            for path, digest in inputs:
+                mof_file = open(path, 'r')
+                mof = mof_file.read()
+                mof_file.close()
+                if _mof_digest(mof) != digest:
+                    return None
+            return pickle.load(f)
+        finally:
+            f.close()
+    except Exception:  # pylint: disable=broad-except
+        # A missing, truncated or otherwise unusable cache file is not an
+        # error; the MOF is simply compiled again.
+        return None
+
+
+def _write_cache_file(cache_file, inputs, state):
+    """Write a cache file of MOFCompiler.compile_file_cached().
+
+    The list of input files and their digests is pickled first, so that the
+    cache file can be validated without unpickling the repository state.
+    The file is written under a temporary name and then renamed, so that
+    concurrent readers never see a partially written file."""
+
+    cache_dir = os.path.dirname(cache_file)
+    if cache_dir and not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    fd, tmp_file = tempfile.mkstemp(dir=cache_dir or None, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw_file:
+            f = gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=1)
+            try:
+                pickle.dump(inputs, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+        if os.name == 'nt' and os.path.exists(cache_file):
+            os.remove(cache_file)
+        os.rename(tmp_file, cache_file)
+    except Exception:  # pylint: disable=broad-except
+        os.remove(tmp_file)
+        raise
+
+
 def _build(verbose=False):
     """Build the LEX and YACC table modules for the MOF compiler, if they do
     not exist yet, or if their table versions do not match the installed
@@ -2215,6 +3388,235 @@ def _lex(verbose=False):
                    debug=False,
                    errorlog=lex.PlyLogger(sys.stdout))
 
+# The YACC parser and the PLY LEX analyzer objects that are shared by all
+# MOFCompiler objects of the process. They are created on first use by
+# _get_parser() and _get_lexer().
+_parser_template = None
+_lexer_template = None
+_template_lock = threading.Lock()
+
+
+def _table_module_valid(name, tabversion):
+    """Return a boolean indicating whether a table module for the MOF compiler
+    can be imported and has the table version of the installed version of the
+    `ply` package."""
+    modname = '%s.%s' % (__name__.rpartition('.')[0], name)
+    try:
+        __import__(modname)
+    except ImportError:
+        return False
+    return getattr(sys.modules[modname], '_tabversion', None) == tabversion
+
+
+def _get_parser(verbose=False):
+    """Return YACC parser object for a MOF compiler object.
+
+    The parser object is a shallow copy of a parser object that is created
+    once per process, so that the parsing tables are shared and only the
+    state of a compilation is specific to the returned object.
+
+    The shared parser object is created from the YACC table module that is
+    built when pywbem is installed. Unlike `_yacc()`, this does not write the
+    table module if it does not exist or does not match the installed version
+    of the `ply` package; the tables are then generated in memory.
+
+    If `verbose` is true and the shared parser object is created, a message
+    tells whether the table module is used.
+    """
+
+    global _parser_template  # pylint: disable=global-statement
+    with _template_lock:
+        if _parser_template is None:
+            if verbose:
+                if _table_module_valid(_tabmodule, yacc.__tabversion__):
+                    print("Using YACC table module %s for MOF compiler" %
+                          _tabmodule)
+                else:
+                    print("Generating YACC tables for MOF compiler in memory")
+            _parser_template = yacc.yacc(optimize=_optimize,
+                                         tabmodule=_tabmodule,
+                                         outputdir=_tabdir,
+                                         write_tables=False,
+                                         debug=True,
+                                         debuglog=yacc.NullLogger(),
+                                         errorlog=yacc.PlyLogger(sys.stdout))
+    return copy.copy(_parser_template)
+
+
+def _get_lexer(verbose=False):
+    """Return PLY LEX analyzer object for a MOF compiler object.
+
+    The LEX analyzer object is a clone of a LEX analyzer object that is
+    created once per process.
+
+    The shared LEX analyzer object is created from the LEX table module that
+    is built when pywbem is installed. Unlike `_lex()`, this does not write
+    the table module if it does not exist; the LEX analyzer is then built from
+    the `t_*` rules of this module.
+
+    If `verbose` is true and the shared LEX analyzer object is created, a
+    message tells whether the table module is used.
+    """
+
+    global _lexer_template  # pylint: disable=global-statement
+    with _template_lock:
+        if _lexer_template is None:
+            valid = _table_module_valid(_lextab, lex.__tabversion__)
+            if verbose:
+                if valid:
+                    print("Using LEX table module %s for MOF compiler" %
+                          _lextab)
+                else:
+                    print("Building LEX analyzer for MOF compiler from its "
+                          "rules")
+            optimize = _optimize if valid else 0
+            _lexer_template = lex.lex(optimize=optimize,
+                                      lextab=_lextab,
+                                      outputdir=_tabdir,
+                                      debug=False,
+                                      errorlog=lex.PlyLogger(sys.stdout))
+    return _lexer_template.clone()
+
+
+def _noncapturing(regex):
+    """Return a regular expression with all capturing groups of a regular
+    expression made non-capturing."""
+    return re.sub(r'(?<!\\)\((?!\?)', '(?:', regex)
+
+
+class _MOFLexer(object):
+    """
+    LEX analyzer for the MOF compiler that produces the same tokens as the
+    PLY LEX analyzer built from the `t_*` rules of this module, but is faster.
+
+    It matches the ignored characters and newlines preceding a token together
+    with the token, using a single regular expression for all rules and the
+    literals, and handles the tokens of all rules except for binary and octal
+    numbers without invoking the rule functions. This includes the handling
+    of multi-line comments, which (like in the PLY LEX analyzer) does not
+    advance the line number of the lexer. Lexical errors are handled by
+    `t_error()`, as in the PLY LEX analyzer.
+
+    It implements the interface of PLY LEX analyzer objects that is used by
+    the PLY YACC parser and by the rule functions.
+    """
+
+    # The regular expressions of the rules for tokens, in the order in which
+    # PLY tries them, i.e. in the order of definition of the rule functions.
+    # The groups are made non-capturing, and for identifiers and strings,
+    # equivalent expressions are used that match runs of plain characters at
+    # once. The ignored characters and the newlines cannot start a token of
+    # any other rule, and the literals are tried after the rules.
+    rules = [(rule.__name__[2:],
+              _noncapturing(getattr(rule, 'regex', rule.__doc__)))
+             for rule in (t_COMMENT, t_MCOMMENT, t_floatValue, t_hexValue,
+                          t_binaryValue, t_octalValue, t_decimalValue)]
+    rules.append(('stringValue', r'"(?:[^"\\\n\r]+|%s)*"' %
+                  _noncapturing(escapeSequence)))
+    rules.append(('IDENTIFIER', r'(?:[a-zA-Z_]|%s)(?:[0-9a-zA-Z_]+|%s)*' %
+                  (_noncapturing(utf8Char), _noncapturing(utf8Char))))
+    rules.append(('literal', '[%s]' % re.escape(literals)))
+    space_re = re.compile(r'[%s\n]*' % re.escape(t_ignore))
+    token_re = re.compile(
+        r'(?P<space>[%s\n]*)(?:%s)' % (
+            re.escape(t_ignore),
+            '|'.join(['(?P<%s>%s)' % rule for rule in rules])),
+        re.VERBOSE)
+
+    def __init__(self):
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.linestart = 0
+
+    def clone(self):
+        """Return a copy of this LEX analyzer."""
+        return copy.copy(self)
+
+    def input(self, data):
+        """Set the input string for tokenizing."""
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+
+    def skip(self, n):
+        """Skip `n` characters of the input string."""
+        self.lexpos += n
+
+    def _skip_space(self, lexpos, end):
+        """Account for the newlines in the ignored characters and newlines in
+        the input string from `lexpos` to `end`."""
+        newlines = self.lexdata.count('\n', lexpos, end)
+        if newlines:
+            self.lineno += newlines
+            # Like t_newline(), which is invoked for each sequence of newlines
+            i = self.lexdata.rindex('\n', lexpos, end)
+            while i > lexpos and self.lexdata[i - 1] == '\n':
+                i -= 1
+            self.linestart = i
+
+    def _error(self, lexpos):
+        """Handle the input string at `lexpos` that does not match a rule
+        or literal, and return the resulting token or `None`."""
+
+        end = self.space_re.match(self.lexdata, lexpos).end()
+        self._skip_space(lexpos, end)
+        lexpos = self.lexpos = end
+        if lexpos >= self.lexlen:
+            return None
+        tok = lex.LexToken()
+        tok.value = self.lexdata[lexpos:]
+        tok.lineno = self.lineno
+        tok.type = 'error'
+        tok.lexer = self
+        tok.lexpos = lexpos
+        newtok = t_error(tok)
+        if lexpos == self.lexpos:
+            raise lex.LexError("Scanning error. Illegal character '%s'" %
+                               self.lexdata[lexpos], self.lexdata[lexpos:])
+        if newtok:
+            return newtok
+        return self.token()
+
+    def token(self):
+        """Return the next token, or `None` at the end of the input."""
+
+        lexdata = self.lexdata
+        match = self.token_re.match
+        lexpos = self.lexpos
+        while True:
+            m = match(lexdata, lexpos)
+            if m is None:
+                return self._error(lexpos)
+            kind = m.lastgroup
+            start, end = m.span(kind)
+            if start != lexpos:
+                self._skip_space(lexpos, start)
+            lexpos = end
+            if kind == 'COMMENT' or kind == 'MCOMMENT':
+                continue
+
+            tok = lex.LexToken()
+            tok.value = value = m.group(kind)
+            tok.lineno = self.lineno
+            tok.lexpos = start
+            tok.lexer = self
+            self.lexpos = end
+            if kind == 'IDENTIFIER':
+                tok.type = reserved.get(value.lower(), 'IDENTIFIER')
+            elif kind == 'literal':
+                tok.type = value
+            elif kind == 'binaryValue':
+                tok.type = kind
+                tok = t_binaryValue(tok)
+            elif kind == 'octalValue':
+                tok.type = kind
+                tok = t_octalValue(tok)
+            else:
+                tok.type = kind
+            return tok
+
 
 def main():
     """Parse command line arguments and process the specified MOF files.
@@ -2278,6 +3680,19 @@ Example:
              "Connection to WBEM server is still required to check " \
              "qualifiers.")
 
+    action_arggroup.add_argument(
+        '-o', '--ordered', dest='ordered',
+        action='store_true', default=False,
+        help='Compile each MOF file completely before updating the ' \
+             'repository, and create its elements in the order of their ' \
+             'dependencies. This avoids failing create operations against ' \
+             'the WBEM server.')
+    action_arggroup.add_argument(
+        '-j', '--jobs', dest='jobs', metavar='number',
+        type=int, default=1,
+        help='Number of concurrent create operations against the WBEM ' \
+             'server, with --ordered. Default: %(default)s')
+
     general_arggroup = argparser.add_argument_group(
         'General options')
     general_arggroup.add_argument(
@@ -2340,7 +3755,11 @@ Example:
         for fname in args.mof_files:
             if fname[0] != '/':
                 fname = os.path.curdir + '/' + fname
-            mofcomp.compile_file(fname, args.namespace)
+            if args.ordered and not (args.remove or args.dry_run):
+                mofcomp.compile_file_ordered(fname, args.namespace,
+                                             max_workers=args.jobs)
+            else:
+                mofcomp.compile_file(fname, args.namespace)
     except MOFParseError:
         sys.exit(1)
     except Error:
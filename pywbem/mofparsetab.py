@@ -0,0 +1,231 @@
+
+# mofparsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "ANY AS ASSOCIATION CLASS DISABLEOVERRIDE DT_BOOL DT_CHAR16 DT_DATETIME DT_REAL32 DT_REAL64 DT_SINT16 DT_SINT32 DT_SINT64 DT_SINT8 DT_STR DT_UINT16 DT_UINT32 DT_UINT64 DT_UINT8 ENABLEOVERRIDE FALSE FLAVOR IDENTIFIER INDICATION INSTANCE METHOD NULL OF PARAMETER PRAGMA PROPERTY QUALIFIER REF REFERENCE RESTRICTED SCHEMA SCOPE TOSUBCLASS TRANSLATABLE TRUE binaryValue charValue decimalValue floatValue hexValue octalValue stringValuemofSpecification : mofProductionListmofProductionList : empty\n                         | mofProductionList mofProduction\n                         mofProduction : compilerDirective\n                     | mp_createClass\n                     | mp_setQualifier\n                     | mp_createInstance\n                     mp_createClass : classDeclaration\n                      | assocDeclaration\n                      | indicDeclaration\n                      mp_createInstance : instanceDeclarationmp_setQualifier : qualifierDeclarationcompilerDirective : '#' PRAGMA pragmaName '(' pragmaParameter ')'pragmaName : identifierpragmaParameter : stringValueclassDeclaration : CLASS className '{' classFeatureList '}' ';'\n                        | CLASS className superClass '{' classFeatureList '}' ';'\n                        | CLASS className alias '{' classFeatureList '}' ';'\n                        | CLASS className alias superClass '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className superClass '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className alias '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className alias superClass '{' classFeatureList '}' ';'\n                        classFeatureList : empty\n                        | classFeatureList classFeature\n                        assocDeclaration : '[' ASSOCIATION qualifierListEmpty ']' CLASS className '{' associationFeatureList '}' ';'\n                        | '[' ASSOCIATION qualifierListEmpty ']' CLASS className superClass '{' associationFeatureList '}' ';'\n                        | '[' ASSOCIATION qualifierListEmpty ']' CLASS className alias '{' associationFeatureList '}' ';'\n                        | '[' ASSOCIATION qualifierListEmpty ']' CLASS className alias superClass '{' associationFeatureList '}' ';'\n                        indicDeclaration : '[' INDICATION qualifierListEmpty ']' CLASS className '{' classFeatureList '}' ';'\n                        | '[' INDICATION qualifierListEmpty ']' CLASS className superClass '{' classFeatureList '}' ';'\n                        | '[' INDICATION qualifierListEmpty ']' CLASS className alias '{' classFeatureList '}' ';'\n                        | '[' INDICATION qualifierListEmpty ']' CLASS className alias superClass '{' classFeatureList '}' ';'\n                        qualifierListEmpty : empty\n                          | qualifierListEmpty ',' qualifier\n                          associationFeatureList : empty\n                              | associationFeatureList associationFeature\n                              className : identifieralias : AS aliasIdentifieraliasIdentifier : '$' identifiersuperClass : ':' classNameclassFeature : propertyDeclaration\n                    | methodDeclaration\n                    | referenceDeclaration\n                    associationFeature : classFeaturequalifierList : '[' qualifier qualifierListEmpty ']'qualifier : qualifierName\n                 | qualifierName ':' flavorList\n                 | qualifierName qualifierParameter\n                 | qualifierName qualifierParameter ':' flavorList\n                 flavorList : flavor\n                  | flavorList flavor\n                  qualifierParameter : '(' constantValue ')'\n                          | arrayInitializer\n                          flavor : ENABLEOVERRIDE\n              | DISABLEOVERRIDE\n              | RESTRICTED\n              | TOSUBCLASS\n              | TRANSLATABLE\n              propertyDeclaration : propertyDeclaration_1\n                           | propertyDeclaration_2\n                           | propertyDeclaration_3\n                           | propertyDeclaration_4\n                           | propertyDeclaration_5\n                           | propertyDeclaration_6\n                           | propertyDeclaration_7\n                           | propertyDeclaration_8\n                           propertyDeclaration_1 : dataType propertyName ';'propertyDeclaration_2 : dataType propertyName defaultValue ';'propertyDeclaration_3 : dataType propertyName array ';'propertyDeclaration_4 : dataType propertyName array defaultValue ';'propertyDeclaration_5 : qualifierList dataType propertyName ';'propertyDeclaration_6 : qualifierList dataType propertyName defaultValue ';'propertyDeclaration_7 : qualifierList dataType propertyName array ';'propertyDeclaration_8 : qualifierList dataType propertyName array defaultValue ';'referenceDeclaration : objectRef referenceName ';'\n                            | objectRef referenceName defaultValue ';'\n                            | qualifierList objectRef referenceName ';'\n                            | qualifierList objectRef referenceName defaultValue ';'\n                            methodDeclaration : dataType methodName '(' ')' ';'\n                         | dataType methodName '(' parameterList ')' ';'\n                         | qualifierList dataType methodName '(' ')' ';'\n                         | qualifierList dataType methodName '(' parameterList ')' ';'\n                         propertyName : identifierreferenceName : identifiermethodName : identifierdataType : DT_UINT8\n                | DT_SINT8\n                | DT_UINT16\n                | DT_SINT16\n                | DT_UINT32\n                | DT_SINT32\n                | DT_UINT64\n                | DT_SINT64\n                | DT_REAL32\n                | DT_REAL64\n                | DT_CHAR16\n                | DT_STR\n                | DT_BOOL\n                | DT_DATETIME\n                objectRef : className REFparameterList : parameter\n                     | parameterList ',' parameter\n                     parameter : parameter_1\n                 | parameter_2\n                 | parameter_3\n                 | parameter_4\n                 parameter_1 : dataType parameterName\n                   | dataType parameterName array\n                   parameter_2 : qualifierList dataType parameterName\n                   | qualifierList dataType parameterName array\n                   parameter_3 : objectRef parameterName\n                   | objectRef parameterName array\n                   parameter_4 : qualifierList objectRef parameterName\n                   | qualifierList objectRef parameterName array\n                   parameterName : identifierarray : '[' ']'\n             | '[' integerValue ']'\n             defaultValue : '=' initializerinitializer : constantValue\n                   | arrayInitializer\n                   | referenceInitializer\n                   arrayInitializer : '{' constantValueList '}'\n                        | '{' '}'\n                        constantValueList : constantValue\n                         | constantValueList ',' constantValue\n                         stringValueList : stringValue\n                       | stringValueList stringValue\n                       constantValue : integerValue\n                     | floatValue\n                     | charValue\n                     | stringValueList\n                     | booleanValue\n                     | nullValue\n                     integerValue : binaryValue\n                    | octalValue\n                    | decimalValue\n                    | hexValue\n                    referenceInitializer : objectHandle\n                            | aliasIdentifier\n                            objectHandle : identifierqualifierDeclaration : QUALIFIER qualifierName qualifierType scope ';'\n                            | QUALIFIER qualifierName qualifierType scope defaultFlavor ';'\n                            qualifierName : identifier\n                     | ASSOCIATION\n                     | INDICATION\n                     qualifierType : qualifierType_1\n                     | qualifierType_2\n                     qualifierType_1 : ':' dataType array\n                       | ':' dataType array defaultValue\n                       qualifierType_2 : ':' dataType\n                       | ':' dataType defaultValue\n                       scope : ',' SCOPE '(' metaElementList ')'metaElementList : metaElement\n                       | metaElementList ',' metaElement\n                       metaElement : SCHEMA\n                   | CLASS\n                   | ASSOCIATION\n                   | INDICATION\n                   | QUALIFIER\n                   | PROPERTY\n                   | REFERENCE\n                   | METHOD\n                   | PARAMETER\n                   | ANY\n                   defaultFlavor : ',' FLAVOR '(' flavorListWithComma ')'flavorListWithComma : flavor\n                           | flavorListWithComma ',' flavor\n                           instanceDeclaration : INSTANCE OF className '{' valueInitializerList '}' ';'\n                           | INSTANCE OF className alias '{' valueInitializerList '}' ';'\n                           | qualifierList INSTANCE OF className '{' valueInitializerList '}' ';'\n                           | qualifierList INSTANCE OF className alias '{' valueInitializerList '}' ';'\n                           valueInitializerList : valueInitializer\n                            | valueInitializerList valueInitializer\n                            valueInitializer : identifier defaultValue ';'\n                        | qualifierList identifier defaultValue ';'\n                        booleanValue : FALSE\n                    | TRUE\n                    nullValue : NULLidentifier : IDENTIFIER\n                  | ANY\n                  | AS\n                  | CLASS\n                  | DISABLEOVERRIDE\n                  | dataType\n                  | ENABLEOVERRIDE\n                  | FLAVOR\n                  | INSTANCE\n                  | METHOD\n                  | OF\n                  | PARAMETER\n                  | PRAGMA\n                  | PROPERTY\n                  | QUALIFIER\n                  | REFERENCE\n                  | RESTRICTED\n                  | SCHEMA\n                  | SCOPE\n                  | TOSUBCLASS\n                  | TRANSLATABLE\n                  empty :"
+    
+_lr_action_items = {'#':([0,2,3,4,5,6,7,8,10,11,12,13,14,179,192,194,214,241,242,244,270,294,295,296,298,314,330,331,354,358,366,367,369,370,372,373,],[-201,9,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,-142,-13,-16,-143,-17,-18,-20,-169,-19,-21,-22,-171,-170,-23,-172,-26,-30,-27,-28,-31,-32,-29,-33,]),'CLASS':([0,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,105,106,107,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,179,186,187,188,190,191,192,193,194,198,199,204,206,207,208,209,210,214,216,228,231,232,233,239,241,242,244,247,249,250,253,270,271,274,282,283,284,285,287,288,291,293,294,295,296,298,300,301,302,303,305,306,307,311,313,314,317,319,320,321,323,326,327,329,330,331,333,334,335,336,337,339,340,341,346,351,353,354,357,358,361,365,366,367,369,370,372,373,],[-201,15,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,21,58,21,21,21,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,21,21,-201,21,21,21,-24,-201,-201,21,-201,170,21,172,-46,21,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,21,21,21,21,21,21,-201,21,-201,-201,21,21,21,-142,21,21,-173,21,21,-13,-101,-16,21,21,21,21,21,-201,21,21,-143,260,-174,21,21,-68,-76,-17,-18,-20,21,21,-201,-201,-169,-175,21,21,21,-69,-70,21,-72,-78,-77,-19,-21,-22,-171,21,-36,-201,-201,21,-201,-201,260,-176,-170,-80,21,21,21,-71,-73,-74,-79,-23,-172,-37,-45,21,21,-201,21,21,-201,-81,-82,-75,-26,21,-30,21,-83,-27,-28,-31,-32,-29,-33,]),'[':([0,2,3,4,5,6,7,8,10,11,12,13,14,21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,71,93,94,95,96,101,137,138,144,145,146,147,148,149,150,151,152,153,154,155,160,161,162,164,165,166,168,179,187,188,191,192,194,196,197,204,206,207,208,209,210,214,228,231,232,233,237,239,241,242,244,247,249,250,253,270,271,284,285,287,288,291,293,294,295,296,298,300,301,302,303,305,306,307,313,314,315,316,317,319,322,323,326,327,329,330,331,333,334,335,336,337,339,340,341,346,348,349,351,353,354,357,358,361,365,366,367,369,370,372,373,],[-201,17,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-201,159,-24,-201,-201,-201,185,159,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,159,159,-201,159,-201,-201,159,-142,159,-173,159,-13,-16,185,-84,159,159,159,-201,159,159,-143,-174,159,159,-68,185,-76,-17,-18,-20,159,159,-201,-201,-169,-175,-69,-70,159,-72,-78,-77,-19,-21,-22,-171,159,-36,-201,-201,159,-201,-201,-176,-170,185,-116,-80,159,185,-71,-73,-74,-79,-23,-172,-37,-45,159,159,-201,159,159,-201,-81,185,185,-82,-75,-26,159,-30,159,-83,-27,-28,-31,-32,-29,-33,]),'QUALIFIER':([0,2,3,4,5,6,7,8,10,11,12,13,14,15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,179,186,187,188,190,191,192,193,194,198,199,204,206,207,208,209,210,214,216,228,231,232,233,239,241,242,244,247,249,250,253,270,271,274,282,283,284,285,287,288,291,293,294,295,296,298,300,301,302,303,305,306,307,311,313,314,317,319,320,321,323,326,327,329,330,331,333,334,335,336,337,339,340,341,346,351,353,354,357,358,361,365,366,367,369,370,372,373,],[-201,18,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,37,37,37,37,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,37,37,-201,37,37,37,-24,-201,-201,37,-201,37,-46,37,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,37,37,37,37,37,37,-201,37,-201,-201,37,37,37,-142,37,37,-173,37,37,-13,-101,-16,37,37,37,37,37,-201,37,37,-143,263,-174,37,37,-68,-76,-17,-18,-20,37,37,-201,-201,-169,-175,37,37,37,-69,-70,37,-72,-78,-77,-19,-21,-22,-171,37,-36,-201,-201,37,-201,-201,263,-176,-170,-80,37,37,37,-71,-73,-74,-79,-23,-172,-37,-45,37,37,-201,37,37,-201,-81,-82,-75,-26,37,-30,37,-83,-27,-28,-31,-32,-29,-33,]),'INSTANCE':([0,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,179,186,187,188,190,191,192,193,194,198,199,204,206,207,208,209,210,214,228,231,232,233,239,241,242,244,247,249,250,253,270,271,274,282,283,284,285,287,288,291,293,294,295,296,298,300,301,302,303,305,306,307,313,314,317,319,320,321,323,326,327,329,330,331,333,334,335,336,337,339,340,341,346,351,353,354,357,358,361,365,366,367,369,370,372,373,],[-201,19,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,31,59,31,31,31,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,31,31,-201,31,31,31,-24,-201,-201,31,-201,31,-46,31,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,31,31,31,31,31,31,-201,31,-201,-201,31,31,31,-142,31,31,-173,31,31,-13,-101,-16,31,31,31,31,31,-201,31,31,-143,-174,31,31,-68,-76,-17,-18,-20,31,31,-201,-201,-169,-175,31,31,31,-69,-70,31,-72,-78,-77,-19,-21,-22,-171,31,-36,-201,-201,31,-201,-201,-176,-170,-80,31,31,31,-71,-73,-74,-79,-23,-172,-37,-45,31,31,-201,31,31,-201,-81,-82,-75,-26,31,-30,31,-83,-27,-28,-31,-32,-29,-33,]),'$end':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,179,192,194,214,241,242,244,270,294,295,296,298,314,330,331,354,358,366,367,369,370,372,373,],[-201,0,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,-142,-13,-16,-143,-17,-18,-20,-169,-19,-21,-22,-171,-170,-23,-172,-26,-30,-27,-28,-31,-32,-29,-33,]),'PRAGMA':([9,15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[20,35,35,35,35,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,35,35,-201,35,35,35,-24,-201,-201,35,-201,35,-46,35,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,35,35,35,35,35,35,-201,35,-201,-201,35,35,35,35,35,-173,35,35,-101,35,35,35,35,35,-201,35,35,-174,35,35,-68,-76,35,35,-201,-201,-175,35,35,35,-69,-70,35,-72,-78,-77,35,-36,-201,-201,35,-201,-201,-176,-80,35,35,35,-71,-73,-74,-79,-37,-45,35,35,-201,35,35,-201,-81,-82,-75,35,35,-83,]),'IDENTIFIER':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[24,24,24,24,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,24,24,-201,24,24,24,-24,-201,-201,24,-201,24,-46,24,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,24,24,24,24,24,24,-201,24,-201,-201,24,24,24,24,24,-173,24,24,-101,24,24,24,24,24,-201,24,24,-174,24,24,-68,-76,24,24,-201,-201,-175,24,24,24,-69,-70,24,-72,-78,-77,24,-36,-201,-201,24,-201,-201,-176,-80,24,24,24,-71,-73,-74,-79,-37,-45,24,24,-201,24,24,-201,-81,-82,-75,24,24,-83,]),'ANY':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,216,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,311,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[25,25,25,25,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,25,25,-201,25,25,25,-24,-201,-201,25,-201,25,-46,25,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,25,25,25,25,25,25,-201,25,-201,-201,25,25,25,25,25,-173,25,25,-101,25,25,25,25,25,-201,25,25,268,-174,25,25,-68,-76,25,25,-201,-201,-175,25,25,25,-69,-70,25,-72,-78,-77,25,-36,-201,-201,25,-201,-201,268,-176,-80,25,25,25,-71,-73,-74,-79,-37,-45,25,25,-201,25,25,-201,-81,-82,-75,25,25,-83,]),'AS':([15,17,18,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,76,77,91,93,94,95,96,100,101,104,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,211,212,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[26,26,26,26,-183,75,-38,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,26,26,-201,26,75,26,75,26,-24,-201,-201,26,-201,75,26,-46,26,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,26,26,26,26,26,26,-201,26,-201,-201,26,26,26,26,26,-173,26,26,-101,26,26,26,26,26,-201,26,26,75,75,-174,26,26,-68,-76,26,26,-201,-201,-175,26,26,26,-69,-70,26,-72,-78,-77,26,-36,-201,-201,26,-201,-201,-176,-80,26,26,26,-71,-73,-74,-79,-37,-45,26,26,-201,26,26,-201,-81,-82,-75,26,26,-83,]),'DISABLEOVERRIDE':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,82,93,94,95,96,100,101,106,108,109,110,111,112,113,114,115,116,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,173,174,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,256,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,342,346,351,353,357,361,365,],[27,27,27,27,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,27,27,-201,27,27,112,27,-24,-201,-201,27,-201,27,-46,112,-51,-55,-56,-57,-58,-59,112,27,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,27,27,27,27,27,27,-201,27,-201,-201,27,27,27,-52,112,27,27,-173,27,27,-101,27,27,27,27,27,-201,27,27,-174,27,27,-68,-76,27,27,-201,-201,112,-175,27,27,27,-69,-70,27,-72,-78,-77,27,-36,-201,-201,27,-201,-201,-176,-80,27,27,27,-71,-73,-74,-79,-37,-45,27,27,-201,27,27,-201,112,-81,-82,-75,27,27,-83,]),'ENABLEOVERRIDE':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,82,93,94,95,96,100,101,106,108,109,110,111,112,113,114,115,116,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,173,174,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,256,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,342,346,351,353,357,361,365,],[29,29,29,29,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,29,29,-201,29,29,111,29,-24,-201,-201,29,-201,29,-46,111,-51,-55,-56,-57,-58,-59,111,29,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,29,29,29,29,29,29,-201,29,-201,-201,29,29,29,-52,111,29,29,-173,29,29,-101,29,29,29,29,29,-201,29,29,-174,29,29,-68,-76,29,29,-201,-201,111,-175,29,29,29,-69,-70,29,-72,-78,-77,29,-36,-201,-201,29,-201,-201,-176,-80,29,29,29,-71,-73,-74,-79,-37,-45,29,29,-201,29,29,-201,111,-81,-82,-75,29,29,-83,]),'FLAVOR':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,181,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[30,30,30,30,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,30,30,-201,30,30,30,-24,-201,-201,30,-201,30,-46,30,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,30,30,30,30,30,30,-201,30,-201,-201,30,30,30,215,30,30,-173,30,30,-101,30,30,30,30,30,-201,30,30,-174,30,30,-68,-76,30,30,-201,-201,-175,30,30,30,-69,-70,30,-72,-78,-77,30,-36,-201,-201,30,-201,-201,-176,-80,30,30,30,-71,-73,-74,-79,-37,-45,30,30,-201,30,30,-201,-81,-82,-75,30,30,-83,]),'METHOD':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,216,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,311,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[32,32,32,32,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,32,32,-201,32,32,32,-24,-201,-201,32,-201,32,-46,32,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,32,32,32,32,32,32,-201,32,-201,-201,32,32,32,32,32,-173,32,32,-101,32,32,32,32,32,-201,32,32,266,-174,32,32,-68,-76,32,32,-201,-201,-175,32,32,32,-69,-70,32,-72,-78,-77,32,-36,-201,-201,32,-201,-201,266,-176,-80,32,32,32,-71,-73,-74,-79,-37,-45,32,32,-201,32,32,-201,-81,-82,-75,32,32,-83,]),'OF':([15,17,18,19,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[33,33,33,68,33,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,33,77,33,-201,33,33,33,-24,-201,-201,33,-201,33,-46,33,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,33,33,33,33,33,33,-201,33,-201,-201,33,33,33,33,33,-173,33,33,-101,33,33,33,33,33,-201,33,33,-174,33,33,-68,-76,33,33,-201,-201,-175,33,33,33,-69,-70,33,-72,-78,-77,33,-36,-201,-201,33,-201,-201,-176,-80,33,33,33,-71,-73,-74,-79,-37,-45,33,33,-201,33,33,-201,-81,-82,-75,33,33,-83,]),'PARAMETER':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,216,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,311,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[34,34,34,34,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,34,34,-201,34,34,34,-24,-201,-201,34,-201,34,-46,34,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,34,34,34,34,34,34,-201,34,-201,-201,34,34,34,34,34,-173,34,34,-101,34,34,34,34,34,-201,34,34,267,-174,34,34,-68,-76,34,34,-201,-201,-175,34,34,34,-69,-70,34,-72,-78,-77,34,-36,-201,-201,34,-201,-201,267,-176,-80,34,34,34,-71,-73,-74,-79,-37,-45,34,34,-201,34,34,-201,-81,-82,-75,34,34,-83,]),'PROPERTY':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,216,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,311,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[36,36,36,36,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,36,36,-201,36,36,36,-24,-201,-201,36,-201,36,-46,36,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,36,36,36,36,36,36,-201,36,-201,-201,36,36,36,36,36,-173,36,36,-101,36,36,36,36,36,-201,36,36,264,-174,36,36,-68,-76,36,36,-201,-201,-175,36,36,36,-69,-70,36,-72,-78,-77,36,-36,-201,-201,36,-201,-201,264,-176,-80,36,36,36,-71,-73,-74,-79,-37,-45,36,36,-201,36,36,-201,-81,-82,-75,36,36,-83,]),'REFERENCE':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,216,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,311,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[38,38,38,38,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,38,38,-201,38,38,38,-24,-201,-201,38,-201,38,-46,38,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,38,38,38,38,38,38,-201,38,-201,-201,38,38,38,38,38,-173,38,38,-101,38,38,38,38,38,-201,38,38,265,-174,38,38,-68,-76,38,38,-201,-201,-175,38,38,38,-69,-70,38,-72,-78,-77,38,-36,-201,-201,38,-201,-201,265,-176,-80,38,38,38,-71,-73,-74,-79,-37,-45,38,38,-201,38,38,-201,-81,-82,-75,38,38,-83,]),'RESTRICTED':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,82,93,94,95,96,100,101,106,108,109,110,111,112,113,114,115,116,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,173,174,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,256,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,342,346,351,353,357,361,365,],[39,39,39,39,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,39,39,-201,39,39,113,39,-24,-201,-201,39,-201,39,-46,113,-51,-55,-56,-57,-58,-59,113,39,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,39,39,39,39,39,39,-201,39,-201,-201,39,39,39,-52,113,39,39,-173,39,39,-101,39,39,39,39,39,-201,39,39,-174,39,39,-68,-76,39,39,-201,-201,113,-175,39,39,39,-69,-70,39,-72,-78,-77,39,-36,-201,-201,39,-201,-201,-176,-80,39,39,39,-71,-73,-74,-79,-37,-45,39,39,-201,39,39,-201,113,-81,-82,-75,39,39,-83,]),'SCHEMA':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,216,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,311,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[40,40,40,40,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,40,40,-201,40,40,40,-24,-201,-201,40,-201,40,-46,40,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,40,40,40,40,40,40,-201,40,-201,-201,40,40,40,40,40,-173,40,40,-101,40,40,40,40,40,-201,40,40,259,-174,40,40,-68,-76,40,40,-201,-201,-175,40,40,40,-69,-70,40,-72,-78,-77,40,-36,-201,-201,40,-201,-201,259,-176,-80,40,40,40,-71,-73,-74,-79,-37,-45,40,40,-201,40,40,-201,-81,-82,-75,40,40,-83,]),'SCOPE':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,93,94,95,96,100,101,106,108,136,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[41,41,41,41,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,41,41,-201,41,41,41,-24,-201,-201,41,-201,41,-46,182,41,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,41,41,41,41,41,41,-201,41,-201,-201,41,41,41,41,41,-173,41,41,-101,41,41,41,41,41,-201,41,41,-174,41,41,-68,-76,41,41,-201,-201,-175,41,41,41,-69,-70,41,-72,-78,-77,41,-36,-201,-201,41,-201,-201,-176,-80,41,41,41,-71,-73,-74,-79,-37,-45,41,41,-201,41,41,-201,-81,-82,-75,41,41,-83,]),'TOSUBCLASS':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,82,93,94,95,96,100,101,106,108,109,110,111,112,113,114,115,116,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,173,174,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,256,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,342,346,351,353,357,361,365,],[42,42,42,42,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,42,42,-201,42,42,114,42,-24,-201,-201,42,-201,42,-46,114,-51,-55,-56,-57,-58,-59,114,42,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,42,42,42,42,42,42,-201,42,-201,-201,42,42,42,-52,114,42,42,-173,42,42,-101,42,42,42,42,42,-201,42,42,-174,42,42,-68,-76,42,42,-201,-201,114,-175,42,42,42,-69,-70,42,-72,-78,-77,42,-36,-201,-201,42,-201,-201,-176,-80,42,42,42,-71,-73,-74,-79,-37,-45,42,42,-201,42,42,-201,114,-81,-82,-75,42,42,-83,]),'TRANSLATABLE':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,82,93,94,95,96,100,101,106,108,109,110,111,112,113,114,115,116,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,173,174,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,256,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,342,346,351,353,357,361,365,],[43,43,43,43,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,43,43,-201,43,43,115,43,-24,-201,-201,43,-201,43,-46,115,-51,-55,-56,-57,-58,-59,115,43,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,43,43,43,43,43,43,-201,43,-201,-201,43,43,43,-52,115,43,43,-173,43,43,-101,43,43,43,43,43,-201,43,43,-174,43,43,-68,-76,43,43,-201,-201,115,-175,43,43,43,-69,-70,43,-72,-78,-77,43,-36,-201,-201,43,-201,-201,-176,-80,43,43,43,-71,-73,-74,-79,-37,-45,43,43,-201,43,43,-201,115,-81,-82,-75,43,43,-83,]),'DT_UINT8':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[44,44,44,44,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,44,44,-201,44,44,44,44,-24,-201,-201,44,-201,44,-46,44,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,44,44,44,44,44,44,-201,44,-201,-201,44,44,44,44,44,-173,44,44,-101,44,44,44,44,44,-201,44,44,-174,44,44,-68,-76,44,44,-201,-201,-175,44,44,44,-69,-70,44,-72,-78,-77,44,-36,-201,-201,44,-201,-201,-176,-80,44,44,44,-71,-73,-74,-79,-37,-45,44,44,-201,44,44,-201,-81,-82,-75,44,44,-83,]),'DT_SINT8':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[45,45,45,45,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,45,45,-201,45,45,45,45,-24,-201,-201,45,-201,45,-46,45,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,45,45,45,45,45,45,-201,45,-201,-201,45,45,45,45,45,-173,45,45,-101,45,45,45,45,45,-201,45,45,-174,45,45,-68,-76,45,45,-201,-201,-175,45,45,45,-69,-70,45,-72,-78,-77,45,-36,-201,-201,45,-201,-201,-176,-80,45,45,45,-71,-73,-74,-79,-37,-45,45,45,-201,45,45,-201,-81,-82,-75,45,45,-83,]),'DT_UINT16':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[46,46,46,46,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,46,46,-201,46,46,46,46,-24,-201,-201,46,-201,46,-46,46,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,46,46,46,46,46,46,-201,46,-201,-201,46,46,46,46,46,-173,46,46,-101,46,46,46,46,46,-201,46,46,-174,46,46,-68,-76,46,46,-201,-201,-175,46,46,46,-69,-70,46,-72,-78,-77,46,-36,-201,-201,46,-201,-201,-176,-80,46,46,46,-71,-73,-74,-79,-37,-45,46,46,-201,46,46,-201,-81,-82,-75,46,46,-83,]),'DT_SINT16':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[47,47,47,47,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,47,47,-201,47,47,47,47,-24,-201,-201,47,-201,47,-46,47,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,47,47,47,47,47,47,-201,47,-201,-201,47,47,47,47,47,-173,47,47,-101,47,47,47,47,47,-201,47,47,-174,47,47,-68,-76,47,47,-201,-201,-175,47,47,47,-69,-70,47,-72,-78,-77,47,-36,-201,-201,47,-201,-201,-176,-80,47,47,47,-71,-73,-74,-79,-37,-45,47,47,-201,47,47,-201,-81,-82,-75,47,47,-83,]),'DT_UINT32':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[48,48,48,48,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,48,48,-201,48,48,48,48,-24,-201,-201,48,-201,48,-46,48,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,48,48,48,48,48,48,-201,48,-201,-201,48,48,48,48,48,-173,48,48,-101,48,48,48,48,48,-201,48,48,-174,48,48,-68,-76,48,48,-201,-201,-175,48,48,48,-69,-70,48,-72,-78,-77,48,-36,-201,-201,48,-201,-201,-176,-80,48,48,48,-71,-73,-74,-79,-37,-45,48,48,-201,48,48,-201,-81,-82,-75,48,48,-83,]),'DT_SINT32':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[49,49,49,49,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,49,49,-201,49,49,49,49,-24,-201,-201,49,-201,49,-46,49,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,49,49,49,49,49,49,-201,49,-201,-201,49,49,49,49,49,-173,49,49,-101,49,49,49,49,49,-201,49,49,-174,49,49,-68,-76,49,49,-201,-201,-175,49,49,49,-69,-70,49,-72,-78,-77,49,-36,-201,-201,49,-201,-201,-176,-80,49,49,49,-71,-73,-74,-79,-37,-45,49,49,-201,49,49,-201,-81,-82,-75,49,49,-83,]),'DT_UINT64':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[50,50,50,50,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,50,50,-201,50,50,50,50,-24,-201,-201,50,-201,50,-46,50,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,50,50,50,50,50,50,-201,50,-201,-201,50,50,50,50,50,-173,50,50,-101,50,50,50,50,50,-201,50,50,-174,50,50,-68,-76,50,50,-201,-201,-175,50,50,50,-69,-70,50,-72,-78,-77,50,-36,-201,-201,50,-201,-201,-176,-80,50,50,50,-71,-73,-74,-79,-37,-45,50,50,-201,50,50,-201,-81,-82,-75,50,50,-83,]),'DT_SINT64':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[51,51,51,51,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,51,51,-201,51,51,51,51,-24,-201,-201,51,-201,51,-46,51,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,51,51,51,51,51,51,-201,51,-201,-201,51,51,51,51,51,-173,51,51,-101,51,51,51,51,51,-201,51,51,-174,51,51,-68,-76,51,51,-201,-201,-175,51,51,51,-69,-70,51,-72,-78,-77,51,-36,-201,-201,51,-201,-201,-176,-80,51,51,51,-71,-73,-74,-79,-37,-45,51,51,-201,51,51,-201,-81,-82,-75,51,51,-83,]),'DT_REAL32':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[52,52,52,52,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,52,52,-201,52,52,52,52,-24,-201,-201,52,-201,52,-46,52,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,52,52,52,52,52,52,-201,52,-201,-201,52,52,52,52,52,-173,52,52,-101,52,52,52,52,52,-201,52,52,-174,52,52,-68,-76,52,52,-201,-201,-175,52,52,52,-69,-70,52,-72,-78,-77,52,-36,-201,-201,52,-201,-201,-176,-80,52,52,52,-71,-73,-74,-79,-37,-45,52,52,-201,52,52,-201,-81,-82,-75,52,52,-83,]),'DT_REAL64':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[53,53,53,53,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,53,53,-201,53,53,53,53,-24,-201,-201,53,-201,53,-46,53,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,53,53,53,53,53,53,-201,53,-201,-201,53,53,53,53,53,-173,53,53,-101,53,53,53,53,53,-201,53,53,-174,53,53,-68,-76,53,53,-201,-201,-175,53,53,53,-69,-70,53,-72,-78,-77,53,-36,-201,-201,53,-201,-201,-176,-80,53,53,53,-71,-73,-74,-79,-37,-45,53,53,-201,53,53,-201,-81,-82,-75,53,53,-83,]),'DT_CHAR16':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[54,54,54,54,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,54,54,-201,54,54,54,54,-24,-201,-201,54,-201,54,-46,54,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,54,54,54,54,54,54,-201,54,-201,-201,54,54,54,54,54,-173,54,54,-101,54,54,54,54,54,-201,54,54,-174,54,54,-68,-76,54,54,-201,-201,-175,54,54,54,-69,-70,54,-72,-78,-77,54,-36,-201,-201,54,-201,-201,-176,-80,54,54,54,-71,-73,-74,-79,-37,-45,54,54,-201,54,54,-201,-81,-82,-75,54,54,-83,]),'DT_STR':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[55,55,55,55,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,55,55,-201,55,55,55,55,-24,-201,-201,55,-201,55,-46,55,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,55,55,55,55,55,55,-201,55,-201,-201,55,55,55,55,55,-173,55,55,-101,55,55,55,55,55,-201,55,55,-174,55,55,-68,-76,55,55,-201,-201,-175,55,55,55,-69,-70,55,-72,-78,-77,55,-36,-201,-201,55,-201,-201,-176,-80,55,55,55,-71,-73,-74,-79,-37,-45,55,55,-201,55,55,-201,-81,-82,-75,55,55,-83,]),'DT_BOOL':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[56,56,56,56,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,56,56,-201,56,56,56,56,-24,-201,-201,56,-201,56,-46,56,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,56,56,56,56,56,56,-201,56,-201,-201,56,56,56,56,56,-173,56,56,-101,56,56,56,56,56,-201,56,56,-174,56,56,-68,-76,56,56,-201,-201,-175,56,56,56,-69,-70,56,-72,-78,-77,56,-36,-201,-201,56,-201,-201,-176,-80,56,56,56,-71,-73,-74,-79,-37,-45,56,56,-201,56,56,-201,-81,-82,-75,56,56,-83,]),'DT_DATETIME':([15,17,18,20,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,68,71,74,77,90,93,94,95,96,100,101,106,108,138,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,164,165,166,168,170,172,186,187,188,190,191,193,198,199,204,206,207,208,209,210,228,231,232,233,239,247,249,250,253,271,274,282,283,284,285,287,288,291,293,300,301,302,303,305,306,307,313,317,319,320,321,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[57,57,57,57,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,57,57,-201,57,57,57,57,-24,-201,-201,57,-201,57,-46,57,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,57,57,57,57,57,57,-201,57,-201,-201,57,57,57,57,57,-173,57,57,-101,57,57,57,57,57,-201,57,57,-174,57,57,-68,-76,57,57,-201,-201,-175,57,57,57,-69,-70,57,-72,-78,-77,57,-36,-201,-201,57,-201,-201,-176,-80,57,57,57,-71,-73,-74,-79,-37,-45,57,57,-201,57,57,-201,-81,-82,-75,57,57,-83,]),'ASSOCIATION':([17,18,106,159,216,311,],[60,66,66,66,261,261,]),'INDICATION':([17,18,106,159,216,311,],[61,67,67,67,262,262,]),'{':([21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,60,61,63,64,66,67,72,73,76,91,97,98,99,102,103,104,139,163,167,169,186,211,212,251,252,254,255,304,308,],[-183,71,-38,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-145,-146,86,-144,-145,-146,95,96,101,138,162,-41,-39,165,166,168,191,-40,208,210,86,250,253,302,303,306,307,337,341,]),':':([21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,60,61,63,64,65,66,67,73,76,83,85,99,103,133,163,175,177,211,212,252,255,],[-183,74,-38,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-145,-146,82,-144,90,-145,-146,74,74,116,-54,-39,74,-124,-40,-53,-123,74,74,74,74,]),'(':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,60,61,63,64,66,67,69,70,182,195,197,215,236,],[-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-145,-146,84,-144,-145,-146,92,-14,216,232,-86,256,287,]),']':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,60,61,62,63,64,66,67,78,79,80,81,83,85,109,110,111,112,113,114,115,124,125,126,127,133,171,173,174,175,177,185,219,],[-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-145,-146,-201,-47,-144,-145,-146,105,-34,107,108,-49,-54,-48,-51,-55,-56,-57,-58,-59,-135,-136,-137,-138,-124,-35,-52,-50,-53,-123,218,269,]),',':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,60,61,62,63,64,66,67,78,79,80,81,83,85,87,88,89,109,110,111,112,113,114,115,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,163,171,173,174,175,176,177,183,184,213,217,218,220,221,222,223,224,225,226,257,258,259,260,261,262,263,264,265,266,267,268,269,276,277,278,279,280,281,309,310,312,315,316,322,325,344,345,347,348,349,350,362,363,364,],[-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-145,-146,-201,-47,-144,-145,-146,106,-34,106,106,-49,-54,136,-147,-148,-48,-51,-55,-56,-57,-58,-59,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-127,-177,-178,-179,178,-124,-125,181,-151,-40,-35,-52,-50,-53,-128,-123,-149,-152,-126,-150,-117,-119,-120,-121,-122,-139,-140,-141,311,-154,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-118,319,-102,-104,-105,-106,-107,342,-167,-153,-108,-116,-112,319,-155,-109,-103,-110,-114,-113,-168,-111,-115,]),'REF':([21,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,142,156,198,274,320,],[-183,-38,-180,-181,-182,-184,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,193,-185,-185,-185,-185,]),';':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,135,143,163,176,177,180,196,197,200,201,202,203,205,218,220,221,222,223,224,225,226,227,229,234,235,237,238,240,243,245,246,248,269,272,273,275,286,289,290,292,297,299,312,318,324,328,332,338,343,352,355,356,359,360,368,371,],[-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-127,-177,-178,-179,-124,179,194,-40,-128,-123,214,233,-84,239,-85,241,242,244,-117,-119,-120,-121,-122,-139,-140,-141,270,271,284,285,288,291,293,294,295,296,298,-118,313,314,317,323,326,327,329,330,331,-153,346,351,353,354,358,-166,365,366,367,369,370,372,373,]),'=':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,137,183,189,196,197,200,201,218,230,235,237,238,269,290,],[-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,186,186,186,186,-84,186,-85,-117,186,186,186,186,-118,186,]),')':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,111,112,113,114,115,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,140,141,176,218,232,257,258,259,260,261,262,263,264,265,266,267,268,269,276,277,278,279,280,281,287,309,310,315,316,322,325,344,345,347,348,349,350,362,363,364,],[-183,-180,-181,-182,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-55,-56,-57,-58,-59,175,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-127,-177,-178,-179,192,-15,-128,-117,275,312,-154,-156,-157,-158,-159,-160,-161,-162,-163,-164,-165,-118,318,-102,-104,-105,-106,-107,324,343,-167,-108,-116,-112,352,-155,-109,-103,-110,-114,-113,-168,-111,-115,]),'}':([71,86,93,94,95,96,101,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,134,144,145,146,147,148,149,150,151,152,153,154,155,160,161,162,164,165,166,176,187,188,204,206,207,208,209,213,228,231,233,239,247,249,250,253,271,284,285,288,291,293,300,301,302,303,305,306,307,313,317,323,326,327,329,333,334,335,336,337,339,340,341,346,351,353,357,361,365,],[-201,133,143,-24,-201,-201,-201,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-127,-177,-178,-179,177,-125,-25,-42,-43,-44,-60,-61,-62,-63,-64,-65,-66,-67,202,203,-201,205,-201,-201,-128,227,-173,243,245,246,-201,248,-126,-174,273,-68,-76,297,299,-201,-201,-175,-69,-70,-72,-78,-77,332,-36,-201,-201,338,-201,-201,-176,-80,-71,-73,-74,-79,-37,-45,355,356,-201,359,360,-201,-81,-82,-75,368,371,-83,]),'$':([75,186,],[100,100,]),'floatValue':([84,86,178,186,],[119,119,119,119,]),'charValue':([84,86,178,186,],[120,120,120,120,]),'binaryValue':([84,86,178,185,186,],[124,124,124,124,124,]),'octalValue':([84,86,178,185,186,],[125,125,125,125,125,]),'decimalValue':([84,86,178,185,186,],[126,126,126,126,126,]),'hexValue':([84,86,178,185,186,],[127,127,127,127,127,]),'stringValue':([84,86,92,121,128,176,178,186,],[128,128,141,176,-127,-128,128,128,]),'FALSE':([84,86,178,186,],[129,129,129,129,]),'TRUE':([84,86,178,186,],[130,130,130,130,]),'NULL':([84,86,178,186,],[131,131,131,131,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'mofSpecification':([0,],[1,]),'mofProductionList':([0,],[2,]),'empty':([0,60,61,62,71,95,96,101,162,165,166,208,250,253,302,303,306,307,337,341,],[3,79,79,79,94,94,94,94,94,94,94,94,301,94,301,301,94,94,301,94,]),'mofProduction':([2,],[4,]),'compilerDirective':([2,],[5,]),'mp_createClass':([2,],[6,]),'mp_setQualifier':([2,],[7,]),'mp_createInstance':([2,],[8,]),'classDeclaration':([2,],[10,]),'assocDeclaration':([2,],[11,]),'indicDeclaration':([2,],[12,]),'qualifierDeclaration':([2,],[13,]),'instanceDeclaration':([2,],[14,]),'qualifierList':([2,93,138,160,161,164,168,187,191,204,206,207,209,210,231,232,247,249,287,300,305,319,335,336,339,340,357,361,],[16,157,190,157,157,157,190,190,190,157,157,157,190,190,190,282,157,190,282,157,157,282,157,157,157,157,157,157,]),'className':([15,58,68,74,77,93,157,160,161,164,170,172,204,206,207,232,247,282,287,300,305,319,335,336,339,340,357,361,],[22,76,91,98,104,142,142,142,142,142,211,212,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'identifier':([15,17,18,20,58,68,74,77,93,100,106,138,156,157,158,159,160,161,164,168,170,172,186,187,190,191,198,199,204,206,207,209,210,231,232,247,249,274,282,283,287,300,305,319,320,321,335,336,339,340,357,361,],[23,64,64,70,23,23,23,23,23,163,64,189,197,23,201,64,23,23,23,189,23,23,226,189,230,189,197,201,23,23,23,189,189,189,23,23,189,316,23,316,23,23,23,23,316,316,23,23,23,23,23,23,]),'dataType':([15,17,18,20,58,68,74,77,90,93,100,106,138,156,157,158,159,160,161,164,168,170,172,186,187,190,191,198,199,204,206,207,209,210,231,232,247,249,274,282,283,287,300,305,319,320,321,335,336,339,340,357,361,],[28,28,28,28,28,28,28,28,137,156,28,28,28,28,198,28,28,156,156,156,28,28,28,28,28,28,28,28,28,156,156,156,28,28,28,274,156,28,28,320,28,274,156,156,274,28,28,156,156,156,156,156,156,]),'qualifier':([17,106,159,],[62,171,62,]),'qualifierName':([17,18,106,159,],[63,65,63,63,]),'pragmaName':([20,],[69,]),'superClass':([22,73,76,103,211,212,252,255,],[72,97,102,167,251,254,304,308,]),'alias':([22,76,91,104,211,212,],[73,103,139,169,252,255,]),'qualifierListEmpty':([60,61,62,],[78,80,81,]),'qualifierParameter':([63,],[83,]),'arrayInitializer':([63,186,],[85,222,]),'qualifierType':([65,],[87,]),'qualifierType_1':([65,],[88,]),'qualifierType_2':([65,],[89,]),'classFeatureList':([71,95,96,101,162,165,166,208,253,306,307,341,],[93,160,161,164,204,206,207,247,305,339,340,361,]),'aliasIdentifier':([75,186,],[99,225,]),'flavorList':([82,116,],[109,174,]),'flavor':([82,109,116,174,256,342,],[110,173,110,173,310,362,]),'constantValue':([84,86,178,186,],[117,134,213,221,]),'integerValue':([84,86,178,185,186,],[118,118,118,219,118,]),'stringValueList':([84,86,178,186,],[121,121,121,121,]),'booleanValue':([84,86,178,186,],[122,122,122,122,]),'nullValue':([84,86,178,186,],[123,123,123,123,]),'constantValueList':([86,],[132,]),'scope':([87,],[135,]),'pragmaParameter':([92,],[140,]),'classFeature':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[144,144,144,144,144,144,144,144,334,144,334,334,144,144,334,144,]),'propertyDeclaration':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,]),'methodDeclaration':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,]),'referenceDeclaration':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'propertyDeclaration_1':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'propertyDeclaration_2':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,]),'propertyDeclaration_3':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,]),'propertyDeclaration_4':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,]),'propertyDeclaration_5':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,]),'propertyDeclaration_6':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,]),'propertyDeclaration_7':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,]),'propertyDeclaration_8':([93,160,161,164,204,206,207,247,300,305,335,336,339,340,357,361,],[155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,]),'objectRef':([93,157,160,161,164,204,206,207,232,247,282,287,300,305,319,335,336,339,340,357,361,],[158,199,158,158,158,158,158,158,283,158,321,283,158,158,283,158,158,158,158,158,158,]),'defaultFlavor':([135,],[180,]),'array':([137,196,237,315,322,348,349,],[183,235,290,345,350,363,364,]),'defaultValue':([137,183,189,196,200,230,235,237,238,290,],[184,217,229,234,240,272,286,289,292,328,]),'valueInitializerList':([138,168,191,210,],[187,209,231,249,]),'valueInitializer':([138,168,187,191,209,210,231,249,],[188,188,228,188,228,188,228,228,]),'methodName':([156,198,],[195,236,]),'propertyName':([156,198,],[196,237,]),'referenceName':([158,199,],[200,238,]),'initializer':([186,],[220,]),'referenceInitializer':([186,],[223,]),'objectHandle':([186,],[224,]),'metaElementList':([216,],[257,]),'metaElement':([216,311,],[258,344,]),'parameterList':([232,287,],[276,325,]),'parameter':([232,287,319,],[277,277,347,]),'parameter_1':([232,287,319,],[278,278,278,]),'parameter_2':([232,287,319,],[279,279,279,]),'parameter_3':([232,287,319,],[280,280,280,]),'parameter_4':([232,287,319,],[281,281,281,]),'associationFeatureList':([250,302,303,337,],[300,335,336,357,]),'flavorListWithComma':([256,],[309,]),'parameterName':([274,283,320,321,],[315,322,348,349,]),'associationFeature':([300,335,336,357,],[333,333,333,333,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> mofSpecification","S'",1,None,None,None),
+  ('mofSpecification -> mofProductionList','mofSpecification',1,'p_mofSpecification','mof_compiler.py',318),
+  ('mofProductionList -> empty','mofProductionList',1,'p_mofProductionList','mof_compiler.py',322),
+  ('mofProductionList -> mofProductionList mofProduction','mofProductionList',2,'p_mofProductionList','mof_compiler.py',323),
+  ('mofProduction -> compilerDirective','mofProduction',1,'p_mofProduction','mof_compiler.py',328),
+  ('mofProduction -> mp_createClass','mofProduction',1,'p_mofProduction','mof_compiler.py',329),
+  ('mofProduction -> mp_setQualifier','mofProduction',1,'p_mofProduction','mof_compiler.py',330),
+  ('mofProduction -> mp_createInstance','mofProduction',1,'p_mofProduction','mof_compiler.py',331),
+  ('mp_createClass -> classDeclaration','mp_createClass',1,'p_mp_createClass','mof_compiler.py',399),
+  ('mp_createClass -> assocDeclaration','mp_createClass',1,'p_mp_createClass','mof_compiler.py',400),
+  ('mp_createClass -> indicDeclaration','mp_createClass',1,'p_mp_createClass','mof_compiler.py',401),
+  ('mp_createInstance -> instanceDeclaration','mp_createInstance',1,'p_mp_createInstance','mof_compiler.py',636),
+  ('mp_setQualifier -> qualifierDeclaration','mp_setQualifier',1,'p_mp_setQualifier','mof_compiler.py',644),
+  ('compilerDirective -> # PRAGMA pragmaName ( pragmaParameter )','compilerDirective',6,'p_compilerDirective','mof_compiler.py',663),
+  ('pragmaName -> identifier','pragmaName',1,'p_pragmaName','mof_compiler.py',679),
+  ('pragmaParameter -> stringValue','pragmaParameter',1,'p_pragmaParameter','mof_compiler.py',683),
+  ('classDeclaration -> CLASS className { classFeatureList } ;','classDeclaration',6,'p_classDeclaration','mof_compiler.py',687),
+  ('classDeclaration -> CLASS className superClass { classFeatureList } ;','classDeclaration',7,'p_classDeclaration','mof_compiler.py',688),
+  ('classDeclaration -> CLASS className alias { classFeatureList } ;','classDeclaration',7,'p_classDeclaration','mof_compiler.py',689),
+  ('classDeclaration -> CLASS className alias superClass { classFeatureList } ;','classDeclaration',8,'p_classDeclaration','mof_compiler.py',690),
+  ('classDeclaration -> qualifierList CLASS className { classFeatureList } ;','classDeclaration',7,'p_classDeclaration','mof_compiler.py',691),
+  ('classDeclaration -> qualifierList CLASS className superClass { classFeatureList } ;','classDeclaration',8,'p_classDeclaration','mof_compiler.py',692),
+  ('classDeclaration -> qualifierList CLASS className alias { classFeatureList } ;','classDeclaration',8,'p_classDeclaration','mof_compiler.py',693),
+  ('classDeclaration -> qualifierList CLASS className alias superClass { classFeatureList } ;','classDeclaration',9,'p_classDeclaration','mof_compiler.py',694),
+  ('classFeatureList -> empty','classFeatureList',1,'p_classFeatureList','mof_compiler.py',746),
+  ('classFeatureList -> classFeatureList classFeature','classFeatureList',2,'p_classFeatureList','mof_compiler.py',747),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className { associationFeatureList } ;','assocDeclaration',10,'p_assocDeclaration','mof_compiler.py',755),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className superClass { associationFeatureList } ;','assocDeclaration',11,'p_assocDeclaration','mof_compiler.py',756),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className alias { associationFeatureList } ;','assocDeclaration',11,'p_assocDeclaration','mof_compiler.py',757),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className alias superClass { associationFeatureList } ;','assocDeclaration',12,'p_assocDeclaration','mof_compiler.py',758),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className { classFeatureList } ;','indicDeclaration',10,'p_indicDeclaration','mof_compiler.py',767),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className superClass { classFeatureList } ;','indicDeclaration',11,'p_indicDeclaration','mof_compiler.py',768),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className alias { classFeatureList } ;','indicDeclaration',11,'p_indicDeclaration','mof_compiler.py',769),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className alias superClass { classFeatureList } ;','indicDeclaration',12,'p_indicDeclaration','mof_compiler.py',770),
+  ('qualifierListEmpty -> empty','qualifierListEmpty',1,'p_qualifierListEmpty','mof_compiler.py',811),
+  ('qualifierListEmpty -> qualifierListEmpty , qualifier','qualifierListEmpty',3,'p_qualifierListEmpty','mof_compiler.py',812),
+  ('associationFeatureList -> empty','associationFeatureList',1,'p_associationFeatureList','mof_compiler.py',820),
+  ('associationFeatureList -> associationFeatureList associationFeature','associationFeatureList',2,'p_associationFeatureList','mof_compiler.py',821),
+  ('className -> identifier','className',1,'p_className','mof_compiler.py',829),
+  ('alias -> AS aliasIdentifier','alias',2,'p_alias','mof_compiler.py',833),
+  ('aliasIdentifier -> $ identifier','aliasIdentifier',2,'p_aliasIdentifier','mof_compiler.py',837),
+  ('superClass -> : className','superClass',2,'p_superClass','mof_compiler.py',841),
+  ('classFeature -> propertyDeclaration','classFeature',1,'p_classFeature','mof_compiler.py',845),
+  ('classFeature -> methodDeclaration','classFeature',1,'p_classFeature','mof_compiler.py',846),
+  ('classFeature -> referenceDeclaration','classFeature',1,'p_classFeature','mof_compiler.py',847),
+  ('associationFeature -> classFeature','associationFeature',1,'p_associationFeature','mof_compiler.py',852),
+  ('qualifierList -> [ qualifier qualifierListEmpty ]','qualifierList',4,'p_qualifierList','mof_compiler.py',856),
+  ('qualifier -> qualifierName','qualifier',1,'p_qualifier','mof_compiler.py',860),
+  ('qualifier -> qualifierName : flavorList','qualifier',3,'p_qualifier','mof_compiler.py',861),
+  ('qualifier -> qualifierName qualifierParameter','qualifier',2,'p_qualifier','mof_compiler.py',862),
+  ('qualifier -> qualifierName qualifierParameter : flavorList','qualifier',4,'p_qualifier','mof_compiler.py',863),
+  ('flavorList -> flavor','flavorList',1,'p_flavorList','mof_compiler.py',917),
+  ('flavorList -> flavorList flavor','flavorList',2,'p_flavorList','mof_compiler.py',918),
+  ('qualifierParameter -> ( constantValue )','qualifierParameter',3,'p_qualifierParameter','mof_compiler.py',926),
+  ('qualifierParameter -> arrayInitializer','qualifierParameter',1,'p_qualifierParameter','mof_compiler.py',927),
+  ('flavor -> ENABLEOVERRIDE','flavor',1,'p_flavor','mof_compiler.py',935),
+  ('flavor -> DISABLEOVERRIDE','flavor',1,'p_flavor','mof_compiler.py',936),
+  ('flavor -> RESTRICTED','flavor',1,'p_flavor','mof_compiler.py',937),
+  ('flavor -> TOSUBCLASS','flavor',1,'p_flavor','mof_compiler.py',938),
+  ('flavor -> TRANSLATABLE','flavor',1,'p_flavor','mof_compiler.py',939),
+  ('propertyDeclaration -> propertyDeclaration_1','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',944),
+  ('propertyDeclaration -> propertyDeclaration_2','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',945),
+  ('propertyDeclaration -> propertyDeclaration_3','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',946),
+  ('propertyDeclaration -> propertyDeclaration_4','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',947),
+  ('propertyDeclaration -> propertyDeclaration_5','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',948),
+  ('propertyDeclaration -> propertyDeclaration_6','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',949),
+  ('propertyDeclaration -> propertyDeclaration_7','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',950),
+  ('propertyDeclaration -> propertyDeclaration_8','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',951),
+  ('propertyDeclaration_1 -> dataType propertyName ;','propertyDeclaration_1',3,'p_propertyDeclaration_1','mof_compiler.py',956),
+  ('propertyDeclaration_2 -> dataType propertyName defaultValue ;','propertyDeclaration_2',4,'p_propertyDeclaration_2','mof_compiler.py',960),
+  ('propertyDeclaration_3 -> dataType propertyName array ;','propertyDeclaration_3',4,'p_propertyDeclaration_3','mof_compiler.py',964),
+  ('propertyDeclaration_4 -> dataType propertyName array defaultValue ;','propertyDeclaration_4',5,'p_propertyDeclaration_4','mof_compiler.py',969),
+  ('propertyDeclaration_5 -> qualifierList dataType propertyName ;','propertyDeclaration_5',4,'p_propertyDeclaration_5','mof_compiler.py',974),
+  ('propertyDeclaration_6 -> qualifierList dataType propertyName defaultValue ;','propertyDeclaration_6',5,'p_propertyDeclaration_6','mof_compiler.py',979),
+  ('propertyDeclaration_7 -> qualifierList dataType propertyName array ;','propertyDeclaration_7',5,'p_propertyDeclaration_7','mof_compiler.py',986),
+  ('propertyDeclaration_8 -> qualifierList dataType propertyName array defaultValue ;','propertyDeclaration_8',6,'p_propertyDeclaration_8','mof_compiler.py',992),
+  ('referenceDeclaration -> objectRef referenceName ;','referenceDeclaration',3,'p_referenceDeclaration','mof_compiler.py',1000),
+  ('referenceDeclaration -> objectRef referenceName defaultValue ;','referenceDeclaration',4,'p_referenceDeclaration','mof_compiler.py',1001),
+  ('referenceDeclaration -> qualifierList objectRef referenceName ;','referenceDeclaration',4,'p_referenceDeclaration','mof_compiler.py',1002),
+  ('referenceDeclaration -> qualifierList objectRef referenceName defaultValue ;','referenceDeclaration',5,'p_referenceDeclaration','mof_compiler.py',1003),
+  ('methodDeclaration -> dataType methodName ( ) ;','methodDeclaration',5,'p_methodDeclaration','mof_compiler.py',1024),
+  ('methodDeclaration -> dataType methodName ( parameterList ) ;','methodDeclaration',6,'p_methodDeclaration','mof_compiler.py',1025),
+  ('methodDeclaration -> qualifierList dataType methodName ( ) ;','methodDeclaration',6,'p_methodDeclaration','mof_compiler.py',1026),
+  ('methodDeclaration -> qualifierList dataType methodName ( parameterList ) ;','methodDeclaration',7,'p_methodDeclaration','mof_compiler.py',1027),
+  ('propertyName -> identifier','propertyName',1,'p_propertyName','mof_compiler.py',1051),
+  ('referenceName -> identifier','referenceName',1,'p_referenceName','mof_compiler.py',1055),
+  ('methodName -> identifier','methodName',1,'p_methodName','mof_compiler.py',1059),
+  ('dataType -> DT_UINT8','dataType',1,'p_dataType','mof_compiler.py',1063),
+  ('dataType -> DT_SINT8','dataType',1,'p_dataType','mof_compiler.py',1064),
+  ('dataType -> DT_UINT16','dataType',1,'p_dataType','mof_compiler.py',1065),
+  ('dataType -> DT_SINT16','dataType',1,'p_dataType','mof_compiler.py',1066),
+  ('dataType -> DT_UINT32','dataType',1,'p_dataType','mof_compiler.py',1067),
+  ('dataType -> DT_SINT32','dataType',1,'p_dataType','mof_compiler.py',1068),
+  ('dataType -> DT_UINT64','dataType',1,'p_dataType','mof_compiler.py',1069),
+  ('dataType -> DT_SINT64','dataType',1,'p_dataType','mof_compiler.py',1070),
+  ('dataType -> DT_REAL32','dataType',1,'p_dataType','mof_compiler.py',1071),
+  ('dataType -> DT_REAL64','dataType',1,'p_dataType','mof_compiler.py',1072),
+  ('dataType -> DT_CHAR16','dataType',1,'p_dataType','mof_compiler.py',1073),
+  ('dataType -> DT_STR','dataType',1,'p_dataType','mof_compiler.py',1074),
+  ('dataType -> DT_BOOL','dataType',1,'p_dataType','mof_compiler.py',1075),
+  ('dataType -> DT_DATETIME','dataType',1,'p_dataType','mof_compiler.py',1076),
+  ('objectRef -> className REF','objectRef',2,'p_objectRef','mof_compiler.py',1081),
+  ('parameterList -> parameter','parameterList',1,'p_parameterList','mof_compiler.py',1085),
+  ('parameterList -> parameterList , parameter','parameterList',3,'p_parameterList','mof_compiler.py',1086),
+  ('parameter -> parameter_1','parameter',1,'p_parameter','mof_compiler.py',1094),
+  ('parameter -> parameter_2','parameter',1,'p_parameter','mof_compiler.py',1095),
+  ('parameter -> parameter_3','parameter',1,'p_parameter','mof_compiler.py',1096),
+  ('parameter -> parameter_4','parameter',1,'p_parameter','mof_compiler.py',1097),
+  ('parameter_1 -> dataType parameterName','parameter_1',2,'p_parameter_1','mof_compiler.py',1102),
+  ('parameter_1 -> dataType parameterName array','parameter_1',3,'p_parameter_1','mof_compiler.py',1103),
+  ('parameter_2 -> qualifierList dataType parameterName','parameter_2',3,'p_parameter_2','mof_compiler.py',1112),
+  ('parameter_2 -> qualifierList dataType parameterName array','parameter_2',4,'p_parameter_2','mof_compiler.py',1113),
+  ('parameter_3 -> objectRef parameterName','parameter_3',2,'p_parameter_3','mof_compiler.py',1123),
+  ('parameter_3 -> objectRef parameterName array','parameter_3',3,'p_parameter_3','mof_compiler.py',1124),
+  ('parameter_4 -> qualifierList objectRef parameterName','parameter_4',3,'p_parameter_4','mof_compiler.py',1133),
+  ('parameter_4 -> qualifierList objectRef parameterName array','parameter_4',4,'p_parameter_4','mof_compiler.py',1134),
+  ('parameterName -> identifier','parameterName',1,'p_parameterName','mof_compiler.py',1145),
+  ('array -> [ ]','array',2,'p_array','mof_compiler.py',1149),
+  ('array -> [ integerValue ]','array',3,'p_array','mof_compiler.py',1150),
+  ('defaultValue -> = initializer','defaultValue',2,'p_defaultValue','mof_compiler.py',1158),
+  ('initializer -> constantValue','initializer',1,'p_initializer','mof_compiler.py',1162),
+  ('initializer -> arrayInitializer','initializer',1,'p_initializer','mof_compiler.py',1163),
+  ('initializer -> referenceInitializer','initializer',1,'p_initializer','mof_compiler.py',1164),
+  ('arrayInitializer -> { constantValueList }','arrayInitializer',3,'p_arrayInitializer','mof_compiler.py',1169),
+  ('arrayInitializer -> { }','arrayInitializer',2,'p_arrayInitializer','mof_compiler.py',1170),
+  ('constantValueList -> constantValue','constantValueList',1,'p_constantValueList','mof_compiler.py',1178),
+  ('constantValueList -> constantValueList , constantValue','constantValueList',3,'p_constantValueList','mof_compiler.py',1179),
+  ('stringValueList -> stringValue','stringValueList',1,'p_stringValueList','mof_compiler.py',1243),
+  ('stringValueList -> stringValueList stringValue','stringValueList',2,'p_stringValueList','mof_compiler.py',1244),
+  ('constantValue -> integerValue','constantValue',1,'p_constantValue','mof_compiler.py',1253),
+  ('constantValue -> floatValue','constantValue',1,'p_constantValue','mof_compiler.py',1254),
+  ('constantValue -> charValue','constantValue',1,'p_constantValue','mof_compiler.py',1255),
+  ('constantValue -> stringValueList','constantValue',1,'p_constantValue','mof_compiler.py',1256),
+  ('constantValue -> booleanValue','constantValue',1,'p_constantValue','mof_compiler.py',1257),
+  ('constantValue -> nullValue','constantValue',1,'p_constantValue','mof_compiler.py',1258),
+  ('integerValue -> binaryValue','integerValue',1,'p_integerValue','mof_compiler.py',1263),
+  ('integerValue -> octalValue','integerValue',1,'p_integerValue','mof_compiler.py',1264),
+  ('integerValue -> decimalValue','integerValue',1,'p_integerValue','mof_compiler.py',1265),
+  ('integerValue -> hexValue','integerValue',1,'p_integerValue','mof_compiler.py',1266),
+  ('referenceInitializer -> objectHandle','referenceInitializer',1,'p_referenceInitializer','mof_compiler.py',1272),
+  ('referenceInitializer -> aliasIdentifier','referenceInitializer',1,'p_referenceInitializer','mof_compiler.py',1273),
+  ('objectHandle -> identifier','objectHandle',1,'p_objectHandle','mof_compiler.py',1287),
+  ('qualifierDeclaration -> QUALIFIER qualifierName qualifierType scope ;','qualifierDeclaration',5,'p_qualifierDeclaration','mof_compiler.py',1291),
+  ('qualifierDeclaration -> QUALIFIER qualifierName qualifierType scope defaultFlavor ;','qualifierDeclaration',6,'p_qualifierDeclaration','mof_compiler.py',1292),
+  ('qualifierName -> identifier','qualifierName',1,'p_qualifierName','mof_compiler.py',1338),
+  ('qualifierName -> ASSOCIATION','qualifierName',1,'p_qualifierName','mof_compiler.py',1339),
+  ('qualifierName -> INDICATION','qualifierName',1,'p_qualifierName','mof_compiler.py',1340),
+  ('qualifierType -> qualifierType_1','qualifierType',1,'p_qualifierType','mof_compiler.py',1345),
+  ('qualifierType -> qualifierType_2','qualifierType',1,'p_qualifierType','mof_compiler.py',1346),
+  ('qualifierType_1 -> : dataType array','qualifierType_1',3,'p_qualifierType_1','mof_compiler.py',1351),
+  ('qualifierType_1 -> : dataType array defaultValue','qualifierType_1',4,'p_qualifierType_1','mof_compiler.py',1352),
+  ('qualifierType_2 -> : dataType','qualifierType_2',2,'p_qualifierType_2','mof_compiler.py',1360),
+  ('qualifierType_2 -> : dataType defaultValue','qualifierType_2',3,'p_qualifierType_2','mof_compiler.py',1361),
+  ('scope -> , SCOPE ( metaElementList )','scope',5,'p_scope','mof_compiler.py',1369),
+  ('metaElementList -> metaElement','metaElementList',1,'p_metaElementList','mof_compiler.py',1384),
+  ('metaElementList -> metaElementList , metaElement','metaElementList',3,'p_metaElementList','mof_compiler.py',1385),
+  ('metaElement -> SCHEMA','metaElement',1,'p_metaElement','mof_compiler.py',1393),
+  ('metaElement -> CLASS','metaElement',1,'p_metaElement','mof_compiler.py',1394),
+  ('metaElement -> ASSOCIATION','metaElement',1,'p_metaElement','mof_compiler.py',1395),
+  ('metaElement -> INDICATION','metaElement',1,'p_metaElement','mof_compiler.py',1396),
+  ('metaElement -> QUALIFIER','metaElement',1,'p_metaElement','mof_compiler.py',1397),
+  ('metaElement -> PROPERTY','metaElement',1,'p_metaElement','mof_compiler.py',1398),
+  ('metaElement -> REFERENCE','metaElement',1,'p_metaElement','mof_compiler.py',1399),
+  ('metaElement -> METHOD','metaElement',1,'p_metaElement','mof_compiler.py',1400),
+  ('metaElement -> PARAMETER','metaElement',1,'p_metaElement','mof_compiler.py',1401),
+  ('metaElement -> ANY','metaElement',1,'p_metaElement','mof_compiler.py',1402),
+  ('defaultFlavor -> , FLAVOR ( flavorListWithComma )','defaultFlavor',5,'p_defaultFlavor','mof_compiler.py',1407),
+  ('flavorListWithComma -> flavor','flavorListWithComma',1,'p_flavorListWithComma','mof_compiler.py',1420),
+  ('flavorListWithComma -> flavorListWithComma , flavor','flavorListWithComma',3,'p_flavorListWithComma','mof_compiler.py',1421),
+  ('instanceDeclaration -> INSTANCE OF className { valueInitializerList } ;','instanceDeclaration',7,'p_instanceDeclaration','mof_compiler.py',1429),
+  ('instanceDeclaration -> INSTANCE OF className alias { valueInitializerList } ;','instanceDeclaration',8,'p_instanceDeclaration','mof_compiler.py',1430),
+  ('instanceDeclaration -> qualifierList INSTANCE OF className { valueInitializerList } ;','instanceDeclaration',8,'p_instanceDeclaration','mof_compiler.py',1431),
+  ('instanceDeclaration -> qualifierList INSTANCE OF className alias { valueInitializerList } ;','instanceDeclaration',9,'p_instanceDeclaration','mof_compiler.py',1432),
+  ('valueInitializerList -> valueInitializer','valueInitializerList',1,'p_valueInitializerList','mof_compiler.py',1513),
+  ('valueInitializerList -> valueInitializerList valueInitializer','valueInitializerList',2,'p_valueInitializerList','mof_compiler.py',1514),
+  ('valueInitializer -> identifier defaultValue ;','valueInitializer',3,'p_valueInitializer','mof_compiler.py',1523),
+  ('valueInitializer -> qualifierList identifier defaultValue ;','valueInitializer',4,'p_valueInitializer','mof_compiler.py',1524),
+  ('booleanValue -> FALSE','booleanValue',1,'p_booleanValue','mof_compiler.py',1537),
+  ('booleanValue -> TRUE','booleanValue',1,'p_booleanValue','mof_compiler.py',1538),
+  ('nullValue -> NULL','nullValue',1,'p_nullValue','mof_compiler.py',1543),
+  ('identifier -> IDENTIFIER','identifier',1,'p_identifier','mof_compiler.py',1547),
+  ('identifier -> ANY','identifier',1,'p_identifier','mof_compiler.py',1548),
+  ('identifier -> AS','identifier',1,'p_identifier','mof_compiler.py',1549),
+  ('identifier -> CLASS','identifier',1,'p_identifier','mof_compiler.py',1550),
+  ('identifier -> DISABLEOVERRIDE','identifier',1,'p_identifier','mof_compiler.py',1551),
+  ('identifier -> dataType','identifier',1,'p_identifier','mof_compiler.py',1552),
+  ('identifier -> ENABLEOVERRIDE','identifier',1,'p_identifier','mof_compiler.py',1553),
+  ('identifier -> FLAVOR','identifier',1,'p_identifier','mof_compiler.py',1554),
+  ('identifier -> INSTANCE','identifier',1,'p_identifier','mof_compiler.py',1555),
+  ('identifier -> METHOD','identifier',1,'p_identifier','mof_compiler.py',1556),
+  ('identifier -> OF','identifier',1,'p_identifier','mof_compiler.py',1557),
+  ('identifier -> PARAMETER','identifier',1,'p_identifier','mof_compiler.py',1558),
+  ('identifier -> PRAGMA','identifier',1,'p_identifier','mof_compiler.py',1559),
+  ('identifier -> PROPERTY','identifier',1,'p_identifier','mof_compiler.py',1560),
+  ('identifier -> QUALIFIER','identifier',1,'p_identifier','mof_compiler.py',1561),
+  ('identifier -> REFERENCE','identifier',1,'p_identifier','mof_compiler.py',1562),
+  ('identifier -> RESTRICTED','identifier',1,'p_identifier','mof_compiler.py',1563),
+  ('identifier -> SCHEMA','identifier',1,'p_identifier','mof_compiler.py',1564),
+  ('identifier -> SCOPE','identifier',1,'p_identifier','mof_compiler.py',1565),
+  ('identifier -> TOSUBCLASS','identifier',1,'p_identifier','mof_compiler.py',1566),
+  ('identifier -> TRANSLATABLE','identifier',1,'p_identifier','mof_compiler.py',1567),
+  ('empty -> <empty>','empty',0,'p_empty','mof_compiler.py',1574),
+]
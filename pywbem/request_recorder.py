@@ -0,0 +1,295 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.WBEMRecorder` and :class:`~pywbem.WBEMReplayer` classes
+record the CIM-XML requests and responses exchanged with WBEM servers into a
+file, and serve the recorded responses back without a WBEM server.
+
+Both classes are transports (see :class:`~pywbem.WBEMTransport`) that are
+specified in the `transport` parameter of :class:`~pywbem.WBEMConnection`.
+The recorder passes each request on to another transport (by default a
+:class:`~pywbem.HTTPTransport`) and records the request data, the HTTP header
+fields specific to the operation, and the response data or the exception
+raised.
+
+The replayer returns the recorded response of a request with the same data and
+header fields, independent of the URL of the connection. If the same request
+has been recorded several times (for example, when recording a sweep of
+several WBEM servers), its responses are returned in the order they were
+recorded, starting again with the first one after the last one. Replaying is
+therefore deterministic, and the parsing and serialization performance of
+real-world responses can be measured repeatedly without any WBEM server.
+
+A recording file is a gzip-compressed sequence of exchanges, each consisting
+of a JSON header line followed by the request data and the response data.
+
+Example::
+
+    with WBEMRecorder('sweep.rec.gz') as recorder:
+        for url in server_urls:
+            conn = WBEMConnection(url, creds, transport=recorder)
+            conn.EnumerateInstances('CIM_ComputerSystem')
+
+    ...
+
+    conn = WBEMConnection('http://replay', transport=WBEMReplayer('sweep.rec.gz'))
+    conn.EnumerateInstances('CIM_ComputerSystem')
+"""
+
+from __future__ import absolute_import
+
+import gzip
+import json
+import sys
+import threading
+from time import time
+
+import six
+
+from .cim_obj import _ensure_bytes, _ensure_unicode
+from .cim_http import WBEMTransport, HTTPTransport
+from . import exceptions
+from .exceptions import Error, ConnectionError
+
+__all__ = ['WBEMRecorder', 'WBEMReplayer']
+
+_MAGIC = b'PYWBEM-RECORDING 1\n'
+
+
+def _request_key(data, headers):
+    """Return the key by which the replayer looks up the response to a
+    request."""
+    return (_ensure_bytes(data),
+            tuple([_ensure_unicode(hdr) for hdr in headers or []]))
+
+
+def _class_path(cls):
+    """Return the module and qualified name of a class, as a
+    ``'module:qualname'`` string."""
+    return '%s:%s' % (cls.__module__,
+                      getattr(cls, '__qualname__', cls.__name__))
+
+
+def _exception_class(error):
+    """
+    Return the exception class of a recorded error, or
+    :exc:`~pywbem.ConnectionError` if it cannot be resolved.
+
+    The class is looked up by its module and qualified name in the modules
+    that have been imported, and by its name in the :mod:`pywbem.exceptions`
+    module for recordings without the module and qualified name.
+    """
+    if len(error) > 2:
+        module_name, _, qualname = error[2].partition(':')
+        exc_class = sys.modules.get(module_name)
+        for name in qualname.split('.'):
+            exc_class = getattr(exc_class, name, None)
+    else:
+        exc_class = getattr(exceptions, error[0], None)
+    if not isinstance(exc_class, six.class_types) or \
+            not issubclass(exc_class, Error):
+        exc_class = ConnectionError
+    return exc_class
+
+
+class WBEMRecorder(WBEMTransport):
+    """
+    A transport for :class:`~pywbem.WBEMConnection` that records the requests
+    and responses of another transport into a file.
+
+    A recorder may be used by several connections, also concurrently from
+    multiple threads. The recording file is complete only after the recorder
+    has been closed.
+    """
+
+    def __init__(self, filename, transport=None):
+        """
+        Parameters:
+
+          filename (:term:`string`):
+            Path name of the recording file. An existing file is overwritten.
+
+          transport (:class:`~pywbem.WBEMTransport`):
+            The transport that performs the requests.
+
+            If `None`, a new :class:`~pywbem.HTTPTransport` object is used.
+        """
+        self.filename = filename
+        self._own_transport = transport is None
+        if transport is None:
+            transport = HTTPTransport()
+        self.transport = transport
+        self.num_exchanges = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(filename, 'wb')
+        self._file.write(_MAGIC)
+
+    def send(self, url, data, headers, **kwargs):
+        """
+        Send a request with the transport, record it, and return the
+        response of the transport.
+
+        For details, see :meth:`WBEMTransport.send`.
+        """
+        start = time()
+        try:
+            response = self.transport.send(url, data, headers, **kwargs)
+            try:
+                reply = response.read()
+            finally:
+                response.close()
+        except Error as exc:
+            self._record(url, data, headers, b'',
+                         [exc.__class__.__name__, str(exc),
+                          _class_path(exc.__class__)], time() - start)
+            raise
+        self._record(url, data, headers, reply, None, time() - start)
+        return six.BytesIO(reply)
+
+    def _record(self, url, data, headers, reply, error, elapsed):
+        """Write an exchange to the recording file."""
+        data, headers = _request_key(data, headers)
+        reply = _ensure_bytes(reply)
+        header = json.dumps({'url': _ensure_unicode(url),
+                             'headers': list(headers),
+                             'request': len(data),
+                             'reply': len(reply),
+                             'error': error,
+                             'time': round(elapsed, 6)},
+                            sort_keys=True)
+        with self._lock:
+            if self._file is None:
+                raise ValueError('Recorder is closed: %s' % self.filename)
+            self._file.write(_ensure_bytes(header) + b'\n')
+            self._file.write(data)
+            self._file.write(reply)
+            self.num_exchanges += 1
+
+    def close(self):
+        """Complete and close the recording file.
+
+        The transport is closed if it has been created by the recorder."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self._own_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class WBEMReplayer(WBEMTransport):
+    """
+    A transport for :class:`~pywbem.WBEMConnection` that returns the
+    responses recorded by a :class:`~pywbem.WBEMRecorder`.
+
+    Attributes:
+
+      exchanges (:class:`py:list`):
+        The recorded exchanges, in the order they were recorded. Each exchange
+        is a :class:`py:dict` with the following items:
+
+          * ``url``: URL of the WBEM server, as a :term:`unicode string`.
+          * ``headers``: :class:`py:tuple` of the operation specific HTTP
+            header fields, as :term:`unicode string` objects.
+          * ``request``: The request data, as a :term:`byte string`.
+          * ``reply``: The response data, as a :term:`byte string`.
+          * ``error``: `None`, or a tuple of the name of the exception class,
+            the message, and the module and qualified name of the exception
+            class (as ``'module:qualname'``) of the exception raised by the
+            transport.
+          * ``time``: The time in seconds the transport took for the request.
+    """
+
+    def __init__(self, filename):
+        """
+        Parameters:
+
+          filename (:term:`string`):
+            Path name of a recording file written by
+            :class:`~pywbem.WBEMRecorder`.
+
+        Raises:
+
+          ValueError: The file is not a recording file.
+        """
+        self.filename = filename
+        self.exchanges = []
+        self._index = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+
+        rec_file = gzip.open(filename, 'rb')
+        try:
+            if rec_file.readline() != _MAGIC:
+                raise ValueError('Not a recording file: %s' % filename)
+            while True:
+                line = rec_file.readline()
+                if not line:
+                    break
+                header = json.loads(_ensure_unicode(line))
+                exchange = {'url': header['url'],
+                            'headers': tuple(header['headers']),
+                            'request': rec_file.read(header['request']),
+                            'reply': rec_file.read(header['reply']),
+                            'error': header['error'] and \
+                                tuple(header['error']),
+                            'time': header['time']}
+                if len(exchange['reply']) != header['reply']:
+                    raise ValueError('Truncated recording file: %s' %
+                                     filename)
+                key = (exchange['request'], exchange['headers'])
+                self._index.setdefault(key, []).append(exchange)
+                self.exchanges.append(exchange)
+        finally:
+            rec_file.close()
+
+    def send(self, url, data, headers, **kwargs):
+        """
+        Return the recorded response for a request, or raise the recorded
+        exception.
+
+        For details, see :meth:`WBEMTransport.send`.
+
+        Raises:
+
+          :exc:`~pywbem.ConnectionError`: The request has not been recorded.
+        """
+        # pylint: disable=unused-argument
+        key = _request_key(data, headers)
+        recorded = self._index.get(key)
+        if not recorded:
+            raise ConnectionError('No recorded response for request with '
+                                  'header fields %s' % ', '.join(key[1]))
+        with self._lock:
+            pos = self._positions.get(key, 0)
+            self._positions[key] = (pos + 1) % len(recorded)
+        exchange = recorded[pos]
+        if exchange['error'] is not None:
+            exc_class = _exception_class(exchange['error'])
+            raise exc_class(exchange['error'][1])
+        return six.BytesIO(exchange['reply'])
+
+    def rewind(self):
+        """Start returning the recorded responses from the first one again."""
+        with self._lock:
+            self._positions.clear()
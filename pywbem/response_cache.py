@@ -0,0 +1,356 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.ResponseCache` class caches the responses of read-only
+intrinsic operations of a :class:`~pywbem.WBEMConnection`.
+
+A response cache is specified in the `response_cache` parameter of
+:class:`~pywbem.WBEMConnection`. The connection then looks up the response of
+each read-only operation in the cache before sending the request, and stores
+successful responses in the cache. The cached responses are the CIM-XML
+response data, so the result of each operation is a new set of Python
+objects that the caller can modify.
+
+The cache entries are keyed by the namespace, the operation, and the
+operation parameters, with the CIM names in the parameters (e.g. class names
+and property names) normalized to lower case. Each operation has its own
+time to live (TTL) for its cache entries; operations without a TTL are not
+cached. The size of the cache is bounded by the total size of the cached
+response data; when it is exceeded, the least recently used entries are
+evicted.
+
+When the connection issues an operation that may modify the CIM objects in a
+namespace, the affected cache entries of that namespace are invalidated:
+
+* `CreateClass`, `ModifyClass`, `DeleteClass`, `SetQualifier` and
+  `DeleteQualifier` invalidate all entries of the namespace.
+* `CreateInstance`, `ModifyInstance`, `DeleteInstance` and `InvokeMethod`
+  invalidate the entries of the operations that return instances or instance
+  paths. Of the `GetInstance` entries, `ModifyInstance` and `DeleteInstance`
+  invalidate only the entries of the modified or deleted instance, and
+  `CreateInstance` invalidates none.
+
+Modifications by other connections or clients are not detected; the TTLs
+limit the time for which they may be missed.
+
+Example::
+
+    cache = ResponseCache(max_size=20 * 1024 * 1024,
+                          ttls={'GetClass': 3600, 'GetInstance': 5})
+    conn = WBEMConnection(url, creds, response_cache=cache)
+"""
+
+from __future__ import absolute_import
+
+import threading
+from time import time
+
+import six
+
+from .cim_obj import CIMClassName, CIMInstanceName
+
+__all__ = ['ResponseCache']
+
+#: Default TTLs in seconds of the cache entries, by operation.
+DEFAULT_TTLS = {
+    'GetClass': 300,
+    'EnumerateClasses': 300,
+    'EnumerateClassNames': 300,
+    'GetQualifier': 300,
+    'EnumerateQualifiers': 300,
+    'GetInstance': 10,
+}
+
+# Read-only intrinsic operations that return instances or instance paths
+_INSTANCE_OPERATIONS = set(['GetInstance', 'EnumerateInstances',
+                            'EnumerateInstanceNames', 'Associators',
+                            'AssociatorNames', 'References', 'ReferenceNames',
+                            'ExecQuery'])
+
+# Read-only intrinsic operations that can be cached
+_CACHEABLE_OPERATIONS = _INSTANCE_OPERATIONS | \
+    set(['GetClass', 'EnumerateClasses', 'EnumerateClassNames',
+         'GetQualifier', 'EnumerateQualifiers'])
+
+# Operations that modify classes or qualifier declarations
+_SCHEMA_MODIFICATIONS = set(['CreateClass', 'ModifyClass', 'DeleteClass',
+                             'SetQualifier', 'DeleteQualifier'])
+
+# Operations that modify instances
+_INSTANCE_MODIFICATIONS = set(['CreateInstance', 'ModifyInstance',
+                               'DeleteInstance', 'InvokeMethod'])
+
+# Operation parameters whose string values are CIM names
+_NAME_PARAMETERS = set(['ClassName', 'AssocClass', 'ResultClass', 'Role',
+                        'ResultRole', 'QualifierName'])
+
+# Indexes into the entries of the LRU list
+_PREV, _NEXT, _KEY, _REPLY, _EXPIRES, _PATH = range(6)
+
+
+def _normalize_path(path):
+    """Return a hashable, case-normalized representation of an instance
+    path, without its host and namespace, that is the same for all instance
+    paths that are equal apart from their host and namespace.
+
+    Key values that are not strings or numbers (such as CIMDateTime) are
+    represented by their string value. The result consists of tuples,
+    strings and numbers only, so that it can also be serialized to JSON.
+    This is the path key of the response cache, of the local repository of
+    MOFWBEMConnection and of instance snapshots."""
+    keys = []
+    for name, value in path.keybindings.items():
+        if isinstance(value, CIMInstanceName):
+            value = _normalize_path(value)
+        elif not isinstance(value, (six.string_types, six.integer_types,
+                                    float)):
+            value = str(value)
+        keys.append((name.lower(), value))
+    return (path.classname.lower(), tuple(sorted(keys)))
+
+
+def _normalize_param(name, value):
+    """Return a hashable, case-normalized representation of the value of an
+    operation parameter."""
+    if isinstance(value, CIMClassName):
+        return value.classname.lower()
+    if isinstance(value, CIMInstanceName):
+        return _normalize_path(value)
+    if isinstance(value, (list, tuple)):
+        return tuple([v.lower() if isinstance(v, six.string_types) else v
+                      for v in value])
+    if name in _NAME_PARAMETERS and isinstance(value, six.string_types):
+        return value.lower()
+    return value
+
+
+class ResponseCache(object):
+    """
+    A cache for the responses of the read-only intrinsic operations of
+    :class:`~pywbem.WBEMConnection` objects.
+
+    A response cache may be used by several connections to the same WBEM
+    server, also concurrently from multiple threads. It must not be shared by
+    connections to different WBEM servers.
+
+    Attributes:
+
+      hits (:term:`integer`): Number of responses found in the cache.
+
+      misses (:term:`integer`): Number of cacheable operations whose response
+        was not found in the cache.
+
+      evictions (:term:`integer`): Number of entries evicted because the size
+        of the cache was exceeded.
+
+      size (:term:`integer`): Total size in bytes of the cached response
+        data.
+
+      generation (:term:`integer`): Number of invalidations so far.
+    """
+
+    def __init__(self, max_size=10 * 1024 * 1024, ttls=None):
+        """
+        Parameters:
+
+          max_size (:term:`integer`):
+            Maximum total size in bytes of the cached response data.
+
+          ttls (:class:`py:dict`):
+            TTLs in seconds of the cache entries, by operation name
+            (e.g. ``'GetClass'``). The items update the default TTLs, which
+            are 300 seconds for `GetClass`, `EnumerateClasses`,
+            `EnumerateClassNames`, `GetQualifier` and `EnumerateQualifiers`,
+            and 10 seconds for `GetInstance`. A TTL of `None` or 0 disables
+            caching of an operation. Of the other read-only operations,
+            `EnumerateInstances`, `EnumerateInstanceNames`, `Associators`,
+            `AssociatorNames`, `References`, `ReferenceNames` and
+            `ExecQuery` can be cached by specifying a TTL for them.
+
+        Raises:
+
+          ValueError: An operation cannot be cached.
+        """
+        self.max_size = max_size
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            for operation in ttls:
+                if operation not in _CACHEABLE_OPERATIONS:
+                    raise ValueError('Operation cannot be cached: %s' %
+                                     operation)
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+        # Circular doubly linked list of the entries, least recently used
+        # first
+        self._root = []
+        self._root[:] = [self._root, self._root, None, None, None, None]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, operation, namespace, params):
+        """
+        Return the cache key for an intrinsic operation, or `None` if the
+        operation is not cached.
+
+        Parameters:
+
+          operation (:term:`string`): Name of the operation.
+
+          namespace (:term:`string`): Name of the CIM namespace.
+
+          params (:class:`py:dict`): Parameters of the operation, as passed
+            to :meth:`~pywbem.WBEMConnection.imethodcall`.
+        """
+        if not self.ttls.get(operation):
+            return None
+        return (namespace.strip('/').lower(), operation,
+                tuple(sorted([(name, _normalize_param(name, value))
+                              for name, value in params.items()
+                              if value is not None])))
+
+    def get(self, key):
+        """
+        Return the cached response data for a cache key, or `None`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[_EXPIRES] <= time():
+                self._remove(entry)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Move the entry to the most recently used end of the list
+            self._unlink(entry)
+            self._link(entry)
+            return entry[_REPLY]
+
+    def put(self, key, reply, params, generation=None):
+        """
+        Store the response data of an operation under its cache key, evicting
+        the least recently used entries if needed.
+
+        Parameters:
+
+          key: The cache key returned by :meth:`key`.
+
+          reply (:term:`byte string`): The CIM-XML response data.
+
+          params (:class:`py:dict`): Parameters of the operation.
+
+          generation (:term:`integer`): The value of :attr:`generation`
+            before the request was sent. If entries have been invalidated
+            since then, the response may be outdated and is not stored.
+        """
+        if len(reply) > self.max_size:
+            return
+        path = None
+        if key[1] == 'GetInstance':
+            path = _normalize_path(params['InstanceName'])
+        expires = time() + self.ttls[key[1]]
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._remove(entry)
+            entry = [None, None, key, reply, expires, path]
+            self._entries[key] = entry
+            self._link(entry)
+            self.size += len(reply)
+            while self.size > self.max_size:
+                self._remove(self._root[_NEXT])
+                self.evictions += 1
+
+    def invalidate(self, operation, namespace, params=None):
+        """
+        Invalidate the cache entries that are affected by an operation that
+        may modify CIM objects.
+
+        Parameters:
+
+          operation (:term:`string`): Name of the operation, or `None` to
+            invalidate all entries of the namespace.
+
+          namespace (:term:`string`): Name of the CIM namespace.
+
+          params (:class:`py:dict`): Parameters of the operation.
+        """
+        if operation is not None and \
+                operation not in _SCHEMA_MODIFICATIONS and \
+                operation not in _INSTANCE_MODIFICATIONS:
+            return
+        namespace = namespace.strip('/').lower()
+        # The instance path whose GetInstance entries are affected; None
+        # for all of them.
+        path = None
+        if operation == 'ModifyInstance':
+            if params['ModifiedInstance'].path is not None:
+                path = _normalize_path(params['ModifiedInstance'].path)
+        elif operation == 'DeleteInstance':
+            path = _normalize_path(params['InstanceName'])
+        with self._lock:
+            self.generation += 1
+            for entry in list(self._entries.values()):
+                if entry[_KEY][0] != namespace:
+                    continue
+                if operation in _INSTANCE_MODIFICATIONS:
+                    if entry[_KEY][1] not in _INSTANCE_OPERATIONS:
+                        continue
+                    if entry[_PATH] is not None and \
+                            (operation == 'CreateInstance' or
+                             path is not None and entry[_PATH] != path):
+                        continue
+                self._remove(entry)
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._root[:] = [self._root, self._root, None, None, None, None]
+            self.size = 0
+
+    def _link(self, entry):
+        """Append an entry to the most recently used end of the list."""
+        last = self._root[_PREV]
+        entry[_PREV] = last
+        entry[_NEXT] = self._root
+        last[_NEXT] = entry
+        self._root[_PREV] = entry
+
+    @staticmethod
+    def _unlink(entry):
+        """Remove an entry from the list."""
+        entry[_PREV][_NEXT] = entry[_NEXT]
+        entry[_NEXT][_PREV] = entry[_PREV]
+
+    def _remove(self, entry):
+        """Remove an entry from the cache."""
+        self._unlink(entry)
+        del self._entries[entry[_KEY]]
+        self.size -= len(entry[_REPLY])
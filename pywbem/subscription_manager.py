@@ -0,0 +1,474 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.SubscriptionManager` class manages indication
+subscriptions on a set of WBEM servers.
+
+An indication subscription consists of three CIM instances on the WBEM server:
+
+* An indication filter (`CIM_IndicationFilter`), that defines the query that
+  selects the indications.
+* A listener destination (`CIM_ListenerDestinationCIMXML`), that defines the
+  URL of the indication listener.
+* The subscription itself (`CIM_IndicationSubscription`), an association that
+  references the filter and the listener destination.
+
+The subscription manager creates these instances idempotently: The names of
+the filters and listener destinations it creates are derived from a name prefix
+and from a digest of the query and the listener URL, and instances that
+already exist on a WBEM server are reused instead of being created again. The
+instances that exist on each WBEM server are enumerated once and remembered,
+so that subsequent operations do not need to look them up again.
+
+Operations that affect several WBEM servers are performed concurrently, with a
+configurable maximum number of concurrent WBEM connections.
+
+Example::
+
+    manager = SubscriptionManager(name_prefix='myapp', max_workers=20)
+    for url in server_urls:
+        manager.add_server(WBEMConnection(url, creds,
+                                          default_namespace='root/interop'))
+
+    results = manager.add_subscriptions(
+        "SELECT * FROM CIM_AlertIndication", 'https://listener:5989')
+    for server_id, result in results.items():
+        if isinstance(result, Error):
+            print('%s: failed: %s' % (server_id, result))
+
+    ...
+
+    manager.remove_subscriptions()
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import socket
+import threading
+
+import six
+
+from .cim_constants import CIM_ERR_NOT_FOUND
+from .cim_obj import CIMInstance, CIMInstanceName
+from .exceptions import CIMError
+from ._threadpool import run_concurrently
+
+__all__ = ['SubscriptionManager']
+
+_FILTER_CLASSNAME = 'CIM_IndicationFilter'
+_DESTINATION_CLASSNAME = 'CIM_ListenerDestinationCIMXML'
+_SUBSCRIPTION_CLASSNAME = 'CIM_IndicationSubscription'
+_SYSTEM_CREATION_CLASSNAME = 'CIM_ComputerSystem'
+
+
+def _digest(*strings):
+    """Return a short hex digest of a sequence of strings."""
+    sha = hashlib.sha1()
+    for string in strings:
+        if isinstance(string, six.text_type):
+            string = string.encode('utf-8')
+        sha.update(string)
+        sha.update(b'\0')
+    return sha.hexdigest()[:16]
+
+
+def _key_value(path, keyname):
+    """Return the value of a keybinding of an instance path, or `None`."""
+    if path is None or keyname not in path.keybindings:
+        return None
+    return path.keybindings[keyname]
+
+
+def _ref_name(value):
+    """
+    Return the lower-cased `Name` key of a reference property value, or `None`.
+    """
+    if not isinstance(value, CIMInstanceName):
+        return None
+    name = _key_value(value, 'Name')
+    return name.lower() if name is not None else None
+
+
+class _ServerState(object):
+    # pylint: disable=too-few-public-methods
+    """
+    The cached knowledge about the subscription related instances in one
+    namespace of one WBEM server.
+
+    The dictionaries are keyed by the lower-cased `Name` key of the filters
+    and listener destinations, and by a tuple of these for the subscriptions.
+    Their values are the instance paths.
+    """
+
+    def __init__(self):
+        self.filters = {}
+        self.destinations = {}
+        self.subscriptions = {}
+
+
+class SubscriptionManager(object):
+    """
+    A manager for indication filters, listener destinations and indication
+    subscriptions on a set of WBEM servers.
+
+    The WBEM servers are represented by :class:`~pywbem.WBEMConnection`
+    objects that are added with :meth:`add_server`. The subscription related
+    instances are created in the default namespace of each connection, which
+    therefore should be the Interop namespace of the WBEM server.
+
+    Methods that act on several WBEM servers return a dictionary with the
+    server IDs as keys. The value for a server is the result of the method for
+    that server, or the exception object (typically a :exc:`~pywbem.Error`)
+    if the method failed for that server. A failure on one server does not
+    affect the other servers.
+
+    Objects of this class are thread-safe, but methods that act on the same
+    WBEM server should not be invoked concurrently.
+    """
+
+    def __init__(self, name_prefix='pywbem', system_name=None,
+                 max_workers=10):
+        """
+        :Parameters:
+
+          name_prefix (:term:`string`):
+            Prefix for the `Name` property of the filters and listener
+            destinations created by this manager. Filters and listener
+            destinations with this prefix are considered to be owned by this
+            manager, even if they were created by a previous instance of it.
+
+          system_name (:term:`string`):
+            Value for the `SystemName` key property of the created filters and
+            listener destinations. `None` means the fully qualified host name
+            of this system.
+
+          max_workers (:term:`integer`):
+            Maximum number of WBEM servers that are communicated with
+            concurrently.
+        """
+
+        self.name_prefix = name_prefix
+        self.system_name = system_name or socket.getfqdn()
+        self.max_workers = max_workers
+
+        self._conns = {}    # server_id -> WBEMConnection
+        self._states = {}   # server_id -> _ServerState, or missing if unknown
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '%s(name_prefix=%r, system_name=%r, max_workers=%r, ' \
+               'servers=%r)' % \
+               (self.__class__.__name__, self.name_prefix, self.system_name,
+                self.max_workers, sorted(self._conns.keys()))
+
+    def add_server(self, conn):
+        """
+        Add a WBEM server to be managed.
+
+        :Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            Connection to the WBEM server.
+
+        :Returns:
+            The server ID (:term:`string`) of the WBEM server, which is the
+            URL of the connection.
+        """
+
+        server_id = conn.url
+        with self._lock:
+            self._conns[server_id] = conn
+            self._states.pop(server_id, None)
+        return server_id
+
+    def remove_server(self, server_id):
+        """
+        Stop managing a WBEM server. The subscription related instances on
+        the WBEM server are not changed.
+
+        :Parameters:
+
+          server_id (:term:`string`):
+            The server ID returned by :meth:`add_server`.
+        """
+
+        with self._lock:
+            del self._conns[server_id]
+            self._states.pop(server_id, None)
+
+    def invalidate_cache(self, server_ids=None):
+        """
+        Forget the cached knowledge about the subscription related instances
+        on WBEM servers, so that they are enumerated again when needed.
+
+        :Parameters:
+
+          server_ids (list of :term:`string`):
+            The server IDs of the WBEM servers, or `None` for all servers.
+        """
+
+        with self._lock:
+            if server_ids is None:
+                self._states.clear()
+            else:
+                for server_id in server_ids:
+                    self._states.pop(server_id, None)
+
+    def filter_name(self, query, query_language='WQL'):
+        """
+        Return the `Name` property value this manager uses for a filter.
+
+        :Parameters:
+
+          query (:term:`string`): The filter query.
+
+          query_language (:term:`string`): The query language.
+        """
+        return '%s:filter:%s' % (self.name_prefix,
+                                 _digest(query_language, query))
+
+    def destination_name(self, destination):
+        """
+        Return the `Name` property value this manager uses for a listener
+        destination.
+
+        :Parameters:
+
+          destination (:term:`string`): The URL of the indication listener.
+        """
+        return '%s:destination:%s' % (self.name_prefix, _digest(destination))
+
+    def add_subscriptions(self, query, destination, query_language='WQL',
+                          server_ids=None):
+        """
+        Make sure that a subscription for a query and a listener destination
+        exists on WBEM servers.
+
+        The filter, the listener destination and the subscription are each
+        created only if they do not exist yet.
+
+        :Parameters:
+
+          query (:term:`string`):
+            The filter query that selects the indications.
+
+          destination (:term:`string`):
+            The URL of the indication listener, e.g.
+            ``'https://listener.example.com:5989'``.
+
+          query_language (:term:`string`):
+            The query language of the filter query.
+
+          server_ids (list of :term:`string`):
+            The server IDs of the WBEM servers, or `None` for all servers.
+
+        :Returns:
+            A dictionary with the server IDs as keys. The value for a server
+            is the instance path (:class:`~pywbem.CIMInstanceName`) of the
+            subscription, or the exception object.
+        """
+
+        return self._for_servers(self._add_subscription, server_ids,
+                                 query, destination, query_language)
+
+    def remove_subscriptions(self, server_ids=None):
+        """
+        Delete the subscriptions, filters and listener destinations owned by
+        this manager from WBEM servers.
+
+        Filters and listener destinations are owned by this manager if their
+        `Name` property starts with the name prefix of this manager.
+        Subscriptions are owned by this manager if they reference an owned
+        filter or an owned listener destination. Instances that have already
+        disappeared on the WBEM server are ignored.
+
+        :Parameters:
+
+          server_ids (list of :term:`string`):
+            The server IDs of the WBEM servers, or `None` for all servers.
+
+        :Returns:
+            A dictionary with the server IDs as keys. The value for a server
+            is the number of deleted instances, or the exception object.
+        """
+
+        return self._for_servers(self._remove_subscriptions, server_ids)
+
+    def list_subscriptions(self, server_ids=None):
+        """
+        Return the instance paths of the subscriptions owned by this manager
+        on WBEM servers, based on the cached knowledge (the instances are
+        enumerated if not yet known).
+
+        :Parameters:
+
+          server_ids (list of :term:`string`):
+            The server IDs of the WBEM servers, or `None` for all servers.
+
+        :Returns:
+            A dictionary with the server IDs as keys. The value for a server
+            is a list of :class:`~pywbem.CIMInstanceName` objects, or the
+            exception object.
+        """
+
+        def list_owned(server_id):
+            """List the owned subscriptions of one server."""
+            state = self._get_state(server_id)
+            return [path for key, path in state.subscriptions.items()
+                    if self._owns_subscription(key)]
+
+        return self._for_servers(list_owned, server_ids)
+
+    def _for_servers(self, func, server_ids, *args):
+        """
+        Invoke func(server_id, *args) concurrently for WBEM servers, and return
+        the dictionary of results by server ID.
+        """
+
+        with self._lock:
+            if server_ids is None:
+                server_ids = list(self._conns.keys())
+            else:
+                for server_id in server_ids:
+                    if server_id not in self._conns:
+                        raise ValueError("Unknown server ID: %r" % server_id)
+
+        args_list = [(server_id,) + args for server_id in server_ids]
+        results = run_concurrently(func, args_list, self.max_workers)
+
+        result_dict = {}
+        for server_id, (result, exc_info) in zip(server_ids, results):
+            result_dict[server_id] = result if exc_info is None \
+                                     else exc_info[1]
+        return result_dict
+
+    def _get_state(self, server_id):
+        """
+        Return the cached state for a WBEM server, enumerating the subscription
+        related instances on it if the state is not known.
+        """
+
+        with self._lock:
+            conn = self._conns[server_id]
+            state = self._states.get(server_id, None)
+        if state is not None:
+            return state
+
+        state = _ServerState()
+        for path in conn.EnumerateInstanceNames(_FILTER_CLASSNAME):
+            name = _key_value(path, 'Name')
+            if name is not None:
+                state.filters[name.lower()] = path
+        for path in conn.EnumerateInstanceNames(_DESTINATION_CLASSNAME):
+            name = _key_value(path, 'Name')
+            if name is not None:
+                state.destinations[name.lower()] = path
+        for path in conn.EnumerateInstanceNames(_SUBSCRIPTION_CLASSNAME):
+            key = (_ref_name(_key_value(path, 'Filter')),
+                   _ref_name(_key_value(path, 'Handler')))
+            state.subscriptions[key] = path
+
+        with self._lock:
+            self._states[server_id] = state
+        return state
+
+    def _owns(self, name):
+        """Check whether a lower-cased Name value is owned by this manager."""
+        return name is not None and \
+            name.startswith(self.name_prefix.lower() + ':')
+
+    def _owns_subscription(self, key):
+        """Check whether a subscription key is owned by this manager."""
+        return self._owns(key[0]) or self._owns(key[1])
+
+    def _new_instance(self, classname, name, namespace):
+        """
+        Return a new filter or listener destination instance with its keys
+        set.
+        """
+
+        keybindings = {'CreationClassName': classname,
+                       'SystemCreationClassName': _SYSTEM_CREATION_CLASSNAME,
+                       'SystemName': self.system_name,
+                       'Name': name}
+        inst = CIMInstance(classname, properties=keybindings)
+        inst.path = CIMInstanceName(classname, keybindings=keybindings,
+                                    namespace=namespace)
+        return inst
+
+    def _add_subscription(self, server_id, query, destination,
+                          query_language):
+        """Add a subscription to one WBEM server."""
+
+        state = self._get_state(server_id)
+        conn = self._conns[server_id]
+        namespace = conn.default_namespace
+
+        filter_name = self.filter_name(query, query_language)
+        filter_path = state.filters.get(filter_name.lower(), None)
+        if filter_path is None:
+            inst = self._new_instance(_FILTER_CLASSNAME, filter_name,
+                                      namespace)
+            inst['SourceNamespace'] = namespace
+            inst['Query'] = query
+            inst['QueryLanguage'] = query_language
+            filter_path = conn.CreateInstance(inst)
+            state.filters[filter_name.lower()] = filter_path
+
+        dest_name = self.destination_name(destination)
+        dest_path = state.destinations.get(dest_name.lower(), None)
+        if dest_path is None:
+            inst = self._new_instance(_DESTINATION_CLASSNAME, dest_name,
+                                      namespace)
+            inst['Destination'] = destination
+            dest_path = conn.CreateInstance(inst)
+            state.destinations[dest_name.lower()] = dest_path
+
+        sub_key = (filter_name.lower(), dest_name.lower())
+        sub_path = state.subscriptions.get(sub_key, None)
+        if sub_path is None:
+            refs = {'Filter': filter_path, 'Handler': dest_path}
+            inst = CIMInstance(_SUBSCRIPTION_CLASSNAME, properties=refs)
+            inst.path = CIMInstanceName(_SUBSCRIPTION_CLASSNAME,
+                                        keybindings=refs, namespace=namespace)
+            sub_path = conn.CreateInstance(inst)
+            state.subscriptions[sub_key] = sub_path
+
+        return sub_path
+
+    def _remove_subscriptions(self, server_id):
+        """Remove the owned subscription related instances from one server."""
+
+        state = self._get_state(server_id)
+        conn = self._conns[server_id]
+        count = 0
+
+        # Subscriptions first, because they reference the other instances.
+        for table, owned in ((state.subscriptions, self._owns_subscription),
+                             (state.filters, self._owns),
+                             (state.destinations, self._owns)):
+            for key in [k for k in table if owned(k)]:
+                try:
+                    conn.DeleteInstance(table[key])
+                    count += 1
+                except CIMError as exc:
+                    if exc.args[0] != CIM_ERR_NOT_FOUND:
+                        raise
+                del table[key]
+
+        return count
@@ -80,17 +80,24 @@ representation of CIM in XML by having the following properties:
 
 from __future__ import absolute_import
 
+import threading
+
 import six
 
 from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, \
                      CIMClassName, CIMProperty, CIMMethod, \
                      CIMParameter, CIMQualifier, CIMQualifierDeclaration, \
-                     tocimobj, byname
+                     tocimobj, byname, _LazyNocaseDict
 from .tupletree import xml_to_tupletree
 from .exceptions import ParseError
 
 __all__ = []
 
+# The lazy property options of parse_cim() in the current thread, as a tuple
+# (property_list), where property_list is a set of lower-cased property
+# names or None. Not set if properties are parsed immediately.
+_LAZY_OPTIONS = threading.local()
+
 
 def filter_tuples(list_):
     """Return only the tuples in a list.
@@ -297,9 +304,14 @@ def notimplemented(tup_tree):
 # Root element
 #
 
-def parse_cim(tup_tree):
+def parse_cim(tup_tree, lazy_properties=False, property_list=None):
     """Parse the top level element of CIM/XML message
 
+    If `lazy_properties` is true, the properties of the INSTANCE elements
+    are not parsed here, but when they are first accessed (see
+    parse_instance()), and the properties that are not in `property_list`
+    (an iterable of property names, unless `None`) are discarded.
+
       ::
 
         <!ELEMENT CIM (MESSAGE | DECLARATION)>
@@ -314,7 +326,18 @@ def parse_cim(tup_tree):
         raise ParseError('CIMVERSION is %s, expected 2.x.y' %
                          attrs(tup_tree)['CIMVERSION'])
 
-    child = one_child(tup_tree, ['MESSAGE', 'DECLARATION'])
+    if not lazy_properties:
+        child = one_child(tup_tree, ['MESSAGE', 'DECLARATION'])
+        return name(tup_tree), attrs(tup_tree), child
+
+    if property_list is not None:
+        property_list = set([p.lower() for p in property_list])
+    saved_options = getattr(_LAZY_OPTIONS, 'options', None)
+    _LAZY_OPTIONS.options = (property_list,)
+    try:
+        child = one_child(tup_tree, ['MESSAGE', 'DECLARATION'])
+    finally:
+        _LAZY_OPTIONS.options = saved_options
 
     return name(tup_tree), attrs(tup_tree), child
 
@@ -878,6 +901,11 @@ def parse_instance(tup_tree):
 
     ## TODO: Parse instance qualifiers
     qualifiers = {}
+
+    options = getattr(_LAZY_OPTIONS, 'options', None)
+    if options is not None:
+        return parse_instance_lazy(tup_tree, options[0])
+
     props = list_of_matching(tup_tree, ['PROPERTY.REFERENCE', 'PROPERTY',
                                         'PROPERTY.ARRAY'])
 
@@ -888,6 +916,37 @@ def parse_instance(tup_tree):
 
     return obj
 
+def parse_instance_lazy(tup_tree, property_list=None):
+    """Return a CIMInstance whose properties are parsed on first access.
+
+    The property elements are stored unparsed in the properties dictionary
+    of the instance, and a CIMProperty object is created from a property
+    element when the property is first accessed. Therefore, errors in
+    property elements are raised as ParseError on access. The properties
+    that are not in `property_list` (a set of lower-cased property names,
+    unless `None`) are discarded.
+    """
+
+    props = _LazyNocaseDict(parse_any)
+    for prop in kids(tup_tree):
+        if name(prop) not in ('PROPERTY', 'PROPERTY.ARRAY',
+                              'PROPERTY.REFERENCE'):
+            continue
+        try:
+            prop_name = attrs(prop)['NAME']
+        except KeyError:
+            raise ParseError('expected NAME attribute on %s node, but only '
+                             'have %s' % (name(prop), attrs(prop).keys()))
+        if property_list is not None and \
+                prop_name.lower() not in property_list:
+            continue
+        props.set_lazy(prop_name, prop)
+
+    obj = CIMInstance(attrs(tup_tree)['CLASSNAME'])
+    obj.properties = props
+
+    return obj
+
 def parse_scope(tup_tree):
     """Parse SCOPE element.
 
@@ -1311,10 +1370,23 @@ def parse_message(tup_tree):
     return name(tup_tree), attrs(tup_tree), messages
 
 
-def parse_multireq(tup_tree):   #pylint: disable=unused-argument
-    """Not Implemented"""
-    # TODO: Implement MULTIREQ parser
-    raise ParseError('MULTIREQ parser not implemented')
+def parse_multireq(tup_tree):
+    """
+      ::
+
+        <!ELEMENT MULTIREQ (SIMPLEREQ, SIMPLEREQ+)>
+
+    Returns the list of the parsed SIMPLEREQ elements.
+    """
+
+    check_node(tup_tree, 'MULTIREQ', [], [], ['SIMPLEREQ'])
+
+    reqs = list_of_various(tup_tree, ['SIMPLEREQ'])
+    if len(reqs) < 2:
+        raise ParseError('Expecting two or more SIMPLEREQ elements in '
+                         'MULTIREQ, got %d' % len(reqs))
+
+    return reqs
 
 
 def parse_multiexpreq(tup_tree):   #pylint: disable=unused-argument
@@ -1491,10 +1563,24 @@ def parse_expparamvalue(tup_tree):
     return _name, child
 
 
-def parse_multirsp(tup_tree):   #pylint: disable=unused-argument
-    """This Function not implemented"""
-    # TODO: Implement MULTIRSP parser
-    raise ParseError('MULTIRSP parser not implemented')
+def parse_multirsp(tup_tree):
+    """Parse for MULTIRSP Element.
+
+      ::
+
+        <!ELEMENT MULTIRSP (SIMPLERSP, SIMPLERSP+)>
+
+    Returns the list of the parsed SIMPLERSP elements.
+    """
+
+    check_node(tup_tree, 'MULTIRSP', [], [], ['SIMPLERSP'])
+
+    rsps = list_of_various(tup_tree, ['SIMPLERSP'])
+    if len(rsps) < 2:
+        raise ParseError('Expecting two or more SIMPLERSP elements in '
+                         'MULTIRSP, got %d' % len(rsps))
+
+    return rsps
 
 
 def parse_multiexprsp(tup_tree):   #pylint: disable=unused-argument
@@ -1637,6 +1723,144 @@ def parse_ireturnvalue(tup_tree):
 
     return name(tup_tree), attrs(tup_tree), values
 
+#
+# Parsing of instances into columns
+#
+
+def _only_kid(tup_tree, acceptable):
+    """Return the only child node of a node, without parsing it."""
+
+    k = kids(tup_tree)
+    if len(k) != 1 or name(k[0]) not in acceptable:
+        raise ParseError('In element %s with attributes %s, expected just '\
+                'one child element %s, but got child elements %s' %\
+                (name(tup_tree), attrs(tup_tree), acceptable,
+                 [t[0] for t in k]))
+    return k[0]
+
+
+def parse_cim_columns(tup_tree, builder):
+    """Parse the top level element of the CIM-XML response of an
+    EnumerateInstances operation like parse_cim(), but add the instances in
+    the IRETURNVALUE element to a table builder with
+    parse_value_namedinstance_columns(), instead of returning CIMInstance
+    objects.
+
+    The IRETURNVALUE element is returned with the table builder as its
+    value.
+    """
+
+    check_node(tup_tree, 'CIM', ['CIMVERSION', 'DTDVERSION'])
+
+    if not attrs(tup_tree)['CIMVERSION'].startswith('2.'):
+        raise ParseError('CIMVERSION is %s, expected 2.x.y' %
+                         attrs(tup_tree)['CIMVERSION'])
+
+    message = _only_kid(tup_tree, ['MESSAGE'])
+    check_node(message, 'MESSAGE', ['ID', 'PROTOCOLVERSION'])
+
+    simplersp = _only_kid(message, ['SIMPLERSP'])
+    check_node(simplersp, 'SIMPLERSP', [], [])
+
+    response = _only_kid(simplersp, ['IMETHODRESPONSE'])
+    check_node(response, 'IMETHODRESPONSE', ['NAME'], [])
+
+    result = None
+    if kids(response):
+        result = _only_kid(response, ['ERROR', 'IRETURNVALUE'])
+        if name(result) == 'ERROR':
+            result = parse_error(result)
+        else:
+            check_node(result, 'IRETURNVALUE', [], [],
+                       ['VALUE.NAMEDINSTANCE'])
+            for namedinstance in kids(result):
+                parse_value_namedinstance_columns(namedinstance, builder)
+            result = (name(result), attrs(result), builder)
+
+    return (name(tup_tree), attrs(tup_tree),
+            (name(message), attrs(message),
+             [(name(simplersp), attrs(simplersp),
+               (name(response), attrs(response), result))]))
+
+
+def parse_value_namedinstance_columns(tup_tree, builder):
+    """Add the instance path and the property values of a
+    VALUE.NAMEDINSTANCE element to a table builder (see
+    pywbem.instance_table), without creating CIMInstance or CIMProperty
+    objects.
+
+    The values of properties for which the builder has no column are not
+    parsed. The values of simple properties are added as their CIM-XML
+    strings, and converted by the column buffer. Qualifiers are ignored.
+
+      ::
+
+        <!ELEMENT VALUE.NAMEDINSTANCE (INSTANCENAME, INSTANCE)>
+    """
+
+    check_node(tup_tree, 'VALUE.NAMEDINSTANCE')
+
+    k = kids(tup_tree)
+    if len(k) != 2:
+        raise ParseError('expecting (INSTANCENAME, INSTANCE), got %r' % k)
+
+    builder.add_row(parse_instancename(k[0]))
+
+    instance = k[1]
+    check_node(instance, 'INSTANCE', ['CLASSNAME'],
+               ['QUALIFIER', 'PROPERTY', 'PROPERTY.ARRAY',
+                'PROPERTY.REFERENCE'])
+
+    for prop in kids(instance):
+        prop_type = name(prop)
+        if prop_type not in ('PROPERTY', 'PROPERTY.ARRAY',
+                             'PROPERTY.REFERENCE'):
+            continue
+        attrl = attrs(prop)
+        buf = builder.buffer(attrl['NAME'])
+        if buf is None:
+            continue
+
+        try:
+            if prop_type == 'PROPERTY.REFERENCE':
+                check_node(prop, 'PROPERTY.REFERENCE', ['NAME'],
+                           ['REFERENCECLASS', 'CLASSORIGIN', 'PROPAGATED'])
+                value = list_of_matching(prop, ['VALUE.REFERENCE'])
+                if len(value) > 1:
+                    raise ParseError('Too many VALUE.REFERENCE elements.')
+                buf.add('reference', False, value and value[0] or None)
+                continue
+
+            embedded = 'EmbeddedObject' in attrl or 'EMBEDDEDOBJECT' in attrl
+            if prop_type == 'PROPERTY':
+                check_node(prop, 'PROPERTY', ['TYPE', 'NAME'],
+                           ['NAME', 'CLASSORIGIN', 'PROPAGATED',
+                            'EmbeddedObject', 'EMBEDDEDOBJECT'],
+                           ['QUALIFIER', 'VALUE'])
+                value = None
+                for child in kids(prop):
+                    if name(child) == 'VALUE':
+                        value = parse_value(child)
+                if embedded:
+                    value = parse_embeddedObject(value)
+                elif not value and attrl['TYPE'] != 'string':
+                    value = None
+                buf.add(attrl['TYPE'], False, value)
+            else:
+                check_node(prop, 'PROPERTY.ARRAY', ['NAME', 'TYPE'],
+                           ['REFERENCECLASS', 'CLASSORIGIN', 'PROPAGATED',
+                            'ARRAYSIZE', 'EmbeddedObject', 'EMBEDDEDOBJECT'],
+                           ['QUALIFIER', 'VALUE.ARRAY'])
+                value = unpack_value(prop)
+                if embedded:
+                    value = parse_embeddedObject(value)
+                buf.add(attrl['TYPE'], True, value)
+        except ValueError as exc:
+            raise ParseError('Cannot parse value for property "%s": %s' %\
+                             (attrl['NAME'], exc))
+
+    builder.end_row()
+
 #
 # Object naming and locating elements
 #
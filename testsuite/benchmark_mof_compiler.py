@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+#
+# Benchmark for the MOF compiler, using a full schema tree (by default the
+# DMTF CIM schema that is downloaded into the 'schema' directory by
+# test_mof_compiler.py).
+#
+# Usage: benchmark_mof_compiler.py [--schema-dir DIR] [--schema-mof FILE]
+#
+
+from __future__ import print_function, absolute_import
+
+import os
+import sys
+import argparse
+import multiprocessing
+from time import time, sleep
+from tempfile import mkdtemp
+from shutil import rmtree
+
+from pywbem import mof_compiler
+from pywbem.mof_compiler import MOFCompiler, MOFWBEMConnection
+
+SCRIPT_DIR = os.path.dirname(__file__)
+SCHEMA_DIR = os.path.join(SCRIPT_DIR, 'schema')
+CIM_SCHEMA_MOF = 'cim_schema_2.45.0.mof'
+NAME_SPACE = 'root/test'
+
+
+def walk_find_mof(search_paths, classname):
+    """The find_mof() lookup without an index, for comparison."""
+    classname = classname.lower()
+    for search in search_paths:
+        for root, dummy_dirs, files in os.walk(search):
+            for file_ in files:
+                if file_.endswith('.mof') and \
+                        file_[:-4].lower() == classname:
+                    return root + '/' + file_
+    return None
+
+
+def bench_startup():
+    """Time the creation of MOF compiler objects, which share the parser
+    tables, compared to building a parser and lexer for each object from the
+    table modules."""
+
+    num = 100
+    t = time()
+    for dummy_i in range(num):
+        mof_compiler._yacc()
+        mof_compiler._lex()
+    tables_time = time() - t
+
+    t = time()
+    for dummy_i in range(num):
+        MOFCompiler(None)
+    shared_time = time() - t
+
+    print('MOFCompiler(): %d objects' % num)
+    print('  parser from table modules: %8.3f s' % tables_time)
+    print('  shared parser:             %8.3f s' % shared_time)
+
+
+def bench_find_mof(schema_dir):
+    """Time find_mof() lookups of all classes in the schema tree."""
+
+    classnames = []
+    for dummy_root, dummy_dirs, files in os.walk(schema_dir):
+        classnames.extend([f[:-4] for f in files if f.endswith('.mof')])
+    # Include some lookups that fail
+    classnames.extend(['CIM_NoSuchClass%d' % i for i in range(10)])
+
+    t = time()
+    for classname in classnames:
+        walk_find_mof([schema_dir], classname)
+    walk_time = time() - t
+
+    mof_compiler._mof_file_indexes.clear()
+    mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[schema_dir],
+                          log_func=lambda msg: None)
+    t = time()
+    for classname in classnames:
+        mofcomp.find_mof(classname)
+    index_time = time() - t
+
+    print('find_mof: %d lookups' % len(classnames))
+    print('  directory walk per lookup: %8.3f s' % walk_time)
+    print('  search path index:         %8.3f s (including index build)' %
+          index_time)
+
+
+def bench_lexer(schema_dir):
+    """Time the tokenizing of all MOF files in the schema tree with the PLY
+    LEX analyzer and with the fast LEX analyzer."""
+
+    mofs = []
+    for root, dummy_dirs, files in os.walk(schema_dir):
+        for file_ in files:
+            if file_.endswith('.mof'):
+                f = open(os.path.join(root, file_), 'r')
+                mofs.append(f.read())
+                f.close()
+
+    mofcomp = MOFCompiler(None, log_func=lambda msg: None)
+    print('lexer: %d MOF files' % len(mofs))
+    for label, lexer in (('PLY', mof_compiler._lex()),
+                         ('fast', mof_compiler._MOFLexer())):
+        lexer.parser = mofcomp.parser
+        num_tokens = 0
+        t = time()
+        for mof in mofs:
+            mofcomp.parser.mof = mof
+            lexer.input(mof)
+            while lexer.token():
+                num_tokens += 1
+        print('  %-4s %7d tokens:        %8.3f s' %
+              (label, num_tokens, time() - t))
+
+
+def bench_compile(schema_dir, schema_mof):
+    """Time the compilation of the complete schema."""
+
+    mof_compiler._mof_file_indexes.clear()
+    mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[schema_dir],
+                          log_func=lambda msg: None)
+
+    lookups = [0]
+    find_mof = mofcomp.find_mof
+
+    def counting_find_mof(classname):
+        lookups[0] += 1
+        return find_mof(classname)
+
+    mofcomp.find_mof = counting_find_mof
+
+    t = time()
+    mofcomp.compile_file(os.path.join(schema_dir, schema_mof), NAME_SPACE)
+    compile_time = time() - t
+
+    print('compile_file: %s' % schema_mof)
+    print('  classes: %d, qualifier types: %d, find_mof lookups: %d' %
+          (len(mofcomp.handle.classes[NAME_SPACE]),
+           len(mofcomp.handle.qualifiers[NAME_SPACE]), lookups[0]))
+    print('  elapsed:                   %8.3f s' % compile_time)
+    return mofcomp.handle
+
+
+def bench_compile_cached(schema_dir, schema_mof):
+    """Time the compilation of the complete schema with compile_file_cached(),
+    without (cold) and with (warm) an existing cache file."""
+
+    cache_dir = mkdtemp()
+    try:
+        for label in ('cold cache', 'warm cache'):
+            mofcomp = MOFCompiler(MOFWBEMConnection(),
+                                  search_paths=[schema_dir],
+                                  log_func=lambda msg: None)
+            t = time()
+            mofcomp.compile_file_cached(os.path.join(schema_dir, schema_mof),
+                                        NAME_SPACE, cache_dir)
+            elapsed = time() - t
+            print('compile_file_cached: %s, %s' % (schema_mof, label))
+            print('  elapsed:                   %8.3f s' % elapsed)
+        cache_size = sum([os.path.getsize(os.path.join(cache_dir, f))
+                          for f in os.listdir(cache_dir)])
+        print('  cache file size:           %8d bytes' % cache_size)
+    finally:
+        rmtree(cache_dir)
+
+
+def bench_compile_parallel(schema_dir, schema_mof):
+    """Time the compilation of the complete schema in multiple processes."""
+
+    max_workers = multiprocessing.cpu_count()
+    mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[schema_dir],
+                          log_func=lambda msg: None)
+    t = time()
+    mofcomp.compile_file_parallel(os.path.join(schema_dir, schema_mof),
+                                  NAME_SPACE, max_workers=max_workers)
+    compile_time = time() - t
+
+    print('compile_file_parallel: %s, %d processes' %
+          (schema_mof, max_workers))
+    print('  elapsed:                   %8.3f s' % compile_time)
+
+
+class LatencyRepository(MOFWBEMConnection):
+    """A local repository that delays each create operation, to simulate the
+    round trip to a WBEM server."""
+
+    latency = 0.002
+
+    def SetQualifier(self, *args, **kwargs):
+        sleep(self.latency)
+        return super(LatencyRepository, self).SetQualifier(*args, **kwargs)
+
+    def CreateClass(self, *args, **kwargs):
+        sleep(self.latency)
+        return super(LatencyRepository, self).CreateClass(*args, **kwargs)
+
+    def CreateInstance(self, *args, **kwargs):
+        sleep(self.latency)
+        return super(LatencyRepository, self).CreateInstance(*args, **kwargs)
+
+
+def bench_upload(repo):
+    """Time MOFWBEMConnection.upload() of a compiled schema into a repository
+    with simulated round trip latency, for different numbers of workers."""
+
+    print('upload: %d classes, %.0f ms latency per operation' %
+          (len(repo.classes[NAME_SPACE]), LatencyRepository.latency * 1000))
+    for max_workers in (1, 4, 16):
+        t = time()
+        repo.upload(LatencyRepository(), max_workers=max_workers)
+        print('  %2d workers:                %8.3f s' %
+              (max_workers, time() - t))
+
+
+def main():
+    """Run the benchmarks."""
+
+    argparser = argparse.ArgumentParser(
+        description='Benchmark the MOF compiler with a full schema tree.')
+    argparser.add_argument('--schema-dir', default=SCHEMA_DIR,
+                           help='Directory of the schema tree. Default: '
+                           '%(default)s')
+    argparser.add_argument('--schema-mof', default=CIM_SCHEMA_MOF,
+                           help='Top-level MOF file in the schema directory. '
+                           'Default: %(default)s')
+    args = argparser.parse_args()
+
+    if not os.path.isfile(os.path.join(args.schema_dir, args.schema_mof)):
+        print('Schema MOF file not found: %s' %
+              os.path.join(args.schema_dir, args.schema_mof))
+        print('Run test_mof_compiler.py to download the DMTF CIM schema.')
+        return 1
+
+    bench_startup()
+    bench_find_mof(args.schema_dir)
+    bench_lexer(args.schema_dir)
+    repo = bench_compile(args.schema_dir, args.schema_mof)
+    bench_compile_parallel(args.schema_dir, args.schema_mof)
+    bench_upload(repo)
+    bench_compile_cached(args.schema_dir, args.schema_mof)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
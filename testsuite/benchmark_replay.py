@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#
+# Benchmark of the serialization of requests and the parsing of responses of
+# WBEMConnection, by replaying the intrinsic operations of a recording file
+# written by WBEMRecorder, without a WBEM server.
+#
+# Usage: benchmark_replay.py [--repeat N] [--profile] FILE
+#
+
+from __future__ import print_function, absolute_import
+
+import sys
+import argparse
+import cProfile
+import pstats
+from time import time
+
+from pywbem import WBEMConnection, WBEMReplayer, Error
+from pywbem.tupleparse import parse_cim
+from pywbem.tupletree import xml_to_tupletree
+
+
+def recorded_calls(replayer):
+    """Return the intrinsic method calls of the recorded requests, as a list
+    of tuples (methodname, namespace, params, reply size)."""
+
+    calls = []
+    for exchange in replayer.exchanges:
+        tup_tree = parse_cim(xml_to_tupletree(exchange['request']))
+        req = tup_tree[2][2][0]
+        if req[0] != 'SIMPLEREQ' or req[2][0] != 'IMETHODCALL':
+            continue
+        imethodcall = req[2]
+        calls.append((imethodcall[1]['NAME'], imethodcall[2],
+                      dict(imethodcall[3]), len(exchange['reply'])))
+    return calls
+
+
+def main():
+    """Run the benchmark."""
+
+    argparser = argparse.ArgumentParser(
+        description='Benchmark WBEMConnection by replaying the intrinsic '
+        'operations of a recording file.')
+    argparser.add_argument('file', help='Recording file written by '
+                           'WBEMRecorder.')
+    argparser.add_argument('--repeat', type=int, default=10,
+                           help='Number of times to replay the recording. '
+                           'Default: %(default)s')
+    argparser.add_argument('--profile', action='store_true',
+                           help='Print the functions with the highest '
+                           'cumulative time.')
+    args = argparser.parse_args()
+
+    replayer = WBEMReplayer(args.file)
+    calls = recorded_calls(replayer)
+    conn = WBEMConnection('http://replay', None, transport=replayer)
+    print('%s: %d exchanges, %d intrinsic operations replayed %d times' %
+          (args.file, len(replayer.exchanges), len(calls), args.repeat))
+
+    results = {}
+    profiler = cProfile.Profile() if args.profile else None
+    for dummy_i in range(args.repeat):
+        replayer.rewind()
+        for methodname, namespace, params, size in calls:
+            if profiler:
+                profiler.enable()
+            t = time()
+            try:
+                conn.imethodcall(methodname, namespace, **params)
+            except Error:
+                pass
+            elapsed = time() - t
+            if profiler:
+                profiler.disable()
+            result = results.setdefault(methodname, [0, 0, 0.0])
+            result[0] += 1
+            result[1] += size
+            result[2] += elapsed
+
+    total_time = sum([r[2] for r in results.values()])
+    for methodname in sorted(results.keys()):
+        num, size, elapsed = results[methodname]
+        print('  %-24s %6d calls  %8.3f ms/call  %7.2f MB/s' %
+              (methodname, num, elapsed / num * 1000,
+               size / elapsed / 1e6 if elapsed else 0.0))
+    print('  total:                   %8.3f s' % total_time)
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+#
+# Benchmark of WBEMConnection operations against the mock WBEM server,
+# which runs in a separate process and serves generated instances of
+# configurable number and size via HTTP or a Unix domain socket.
+#
+# Usage: benchmark_wbem_server.py [--transport http|uds] [--requests N] ...
+#
+
+from __future__ import print_function, absolute_import
+
+import os
+import sys
+import gc
+import argparse
+import threading
+import multiprocessing
+from time import time
+from tempfile import mkdtemp
+from shutil import rmtree
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from pywbem import WBEMConnection, CIMInstanceName
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+OPERATIONS = ['GetInstance', 'EnumerateInstances', 'EnumerateInstanceNames',
+              'GetClass', 'Associators', 'GetInstances']
+
+
+def run_server(args, uds_path, queue, stop_event):
+    """Run the mock WBEM server in a child process until stop_event is set,
+    and pass its URL to the parent process via queue."""
+
+    repo = create_repository(num_instances=args.instances,
+                             num_properties=args.properties,
+                             property_size=args.property_size)
+    server = MockWBEMServer(repo, uds_path=uds_path, latency=args.latency,
+                            cache_responses=not args.no_cache,
+                            local_auth=args.local_auth)
+    server.start()
+    queue.put(uds_path or server.url)
+    stop_event.wait()
+    server.stop()
+
+
+def operation(conn, name, num_instances):
+    """Return a function that issues one request of the operation name on
+    conn."""
+
+    path = CIMInstanceName(PAYLOAD_CLASS,
+                           {'InstanceID': 'payload-%d' % (num_instances // 2)},
+                           namespace=DEFAULT_NAMESPACE)
+    if name == 'GetInstance':
+        return lambda: conn.GetInstance(path)
+    if name == 'EnumerateInstances':
+        return lambda: conn.EnumerateInstances(PAYLOAD_CLASS)
+    if name == 'EnumerateInstanceNames':
+        return lambda: conn.EnumerateInstanceNames(PAYLOAD_CLASS)
+    if name == 'GetClass':
+        return lambda: conn.GetClass(PAYLOAD_CLASS, LocalOnly=False)
+    if name == 'Associators':
+        return lambda: conn.Associators(path)
+    if name == 'GetInstances':
+        paths = [CIMInstanceName(PAYLOAD_CLASS,
+                                 {'InstanceID': 'payload-%d' % index},
+                                 namespace=DEFAULT_NAMESPACE)
+                 for index in range(num_instances)]
+        return lambda: conn.GetInstances(paths, multireq=True)
+    raise ValueError('Unknown operation: %s' % name)
+
+
+def percentile(sorted_values, percent):
+    """Return the percentile of a sorted list of values."""
+
+    index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def bench_operation(url, name, args):
+    """Issue args.requests requests of the operation name from
+    args.concurrency threads, and print the throughput, latency and memory
+    usage of the client."""
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    per_thread = max(1, args.requests // args.concurrency)
+
+    def worker():
+        conn = WBEMConnection(url, None, default_namespace=DEFAULT_NAMESPACE)
+        request = operation(conn, name, args.instances)
+        times = []
+        for dummy_i in range(per_thread):
+            t = time()
+            try:
+                request()
+            except Exception as exc:  # pylint: disable=broad-except
+                with lock:
+                    errors.append(exc)
+                return
+            times.append(time() - t)
+        with lock:
+            latencies.extend(times)
+
+    gc.collect()
+    trace = args.trace_memory and tracemalloc is not None
+    if trace:
+        tracemalloc.start()
+    threads = [threading.Thread(target=worker)
+               for dummy_i in range(args.concurrency)]
+    t = time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time() - t
+    peak = None
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    if errors:
+        print('%-24s failed: %r' % (name, errors[0]))
+        return
+    latencies.sort()
+    print('%-24s %8.1f req/s  p50 %7.2f ms  p99 %7.2f ms  peak %s' %
+          (name, len(latencies) / elapsed,
+           percentile(latencies, 50) * 1000,
+           percentile(latencies, 99) * 1000,
+           '%7.1f KiB' % (peak / 1024.0) if peak is not None else 'n/a'))
+
+
+def main():
+    """Run the benchmarks."""
+
+    argparser = argparse.ArgumentParser(
+        description='Benchmark WBEMConnection operations against the mock '
+        'WBEM server.')
+    argparser.add_argument('--transport', choices=['http', 'uds'],
+                           default='http',
+                           help='Transport to the server. '
+                           'Default: %(default)s')
+    argparser.add_argument('--operation', action='append', default=[],
+                           choices=OPERATIONS,
+                           help='Operation to run. May be specified multiple '
+                           'times. Default: all operations')
+    argparser.add_argument('--requests', type=int, default=200,
+                           help='Number of requests per operation. '
+                           'Default: %(default)s')
+    argparser.add_argument('--concurrency', type=int, default=1,
+                           help='Number of client threads. '
+                           'Default: %(default)s')
+    argparser.add_argument('--instances', type=int, default=100,
+                           help='Number of payload instances. '
+                           'Default: %(default)s')
+    argparser.add_argument('--properties', type=int, default=1,
+                           help='Number of string properties of the payload '
+                           'instances. Default: %(default)s')
+    argparser.add_argument('--property-size', type=int, default=32,
+                           help='Size of the string properties of the payload '
+                           'instances. Default: %(default)s')
+    argparser.add_argument('--latency', type=float, default=0.0,
+                           help='Server delay in seconds before each '
+                           'response. Default: %(default)s')
+    argparser.add_argument('--no-cache', action='store_true',
+                           help='Generate each response in the server '
+                           'instead of reusing the responses to identical '
+                           'requests.')
+    argparser.add_argument('--local-auth', action='store_true',
+                           help='Require OpenPegasus style local '
+                           'authentication.')
+    argparser.add_argument('--trace-memory', action='store_true',
+                           help='Report the peak memory allocated by the '
+                           'client for each operation (Python 3.4 and '
+                           'later). Slows down the client.')
+    args = argparser.parse_args()
+
+    tmp_dir = None
+    uds_path = None
+    if args.transport == 'uds':
+        tmp_dir = mkdtemp()
+        uds_path = os.path.join(tmp_dir, 'wbem.sock')
+
+    queue = multiprocessing.Queue()
+    stop_event = multiprocessing.Event()
+    server = multiprocessing.Process(target=run_server,
+                                     args=(args, uds_path, queue, stop_event))
+    server.start()
+    try:
+        url = queue.get(timeout=60)
+        print('Server: %s, %d instances of %d x %d bytes, %.1f ms latency' %
+              (url, args.instances, args.properties, args.property_size,
+               args.latency * 1000))
+        print('Client: %d requests per operation, %d threads' %
+              (args.requests, args.concurrency))
+        for name in args.operation or OPERATIONS:
+            bench_operation(url, name, args)
+        if resource is not None:
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            if sys.platform == 'darwin':
+                maxrss //= 1024
+            print('Client max RSS: %d KiB' % maxrss)
+    finally:
+        stop_event.set()
+        server.join()
+        if tmp_dir:
+            rmtree(tmp_dir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,635 @@
+#!/usr/bin/env python
+#
+# A mock WBEM server for tests and benchmarks of the PyWBEM client.
+#
+# The server accepts CIM-XML operation requests via HTTP and via a Unix
+# domain socket, and answers intrinsic operations from an in-memory
+# repository (a MOFWBEMConnection) that is populated by compiling MOF and by
+# generating instances of configurable number and size.
+#
+# Usage as a standalone server:
+#
+#   mock_wbem_server.py [--port PORT] [--uds PATH] [--mof FILE] ...
+#
+
+from __future__ import print_function, absolute_import
+
+import os
+import re
+import sys
+import time
+import shutil
+import binascii
+import tempfile
+import socket
+import argparse
+import threading
+from xml.parsers.expat import ExpatError
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from pywbem import cim_xml
+from pywbem.cim_obj import CIMInstance, CIMInstanceName, CIMClassName
+from pywbem.cim_types import Uint32
+from pywbem.cim_operations import CIMError
+from pywbem.cim_constants import CIM_ERR_NOT_SUPPORTED, \
+    CIM_ERR_INVALID_NAMESPACE, CIM_ERR_INVALID_PARAMETER
+from pywbem.exceptions import ParseError
+from pywbem.mof_compiler import MOFCompiler, MOFWBEMConnection
+from pywbem.tupleparse import parse_cim
+from pywbem.tupletree import xml_to_tupletree
+
+DEFAULT_NAMESPACE = 'root/cimv2'
+
+PAYLOAD_CLASS = 'PyWBEM_Payload'
+PAYLOAD_LINK_CLASS = 'PyWBEM_PayloadLink'
+
+_MODIFYING_METHODS = ('ModifyInstance', 'DeleteInstance')
+
+_QUALIFIERS_MOF = '''
+Qualifier Key : boolean = false, Scope(property, reference),
+    Flavor(DisableOverride, ToSubclass);
+Qualifier Association : boolean = false, Scope(association),
+    Flavor(DisableOverride, ToSubclass);
+'''
+
+
+def create_repository(mof=None, mof_files=None, namespace=DEFAULT_NAMESPACE,
+                      search_paths=None, num_instances=0, num_properties=1,
+                      property_size=32):
+    """
+    Return a MOFWBEMConnection with a local repository that contains the
+    compiled MOF and the generated payload instances.
+
+    The payload consists of `num_instances` instances of class
+    PyWBEM_Payload with a key property InstanceID, a uint32 property Index
+    and `num_properties` string properties Data1, Data2, ... with values of
+    `property_size` characters, and of PyWBEM_PayloadLink association
+    instances that link each payload instance to the next one.
+    """
+
+    repo = MOFWBEMConnection()
+    mofcomp = MOFCompiler(repo, search_paths=search_paths,
+                          log_func=lambda msg: None)
+    if mof is not None:
+        mofcomp.compile_string(mof, namespace)
+    for mof_file in mof_files or []:
+        mofcomp.compile_file(mof_file, namespace)
+    if num_instances:
+        add_payload(mofcomp, namespace, num_instances, num_properties,
+                    property_size)
+    return repo
+
+
+def add_payload(mofcomp, namespace, num_instances, num_properties=1,
+                property_size=32):
+    """
+    Add the payload classes and instances described for create_repository()
+    to the repository of a MOF compiler.
+    """
+
+    data_props = ''.join(['  string Data%d;\n' % (i + 1)
+                          for i in range(num_properties)])
+    mofcomp.compile_string(
+        _QUALIFIERS_MOF +
+        'class %s {\n  [Key] string InstanceID;\n  uint32 Index;\n%s};\n'
+        '[Association]\nclass %s {\n  [Key] %s REF Source;\n'
+        '  [Key] %s REF Target;\n};\n' %
+        (PAYLOAD_CLASS, data_props, PAYLOAD_LINK_CLASS, PAYLOAD_CLASS,
+         PAYLOAD_CLASS), namespace)
+
+    repo = mofcomp.handle
+    repo.default_namespace = namespace
+    fill = 'abcdefghijklmnopqrstuvwxyz0123456789' * \
+        (property_size // 36 + 1)
+    paths = []
+    for index in range(num_instances):
+        path = CIMInstanceName(PAYLOAD_CLASS,
+                               keybindings={'InstanceID': 'payload-%d' % index},
+                               namespace=namespace)
+        inst = CIMInstance(PAYLOAD_CLASS, path=path)
+        inst['InstanceID'] = 'payload-%d' % index
+        inst['Index'] = Uint32(index)
+        for i in range(num_properties):
+            inst['Data%d' % (i + 1)] = \
+                fill[(index + i) % 36:][:property_size]
+        repo.CreateInstance(inst)
+        paths.append(path)
+    for source, target in zip(paths[:-1], paths[1:]):
+        path = CIMInstanceName(PAYLOAD_LINK_CLASS,
+                               keybindings={'Source': source,
+                                            'Target': target},
+                               namespace=namespace)
+        inst = CIMInstance(PAYLOAD_LINK_CLASS, path=path)
+        inst['Source'] = source
+        inst['Target'] = target
+        repo.CreateInstance(inst)
+
+
+def _local_path(path):
+    """Return a copy of an instance path without host and namespace."""
+    path = path.copy()
+    path.host = None
+    path.namespace = None
+    return path
+
+
+def _instance_xml(inst):
+    """Return the INSTANCE element for an instance, without its path."""
+    inst = inst.copy()
+    inst.path = None
+    return inst.tocimxml()
+
+
+def _param_classname(value):
+    """Return the class name of a CLASSNAME parameter value, or `None`."""
+    if isinstance(value, CIMClassName):
+        return value.classname
+    return value
+
+
+class MockWBEMServer(object):
+    """
+    A WBEM server that answers CIM-XML operation requests from the local
+    repository of a MOFWBEMConnection.
+
+    The intrinsic operations GetClass, EnumerateClasses, EnumerateClassNames,
+    GetInstance, EnumerateInstances, EnumerateInstanceNames, Associators,
+    AssociatorNames, GetQualifier, EnumerateQualifiers, ModifyInstance and
+    DeleteInstance are supported, for instance level usage only, also in
+    multiple operation requests. Other operations fail with
+    CIM_ERR_NOT_SUPPORTED. The LocalOnly, DeepInheritance (for instances),
+    IncludeQualifiers and IncludeClassOrigin parameters are ignored.
+
+    The server listens on a TCP port for HTTP, and optionally on a Unix
+    domain socket. Each connection is served in its own thread, with HTTP/1.1
+    keep-alive.
+
+    Optionally, the server requires the local authentication of OpenPegasus
+    on each connection: A request with a ``PegasusAuthorization: Local
+    "user"`` header is answered with status 401 and the path name of a file
+    with a cookie in the ``WWW-Authenticate`` header, and the connection is
+    authenticated by a subsequent request with a ``PegasusAuthorization:
+    Local "user:file:cookie"`` header. The cookie can be used only once.
+    """
+
+    def __init__(self, repo, host='localhost', port=0, uds_path=None,
+                 latency=0.0, cache_responses=True, local_auth=False,
+                 multireq=True, ignore_property_list=False):
+        """
+        Parameters:
+
+          repo (MOFWBEMConnection): The repository with the CIM elements.
+
+          host (string): Host name or IP address to listen on for HTTP.
+
+          port (integer): TCP port to listen on for HTTP. 0 means to use a
+            free port (see the `url` attribute).
+
+          uds_path (string): Path name of a Unix domain socket to listen on,
+            or `None`.
+
+          latency (float): Delay in seconds before each response.
+
+          cache_responses (bool): Reuse the response to an identical earlier
+            request, to keep the server overhead out of client benchmarks.
+            Responses are cached as long as the server runs.
+
+          local_auth (bool): Require local authentication on each connection.
+
+          multireq (bool): Support multiple operation requests (MULTIREQ).
+            If `False`, they are rejected with status 501.
+
+          ignore_property_list (bool): Ignore the PropertyList parameter,
+            like some WBEM servers do, and return all properties.
+        """
+
+        self.repo = repo
+        self.host = host
+        self.latency = latency
+        self.cache_responses = cache_responses
+        self.local_auth = local_auth
+        self.multireq = multireq
+        self.ignore_property_list = ignore_property_list
+        self.num_requests = 0
+        self.num_operations = 0
+        self.num_connections = 0
+        self.num_auth_challenges = 0
+        self.num_unauthorized = 0
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._servers = []
+        self._connections = set()
+        self._cookies = {}
+        self._cookie_dir = tempfile.mkdtemp() if local_auth else None
+
+        http_server = _ThreadingHTTPServer((host, port), _RequestHandler)
+        http_server.mock = self
+        self._servers.append(http_server)
+        self.url = 'http://%s:%d' % (host, http_server.server_address[1])
+
+        self.uds_path = uds_path
+        if uds_path is not None:
+            if os.path.exists(uds_path):
+                os.remove(uds_path)
+            uds_server = _ThreadingUnixServer(uds_path, _RequestHandler)
+            uds_server.mock = self
+            self._servers.append(uds_server)
+
+    def start(self):
+        """Start serving requests in background threads, and return
+        the server."""
+
+        for server in self._servers:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.daemon = True
+            thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests and close the sockets."""
+
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+        if self.uds_path is not None and os.path.exists(self.uds_path):
+            os.remove(self.uds_path)
+        if self._cookie_dir is not None:
+            shutil.rmtree(self._cookie_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def new_cookie_file(self):
+        """Create a file with a new local authentication cookie and return
+        its path name."""
+
+        cookie = binascii.hexlify(os.urandom(16)).decode('ascii')
+        with self._lock:
+            self.num_auth_challenges += 1
+            path = os.path.join(self._cookie_dir,
+                                'cookie%d' % self.num_auth_challenges)
+            self._cookies[path] = cookie
+        with open(path, 'w') as fp:
+            fp.write(cookie)
+        return path
+
+    def check_cookie(self, path, cookie):
+        """Return whether a local authentication cookie is valid, and
+        invalidate it."""
+
+        with self._lock:
+            valid = self._cookies.pop(path, None)
+        if valid is None:
+            return False
+        os.remove(path)
+        return valid == cookie
+
+    def handle_request(self, body):
+        """Return the response body (as bytes) for a CIM-XML request body,
+        or raise _RequestError."""
+
+        with self._lock:
+            self.num_requests += 1
+            response = self._cache.get(body)
+        if response is None:
+            response, cacheable = self._response(body)
+            if cacheable and self.cache_responses:
+                with self._lock:
+                    self._cache[body] = response
+        if self.latency:
+            time.sleep(self.latency)
+        return response
+
+    def _response(self, body):
+        """Process a CIM-XML request body and return a tuple of the response
+        body and whether it may be cached."""
+
+        try:
+            tup_tree = parse_cim(xml_to_tupletree(body))
+        except (ExpatError, ParseError) as exc:
+            raise _RequestError('request-not-well-formed', str(exc))
+        message = tup_tree[2]
+        messages = message[2]
+        if len(messages) > 1 and not self.multireq:
+            raise _RequestError('multiple-requests-unsupported',
+                                'Multiple operation requests are not '
+                                'supported', 501)
+        for simplereq in messages:
+            if simplereq[0] != 'SIMPLEREQ' or \
+                    simplereq[2][0] != 'IMETHODCALL':
+                raise _RequestError('request-not-valid',
+                                    'Expecting intrinsic method calls')
+
+        rsps = []
+        cacheable = True
+        for simplereq in messages:
+            # IMETHODCALL is: ('IMETHODCALL', attrs, namespace,
+            # [(name, value)])
+            imethodcall = simplereq[2]
+            method = imethodcall[1]['NAME']
+            params = dict(imethodcall[3])
+
+            if method in _MODIFYING_METHODS:
+                cacheable = False
+            try:
+                with self._lock:
+                    self.num_operations += 1
+                    if method in _MODIFYING_METHODS:
+                        self._cache.clear()
+                    result = self._dispatch(method, imethodcall[2], params)
+                data = cim_xml.IRETURNVALUE(None)
+                data.appendChildren(result)
+            except CIMError as exc:
+                data = cim_xml.ERROR(str(exc.args[0]), exc.args[1])
+            rsps.append(
+                cim_xml.SIMPLERSP(cim_xml.IMETHODRESPONSE(method, data)))
+
+        resp_xml = cim_xml.CIM(
+            cim_xml.MESSAGE(
+                rsps[0] if len(rsps) == 1 else cim_xml.MULTIRSP(rsps),
+                message[1]['ID'], '1.0'),
+            '2.0', '2.0')
+        resp = '<?xml version="1.0" encoding="utf-8" ?>\n' + resp_xml.toxml()
+        return resp.encode('utf-8'), cacheable
+
+    def _namespaces(self):
+        """Return a dictionary of the namespaces in the repository, by their
+        lower-cased names."""
+
+        namespaces = {}
+        for ns_dict in (self.repo.classes, self.repo.qualifiers,
+                        self.repo.instances):
+            for ns in ns_dict.keys():
+                namespaces[ns.lower()] = ns
+        return namespaces
+
+    def _dispatch(self, method, namespace, params):
+        """Perform an intrinsic operation on the repository and return the
+        list of elements for its IRETURNVALUE."""
+
+        # pylint: disable=too-many-return-statements
+        if namespace.lower() not in self._namespaces():
+            raise CIMError(CIM_ERR_INVALID_NAMESPACE, namespace)
+        namespace = self._namespaces()[namespace.lower()]
+        repo = self.repo
+        repo.default_namespace = namespace
+        classname = _param_classname(params.get('ClassName'))
+        property_list = params.get('PropertyList')
+        if self.ignore_property_list:
+            property_list = None
+
+        if method == 'GetClass':
+            if classname is None:
+                raise CIMError(CIM_ERR_INVALID_PARAMETER, 'ClassName')
+            return [repo.GetClass(
+                classname, LocalOnly=params.get('LocalOnly', True)).tocimxml()]
+        if method in ('EnumerateClassNames', 'EnumerateClasses'):
+            cnames = repo.EnumerateClassNames(
+                namespace, ClassName=classname,
+                DeepInheritance=params.get('DeepInheritance', False))
+            if method == 'EnumerateClassNames':
+                return [cim_xml.CLASSNAME(cname) for cname in cnames]
+            return [repo.GetClass(cname, LocalOnly=params.get('LocalOnly',
+                                                              True)).tocimxml()
+                    for cname in cnames]
+        if method == 'GetInstance':
+            inst = repo.GetInstance(params['InstanceName'],
+                                    PropertyList=property_list)
+            return [_instance_xml(inst)]
+        if method == 'EnumerateInstances':
+            return [cim_xml.VALUE_NAMEDINSTANCE(
+                _local_path(inst.path).tocimxml(), _instance_xml(inst))
+                    for inst in repo.EnumerateInstances(
+                        classname, namespace, PropertyList=property_list)]
+        if method == 'EnumerateInstanceNames':
+            return [_local_path(path).tocimxml() for path in
+                    repo.EnumerateInstanceNames(classname, namespace)]
+        if method in ('Associators', 'AssociatorNames'):
+            object_name = params['ObjectName']
+            if not isinstance(object_name, CIMInstanceName):
+                raise CIMError(CIM_ERR_NOT_SUPPORTED,
+                               'Class level %s is not supported' % method)
+            kwargs = dict(
+                AssocClass=_param_classname(params.get('AssocClass')),
+                ResultClass=_param_classname(params.get('ResultClass')),
+                Role=params.get('Role'), ResultRole=params.get('ResultRole'))
+            if method == 'AssociatorNames':
+                return [cim_xml.OBJECTPATH(self._host_path(path).tocimxml())
+                        for path in repo.AssociatorNames(object_name,
+                                                         **kwargs)]
+            return [cim_xml.VALUE_OBJECTWITHPATH(
+                self._host_path(inst.path).tocimxml(), _instance_xml(inst))
+                    for inst in repo.Associators(
+                        object_name, PropertyList=property_list, **kwargs)]
+        if method == 'GetQualifier':
+            return [repo.GetQualifier(params['QualifierName']).tocimxml()]
+        if method == 'EnumerateQualifiers':
+            return [qual.tocimxml() for qual in repo.EnumerateQualifiers()]
+        if method == 'ModifyInstance':
+            modified = params['ModifiedInstance']
+            inst = repo.GetInstance(modified.path).copy()
+            for name, value in modified.properties.items():
+                if property_list is None or \
+                        name.lower() in [p.lower() for p in property_list]:
+                    inst.properties[name] = value
+            repo.CreateInstance(inst)
+            return []
+        if method == 'DeleteInstance':
+            repo.DeleteInstance(params['InstanceName'])
+            return []
+        raise CIMError(CIM_ERR_NOT_SUPPORTED, method)
+
+    def _host_path(self, path):
+        """Return a copy of an instance path with the host of the server and
+        the namespace of the repository."""
+        path = path.copy()
+        path.host = self.host
+        path.namespace = self.repo.default_namespace
+        return path
+
+
+class _RequestError(Exception):
+    """Rejection of a request at the HTTP level, with the value of the
+    CIMError header, a description and the HTTP status."""
+
+    def __init__(self, cimerror, description, status=400):
+        Exception.__init__(self, cimerror, description)
+        self.status = status
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Handler for the CIM-XML operation requests of a connection."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.authenticated = False
+        mock = self.server.mock
+        with mock._lock:
+            mock.num_connections += 1
+            mock._connections.add(self.connection)
+
+    def finish(self):
+        mock = self.server.mock
+        with mock._lock:
+            mock._connections.discard(self.connection)
+        BaseHTTPServer.BaseHTTPRequestHandler.finish(self)
+
+    def authenticate(self):
+        """Perform the local authentication of the connection, and return
+        whether it is authenticated."""
+
+        mock = self.server.mock
+        auth = self.headers.get('PegasusAuthorization', '')
+        match = re.match(r'Local "([^:"]*)(?::([^:"]*):([^"]*))?"$', auth)
+        if match and match.group(2) is not None:
+            if mock.check_cookie(match.group(2), match.group(3)):
+                self.authenticated = True
+                return True
+            challenge = 'Local ""'
+        elif match:
+            challenge = 'Local "%s"' % mock.new_cookie_file()
+        else:
+            challenge = 'Local ""'
+        with mock._lock:
+            mock.num_unauthorized += 1
+        self.send_response(401, 'Unauthorized')
+        self.send_header('WWW-Authenticate', challenge)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return False
+
+    def do_POST(self):
+        # pylint: disable=invalid-name
+        """Handle a CIM-XML operation request."""
+
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        if self.server.mock.local_auth and not self.authenticated and \
+                not self.authenticate():
+            return
+        try:
+            if self.headers.get('CIMOperation') != 'MethodCall':
+                raise _RequestError('unsupported-operation',
+                                    'Expecting CIMOperation: MethodCall')
+            response = self.server.mock.handle_request(body)
+        except _RequestError as exc:
+            self.send_response(exc.status)
+            self.send_header('CIMError', exc.args[0])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        except Exception:  # pylint: disable=broad-except
+            self.send_response(500, 'Internal Server Error')
+            self.send_header('CIMError', 'request-not-valid')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200, 'OK')
+        self.send_header('Content-Type', 'application/xml; charset="utf-8"')
+        self.send_header('Content-Length', str(len(response)))
+        self.send_header('CIMOperation', 'MethodResponse')
+        self.end_headers()
+        self.wfile.write(response)
+
+    def address_string(self):
+        # The client address of a Unix domain socket is not a tuple
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return 'localhost'
+
+    def log_message(self, format, *args):
+        # pylint: disable=redefined-builtin
+        pass
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                           BaseHTTPServer.HTTPServer):
+    """HTTP server with a thread per connection."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socket, 'AF_UNIX'):
+    class _ThreadingUnixServer(socketserver.ThreadingMixIn,
+                               socketserver.UnixStreamServer):
+        """HTTP server on a Unix domain socket with a thread per
+        connection."""
+        daemon_threads = True
+
+        def get_request(self):
+            request, dummy_address = self.socket.accept()
+            return request, ('localhost', 0)
+else:
+    _ThreadingUnixServer = None  # pylint: disable=invalid-name
+
+
+def main():
+    """Run a mock WBEM server until it is interrupted."""
+
+    argparser = argparse.ArgumentParser(
+        description='Run a mock WBEM server with an in-memory repository.')
+    argparser.add_argument('--host', default='localhost',
+                           help='Host to listen on for HTTP. '
+                           'Default: %(default)s')
+    argparser.add_argument('--port', type=int, default=5988,
+                           help='Port to listen on for HTTP. '
+                           'Default: %(default)s')
+    argparser.add_argument('--uds', default=None,
+                           help='Path name of a Unix domain socket to listen '
+                           'on in addition.')
+    argparser.add_argument('--mof', action='append', default=[],
+                           help='MOF file to compile into the repository. '
+                           'May be specified multiple times.')
+    argparser.add_argument('--search-path', action='append', default=[],
+                           help='Search path for MOF include files.')
+    argparser.add_argument('--namespace', default=DEFAULT_NAMESPACE,
+                           help='Namespace of the repository. '
+                           'Default: %(default)s')
+    argparser.add_argument('--instances', type=int, default=100,
+                           help='Number of payload instances. '
+                           'Default: %(default)s')
+    argparser.add_argument('--properties', type=int, default=1,
+                           help='Number of string properties of the payload '
+                           'instances. Default: %(default)s')
+    argparser.add_argument('--property-size', type=int, default=32,
+                           help='Size of the string properties of the payload '
+                           'instances. Default: %(default)s')
+    argparser.add_argument('--latency', type=float, default=0.0,
+                           help='Delay in seconds before each response. '
+                           'Default: %(default)s')
+    args = argparser.parse_args()
+
+    repo = create_repository(mof_files=args.mof, namespace=args.namespace,
+                             search_paths=args.search_path,
+                             num_instances=args.instances,
+                             num_properties=args.properties,
+                             property_size=args.property_size)
+    server = MockWBEMServer(repo, host=args.host, port=args.port,
+                            uds_path=args.uds, latency=args.latency)
+    server.start()
+    print('Serving %s%s' % (server.url,
+                            ' and %s' % args.uds if args.uds else ''))
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+#
+# Test the asyncio based indication listener.
+#
+
+from __future__ import absolute_import
+
+import sys
+import threading
+import unittest
+
+from six.moves import http_client as httplib
+
+from pywbem import CIMInstance, cim_xml
+from pywbem.tupletree import xml_to_tupletree
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from pywbem.aio_listener import AsyncIndicationListener
+
+
+def export_request(indication, method_name='ExportIndication'):
+    """Return the CIM-XML export request for an indication."""
+    params = []
+    if indication is not None:
+        params.append(cim_xml.EXPPARAMVALUE('NewIndication',
+                                            indication.tocimxml()))
+    req = cim_xml.CIM(
+        cim_xml.MESSAGE(
+            cim_xml.SIMPLEEXPREQ(cim_xml.EXPMETHODCALL(method_name, params)),
+            '42', '1.0'),
+        '2.0', '2.0')
+    return req.toxml().encode('utf-8')
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "requires Python 3.5")
+class TestAsyncListener(unittest.TestCase):
+
+    def setUp(self):
+        self.received = []
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+        self.addCleanup(self.stop_loop)
+
+    def stop_loop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def run_coro(self, coro):
+        """Run a coroutine in the loop thread and return its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(10)
+
+    def start_listener(self, handler, **kwargs):
+        listener = AsyncIndicationListener(handler, host='127.0.0.1',
+                                           http_port=0, **kwargs)
+        self.run_coro(listener.start())
+        self.addCleanup(lambda: self.run_coro(listener.stop()))
+        return listener
+
+    def handler(self, indication, host):
+        self.received.append((indication, host))
+        return asyncio.sleep(0)
+
+    def post(self, conn, body, headers=None):
+        hdrs = {'Content-Type': 'application/xml; charset="utf-8"',
+                'CIMExport': 'MethodRequest',
+                'CIMExportMethod': 'ExportIndication'}
+        if headers is not None:
+            hdrs.update(headers)
+        conn.request('POST', '/', body, hdrs)
+        resp = conn.getresponse()
+        return resp, resp.read()
+
+    def test_indications(self):
+        listener = self.start_listener(self.handler)
+        conn = httplib.HTTPConnection('127.0.0.1', listener.ports[0])
+        inds = []
+        for i in range(3):
+            ind = CIMInstance('CIM_AlertIndication')
+            ind['IndicationIdentifier'] = 'id%d' % i
+            inds.append(ind)
+            # Several requests on the same (kept alive) connection
+            resp, body = self.post(conn, export_request(ind))
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(resp.getheader('CIMExport'), 'MethodResponse')
+            message = xml_to_tupletree(body)[2][0]
+            self.assertEqual(message[1]['ID'], '42')
+            simpleexprsp = message[2][0]
+            self.assertEqual(simpleexprsp[0], 'SIMPLEEXPRSP')
+            self.assertEqual(simpleexprsp[2][0][0], 'EXPMETHODRESPONSE')
+            self.assertEqual(simpleexprsp[2][0][2], [])
+        conn.close()
+
+        self.run_coro(listener.stop())
+        self.assertEqual([ind for ind, _ in self.received], inds)
+        self.assertEqual(self.received[0][1], '127.0.0.1')
+
+    def test_unsupported_method(self):
+        listener = self.start_listener(self.handler)
+        conn = httplib.HTTPConnection('127.0.0.1', listener.ports[0])
+        resp, body = self.post(conn, export_request(None, 'Foo'))
+        self.assertEqual(resp.status, 200)
+        expmethodresponse = xml_to_tupletree(body)[2][0][2][0][2][0]
+        error = expmethodresponse[2][0]
+        self.assertEqual(error[0], 'ERROR')
+        self.assertEqual(error[1]['CODE'], '7')
+        conn.close()
+        self.assertEqual(self.received, [])
+
+    def test_bad_requests(self):
+        listener = self.start_listener(self.handler)
+        conn = httplib.HTTPConnection('127.0.0.1', listener.ports[0])
+
+        resp, _ = self.post(conn, b'<CIM>not well formed')
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(resp.getheader('CIMError'),
+                         'request-not-well-formed')
+
+        resp, _ = self.post(conn, export_request(CIMInstance('CIM_Foo')),
+                            {'CIMExport': 'MethodCall'})
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(resp.getheader('CIMError'), 'header-mismatch')
+
+        # Well-formed, but with an invalid array value
+        prop = b'<PROPERTY.ARRAY NAME="P" TYPE="uint8"><VALUE.ARRAY>' \
+               b'<VALUE>x</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        body = export_request(CIMInstance('CIM_Foo')).replace(
+            b'<INSTANCE CLASSNAME="CIM_Foo"/>',
+            b'<INSTANCE CLASSNAME="CIM_Foo">' + prop + b'</INSTANCE>')
+        self.assertTrue(prop in body)
+        resp, _ = self.post(conn, body)
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(resp.getheader('CIMError'), 'request-not-valid')
+
+        conn.request('GET', '/')
+        resp = conn.getresponse()
+        resp.read()
+        self.assertEqual(resp.status, 405)
+        conn.close()
+
+    def test_unread_body(self):
+        listener = self.start_listener(self.handler)
+        conn = httplib.HTTPConnection('127.0.0.1', listener.ports[0])
+
+        # The body of a rejected request is not read, so the connection must
+        # not be used for further requests.
+        conn.request('PUT', '/', export_request(CIMInstance('CIM_Foo')))
+        resp = conn.getresponse()
+        resp.read()
+        self.assertEqual(resp.status, 405)
+        self.assertEqual(resp.getheader('Connection'), 'close')
+
+        resp, _ = self.post(conn, export_request(CIMInstance('CIM_Foo')))
+        self.assertEqual(resp.status, 200)
+        conn.close()
+
+        self.run_coro(listener.stop())
+        self.assertEqual(len(self.received), 1)
+
+    def test_concurrency_limit(self):
+        state = {'active': 0, 'max_active': 0}
+
+        async_sleep = asyncio.sleep
+
+        def handler(indication, host):
+            state['active'] += 1
+            state['max_active'] = max(state['max_active'], state['active'])
+
+            def done(_):
+                state['active'] -= 1
+                self.received.append((indication, host))
+
+            future = asyncio.ensure_future(async_sleep(0.05))
+            future.add_done_callback(done)
+            return future
+
+        listener = self.start_listener(handler, max_concurrency=2)
+        threads = []
+        for i in range(6):
+            ind = CIMInstance('CIM_AlertIndication')
+            ind['IndicationIdentifier'] = 'id%d' % i
+
+            def send(ind=ind):
+                conn = httplib.HTTPConnection('127.0.0.1', listener.ports[0])
+                self.post(conn, export_request(ind))
+                conn.close()
+
+            thread = threading.Thread(target=send)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+        self.run_coro(listener.stop())
+        self.assertEqual(len(self.received), 6)
+        self.assertEqual(state['max_active'], 2)
+
+    def test_handler_exception(self):
+        errors = []
+        self.loop.set_exception_handler(
+            lambda loop, context: errors.append(context['exception']))
+
+        def handler(indication, host):
+            raise ValueError('handler failed')
+
+        listener = self.start_listener(handler)
+        conn = httplib.HTTPConnection('127.0.0.1', listener.ports[0])
+        resp, _ = self.post(conn, export_request(CIMInstance('CIM_Foo')))
+        self.assertEqual(resp.status, 200)
+        conn.close()
+        self.run_coro(listener.stop())
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(isinstance(errors[0], ValueError))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# Test the association traversal.
+#
+
+from __future__ import absolute_import
+
+import unittest
+
+from pywbem import WBEMConnection, AssociationTraversal, TraversalHop, \
+                   CIMInstanceName, CIMError, CIM_ERR_INVALID_NAMESPACE
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, PAYLOAD_LINK_CLASS, DEFAULT_NAMESPACE
+
+
+def payload_path(index, namespace=DEFAULT_NAMESPACE):
+    return CIMInstanceName(PAYLOAD_CLASS,
+                           {'InstanceID': 'payload-%d' % index},
+                           namespace=namespace)
+
+
+def indexes(paths):
+    return sorted([int(p['InstanceID'].split('-')[1]) for p in paths])
+
+
+class TestAssociationTraversal(unittest.TestCase):
+
+    def setUp(self):
+        repo = create_repository(num_instances=5)
+        self.server = MockWBEMServer(repo)
+        self.server.start()
+        self.conn = WBEMConnection(self.server.url, None,
+                                   default_namespace=DEFAULT_NAMESPACE)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_chain(self):
+        hop = TraversalHop(AssocClass=PAYLOAD_LINK_CLASS, Role='Source')
+        result = AssociationTraversal(self.conn, [hop] * 3).run(
+            CIMInstanceName(PAYLOAD_CLASS, {'InstanceID': 'payload-0'}))
+        self.assertEqual([indexes(level) for level in result.levels],
+                         [[0], [1], [2], [3]])
+        self.assertEqual([inst['Index'] for inst in result.instances],
+                         [1, 2, 3])
+        self.assertEqual(len(result.edges), 3)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.instance(payload_path(2))['Index'], 2)
+        self.assertEqual(result.instance(payload_path(0)), None)
+        self.assertEqual(indexes(result.targets(payload_path(1))), [2])
+        self.assertEqual(self.server.num_requests, 3)
+
+        # The traversal ends early when no instances are reached
+        result = AssociationTraversal(self.conn, [hop] * 3).run(
+            payload_path(3))
+        self.assertEqual([indexes(level) for level in result.levels],
+                         [[3], [4], [], []])
+
+    def test_deduplication(self):
+        hop = TraversalHop(AssocClass=PAYLOAD_LINK_CLASS)
+        result = AssociationTraversal(self.conn, [hop, hop]).run(
+            [payload_path(2), payload_path(2)])
+        self.assertEqual([indexes(level) for level in result.levels],
+                         [[2], [1, 3], [0, 4]])
+        self.assertEqual(len(result.instances), 4)
+        # 2->1, 2->3, then 1->0, 1->2, 3->2, 3->4
+        self.assertEqual(len(result.edges), 6)
+        self.assertEqual(indexes(result.targets(payload_path(3))), [2, 4])
+
+    def test_names_first(self):
+        hop = TraversalHop(AssocClass=PAYLOAD_LINK_CLASS)
+        result = AssociationTraversal(self.conn, [hop, hop],
+                                      names_first=True,
+                                      PropertyList=['Index']).run(
+                                          payload_path(2))
+        self.assertEqual([indexes(level) for level in result.levels],
+                         [[2], [1, 3], [0, 4]])
+        self.assertEqual(sorted([inst['Index'] for inst in result.instances]),
+                         [0, 1, 3, 4])
+        self.assertFalse('Data1' in result.instances[0])
+        # AssociatorNames for 2, 1, 3 and GetInstance for 1, 3, 0, 4
+        self.assertEqual(self.server.num_requests, 7)
+
+    def test_names_only(self):
+        hop = TraversalHop(AssocClass=PAYLOAD_LINK_CLASS)
+        result = AssociationTraversal(self.conn, [hop, hop],
+                                      instances=False).run(payload_path(2))
+        self.assertEqual([indexes(level) for level in result.levels],
+                         [[2], [1, 3], [0, 4]])
+        self.assertEqual(result.instances, [])
+        self.assertEqual(self.server.num_requests, 3)
+
+    def test_errors(self):
+        hop = TraversalHop(AssocClass=PAYLOAD_LINK_CLASS, Role='Source')
+        result = AssociationTraversal(self.conn, [hop], max_workers=1).run(
+            [payload_path(0, 'root/bad'), payload_path(0)])
+        self.assertEqual(indexes(result.levels[1]), [1])
+        self.assertEqual(len(result.errors), 1)
+        hop_index, path, exc = result.errors[0]
+        self.assertEqual((hop_index, path.namespace), (1, 'root/bad'))
+        self.assertTrue(isinstance(exc, CIMError))
+        self.assertEqual(exc.args[0], CIM_ERR_INVALID_NAMESPACE)
+
+
+if __name__ == '__main__':
+    unittest.main()
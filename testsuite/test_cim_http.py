@@ -4,9 +4,17 @@
 
 from __future__ import absolute_import
 
+import os
+import threading
 import unittest
+from tempfile import mkdtemp
+from shutil import rmtree
 
-from pywbem import cim_http
+from pywbem import cim_http, WBEMConnection, WBEMTransport, HTTPTransport, \
+                   ConnectionError, AuthError
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS
 
 
 class Parse_url(unittest.TestCase):  # pylint: disable=invalid-name
@@ -196,5 +204,196 @@ class Parse_url(unittest.TestCase):  # pylint: disable=invalid-name
                          default_ssl)
 
 
+class CountingTransport(WBEMTransport):
+    """A transport that passes the requests on to an HTTP transport and
+    remembers the arguments of each request."""
+
+    def __init__(self):
+        self.transport = HTTPTransport()
+        self.requests = []
+
+    def send(self, url, data, headers, **kwargs):
+        self.requests.append((url, data, headers, kwargs))
+        return self.transport.send(url, data, headers, **kwargs)
+
+
+class Transport(unittest.TestCase):
+    """
+    Test the transports of WBEMConnection.
+    """
+
+    def setUp(self):
+        self.server = MockWBEMServer(create_repository(num_instances=2))
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_default(self):
+        conn = WBEMConnection(self.server.url)
+        self.assertTrue(isinstance(conn.transport, HTTPTransport))
+        self.assertFalse(
+            WBEMConnection(self.server.url).transport is conn.transport)
+        self.assertEqual(len(conn.EnumerateInstanceNames(PAYLOAD_CLASS)), 2)
+
+    def test_custom(self):
+        transport = CountingTransport()
+        conn = WBEMConnection(self.server.url, ('user', 'pw'),
+                              transport=transport, timeout=10)
+        conn.GetClass(PAYLOAD_CLASS)
+        conn.EnumerateInstances(PAYLOAD_CLASS)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(self.server.num_requests, 2)
+
+        url, data, headers, kwargs = transport.requests[0]
+        self.assertEqual(url, self.server.url)
+        self.assertTrue(isinstance(data, bytes))
+        self.assertTrue(data.startswith(b'<CIM '))
+        self.assertTrue('CIMMethod: GetClass' in headers)
+        self.assertEqual(kwargs['creds'], ('user', 'pw'))
+        self.assertEqual(kwargs['timeout'], 10)
+
+    def test_send_errors(self):
+        transport = HTTPTransport()
+        self.assertRaises(ConnectionError, transport.send,
+                          'http://localhost:1', b'<CIM/>', [])
+        self.assertRaises(NotImplementedError, WBEMTransport().send,
+                          self.server.url, b'<CIM/>', [])
+
+
+class UDSTransport(unittest.TestCase):
+    """
+    Test the persistent connections of HTTPTransport via a Unix domain socket.
+    """
+
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        self.uds_path = os.path.join(self.tmp_dir, 'wbem.sock')
+        self.repo = create_repository(num_instances=2)
+        self.server = MockWBEMServer(self.repo, uds_path=self.uds_path,
+                                     local_auth=True)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        rmtree(self.tmp_dir)
+
+    def test_persistent(self):
+        checks = []
+        check_socket = cim_http._check_socket
+
+        def counting_check_socket(path, url):
+            checks.append(path)
+            check_socket(path, url)
+
+        cim_http._check_socket = counting_check_socket
+        try:
+            conn = WBEMConnection(self.uds_path)
+            for dummy_i in range(5):
+                conn.GetClass(PAYLOAD_CLASS)
+        finally:
+            cim_http._check_socket = check_socket
+        self.assertEqual(self.server.num_requests, 5)
+        self.assertEqual(self.server.num_connections, 1)
+        self.assertEqual(self.server.num_auth_challenges, 1)
+        self.assertEqual(checks, [self.uds_path])
+
+        # A new connection negotiates the local authentication again
+        conn.transport.close()
+        conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_connections, 2)
+        self.assertEqual(self.server.num_auth_challenges, 2)
+
+    def test_creds(self):
+        conn1 = WBEMConnection(self.uds_path)
+        conn2 = WBEMConnection(self.uds_path, ('user', 'password'),
+                               transport=conn1.transport)
+        conn1.GetClass(PAYLOAD_CLASS)
+
+        # The connection that has been authenticated for the local user is
+        # not used with other credentials (which the mock server rejects)
+        self.assertRaises(AuthError, conn2.GetClass, PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_connections, 2)
+        conn1.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_connections, 2)
+        self.assertEqual(self.server.num_auth_challenges, 1)
+
+    def test_concurrent(self):
+        conn = WBEMConnection(self.uds_path)
+        errors = []
+
+        def worker():
+            try:
+                for dummy_i in range(5):
+                    conn.EnumerateInstanceNames(PAYLOAD_CLASS)
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for dummy_i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.server.num_requests, 20)
+        self.assertTrue(self.server.num_connections <= 4)
+
+    def test_server_restart(self):
+        conn = WBEMConnection(self.uds_path)
+        conn.GetClass(PAYLOAD_CLASS)
+        self.server.stop()
+        self.server = MockWBEMServer(self.repo, uds_path=self.uds_path,
+                                     local_auth=True)
+        self.server.start()
+        conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 1)
+        self.assertEqual(self.server.num_connections, 1)
+
+        self.server.stop()
+        self.assertRaises(ConnectionError, conn.GetClass, PAYLOAD_CLASS)
+
+    def test_error_response(self):
+        conn = WBEMConnection(self.uds_path)
+        conn.GetClass(PAYLOAD_CLASS)
+        num_requests = self.server.num_requests
+
+        # A request that the WBEM server has answered with an error on a
+        # reused connection is not repeated
+        try:
+            conn.transport.send(conn.url, b'<CIM',
+                                ['CIMOperation: MethodCall'])
+        except ConnectionError as exc:
+            self.assertEqual(str(exc), 'CIMError: request-not-well-formed')
+        else:
+            self.fail('ConnectionError not raised')
+        self.assertEqual(self.server.num_requests, num_requests + 1)
+
+
+class LocalAuth(unittest.TestCase):
+    """
+    Test the local authentication of HTTPTransport via HTTP.
+    """
+
+    def setUp(self):
+        self.server = MockWBEMServer(create_repository(num_instances=2),
+                                     local_auth=True)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_new_connections(self):
+        # The cookies can be used only once, so each HTTP request on a new
+        # connection negotiates the local authentication, with a single
+        # 401 response
+        conn = WBEMConnection(self.server.url)
+        for dummy_i in range(3):
+            conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 3)
+        self.assertEqual(self.server.num_connections, 3)
+        self.assertEqual(self.server.num_auth_challenges, 3)
+        self.assertEqual(self.server.num_unauthorized, 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -476,6 +476,41 @@ class CIMInstanceNameSort(unittest.TestCase):
         # TODO Implement sorting test for CIMInstanceName
         raise AssertionError("test not implemented")
 
+class CIMInstanceNameFingerprint(unittest.TestCase):
+    """
+    Test the content fingerprint of `CIMInstanceName` objects.
+    """
+
+    def test_all(self):
+
+        path1 = CIMInstanceName('CIM_Foo', {'Name': 'a', 'Num': Uint32(3)},
+                                namespace='root/cimv2')
+        path2 = CIMInstanceName('cim_foo', {'name': u'a', 'NUM': Uint16(3)},
+                                namespace='root/CIMV2')
+        self.assertEqual(path1.fingerprint(), path2.fingerprint())
+        self.assertEqual(len(path1.fingerprint()), 40)
+        self.assertEqual(path1, path2)
+
+        # Mutation invalidates the cached fingerprint
+        fingerprint = path2.fingerprint()
+        path2['Num'] = Uint32(4)
+        self.assertNotEqual(path2.fingerprint(), fingerprint)
+        self.assertNotEqual(path1, path2)
+        path2.host = 'woot.com'
+        path2['Num'] = Uint32(3)
+        self.assertNotEqual(path1.fingerprint(), path2.fingerprint())
+        self.assertNotEqual(path1, path2)
+        path2.host = None
+        self.assertEqual(path1.fingerprint(), path2.fingerprint())
+
+        # Instance paths in keybindings
+        ref1 = CIMInstanceName('CIM_Ref', {'Ref': path1})
+        ref2 = CIMInstanceName('CIM_Ref', {'Ref': path1.copy()})
+        self.assertEqual(ref1.fingerprint(), ref2.fingerprint())
+        ref2['Ref']['Name'] = 'b'
+        self.assertNotEqual(ref1.fingerprint(), ref2.fingerprint())
+        self.assertNotEqual(ref1, ref2)
+
 class CIMInstanceNameString(unittest.TestCase, RegexpMixin):
     """
     Test the string representation functions of `CIMInstanceName` objects.
@@ -1002,6 +1037,90 @@ class CIMInstanceSort(unittest.TestCase):
         # TODO Implement sorting test for CIMInstance
         raise AssertionError("test not implemented")
 
+class CIMInstanceFingerprint(unittest.TestCase):
+    """
+    Test the content fingerprint of `CIMInstance` objects.
+    """
+
+    def test_all(self):
+
+        path = CIMInstanceName('CIM_Foo', {'Name': 'a'})
+        inst1 = CIMInstance('CIM_Foo',
+                            properties={'Name': 'a',
+                                        'Ratio': Real64(2.0),
+                                        'Names': ['a', 'b'],
+                                        'Date': CIMDateTime(
+                                            '20160101120000.000000+060')},
+                            path=path)
+        inst2 = CIMInstance('CIM_Foo',
+                            properties={'name': 'a',
+                                        'Ratio': Real64(2),
+                                        'Names': [u'a', u'b'],
+                                        'Date': CIMDateTime(
+                                            '20160101110000.000000+000')},
+                            path=path.copy())
+        self.assertEqual(inst1.fingerprint(), inst2.fingerprint())
+        self.assertEqual(inst1, inst2)
+        self.assertNotEqual(inst1.fingerprint(), path.fingerprint())
+
+        # The fingerprint does not depend on the process
+        self.assertEqual(
+            CIMInstance('CIM_Foo', {'Name': 'a'}).fingerprint(),
+            u'8c385c045231b1fa1a6e9787054f0fd36320a5cf')
+
+        # Changes through the instance invalidate the cached fingerprint
+        fingerprint = inst2.fingerprint()
+        inst2['Ratio'] = Real64(2.5)
+        self.assertNotEqual(inst2.fingerprint(), fingerprint)
+        self.assertNotEqual(inst1, inst2)
+        self.assertTrue(inst1 != inst2)
+        inst2['Ratio'] = Real64(2.0)
+        self.assertEqual(inst1, inst2)
+        del inst2['Names']
+        self.assertNotEqual(inst1.fingerprint(), inst2.fingerprint())
+        inst2 = inst1.copy()
+        inst2.path['Name'] = 'b'
+        self.assertNotEqual(inst1.fingerprint(), inst2.fingerprint())
+        inst2.path = None
+        self.assertNotEqual(inst1.fingerprint(), inst2.fingerprint())
+        inst2.path = path
+        self.assertEqual(inst1.fingerprint(), inst2.fingerprint())
+        inst2.qualifiers['Key'] = CIMQualifier('Key', True)
+        self.assertNotEqual(inst1.fingerprint(), inst2.fingerprint())
+        self.assertNotEqual(inst1, inst2)
+
+        # Changes of contained properties and of list values in place
+        # invalidate the cached fingerprint as well
+        inst3 = CIMInstance('CIM_Foo', {'Name': 'b', 'P': Uint32(1),
+                                        'L': ['x']})
+        inst4 = CIMInstance('CIM_Foo', {'Name': 'a', 'P': Uint32(2),
+                                        'L': ['x', 'y']})
+        fingerprint = inst3.fingerprint()
+        inst4.fingerprint()
+        inst3.properties['Name'].value = 'a'
+        self.assertNotEqual(inst3.fingerprint(), fingerprint)
+        inst3.properties['P'].value = Uint32(2)
+        inst3.properties['L'].value.append('y')
+        self.assertEqual(inst3.fingerprint(), inst4.fingerprint())
+        self.assertEqual(inst3, inst4)
+        self.assertFalse(inst3 != inst4)
+        inst4.properties['P'].qualifiers['Key'] = CIMQualifier('Key', True)
+        self.assertNotEqual(inst3, inst4)
+        inst4.properties['P'].qualifiers['Key'].value = False
+        self.assertNotEqual(inst3, inst4)
+        del inst4.properties['P'].qualifiers['Key']
+        self.assertEqual(inst3, inst4)
+
+        # The fingerprint of an embedded instance is validated as well
+        inst5 = CIMInstance('CIM_Foo', {'E': CIMInstance('CIM_Bar',
+                                                         {'Name': 'a'})})
+        inst6 = inst5.copy()
+        inst6['E'] = CIMInstance('CIM_Bar', {'Name': 'a'})
+        self.assertEqual(inst5.fingerprint(), inst6.fingerprint())
+        inst6['E'].properties['Name'].value = 'b'
+        self.assertNotEqual(inst5.fingerprint(), inst6.fingerprint())
+        self.assertNotEqual(inst5, inst6)
+
 class CIMInstanceString(unittest.TestCase, RegexpMixin):
     """
     Test the string representation functions of `CIMInstance` objects.
@@ -2308,6 +2427,24 @@ class CIMClassSort(unittest.TestCase):
     def test_all(self):
         raise AssertionError("test not implemented")
 
+class CIMClassFingerprint(unittest.TestCase):
+
+    def test_all(self):
+
+        cls1 = CIMClass('CIM_Foo', superclass='CIM_Bar',
+                        properties={'Name': CIMProperty('Name', None,
+                                                        type='string')})
+        cls2 = CIMClass('cim_foo', superclass='cim_bar',
+                        properties={'name': CIMProperty('name', None,
+                                                        type='string')})
+        self.assertEqual(cls1.fingerprint(), cls2.fingerprint())
+        cls2.methods['Reset'] = CIMMethod('Reset', 'uint32')
+        self.assertNotEqual(cls1.fingerprint(), cls2.fingerprint())
+        self.assertNotEqual(cls1, cls2)
+        cls2 = cls1.copy()
+        cls2.superclass = None
+        self.assertNotEqual(cls1.fingerprint(), cls2.fingerprint())
+
 class CIMClassString(unittest.TestCase, RegexpMixin):
 
     def test_all(self):
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+#
+# Test the retrieval of the instances for a list of instance paths with
+# WBEMConnection.GetInstances().
+#
+
+from __future__ import absolute_import
+
+import unittest
+
+from pywbem import WBEMConnection, CIMInstanceName, CIMError, \
+                   CIM_ERR_NOT_FOUND, CIM_ERR_INVALID_NAMESPACE
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+
+def payload_path(index, namespace=None):
+    return CIMInstanceName(PAYLOAD_CLASS,
+                           {'InstanceID': 'payload-%d' % index},
+                           namespace=namespace)
+
+
+class TestGetInstances(unittest.TestCase):
+
+    def start_server(self, **kwargs):
+        repo = create_repository(num_instances=10, num_properties=2)
+        self.server = MockWBEMServer(repo, **kwargs)
+        self.server.start()
+        self.conn = WBEMConnection(self.server.url, None,
+                                   default_namespace=DEFAULT_NAMESPACE)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def check_results(self, indexes, results):
+        """Check the results for the payload paths with the indexes, where
+        the paths with indexes >= 10 do not exist."""
+        self.assertEqual(len(results), len(indexes))
+        for index, result in zip(indexes, results):
+            if index >= 10:
+                self.assertTrue(isinstance(result, CIMError))
+                self.assertEqual(result.args[0], CIM_ERR_NOT_FOUND)
+            else:
+                self.assertEqual(result['Index'], index)
+                self.assertEqual(result.path.namespace, DEFAULT_NAMESPACE)
+                self.assertEqual(result.path.host, None)
+                self.assertEqual(result.path['InstanceID'],
+                                 'payload-%d' % index)
+
+    def test_single(self):
+        self.start_server()
+        indexes = [7, 2, 12, 0, 9, 2]
+        results = self.conn.GetInstances([payload_path(i) for i in indexes],
+                                         PropertyList=['Index'], max_workers=3)
+        self.check_results(indexes, results)
+        self.assertFalse('Data1' in results[0])
+        self.assertEqual(self.server.num_requests, len(indexes))
+        self.assertEqual(self.conn.GetInstances([]), [])
+
+    def test_multireq(self):
+        self.start_server()
+        indexes = [7, 2, 12, 0, 9, 2, 5]
+        results = self.conn.GetInstances(
+            [payload_path(i, DEFAULT_NAMESPACE) for i in indexes],
+            multireq=True, batch_size=3)
+        self.check_results(indexes, results)
+        self.assertEqual(self.server.num_requests, 3)
+        self.assertEqual(self.server.num_operations, len(indexes))
+
+    def test_namespaces(self):
+        self.start_server()
+        paths = [payload_path(1), payload_path(2, 'root/bad'),
+                 payload_path(3), payload_path(4, 'root/bad')]
+        results = self.conn.GetInstances(paths, multireq=True)
+        self.assertEqual([results[0]['Index'], results[2]['Index']], [1, 3])
+        for result in (results[1], results[3]):
+            self.assertTrue(isinstance(result, CIMError))
+            self.assertEqual(result.args[0], CIM_ERR_INVALID_NAMESPACE)
+        # One request per namespace
+        self.assertEqual(self.server.num_requests, 2)
+
+    def test_multireq_unsupported(self):
+        self.start_server(multireq=False)
+        indexes = [3, 11, 4]
+        results = self.conn.GetInstances([payload_path(i) for i in indexes],
+                                         multireq=True)
+        self.check_results(indexes, results)
+        self.assertEqual(self.server.num_requests, 4)
+        # The connection remembers that the server does not support it
+        results = self.conn.GetInstances([payload_path(i) for i in indexes],
+                                         multireq=True)
+        self.check_results(indexes, results)
+        self.assertEqual(self.server.num_requests, 7)
+
+    def test_debug(self):
+        self.start_server()
+        self.conn.debug = True
+        indexes = [1, 2, 3, 4]
+        results = self.conn.GetInstances([payload_path(i) for i in indexes],
+                                         max_workers=2)
+        self.check_results(indexes, results)
+        # The operations are performed on copies of the connection
+        self.assertEqual(self.conn.last_request, None)
+        self.assertEqual(self.conn.last_raw_reply, None)
+        self.conn.GetInstance(payload_path(1))
+        self.assertTrue('payload-1' in self.conn.last_request)
+
+    def test_invalid(self):
+        self.start_server()
+        self.assertRaises(TypeError, self.conn.GetInstances,
+                          [payload_path(1), 'payload-2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+#
+# Test the batching and deduplicating indication delivery layer.
+#
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from pywbem import CIMInstance, Uint64
+from pywbem import indication_batcher
+
+
+def make_indication(identifier=None, context=None, number=None,
+                    classname='CIM_AlertIndication'):
+    """Return an indication instance with the specified identification."""
+    ind = CIMInstance(classname)
+    ind['Description'] = 'test'
+    if identifier is not None:
+        ind['IndicationIdentifier'] = identifier
+    if context is not None:
+        ind['SequenceContext'] = context
+    if number is not None:
+        ind['SequenceNumber'] = Uint64(number)
+    return ind
+
+
+class FakeTime(object):
+    """Replacement for the time module, with a settable clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class BatcherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.saved_time = indication_batcher.time
+        self.fake_time = FakeTime()
+        indication_batcher.time = self.fake_time
+
+    def tearDown(self):
+        indication_batcher.time = self.saved_time
+
+    def consumer(self, indications):
+        self.batches.append(indications)
+
+
+class TestBatching(BatcherTestCase):
+
+    def test_batch_by_count(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=3, max_batch_delay=None)
+        inds = [make_indication(identifier='id%d' % i) for i in range(7)]
+        for ind in inds:
+            self.assertTrue(batcher(ind))
+
+        self.assertEqual(self.batches, [inds[0:3], inds[3:6]])
+        self.assertEqual(batcher.flush(), 1)
+        self.assertEqual(self.batches, [inds[0:3], inds[3:6], inds[6:7]])
+        self.assertEqual(batcher.batch_count, 3)
+        self.assertEqual(batcher.received_count, 7)
+
+        # Flushing an empty batch does not invoke the consumer
+        self.assertEqual(batcher.flush(), 0)
+        self.assertEqual(len(self.batches), 3)
+
+    def test_batch_by_time(self):
+        delivered = threading.Event()
+
+        def consumer(indications):
+            self.batches.append(indications)
+            delivered.set()
+
+        batcher = indication_batcher.IndicationBatcher(
+            consumer, max_batch_size=100, max_batch_delay=0.05)
+        ind = make_indication(identifier='id1')
+        batcher(ind)
+        self.assertTrue(delivered.wait(5))
+        self.assertEqual(self.batches, [[ind]])
+
+    def test_close(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=10, max_batch_delay=None)
+        with batcher:
+            batcher(make_indication(identifier='id1'))
+            self.assertEqual(self.batches, [])
+        self.assertEqual(len(self.batches), 1)
+        self.assertRaises(ValueError, batcher, make_indication())
+
+    def test_invalid_batch_size(self):
+        self.assertRaises(ValueError, indication_batcher.IndicationBatcher,
+                          self.consumer, max_batch_size=0)
+
+
+class TestDeduplication(BatcherTestCase):
+
+    def test_default_key(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=1)
+
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+        self.assertFalse(batcher(make_indication(identifier='id1')))
+        self.assertTrue(batcher(make_indication(identifier='id2')))
+
+        self.assertTrue(batcher(make_indication(context='ctx', number=1)))
+        self.assertFalse(batcher(make_indication(context='ctx', number=1)))
+        self.assertTrue(batcher(make_indication(context='ctx', number=2)))
+
+        # Indications without identification are never duplicates
+        self.assertTrue(batcher(make_indication()))
+        self.assertTrue(batcher(make_indication()))
+
+        self.assertEqual(len(self.batches), 6)
+        self.assertEqual(batcher.duplicate_count, 2)
+
+    def test_property_list_key(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=1, dedup_key=['SequenceContext'])
+        self.assertTrue(batcher(make_indication(context='ctx', number=1)))
+        self.assertFalse(batcher(make_indication(context='ctx', number=2)))
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+
+    def test_callable_key(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=1,
+            dedup_key=lambda ind: ind.classname.lower())
+        self.assertTrue(batcher(make_indication(classname='CIM_A')))
+        self.assertFalse(batcher(make_indication(classname='cim_a')))
+        self.assertTrue(batcher(make_indication(classname='CIM_B')))
+
+    def test_disabled(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=1, dedup_key=None)
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+
+    def test_window_expiry(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=1, dedup_window=10)
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+        self.fake_time.now += 5
+        self.assertFalse(batcher(make_indication(identifier='id1')))
+        self.fake_time.now += 6
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+
+    def test_max_entries(self):
+        batcher = indication_batcher.IndicationBatcher(
+            self.consumer, max_batch_size=1, dedup_max_entries=2)
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+        self.assertTrue(batcher(make_indication(identifier='id2')))
+        self.assertTrue(batcher(make_indication(identifier='id3')))
+        # id1 has been forgotten, id3 is still remembered
+        self.assertFalse(batcher(make_indication(identifier='id3')))
+        self.assertTrue(batcher(make_indication(identifier='id1')))
+
+    def test_invalid_max_entries(self):
+        self.assertRaises(ValueError, indication_batcher.IndicationBatcher,
+                          self.consumer, dedup_max_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
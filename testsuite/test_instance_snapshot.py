@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+#
+# Test the snapshots of CIM instances and their differences.
+#
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pywbem import InstanceSnapshot, write_snapshot_file, diff_snapshots, \
+                   iter_snapshot_diff, CIMInstance, CIMInstanceName, \
+                   CIMDateTime, Uint32, Uint64
+
+
+def volume(index, namespace='root/cimv2', **props):
+    path = CIMInstanceName('CIM_StorageVolume',
+                           {'DeviceID': 'vol-%d' % index},
+                           namespace=namespace)
+    properties = {'DeviceID': 'vol-%d' % index,
+                  'BlockSize': Uint64(512),
+                  'Names': ['vol', 'vol-%d' % index],
+                  'System': CIMInstanceName('CIM_System', {'Name': 'sys'},
+                                            namespace=namespace),
+                  'InstallDate': CIMDateTime('20160101120000.000000+000')}
+    properties.update(props)
+    return CIMInstance('CIM_StorageVolume', properties=properties, path=path)
+
+
+def device_ids(changes):
+    return [change.path['DeviceID'] for change in changes]
+
+
+class TestInstanceSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_snapshot(self):
+        snapshot = InstanceSnapshot([volume(1), volume(2), volume(1)])
+        self.assertEqual(len(snapshot), 2)
+        path = CIMInstanceName('cim_storagevolume', {'deviceid': 'vol-2'},
+                               host='server', namespace='/root/CIMV2')
+        self.assertTrue(path in snapshot)
+        self.assertEqual(snapshot.get(path)['DeviceID'], 'vol-2')
+        self.assertEqual(snapshot.digest(path), snapshot.digest(path.copy()))
+        self.assertNotEqual(snapshot.digest(path),
+                            snapshot.digest(volume(1).path))
+        self.assertFalse(volume(3).path in snapshot)
+        self.assertEqual(snapshot.get(volume(3).path), None)
+
+        snapshot = InstanceSnapshot([volume(1)], keep_instances=False)
+        self.assertEqual(snapshot.get(volume(1).path), None)
+        self.assertTrue(snapshot.digest(volume(1).path) is not None)
+
+        inst = volume(1)
+        inst.path = None
+        self.assertRaises(ValueError, InstanceSnapshot, [inst])
+
+    def test_normalized_values(self):
+        old = InstanceSnapshot([volume(1)])
+        new = InstanceSnapshot([volume(1, blocksize=Uint64(512),
+                                       Names=[u'vol', u'vol-1'])])
+        self.assertEqual(len(diff_snapshots(old, new)), 0)
+
+        # A different CIM type is a change
+        new = InstanceSnapshot([volume(1, BlockSize=Uint32(512))])
+        diff = diff_snapshots(old, new)
+        self.assertEqual([change.properties for change in diff.modified],
+                         [['BlockSize']])
+
+    def test_diff(self):
+        old = InstanceSnapshot([volume(i) for i in range(5)])
+        new = InstanceSnapshot(
+            [volume(0), volume(1, System=volume(7).path),
+             volume(3, ElementName='three'), volume(4), volume(5),
+             volume(6, namespace='root/other')])
+        diff = diff_snapshots(old, new)
+        self.assertEqual(device_ids(diff.added), ['vol-5', 'vol-6'])
+        self.assertEqual(device_ids(diff.removed), ['vol-2'])
+        self.assertEqual(device_ids(diff.modified), ['vol-1', 'vol-3'])
+        self.assertEqual([change.properties for change in diff.modified],
+                         [['System'], ['ElementName']])
+        change = diff.modified[1]
+        self.assertEqual(change.kind, 'modified')
+        self.assertFalse('ElementName' in change.old)
+        self.assertEqual(change.new['ElementName'], 'three')
+        self.assertEqual(diff.removed[0].old['DeviceID'], 'vol-2')
+        self.assertEqual(diff.removed[0].new, None)
+        self.assertEqual(len(diff_snapshots(new, new)), 0)
+
+    def test_files(self):
+        old_file = os.path.join(self.tmpdir, 'old.snap')
+        new_file = os.path.join(self.tmpdir, 'new.snap')
+        old = InstanceSnapshot([volume(i) for i in range(10)])
+        old.save(old_file)
+        new_insts = [volume(i) for i in range(12) if i != 4]
+        new_insts[7] = volume(8, BlockSize=Uint64(4096))
+        # Chunks of 3 instances, with a duplicate in different chunks
+        write_snapshot_file(new_file, new_insts + [volume(0)], chunk_size=3)
+
+        for old_snapshot, new_snapshot in [(old, new_file),
+                                           (old_file, new_file),
+                                           (old_file,
+                                            InstanceSnapshot(new_insts))]:
+            diff = diff_snapshots(old_snapshot, new_snapshot)
+            self.assertEqual(device_ids(diff.added), ['vol-10', 'vol-11'])
+            self.assertEqual(device_ids(diff.removed), ['vol-4'])
+            self.assertEqual(device_ids(diff.modified), ['vol-8'])
+            self.assertEqual(diff.modified[0].properties, ['BlockSize'])
+            self.assertEqual(diff.modified[0].path, volume(8).path)
+
+        changes = list(iter_snapshot_diff(new_file, old_file))
+        self.assertEqual([change.kind for change in changes],
+                         ['removed', 'removed', 'added', 'modified'])
+
+    def test_invalid(self):
+        bad_file = os.path.join(self.tmpdir, 'bad.snap')
+        self.assertRaises(IOError, diff_snapshots, InstanceSnapshot(),
+                          bad_file)
+        self.assertRaises(TypeError, diff_snapshots, InstanceSnapshot(), [])
+        write_snapshot_file(bad_file, [])
+        self.assertEqual(len(diff_snapshots(InstanceSnapshot(), bad_file)), 0)
+        with open(bad_file, 'wb') as fp:
+            fp.write(b'garbage')
+        self.assertRaises(Exception, diff_snapshots, InstanceSnapshot(),
+                          bad_file)
+
+
+if __name__ == '__main__':
+    unittest.main()
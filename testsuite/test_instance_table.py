@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+#
+# Test the columnar storage of the property values of CIM instances.
+#
+
+from __future__ import absolute_import
+
+import array
+import unittest
+
+import pytest
+
+from pywbem import InstanceTable, InstanceColumn, CIMInstance, \
+                   CIMInstanceName, CIMProperty, CIMDateTime, Uint8, Uint32, \
+                   Sint64, Uint64, Real32, WBEMConnection, CIMError, \
+                   CIM_ERR_INVALID_NAMESPACE
+from pywbem import instance_table
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+requires_numpy = pytest.mark.skipif(instance_table.numpy is None,
+                                    reason="NumPy is not installed")
+
+
+def statistics(index, **props):
+    path = CIMInstanceName('CIM_BlockStorageStatisticalData',
+                           {'InstanceID': 'stat-%d' % index})
+    properties = {'InstanceID': 'stat-%d' % index,
+                  'KBytesRead': Uint64(1000 * index),
+                  'ElementType': Uint32(3),
+                  'StatisticTime': CIMDateTime(
+                      '19700101%02d0000.500000+060' % (index + 1))}
+    properties.update(props)
+    return CIMInstance('CIM_BlockStorageStatisticalData',
+                       properties=properties, path=path)
+
+
+class TestInstanceTable(unittest.TestCase):
+
+    def test_from_instances(self):
+        insts = [statistics(0), statistics(1, Errors=Sint64(-1)),
+                 statistics(2, KBytesRead=CIMProperty('KBytesRead', None,
+                                                      type='uint64'))]
+        table = InstanceTable.from_instances(insts, use_numpy=False)
+        self.assertEqual(len(table), 3)
+        self.assertEqual([path['InstanceID'] for path in table.paths],
+                         ['stat-0', 'stat-1', 'stat-2'])
+        self.assertEqual(sorted(table.column_names),
+                         ['ElementType', 'Errors', 'InstanceID', 'KBytesRead',
+                          'StatisticTime'])
+        self.assertEqual(table.column_names[-1], 'Errors')
+
+        column = table['kbytesread']
+        self.assertEqual((column.name, column.type, column.is_array),
+                         ('KBytesRead', 'uint64', False))
+        self.assertTrue(isinstance(column.values, array.array))
+        self.assertEqual(list(column.values), [0, 1000, 0])
+        self.assertEqual(list(column.mask), [0, 0, 1])
+        self.assertEqual(column.null_count, 1)
+        self.assertEqual(column.tolist(), [0, 1000, None])
+
+        self.assertEqual(table['Errors'].tolist(), [None, -1, None])
+        self.assertEqual(table['ElementType'].values.itemsize >= 4, True)
+        self.assertEqual(table['InstanceID'].values,
+                         ['stat-0', 'stat-1', 'stat-2'])
+
+        # 01:00 at UTC+01:00 is the epoch
+        self.assertEqual(table['StatisticTime'].tolist(), [0.5, 3600.5,
+                                                           7200.5])
+        self.assertEqual(table.to_dict()['Errors'], [None, -1, None])
+        self.assertTrue('KBYTESREAD' in table)
+        self.assertEqual(len(list(table)), 5)
+
+    def test_property_list(self):
+        insts = [statistics(0, Ratio=Real32(0.5),
+                            Sampled=True, Intervals=[Uint8(1), Uint8(2)],
+                            Duration=CIMDateTime('00000001000000.000000:000')),
+                 statistics(1)]
+        table = InstanceTable.from_instances(
+            insts, PropertyList=['Duration', 'ratio', 'Sampled', 'Intervals',
+                                 'Missing'],
+            use_numpy=False)
+        self.assertEqual(table.column_names,
+                         ['Duration', 'ratio', 'Sampled', 'Intervals',
+                          'Missing'])
+        self.assertEqual(table['Duration'].tolist(), [86400.0, None])
+        self.assertEqual(table['Ratio'].tolist(), [0.5, None])
+        self.assertEqual(table['Ratio'].values.typecode, 'f')
+        self.assertEqual(table['Sampled'].tolist(), [1, None])
+        self.assertEqual(table['Intervals'].is_array, True)
+        self.assertEqual(table['Intervals'].values, [[1, 2], None])
+        self.assertEqual(table['Missing'].type, None)
+        self.assertEqual(table['Missing'].null_count, 2)
+
+    def test_type_mismatch(self):
+        self.assertRaises(ValueError, InstanceTable.from_instances,
+                          [statistics(0), statistics(1, KBytesRead='many')],
+                          use_numpy=False)
+
+    def test_columns(self):
+        column = InstanceColumn.from_values('Count', 'uint32', False,
+                                            [Uint32(1), None], use_numpy=False)
+        self.assertRaises(ValueError, InstanceTable, [column], [None])
+        self.assertEqual(len(InstanceTable([column], [None, None])), 2)
+
+    @requires_numpy
+    def test_numpy(self):
+        insts = [statistics(0), statistics(1, Errors=Sint64(-1))]
+        table = InstanceTable.from_instances(insts, use_numpy=True)
+        column = table['KBytesRead']
+        self.assertEqual(str(column.values.dtype), 'uint64')
+        self.assertEqual(str(column.mask.dtype), 'bool')
+        self.assertEqual(column.values.tolist(), [0, 1000])
+        self.assertEqual(table['Errors'].tolist(), [None, -1])
+        self.assertEqual(table['StatisticTime'].values.tolist(),
+                         [0.5, 3600.5])
+
+    @requires_numpy
+    def test_numpy_datetime(self):
+        values = [CIMDateTime('20140924193040.654321-120'), None,
+                  CIMDateTime('00000001020304.500000:000'),
+                  CIMDateTime('19691231230000.000000+000')]
+        column = InstanceColumn.from_values('StatisticTime', 'datetime',
+                                            False, values, use_numpy=True)
+        expected = InstanceColumn.from_values('StatisticTime', 'datetime',
+                                              False, values, use_numpy=False)
+        self.assertEqual(str(column.values.dtype), 'float64')
+        self.assertEqual(column.values.tolist(), list(expected.values))
+        self.assertEqual(column.values.tolist()[1:],
+                         [0.0, 93784.5, -3600.0])
+
+
+class TestEnumerateInstanceTable(unittest.TestCase):
+
+    def setUp(self):
+        repo = create_repository(num_instances=10, num_properties=2)
+        self.server = MockWBEMServer(repo)
+        self.server.start()
+        self.conn = WBEMConnection(self.server.url, None,
+                                   default_namespace=DEFAULT_NAMESPACE)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_enumerate(self):
+        insts = self.conn.EnumerateInstances(PAYLOAD_CLASS)
+        table = self.conn.EnumerateInstanceTable(PAYLOAD_CLASS,
+                                                 use_numpy=False)
+        expected = InstanceTable.from_instances(insts, use_numpy=False)
+        self.assertEqual(table.paths, expected.paths)
+        self.assertEqual(table.paths[0].namespace, DEFAULT_NAMESPACE)
+        self.assertEqual(sorted(table.column_names),
+                         sorted(expected.column_names))
+        for column in expected:
+            self.assertEqual(table[column.name].tolist(), column.tolist())
+        self.assertEqual(table['Index'].values.typecode,
+                         expected['Index'].values.typecode)
+
+    def test_property_list(self):
+        table = self.conn.EnumerateInstanceTable(PAYLOAD_CLASS,
+                                                 PropertyList=['index'],
+                                                 use_numpy=False)
+        self.assertEqual(table.column_names, ['index'])
+        self.assertEqual(sorted(table['Index'].tolist()), list(range(10)))
+
+    def test_error(self):
+        try:
+            self.conn.EnumerateInstanceTable(PAYLOAD_CLASS,
+                                             namespace='root/missing')
+        except CIMError as exc:
+            self.assertEqual(exc.args[0], CIM_ERR_INVALID_NAMESPACE)
+        else:
+            self.fail('CIMError not raised')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+#
+# Test the lazy parsing of the properties of instances, and the discarding
+# of the properties that are not in the property list of an operation.
+#
+
+from __future__ import absolute_import
+
+import copy
+import unittest
+
+from pywbem import tupletree, tupleparse, cim_xml
+from pywbem import WBEMConnection, CIMInstance, CIMInstanceName, \
+                   CIMProperty, ParseError, Uint32
+from pywbem.cim_obj import NocaseDict
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+
+def response(instances):
+    """Return the CIM-XML response of an EnumerateInstances operation."""
+    data = cim_xml.IRETURNVALUE(None)
+    data.appendChildren([inst.tocimxml() for inst in instances])
+    return cim_xml.CIM(
+        cim_xml.MESSAGE(
+            cim_xml.SIMPLERSP(
+                cim_xml.IMETHODRESPONSE('EnumerateInstances', data)),
+            '1001', '1.0'),
+        '2.0', '2.0').toxml()
+
+
+def parse_instances(xml, **kwargs):
+    """Parse the CIM-XML response of an EnumerateInstances operation, and
+    return the instances."""
+    tup_tree = tupleparse.parse_cim(tupletree.xml_to_tupletree(xml), **kwargs)
+    return tup_tree[2][2][0][2][2][2]
+
+
+class ParseLazyProperties(unittest.TestCase):
+
+    def setUp(self):
+        self.instances = []
+        for index in range(2):
+            path = CIMInstanceName('PyWBEM_Test',
+                                   {'InstanceID': 'test-%d' % index})
+            inst = CIMInstance('PyWBEM_Test', path=path)
+            inst['InstanceID'] = 'test-%d' % index
+            inst['Count'] = Uint32(index)
+            inst['Names'] = ['a', 'b']
+            inst['Other'] = CIMInstanceName('PyWBEM_Test',
+                                            {'InstanceID': 'other'})
+            inst['Embedded'] = CIMProperty('Embedded',
+                                           CIMInstance('PyWBEM_Embedded',
+                                                       {'Name': 'e'}))
+            self.instances.append(inst)
+        self.xml = response(self.instances)
+
+    def test_lazy(self):
+        instances = parse_instances(self.xml, lazy_properties=True)
+        self.assertEqual(instances, parse_instances(self.xml))
+        self.assertEqual(instances, self.instances)
+
+        inst = parse_instances(self.xml, lazy_properties=True)[1]
+        props = inst.properties
+        self.assertEqual(len(inst), 5)
+        self.assertTrue('count' in inst)
+        self.assertFalse(props.is_materialized('Count'))
+        self.assertEqual(inst['count'], 1)
+        self.assertTrue(props.is_materialized('Count'))
+        self.assertFalse(props.is_materialized('Names'))
+        self.assertTrue(inst.properties['Count'] is props['Count'])
+        self.assertEqual(sorted(inst.keys()),
+                         ['Count', 'Embedded', 'InstanceID', 'Names',
+                          'Other'])
+        self.assertFalse(props.is_materialized('Names'))
+        self.assertEqual(inst['Embedded']['Name'], 'e')
+
+        inst = parse_instances(self.xml, lazy_properties=True)[0]
+        self.assertEqual(inst.copy(), self.instances[0])
+        self.assertEqual(copy.deepcopy(inst), self.instances[0])
+        self.assertEqual(inst.fingerprint(), self.instances[0].fingerprint())
+        self.assertEqual(inst.tocimxml().toxml(),
+                         self.instances[0].tocimxml().toxml())
+
+    def test_property_list(self):
+        instances = parse_instances(self.xml, lazy_properties=True,
+                                    property_list=['count', 'NAMES',
+                                                   'Missing'])
+        self.assertEqual(sorted(instances[1].keys()), ['Count', 'Names'])
+        self.assertEqual(instances[1]['Names'], ['a', 'b'])
+        self.assertEqual(instances[1].path, self.instances[1].path)
+
+        # The property list only applies in lazy mode
+        instances = parse_instances(self.xml, property_list=['Count'])
+        self.assertEqual(len(instances[0]), 5)
+
+    def test_errors(self):
+        xml = self.xml.replace('<VALUE>1</VALUE>', '<VALUE>x</VALUE>')
+        self.assertRaises(ParseError, parse_instances, xml)
+        inst = parse_instances(xml, lazy_properties=True)[1]
+        self.assertEqual(inst['InstanceID'], 'test-1')
+        self.assertRaises(ParseError, inst.__getitem__, 'Count')
+
+        # The lazy mode ends with the parsing of the response
+        inst = tupleparse.parse_any(tupletree.xml_to_tupletree(
+            self.instances[0].tocimxml().toxml()))
+        self.assertTrue(inst.properties.__class__ is NocaseDict)
+
+
+class TestLazyProperties(unittest.TestCase):
+
+    def start_server(self, **kwargs):
+        repo = create_repository(num_instances=5, num_properties=3)
+        self.server = MockWBEMServer(repo, **kwargs)
+        self.server.start()
+        self.conn = WBEMConnection(self.server.url, None,
+                                   default_namespace=DEFAULT_NAMESPACE,
+                                   lazy_properties=True)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_operations(self):
+        self.start_server()
+        insts = self.conn.EnumerateInstances(PAYLOAD_CLASS)
+        self.assertFalse(insts[0].properties.is_materialized('Data1'))
+        self.assertEqual(len(insts), 5)
+        self.assertEqual(insts[0].path.namespace, DEFAULT_NAMESPACE)
+
+        inst = self.conn.GetInstance(insts[0].path)
+        self.assertEqual(inst, insts[0])
+        self.assertEqual(inst.path.namespace, DEFAULT_NAMESPACE)
+        results = self.conn.GetInstances([insts[0].path, insts[1].path],
+                                         PropertyList=['Index'],
+                                         multireq=True)
+        self.assertEqual([inst.items() for inst in results],
+                         [[('Index', 0)], [('Index', 1)]])
+
+        self.conn.lazy_properties = False
+        self.assertEqual(self.conn.EnumerateInstances(PAYLOAD_CLASS), insts)
+
+    def test_ignored_property_list(self):
+        self.start_server(ignore_property_list=True)
+        insts = self.conn.EnumerateInstances(PAYLOAD_CLASS,
+                                             PropertyList=['Index'])
+        self.assertEqual([inst.keys() for inst in insts], [['Index']] * 5)
+        inst = self.conn.GetInstance(insts[0].path, PropertyList=['Data2'])
+        self.assertEqual(inst.keys(), ['Data2'])
+
+        self.conn.lazy_properties = False
+        insts = self.conn.EnumerateInstances(PAYLOAD_CLASS,
+                                             PropertyList=['Index'])
+        self.assertEqual(len(insts[0]), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
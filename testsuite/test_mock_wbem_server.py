@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+#
+# Test the mock WBEM server with WBEMConnection, via HTTP and via a Unix
+# domain socket.
+#
+
+from __future__ import absolute_import
+
+import os
+import time
+import unittest
+from tempfile import mkdtemp
+from shutil import rmtree
+
+from pywbem import WBEMConnection, CIMInstanceName, CIMError, \
+                   CIM_ERR_NOT_FOUND, CIM_ERR_INVALID_NAMESPACE, \
+                   CIM_ERR_NOT_SUPPORTED
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, PAYLOAD_LINK_CLASS, DEFAULT_NAMESPACE
+
+
+class MockServerTests(object):
+    """Tests of the operations of the mock WBEM server, for a connection to
+    the server in self.conn."""
+
+    def payload_path(self, index):
+        return CIMInstanceName(PAYLOAD_CLASS,
+                               {'InstanceID': 'payload-%d' % index},
+                               namespace=DEFAULT_NAMESPACE)
+
+    def test_instances(self):
+        insts = self.conn.EnumerateInstances(PAYLOAD_CLASS)
+        self.assertEqual(len(insts), 5)
+        self.assertEqual(sorted([inst['Index'] for inst in insts]),
+                         [0, 1, 2, 3, 4])
+        self.assertEqual(len(insts[0]['Data1']), 8)
+        self.assertEqual(len(insts[0]['Data2']), 8)
+
+        paths = self.conn.EnumerateInstanceNames(PAYLOAD_LINK_CLASS)
+        self.assertEqual(len(paths), 4)
+
+        inst = self.conn.GetInstance(self.payload_path(3),
+                                     PropertyList=['Index'])
+        self.assertEqual(inst['Index'], 3)
+        self.assertFalse('Data1' in inst)
+
+    def test_associators(self):
+        paths = self.conn.AssociatorNames(self.payload_path(2))
+        self.assertEqual(sorted([p['InstanceID'] for p in paths]),
+                         ['payload-1', 'payload-3'])
+        insts = self.conn.Associators(self.payload_path(2), Role='Source')
+        self.assertEqual([inst['Index'] for inst in insts], [3])
+
+    def test_classes(self):
+        self.assertEqual(sorted(self.conn.EnumerateClassNames()),
+                         [PAYLOAD_CLASS, PAYLOAD_LINK_CLASS])
+        cc = self.conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(sorted(cc.properties.keys()),
+                         ['Data1', 'Data2', 'Index', 'InstanceID'])
+        self.assertEqual(len(self.conn.EnumerateClasses()), 2)
+
+    def test_qualifiers(self):
+        self.assertEqual(
+            sorted([q.name for q in self.conn.EnumerateQualifiers()]),
+            ['Association', 'Key'])
+        qual = self.conn.GetQualifier('Key')
+        self.assertTrue(qual.scopes['PROPERTY'])
+        self.assertFalse(qual.scopes['CLASS'])
+
+    def test_errors(self):
+        try:
+            self.conn.GetInstance(self.payload_path(10))
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_NOT_FOUND)
+        try:
+            self.conn.EnumerateInstances(PAYLOAD_CLASS, namespace='root/bad')
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_INVALID_NAMESPACE)
+        try:
+            self.conn.References(self.payload_path(1))
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_NOT_SUPPORTED)
+
+
+class TestMockServerHTTP(MockServerTests, unittest.TestCase):
+
+    def setUp(self):
+        repo = create_repository(num_instances=5, num_properties=2,
+                                 property_size=8)
+        self.server = MockWBEMServer(repo)
+        self.server.start()
+        self.conn = WBEMConnection(self.server.url, None,
+                                   default_namespace=DEFAULT_NAMESPACE)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_response_cache(self):
+        self.conn.GetInstance(self.payload_path(1))
+        self.conn.GetInstance(self.payload_path(1))
+        self.assertEqual(self.server.num_requests, 2)
+        self.assertEqual(len(self.server._cache), 1)
+
+    def test_latency(self):
+        self.server.latency = 0.1
+        t = time.time()
+        self.conn.GetClass(PAYLOAD_CLASS)
+        self.assertTrue(time.time() - t >= 0.1)
+
+
+class TestMockServerUDS(MockServerTests, unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        uds_path = os.path.join(self.tmp_dir, 'wbem.sock')
+        repo = create_repository(num_instances=5, num_properties=2,
+                                 property_size=8)
+        self.server = MockWBEMServer(repo, uds_path=uds_path)
+        self.server.start()
+        self.conn = WBEMConnection(uds_path, None,
+                                   default_namespace=DEFAULT_NAMESPACE)
+
+    def tearDown(self):
+        self.server.stop()
+        rmtree(self.tmp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
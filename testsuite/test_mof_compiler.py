@@ -7,8 +7,10 @@ import sys
 import os
 from time import time
 from zipfile import ZipFile
-from tempfile import TemporaryFile
+from tempfile import TemporaryFile, mkdtemp
+from shutil import rmtree
 import unittest
+import threading
 
 import six
 if six.PY2:
@@ -20,7 +22,8 @@ else:
 
 from ply import lex
 
-from pywbem.cim_operations import CIMError
+from pywbem.cim_obj import CIMInstanceName
+from pywbem.cim_operations import CIMError, WBEMConnection
 from pywbem.mof_compiler import MOFCompiler, MOFWBEMConnection, MOFParseError
 from pywbem.cim_constants import *
 from pywbem import mof_compiler
@@ -175,6 +178,632 @@ class TestSchemaSearch(MOFTest):
         self.assertEqual(cele.properties['RequestedState'].type, 'uint16')
 
 
+class TestFindMof(unittest.TestCase):
+    """Test find_mof() and its index of the search paths."""
+
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+        os.mkdir(os.path.join(self.tmpdir, 'sub'))
+        self.write_mof('CIM_Foo.mof')
+        self.write_mof(os.path.join('sub', 'CIM_Bar.mof'))
+        self.mofcomp = MOFCompiler(MOFWBEMConnection(),
+                                   search_paths=[self.tmpdir],
+                                   log_func=lambda msg: None)
+
+    def tearDown(self):
+        rmtree(self.tmpdir)
+
+    def write_mof(self, filename):
+        """Create an empty MOF file in the temporary directory, and make sure
+        the mtime of its directory changes."""
+        path = os.path.join(self.tmpdir, filename)
+        open(path, 'w').close()
+        dir_path = os.path.dirname(path)
+        mtime = os.stat(dir_path).st_mtime + 10
+        os.utime(dir_path, (mtime, mtime))
+
+    def test_lookup(self):
+        self.assertEqual(self.mofcomp.find_mof('CIM_Foo'),
+                         self.tmpdir + '/CIM_Foo.mof')
+        self.assertEqual(self.mofcomp.find_mof('cim_bar'),
+                         os.path.join(self.tmpdir, 'sub') + '/CIM_Bar.mof')
+        self.assertEqual(self.mofcomp.find_mof('CIM_Baz'), None)
+
+    def test_invalidation(self):
+        self.assertEqual(self.mofcomp.find_mof('CIM_Baz'), None)
+        self.write_mof(os.path.join('sub', 'CIM_Baz.mof'))
+        self.assertEqual(self.mofcomp.find_mof('CIM_Baz'),
+                         os.path.join(self.tmpdir, 'sub') + '/CIM_Baz.mof')
+
+        os.remove(os.path.join(self.tmpdir, 'CIM_Foo.mof'))
+        mtime = os.stat(self.tmpdir).st_mtime + 10
+        os.utime(self.tmpdir, (mtime, mtime))
+        self.assertEqual(self.mofcomp.find_mof('CIM_Foo'), None)
+
+    def test_index_reuse(self):
+        self.mofcomp.find_mof('CIM_Foo')
+        index = mof_compiler._mof_file_indexes[self.tmpdir]
+        mofcomp = MOFCompiler(MOFWBEMConnection(),
+                              search_paths=[self.tmpdir],
+                              log_func=lambda msg: None)
+        self.assertEqual(mofcomp.find_mof('CIM_Bar'),
+                         os.path.join(self.tmpdir, 'sub') + '/CIM_Bar.mof')
+        self.assertTrue(mof_compiler._mof_file_indexes[self.tmpdir] is index)
+
+
+class TestCompileFileCached(unittest.TestCase):
+    """Test compile_file_cached()."""
+
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+        self.cache_dir = os.path.join(self.tmpdir, 'cache')
+        self.write_mof('qualifiers.mof',
+                       'Qualifier Key : boolean = false, Scope(property, '
+                       'reference), Flavor(DisableOverride, ToSubclass);\n')
+        self.write_mof('CIM_Foo.mof',
+                       'class CIM_Foo {\n  [Key] string Name;\n};\n')
+        self.write_mof('top.mof',
+                       '#pragma include ("qualifiers.mof")\n'
+                       '#pragma include ("CIM_Foo.mof")\n'
+                       'instance of CIM_Foo { Name = "foo"; };\n')
+
+    def tearDown(self):
+        rmtree(self.tmpdir)
+
+    def write_mof(self, filename, mof):
+        """Write a MOF file into the temporary directory."""
+        f = open(os.path.join(self.tmpdir, filename), 'w')
+        f.write(mof)
+        f.close()
+
+    def compile(self):
+        """Compile top.mof with a new compiler, and return the compiler and
+        the result of compile_file_cached()."""
+        mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[self.tmpdir],
+                              log_func=lambda msg: None)
+        compile_string = mofcomp.compile_string
+        compiled = []
+
+        def tracking_compile_string(mof, ns, filename=None):
+            compiled.append(os.path.basename(filename))
+            return compile_string(mof, ns, filename=filename)
+
+        mofcomp.compile_string = tracking_compile_string
+        loaded = mofcomp.compile_file_cached(
+            os.path.join(self.tmpdir, 'top.mof'), NAME_SPACE, self.cache_dir)
+        self.assertEqual(loaded, not compiled)
+        return mofcomp, loaded
+
+    def test_cache(self):
+        mofcomp, loaded = self.compile()
+        self.assertFalse(loaded)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        mofcomp, loaded = self.compile()
+        self.assertTrue(loaded)
+        repo = mofcomp.handle
+        self.assertEqual(repo.class_names[NAME_SPACE], ['CIM_Foo'])
+        self.assertTrue('Key' in repo.qualifiers[NAME_SPACE])
+        self.assertEqual(repo.instances[NAME_SPACE][0]['Name'], 'foo')
+        cc = repo.GetClass('CIM_Foo', namespace=NAME_SPACE)
+        self.assertTrue(cc.properties['Name'].qualifiers['Key'].value)
+
+    def test_invalidation(self):
+        self.compile()
+        self.write_mof('CIM_Foo.mof',
+                       'class CIM_Foo {\n  [Key] string Name;\n'
+                       '  uint32 Size;\n};\n')
+        mofcomp, loaded = self.compile()
+        self.assertFalse(loaded)
+        self.assertTrue('Size' in
+                        mofcomp.handle.classes[NAME_SPACE]['CIM_Foo'].properties)
+
+        mofcomp, loaded = self.compile()
+        self.assertTrue(loaded)
+
+    def test_existing_content(self):
+        self.compile()
+        mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[self.tmpdir],
+                              log_func=lambda msg: None)
+        mofcomp.compile_string('class CIM_Bar { string Name; };', NAME_SPACE)
+        top = os.path.join(self.tmpdir, 'top.mof')
+
+        # The cache file of the compilation into an empty repository is not
+        # used, because it would drop the existing class
+        loaded = mofcomp.compile_file_cached(top, NAME_SPACE, self.cache_dir)
+        self.assertFalse(loaded)
+        self.assertEqual(sorted(mofcomp.handle.class_names[NAME_SPACE]),
+                         ['CIM_Bar', 'CIM_Foo'])
+
+        mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[self.tmpdir],
+                              log_func=lambda msg: None)
+        mofcomp.compile_string('class CIM_Bar { string Name; };', NAME_SPACE)
+        loaded = mofcomp.compile_file_cached(top, NAME_SPACE, self.cache_dir)
+        self.assertTrue(loaded)
+        self.assertEqual(sorted(mofcomp.handle.class_names[NAME_SPACE]),
+                         ['CIM_Bar', 'CIM_Foo'])
+
+    def test_corrupt_cache_file(self):
+        self.compile()
+        cache_file = os.path.join(self.cache_dir,
+                                  os.listdir(self.cache_dir)[0])
+        f = open(cache_file, 'wb')
+        f.write(b'garbage')
+        f.close()
+        dummy_mofcomp, loaded = self.compile()
+        self.assertFalse(loaded)
+
+    def test_connection_not_allowed(self):
+        conn = WBEMConnection('http://localhost')
+        mofcomp = MOFCompiler(MOFWBEMConnection(conn=conn),
+                              log_func=lambda msg: None)
+        self.assertRaises(ValueError, mofcomp.compile_file_cached,
+                          os.path.join(self.tmpdir, 'top.mof'), NAME_SPACE,
+                          self.cache_dir)
+
+
+class StrictRepository(MOFWBEMConnection):
+    """
+    A local repository that, like a WBEM server, rejects classes whose
+    superclass or referenced classes do not exist, and that records the
+    create operations.
+    """
+
+    def __init__(self):
+        super(StrictRepository, self).__init__()
+        self.operations = []
+
+    def SetQualifier(self, *args, **kwargs):
+        qual = args[0]
+        self.operations.append(('SetQualifier', qual.name))
+        return super(StrictRepository, self).SetQualifier(*args, **kwargs)
+
+    def CreateClass(self, *args, **kwargs):
+        cc = args[0]
+        self.operations.append(('CreateClass', cc.classname))
+        for prop in cc.properties.values():
+            if prop.type == 'reference':
+                self.GetClass(prop.reference_class)
+        return super(StrictRepository, self).CreateClass(*args, **kwargs)
+
+    def CreateInstance(self, *args, **kwargs):
+        inst = args[0]
+        self.operations.append(('CreateInstance', inst.classname))
+        return super(StrictRepository, self).CreateInstance(*args, **kwargs)
+
+    def DeleteInstance(self, InstanceName):
+        self.operations.append(('DeleteInstance', InstanceName.classname))
+        return super(StrictRepository, self).DeleteInstance(InstanceName)
+
+    def DeleteClass(self, ClassName):
+        self.operations.append(('DeleteClass', ClassName))
+        return super(StrictRepository, self).DeleteClass(ClassName)
+
+
+class TestCompileFileOrdered(unittest.TestCase):
+    """Test compile_file_ordered()."""
+
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+        self.write_mof('qualifiers.mof',
+                       'Qualifier Key : boolean = false, Scope(property, '
+                       'reference), Flavor(DisableOverride, ToSubclass);\n'
+                       'Qualifier Association : boolean = false, '
+                       'Scope(association), Flavor(DisableOverride, '
+                       'ToSubclass);\n')
+        # CIM_Bar is only found in the search path
+        self.write_mof('CIM_Bar.mof',
+                       'class CIM_Bar {\n  [Key] string Name;\n};\n')
+        # The association and the subclass come before the classes they
+        # depend on
+        self.write_mof('top.mof',
+                       '#pragma include ("qualifiers.mof")\n'
+                       '[Association]\n'
+                       'class CIM_FooBar {\n'
+                       '  [Key] CIM_Foo REF Foo;\n'
+                       '  [Key] CIM_Bar REF Bar;\n'
+                       '};\n'
+                       'class CIM_Foo {\n  [Key] string Name;\n};\n'
+                       'instance of CIM_Foo { Name = "foo"; };\n')
+        self.repo = StrictRepository()
+        self.mofcomp = MOFCompiler(self.repo, search_paths=[self.tmpdir],
+                                   log_func=lambda msg: None)
+
+    def tearDown(self):
+        rmtree(self.tmpdir)
+
+    def write_mof(self, filename, mof):
+        """Write a MOF file into the temporary directory."""
+        f = open(os.path.join(self.tmpdir, filename), 'w')
+        f.write(mof)
+        f.close()
+
+    def test_order(self):
+        staging = self.mofcomp.compile_file_ordered(
+            os.path.join(self.tmpdir, 'top.mof'), NAME_SPACE)
+        self.assertEqual(self.repo.operations,
+                         [('SetQualifier', 'Key'),
+                          ('SetQualifier', 'Association'),
+                          ('CreateClass', 'CIM_Foo'),
+                          ('CreateClass', 'CIM_Bar'),
+                          ('CreateClass', 'CIM_FooBar'),
+                          ('CreateInstance', 'CIM_Foo')])
+        self.assertEqual(sorted(self.repo.class_names[NAME_SPACE]),
+                         ['CIM_Bar', 'CIM_Foo', 'CIM_FooBar'])
+        self.assertEqual(sorted(staging.class_names[NAME_SPACE]),
+                         ['CIM_Bar', 'CIM_Foo', 'CIM_FooBar'])
+        self.assertEqual(self.repo.default_namespace, NAME_SPACE)
+
+    def test_existing_classes(self):
+        self.mofcomp.compile_file(os.path.join(self.tmpdir, 'CIM_Bar.mof'),
+                                  NAME_SPACE)
+        del self.repo.operations[:]
+        self.mofcomp.compile_file_ordered(
+            os.path.join(self.tmpdir, 'top.mof'), NAME_SPACE)
+        self.assertEqual([op for op in self.repo.operations
+                          if op[0] == 'CreateClass'],
+                         [('CreateClass', 'CIM_Foo'),
+                          ('CreateClass', 'CIM_FooBar')])
+
+    def test_sort_classes(self):
+        mofcomp = MOFCompiler(MOFWBEMConnection(), log_func=lambda msg: None)
+        mofcomp.compile_string(
+            'class A { B REF b; };\n'
+            'class B { A REF a; };\n'
+            'class D { };\n'
+            'class C : D { };\n'
+            'class E : C { };\n', NAME_SPACE)
+        classes = mofcomp.handle.classes[NAME_SPACE]
+        sorted_classes = mof_compiler._sort_classes(
+            [classes[cname] for cname in ['E', 'A', 'C', 'B', 'D']])
+        self.assertEqual([cc.classname for cc in sorted_classes],
+                         ['D', 'C', 'E', 'B', 'A'])
+
+
+class TestUpload(unittest.TestCase):
+    """Test MOFWBEMConnection.upload()."""
+
+    def setUp(self):
+        mofcomp = MOFCompiler(MOFWBEMConnection(), log_func=lambda msg: None)
+        mofcomp.compile_string(
+            'Qualifier Key : boolean = false, Scope(property, reference), '
+            'Flavor(DisableOverride, ToSubclass);\n'
+            'Qualifier Association : boolean = false, Scope(association), '
+            'Flavor(DisableOverride, ToSubclass);\n'
+            'class CIM_Base { [Key] string Name; };\n'
+            'class CIM_A : CIM_Base { };\n'
+            'class CIM_B : CIM_Base { };\n'
+            'class CIM_A1 : CIM_A { };\n'
+            'class CIM_A2 : CIM_A { };\n'
+            'class CIM_B1 : CIM_B { };\n'
+            '[Association] class CIM_AB {\n'
+            '  [Key] CIM_A REF A; [Key] CIM_B REF B; };\n'
+            'instance of CIM_A1 { Name = "a1"; };\n'
+            'instance of CIM_B1 { Name = "b1"; };\n'
+            'instance of CIM_AB {\n'
+            '  A = "CIM_A1.Name=\\"a1\\""; B = "CIM_B1.Name=\\"b1\\""; };\n',
+            NAME_SPACE)
+        self.local = mofcomp.handle
+        self.repo = StrictRepository()
+
+    def test_upload(self):
+        progress = []
+        lock = threading.Lock()
+
+        def progress_func(done, total):
+            with lock:
+                progress.append((done, total, threading.current_thread()))
+
+        self.repo.default_namespace = 'root/other'
+        self.local.upload(self.repo, max_workers=4, progress=progress_func)
+        self.assertEqual(self.repo.default_namespace, 'root/other')
+
+        # The local repository of a MOFWBEMConnection target is not
+        # updated concurrently
+        self.assertEqual(set([p[2] for p in progress]),
+                         set([threading.current_thread()]))
+        progress = [p[:2] for p in progress]
+
+        ops = self.repo.operations
+        self.assertEqual(len(ops), 12)
+        self.assertEqual(progress[-1], (12, 12))
+        self.assertEqual(len(progress), 12)
+        self.assertEqual(sorted(self.repo.class_names[NAME_SPACE]),
+                         sorted(self.local.class_names[NAME_SPACE]))
+        self.assertEqual(len(self.repo.instances[NAME_SPACE]), 3)
+        for op, cname in ops:
+            if op == 'CreateClass':
+                cc = self.local.classes[NAME_SPACE][cname]
+                if cc.superclass:
+                    self.assertTrue(
+                        ops.index(('CreateClass', cc.superclass)) <
+                        ops.index((op, cname)))
+        self.assertEqual(ops[-1], ('CreateInstance', 'CIM_AB'))
+        self.assertEqual(set(ops[:2]), set([('SetQualifier', 'Key'),
+                                            ('SetQualifier', 'Association')]))
+
+    def test_rollback(self):
+        repo = self.repo
+        create_class = repo.CreateClass
+
+        def failing_create_class(cc):
+            if cc.classname == 'CIM_B1':
+                raise CIMError(CIM_ERR_FAILED, 'disk full')
+            return create_class(cc)
+
+        repo.CreateClass = failing_create_class
+        repo.default_namespace = 'root/other'
+        try:
+            self.local.upload(repo, max_workers=1)
+        except CIMError as ce:
+            self.assertEqual(ce.args[1], 'disk full')
+        else:
+            self.fail('CIMError not raised')
+        self.assertEqual(repo.default_namespace, 'root/other')
+
+        self.assertEqual(repo.class_names[NAME_SPACE], [])
+        deleted = [cname for op, cname in repo.operations
+                   if op == 'DeleteClass']
+        self.assertEqual(deleted, ['CIM_A2', 'CIM_A1', 'CIM_B', 'CIM_A',
+                                   'CIM_Base'])
+        self.assertFalse('CIM_AB' in repo.classes[NAME_SPACE])
+        self.assertFalse(NAME_SPACE in repo.instances)
+
+
+class TestIndexedRepository(unittest.TestCase):
+    """Test the operations of the local repository of MOFWBEMConnection."""
+
+    def setUp(self):
+        self.mofcomp = MOFCompiler(MOFWBEMConnection(),
+                                   log_func=lambda msg: None)
+        self.mofcomp.compile_string(
+            'Qualifier Key : boolean = false, Scope(property, reference), '
+            'Flavor(DisableOverride, ToSubclass);\n'
+            'Qualifier Association : boolean = false, Scope(association), '
+            'Flavor(DisableOverride, ToSubclass);\n'
+            'class CIM_Foo {\n  [Key] string Name;\n  string Value;\n};\n'
+            'class CIM_SubFoo : CIM_Foo {\n  uint32 Size;\n};\n'
+            'class CIM_SubSubFoo : CIM_SubFoo { };\n'
+            'class CIM_Bar {\n  [Key] string Name;\n};\n'
+            '[Association]\n'
+            'class CIM_FooBar {\n'
+            '  [Key] CIM_Foo REF Foo;\n'
+            '  [Key] CIM_Bar REF Bar;\n'
+            '};\n'
+            '[Association]\n'
+            'class CIM_SubFooBar : CIM_FooBar { };\n'
+            'instance of CIM_Foo as $foo1 { Name = "foo1"; Value = "a"; };\n'
+            'instance of CIM_Foo as $foo2 { Name = "foo2"; Value = "b"; };\n'
+            'instance of CIM_SubFoo as $sub1 { Name = "sub1"; Size = 1; };\n'
+            'instance of CIM_Bar as $bar1 { Name = "bar1"; };\n'
+            'instance of CIM_Bar as $bar2 { Name = "bar2"; };\n'
+            'instance of CIM_FooBar { Foo = $foo1; Bar = $bar1; };\n'
+            'instance of CIM_SubFooBar { Foo = $foo1; Bar = $bar2; };\n'
+            'instance of CIM_FooBar { Foo = $sub1; Bar = $bar1; };\n',
+            NAME_SPACE)
+        self.repo = self.mofcomp.handle
+
+    @staticmethod
+    def path(classname, **keys):
+        """Return an instance path in the test namespace."""
+        return CIMInstanceName(classname, keybindings=keys,
+                               namespace=NAME_SPACE)
+
+    @staticmethod
+    def names(objs):
+        """Return the sorted values of the Name keys of instance paths or
+        instances."""
+        return sorted([obj['Name'] for obj in objs])
+
+    def test_get_instance(self):
+        inst = self.repo.GetInstance(self.path('CIM_Foo', Name='foo1'))
+        self.assertEqual(inst['Value'], 'a')
+        inst = self.repo.GetInstance(self.path('CIM_Foo', Name='foo2'),
+                                     PropertyList=['Name'])
+        self.assertEqual(list(inst.properties.keys()), ['Name'])
+        try:
+            self.repo.GetInstance(self.path('CIM_Foo', Name='foo3'))
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_NOT_FOUND)
+
+    def test_create_instance_overwrites(self):
+        self.mofcomp.compile_string(
+            'instance of CIM_Foo { Name = "foo1"; Value = "c"; };\n',
+            NAME_SPACE)
+        insts = [inst for inst in self.repo.instances[NAME_SPACE]
+                 if inst.path == self.path('CIM_Foo', Name='foo1')]
+        self.assertEqual(len(insts), 1)
+        self.assertEqual(insts[0]['Value'], 'c')
+        self.assertEqual(
+            self.repo.GetInstance(self.path('CIM_Foo', Name='foo1'))['Value'],
+            'c')
+        # Instances of the same class have their own property values
+        self.assertEqual(
+            self.repo.GetInstance(self.path('CIM_Foo', Name='foo2'))['Value'],
+            'b')
+
+    def test_enumerate_instances(self):
+        insts = self.repo.EnumerateInstances('CIM_Foo', NAME_SPACE)
+        self.assertEqual(self.names(insts), ['foo1', 'foo2', 'sub1'])
+        insts = self.repo.EnumerateInstances('cim_subfoo', NAME_SPACE)
+        self.assertEqual(self.names(insts), ['sub1'])
+        self.assertEqual(insts[0]['Size'], 1)
+        self.assertEqual(self.repo.EnumerateInstances('CIM_SubSubFoo'), [])
+        paths = self.repo.EnumerateInstanceNames('CIM_Foo')
+        self.assertEqual(self.names(paths), ['foo1', 'foo2', 'sub1'])
+        self.assertEqual(len(self.repo.EnumerateInstanceNames('CIM_FooBar')),
+                         3)
+
+    def test_enumerate_class_names(self):
+        self.assertEqual(sorted(self.repo.EnumerateClassNames()),
+                         ['CIM_Bar', 'CIM_Foo', 'CIM_FooBar'])
+        self.assertEqual(self.repo.EnumerateClassNames(ClassName='CIM_Foo'),
+                         ['CIM_SubFoo'])
+        self.assertEqual(
+            sorted(self.repo.EnumerateClassNames(ClassName='CIM_Foo',
+                                                 DeepInheritance=True)),
+            ['CIM_SubFoo', 'CIM_SubSubFoo'])
+        self.assertEqual(len(self.repo.EnumerateClassNames(
+            DeepInheritance=True)), 6)
+        try:
+            self.repo.EnumerateClassNames(ClassName='CIM_NoSuchClass')
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_INVALID_CLASS)
+
+    def test_resolved_classes(self):
+        cc = self.repo.GetClass('CIM_SubSubFoo', LocalOnly=False)
+        self.assertEqual(sorted(cc.properties.keys()),
+                         ['Name', 'Size', 'Value'])
+        self.assertTrue(self.repo.GetClass('CIM_SubSubFoo', LocalOnly=False)
+                        is cc)
+        local_cc = self.repo.GetClass('CIM_SubSubFoo', LocalOnly=True)
+        self.assertEqual(list(local_cc.properties.keys()), [])
+
+        # Creating a class invalidates the cached classes
+        self.mofcomp.compile_string(
+            'class CIM_SubFoo : CIM_Foo {\n  uint32 Size;\n  uint32 Max;\n'
+            '};\n', NAME_SPACE)
+        cc = self.repo.GetClass('CIM_SubSubFoo', LocalOnly=False)
+        self.assertEqual(sorted(cc.properties.keys()),
+                         ['Max', 'Name', 'Size', 'Value'])
+
+    def test_associators(self):
+        foo1 = self.path('CIM_Foo', Name='foo1')
+        self.assertEqual(self.names(self.repo.Associators(foo1)),
+                         ['bar1', 'bar2'])
+        self.assertEqual(
+            self.names(self.repo.Associators(foo1, AssocClass='CIM_SubFooBar')),
+            ['bar2'])
+        self.assertEqual(self.repo.Associators(foo1, Role='Bar'), [])
+        self.assertEqual(self.repo.Associators(foo1, ResultRole='Foo'), [])
+        self.assertEqual(
+            self.names(self.repo.AssociatorNames(foo1, Role='foo',
+                                                 ResultRole='bar')),
+            ['bar1', 'bar2'])
+
+        bar1 = self.path('CIM_Bar', Name='bar1')
+        self.assertEqual(self.names(self.repo.AssociatorNames(bar1)),
+                         ['foo1', 'sub1'])
+        self.assertEqual(
+            self.names(self.repo.Associators(bar1, ResultClass='CIM_SubFoo',
+                                             PropertyList=['Name'])),
+            ['sub1'])
+        self.assertEqual(
+            self.repo.AssociatorNames(self.path('CIM_Foo', Name='foo2')), [])
+        self.assertRaises(CIMError, self.repo.Associators, 'CIM_Foo')
+
+    def test_delete(self):
+        foo2 = self.path('CIM_Foo', Name='foo2')
+        self.repo.DeleteInstance(foo2)
+        self.assertEqual(self.names(self.repo.EnumerateInstances('CIM_Foo')),
+                         ['foo1', 'sub1'])
+        self.assertRaises(CIMError, self.repo.DeleteInstance, foo2)
+
+        try:
+            self.repo.DeleteClass('CIM_SubFoo')
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_CLASS_HAS_CHILDREN)
+        self.repo.DeleteClass('CIM_SubSubFoo')
+        self.assertFalse('CIM_SubSubFoo' in self.repo.classes[NAME_SPACE])
+        self.assertFalse('CIM_SubSubFoo' in self.repo.class_names[NAME_SPACE])
+        self.assertEqual(self.repo.EnumerateClassNames(ClassName='CIM_SubFoo'),
+                         [])
+
+    def test_set_state(self):
+        repo = MOFWBEMConnection()
+        repo._set_state(self.repo._get_state())
+        self.assertEqual(self.names(repo.EnumerateInstances('CIM_Foo',
+                                                            NAME_SPACE)),
+                         ['foo1', 'foo2', 'sub1'])
+        self.assertEqual(
+            self.names(repo.AssociatorNames(self.path('CIM_Bar',
+                                                      Name='bar2'))),
+            ['foo1'])
+        self.assertEqual(
+            repo.EnumerateClassNames(namespace=NAME_SPACE,
+                                     ClassName='CIM_SubFoo'),
+            ['CIM_SubSubFoo'])
+
+class TestCompileFileParallel(unittest.TestCase):
+    """Test compile_file_parallel()."""
+
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+        os.mkdir(os.path.join(self.tmpdir, 'sub'))
+        self.write_mof('qualifiers.mof',
+                       'Qualifier Key : boolean = false, Scope(property, '
+                       'reference), Flavor(DisableOverride, ToSubclass);\n')
+        # CIM_Base is only found in the search path
+        self.write_mof('CIM_Base.mof',
+                       'class CIM_Base {\n  [Key] string Name;\n};\n')
+        self.write_mof('sub/CIM_Sub1.mof',
+                       'class CIM_Sub1 : CIM_Sub2 {\n  uint32 Size;\n};\n')
+        self.write_mof('sub/CIM_Sub2.mof',
+                       'class CIM_Sub2 : CIM_Base {\n  string Label;\n};\n')
+        for i in range(3, 7):
+            self.write_mof('sub/CIM_Sub%d.mof' % i,
+                           'class CIM_Sub%d : CIM_Sub1 { };\n' % i)
+        self.write_mof('instances.mof',
+                       'instance of CIM_Sub3 { Name = "s3"; Size = 3; };\n')
+        self.write_mof('top.mof',
+                       '// The schema\n'
+                       '#pragma locale ("en_US")\n'
+                       '#pragma include ("qualifiers.mof")\n' +
+                       ''.join(['#pragma include ("sub/CIM_Sub%d.mof")\n' % i
+                                for i in range(1, 7)]) +
+                       '/* instances */\n'
+                       '#pragma include ("instances.mof")\n')
+
+    def tearDown(self):
+        rmtree(self.tmpdir)
+
+    def write_mof(self, filename, mof):
+        """Write a MOF file into the temporary directory."""
+        f = open(os.path.join(self.tmpdir, filename), 'w')
+        f.write(mof)
+        f.close()
+
+    def compile(self, filename, parallel):
+        """Compile a MOF file and return the repository."""
+        mofcomp = MOFCompiler(MOFWBEMConnection(), search_paths=[self.tmpdir],
+                              log_func=lambda msg: None)
+        filename = os.path.join(self.tmpdir, filename)
+        if parallel:
+            mofcomp.compile_file_parallel(filename, NAME_SPACE, max_workers=2)
+        else:
+            mofcomp.compile_file(filename, NAME_SPACE)
+        return mofcomp.handle
+
+    def test_parallel(self):
+        repo = self.compile('top.mof', parallel=True)
+        ref_repo = self.compile('top.mof', parallel=False)
+        self.assertEqual(sorted(repo.classes[NAME_SPACE].keys()),
+                         sorted(ref_repo.classes[NAME_SPACE].keys()))
+        for cname in ref_repo.classes[NAME_SPACE]:
+            self.assertEqual(repo.classes[NAME_SPACE][cname],
+                             ref_repo.classes[NAME_SPACE][cname])
+        self.assertEqual(repo.instances[NAME_SPACE],
+                         ref_repo.instances[NAME_SPACE])
+        names = [cname.lower() for cname in repo.class_names[NAME_SPACE]]
+        self.assertTrue(names.index('cim_base') < names.index('cim_sub2') <
+                        names.index('cim_sub1') < names.index('cim_sub3'))
+
+    def test_not_only_includes(self):
+        self.write_mof('other.mof',
+                       '#pragma include ("qualifiers.mof")\n'
+                       'class CIM_Other : CIM_Base { };\n')
+        repo = self.compile('other.mof', parallel=True)
+        self.assertEqual(sorted(repo.classes[NAME_SPACE].keys()),
+                         ['CIM_Base', 'CIM_Other'])
+
+    def test_parse_error(self):
+        self.write_mof('sub/CIM_Sub5.mof', 'class CIM_Sub5 : CIM_Sub1 {\n')
+        self.assertRaises(MOFParseError, self.compile, 'top.mof', True)
+
+
 class TestParseError(MOFTest):
 
     def test_all(self):
@@ -667,5 +1296,122 @@ class TestLexerNumber(BaseTestLexer):
         self.run_assert_lexer(input_data, exp_tokens)
 
 
+class TestLexerEquivalence(unittest.TestCase):
+    """Test that the fast LEX analyzer produces the same tokens as the PLY
+    LEX analyzer."""
+
+    @staticmethod
+    def tokens(lexer, input_data):
+        """Return the tokens and error messages for the input data."""
+        messages = []
+        mofcomp = MOFCompiler(handle=None, log_func=messages.append)
+        lexer.parser = mofcomp.parser
+        mofcomp.parser.mof = input_data
+        lexer.input(input_data)
+        result = []
+        while True:
+            tok = lexer.token()
+            if not tok:
+                break
+            result.append((tok.type, tok.value, tok.lineno, tok.lexpos,
+                           lexer.lineno, lexer.lexpos))
+        return result, messages
+
+    def assert_equivalent(self, input_data):
+        """Assert that both LEX analyzers produce the same tokens, and return
+        the tokens."""
+        fast_tokens = self.tokens(mof_compiler._MOFLexer(), input_data)
+        ply_tokens = self.tokens(mof_compiler._lex(), input_data)
+        self.assertEqual(fast_tokens, ply_tokens)
+        return fast_tokens[0]
+
+    def test_snippets(self):
+        for input_data in [
+                '',
+                'class CIM_Foo : CIM_Bar { string Name; };',
+                '// comment\n/* multi\nline\ncomment */ a\n\n\r\n b',
+                '42 -42 +0 0x1F -0X1f 0.5 -.5e10 1.5E-3 0101b 0101B 017',
+                '0 00 02B 2b 019 08 0.',
+                r'"str" "es\"ca\\pe" "hex\x1F" "\n"',
+                'instance of Foo as $Alias { A = {1, 2}; B = NULL; };',
+                'true FALSE Null Association QUALIFIER sint64 UInt8 ref',
+                '#pragma include ("foo.mof")',
+                'a ? b @ c',
+                '"unterminated\nstring"',
+                'a /* unterminated comment',
+                u'caf\xe9 \xc3\xa9t\xc3\xa9',
+        ]:
+            self.assert_equivalent(input_data)
+
+    def test_mof_files(self):
+        filenames = [os.path.join(SCRIPT_DIR, 'test.mof')]
+        mof_dir = os.path.join(SCRIPT_DIR, 'testmofs')
+        filenames += [os.path.join(mof_dir, f) for f in os.listdir(mof_dir)]
+        if os.path.isdir(SCHEMA_DIR):
+            for root, dummy_dirs, files in os.walk(SCHEMA_DIR):
+                filenames += [os.path.join(root, f) for f in files
+                              if f.endswith('.mof')]
+        for filename in filenames:
+            f = open(filename, 'r')
+            input_data = f.read()
+            f.close()
+            self.assertTrue(len(self.assert_equivalent(input_data)) > 0)
+
+
+class TestSharedParser(unittest.TestCase):
+    """Test that MOF compiler objects share the parsing tables."""
+
+    def test_shared_tables(self):
+        mofcomp1 = MOFCompiler(MOFWBEMConnection(), log_func=lambda msg: None)
+        mofcomp2 = MOFCompiler(MOFWBEMConnection(), search_paths=[SCRIPT_DIR],
+                               log_func=lambda msg: None)
+        self.assertFalse(mofcomp1.parser is mofcomp2.parser)
+        self.assertTrue(mofcomp1.parser.action is mofcomp2.parser.action)
+        self.assertTrue(mofcomp1.parser.goto is mofcomp2.parser.goto)
+        self.assertEqual(mofcomp1.parser.search_paths, [])
+        self.assertEqual(mofcomp2.parser.search_paths, [SCRIPT_DIR])
+
+        # The compilation state is specific to each MOF compiler object
+        mofcomp1.compile_string('class CIM_Foo { string Name; };', NAME_SPACE)
+        mofcomp2.compile_string('class CIM_Bar { string Name; };', NAME_SPACE)
+        self.assertEqual(mofcomp1.parser.classnames[NAME_SPACE], ['cim_foo'])
+        self.assertEqual(mofcomp2.parser.classnames[NAME_SPACE], ['cim_bar'])
+        self.assertEqual(list(mofcomp1.handle.classes[NAME_SPACE].keys()),
+                         ['CIM_Foo'])
+
+    def test_shared_lexer(self):
+        mofcomp1 = MOFCompiler(None, fast_lexer=False)
+        mofcomp2 = MOFCompiler(None, fast_lexer=False)
+        self.assertFalse(mofcomp1.lexer is mofcomp2.lexer)
+        self.assertTrue(mofcomp1.lexer.lexre is mofcomp2.lexer.lexre)
+
+    def test_missing_tables(self):
+        saved = (mof_compiler._parser_template, mof_compiler._tabmodule,
+                 mof_compiler._tabdir)
+        tabdir = mkdtemp()
+        try:
+            mof_compiler._parser_template = None
+            mof_compiler._tabmodule = 'nosuchparsetab'
+            mof_compiler._tabdir = tabdir
+            stdout = sys.stdout
+            sys.stdout = six.StringIO()
+            try:
+                mofcomp = MOFCompiler(MOFWBEMConnection(), verbose=True,
+                                      log_func=lambda msg: None)
+                output = sys.stdout.getvalue()
+            finally:
+                sys.stdout = stdout
+            self.assertTrue('Generating YACC tables' in output)
+            mofcomp.compile_string('class CIM_Foo { string Name; };',
+                                   NAME_SPACE)
+            self.assertTrue('CIM_Foo' in mofcomp.handle.classes[NAME_SPACE])
+            # The tables are generated in memory, but not written
+            self.assertEqual(os.listdir(tabdir), [])
+        finally:
+            (mof_compiler._parser_template, mof_compiler._tabmodule,
+             mof_compiler._tabdir) = saved
+            rmtree(tabdir)
+
+
 if __name__ == '__main__':
     unittest.main()
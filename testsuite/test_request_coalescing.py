@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#
+# Test the coalescing of concurrent identical operations of WBEMConnection.
+#
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from pywbem import WBEMConnection, CIMInstanceName, CIMError, \
+                   CIM_ERR_NOT_FOUND
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+NUM_THREADS = 8
+
+
+def payload_path(index):
+    return CIMInstanceName(PAYLOAD_CLASS,
+                           {'InstanceID': 'payload-%d' % index},
+                           namespace=DEFAULT_NAMESPACE)
+
+
+class TestRequestCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        repo = create_repository(num_instances=3)
+        self.server = MockWBEMServer(repo, latency=0.3)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def run_concurrently(self, operation, coalesce_requests=True):
+        """Perform operation(conn, i) in NUM_THREADS threads with the same
+        connection, and return the list of results or exceptions."""
+        conn = WBEMConnection(self.server.url, None,
+                              default_namespace=DEFAULT_NAMESPACE,
+                              coalesce_requests=coalesce_requests)
+        results = [None] * NUM_THREADS
+
+        def run(i):
+            try:
+                results[i] = operation(conn, i)
+            except Exception as exc:  # pylint: disable=broad-except
+                results[i] = exc
+
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(NUM_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(conn._in_flight, {})
+        return results
+
+    def test_coalesced(self):
+        results = self.run_concurrently(
+            lambda conn, i: conn.GetInstance(payload_path(1)))
+        self.assertEqual(self.server.num_requests, 1)
+        for inst in results:
+            self.assertEqual(inst, results[0])
+        # Each thread gets its own copy
+        self.assertEqual(len(set([id(inst) for inst in results])),
+                         NUM_THREADS)
+        self.assertEqual(len(set([id(inst.properties) for inst in results])),
+                         NUM_THREADS)
+
+    def test_errors(self):
+        results = self.run_concurrently(
+            lambda conn, i: conn.GetInstance(payload_path(10)))
+        self.assertEqual(self.server.num_requests, 1)
+        for exc in results:
+            self.assertTrue(isinstance(exc, CIMError))
+            self.assertEqual(exc.args[0], CIM_ERR_NOT_FOUND)
+
+    def test_different(self):
+        results = self.run_concurrently(
+            lambda conn, i: conn.GetInstance(payload_path(i % 2)))
+        self.assertEqual(self.server.num_requests, 2)
+        self.assertEqual([inst['Index'] for inst in results],
+                         [i % 2 for i in range(NUM_THREADS)])
+
+    def test_disabled(self):
+        self.run_concurrently(
+            lambda conn, i: conn.GetClass(PAYLOAD_CLASS),
+            coalesce_requests=False)
+        self.assertEqual(self.server.num_requests, NUM_THREADS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+#
+# Test the recording and replaying of requests.
+#
+
+from __future__ import absolute_import
+
+import os
+import unittest
+from tempfile import mkdtemp
+from shutil import rmtree
+
+from pywbem import WBEMConnection, WBEMRecorder, WBEMReplayer, \
+                   CIMInstanceName, CIMError, ConnectionError, \
+                   CIM_ERR_NOT_FOUND, Uint32
+from pywbem.cim_http import _NoResponseError
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+
+def payload_path(index):
+    return CIMInstanceName(PAYLOAD_CLASS,
+                           {'InstanceID': 'payload-%d' % index},
+                           namespace=DEFAULT_NAMESPACE)
+
+
+class TestRecordReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'test.rec.gz')
+        self.repo = create_repository(num_instances=3)
+        self.server = MockWBEMServer(self.repo)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        rmtree(self.tmp_dir)
+
+    def record(self, operations):
+        """Perform operations(conn) with a connection to the mock server
+        that records into the recording file, and return the results."""
+        with WBEMRecorder(self.filename) as recorder:
+            conn = WBEMConnection(self.server.url, None,
+                                  default_namespace=DEFAULT_NAMESPACE,
+                                  transport=recorder)
+            results = operations(conn)
+        self.assertEqual(recorder.num_exchanges, self.server.num_requests)
+        return results
+
+    @staticmethod
+    def replay_connection(replayer):
+        return WBEMConnection('http://replay.example.com', None,
+                              default_namespace=DEFAULT_NAMESPACE,
+                              transport=replayer)
+
+    def test_replay(self):
+        def operations(conn):
+            return (conn.EnumerateInstances(PAYLOAD_CLASS),
+                    conn.GetClass(PAYLOAD_CLASS),
+                    conn.AssociatorNames(payload_path(1)))
+        insts, cls, paths = self.record(operations)
+        self.server.stop()
+
+        replayer = WBEMReplayer(self.filename)
+        self.assertEqual(len(replayer.exchanges), 3)
+        self.assertEqual(replayer.exchanges[0]['url'], self.server.url)
+        self.assertTrue('CIMMethod: EnumerateInstances' in
+                        replayer.exchanges[0]['headers'])
+
+        conn = self.replay_connection(replayer)
+        for dummy_i in range(2):
+            self.assertEqual(conn.EnumerateInstances(PAYLOAD_CLASS), insts)
+            self.assertEqual(conn.GetClass(PAYLOAD_CLASS), cls)
+            self.assertEqual(conn.AssociatorNames(payload_path(1)), paths)
+
+        # Requests that have not been recorded
+        self.assertRaises(ConnectionError, conn.GetClass, PAYLOAD_CLASS,
+                          LocalOnly=False)
+        self.assertRaises(ConnectionError, conn.EnumerateInstances,
+                          PAYLOAD_CLASS, namespace='root/other')
+
+    def test_replay_order(self):
+        def operations(conn):
+            first = conn.GetInstance(payload_path(0))
+            self.repo.instances[DEFAULT_NAMESPACE][0]['Index'] = Uint32(42)
+            self.server._cache.clear()
+            return [first, conn.GetInstance(payload_path(0))]
+        results = self.record(operations)
+        self.assertEqual([inst['Index'] for inst in results], [0, 42])
+
+        replayer = WBEMReplayer(self.filename)
+        conn = self.replay_connection(replayer)
+        indexes = [conn.GetInstance(payload_path(0))['Index']
+                   for dummy_i in range(3)]
+        self.assertEqual(indexes, [0, 42, 0])
+        replayer.rewind()
+        self.assertEqual(conn.GetInstance(payload_path(0))['Index'], 0)
+
+    def test_replay_errors(self):
+        def operations(conn):
+            self.assertRaises(CIMError, conn.GetInstance, payload_path(5))
+            self.server.stop()
+            try:
+                conn.GetClass(PAYLOAD_CLASS)
+                self.fail('ConnectionError not raised')
+            except ConnectionError as exc:
+                return exc.__class__
+        self.server.num_requests += 1  # The request to the stopped server
+        exc_class = self.record(operations)
+        # The private subclass raised by the transport
+        self.assertEqual(exc_class, _NoResponseError)
+
+        conn = self.replay_connection(WBEMReplayer(self.filename))
+        try:
+            conn.GetInstance(payload_path(5))
+            self.fail('CIMError not raised')
+        except CIMError as ce:
+            self.assertEqual(ce.args[0], CIM_ERR_NOT_FOUND)
+        self.assertRaises(_NoResponseError, conn.GetClass, PAYLOAD_CLASS)
+
+    def test_invalid_file(self):
+        filename = os.path.join(self.tmp_dir, 'invalid.gz')
+        with WBEMRecorder(filename):
+            pass
+        self.assertEqual(WBEMReplayer(filename).exchanges, [])
+        fp = open(filename, 'wb')
+        fp.write(b'not a recording')
+        fp.close()
+        self.assertRaises((ValueError, IOError), WBEMReplayer, filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+#
+# Test the response cache of WBEMConnection.
+#
+
+from __future__ import absolute_import
+
+import time
+import unittest
+
+from pywbem import WBEMConnection, ResponseCache, CIMInstance, \
+                   CIMInstanceName, CIMDateTime, CIMError, CIM_ERR_NOT_FOUND, \
+                   Uint32
+
+from mock_wbem_server import create_repository, MockWBEMServer, \
+    PAYLOAD_CLASS, DEFAULT_NAMESPACE
+
+
+def payload_path(index):
+    return CIMInstanceName(PAYLOAD_CLASS,
+                           {'InstanceID': 'payload-%d' % index},
+                           namespace=DEFAULT_NAMESPACE)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        repo = create_repository(num_instances=3)
+        self.server = MockWBEMServer(repo)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def connect(self, **kwargs):
+        self.cache = ResponseCache(**kwargs)
+        return WBEMConnection(self.server.url, None,
+                              default_namespace=DEFAULT_NAMESPACE,
+                              response_cache=self.cache)
+
+    def test_hits(self):
+        conn = self.connect()
+        cls1 = conn.GetClass(PAYLOAD_CLASS)
+        cls2 = conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 1)
+        self.assertEqual(cls1, cls2)
+        self.assertFalse(cls1 is cls2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        # Class names are case-insensitive, other parameters are not ignored
+        conn.GetClass(PAYLOAD_CLASS.upper())
+        self.assertEqual(self.server.num_requests, 1)
+        conn.GetClass(PAYLOAD_CLASS, LocalOnly=False)
+        self.assertEqual(self.server.num_requests, 2)
+
+        # Not cached by default
+        conn.EnumerateInstances(PAYLOAD_CLASS)
+        conn.EnumerateInstances(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 4)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_errors(self):
+        conn = self.connect()
+        for dummy_i in range(2):
+            try:
+                conn.GetInstance(payload_path(10))
+                self.fail('CIMError not raised')
+            except CIMError as ce:
+                self.assertEqual(ce.args[0], CIM_ERR_NOT_FOUND)
+        self.assertEqual(self.server.num_requests, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl(self):
+        conn = self.connect(ttls={'GetInstance': 0.2,
+                                  'EnumerateInstanceNames': 10})
+        conn.GetInstance(payload_path(0))
+        conn.EnumerateInstanceNames(PAYLOAD_CLASS)
+        time.sleep(0.3)
+        conn.GetInstance(payload_path(0))
+        conn.EnumerateInstanceNames(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 3)
+
+        self.assertRaises(ValueError, ResponseCache,
+                          ttls={'DeleteInstance': 10})
+        cache = ResponseCache(ttls={'GetClass': None})
+        self.assertEqual(cache.key('GetClass', DEFAULT_NAMESPACE, {}), None)
+
+    def test_lru(self):
+        conn = self.connect()
+        conn.GetInstance(payload_path(0))
+        size = self.cache.size
+        self.cache.max_size = size * 2 + size // 2
+        conn.GetInstance(payload_path(1))
+        conn.GetInstance(payload_path(0))
+        conn.GetInstance(payload_path(2))  # Evicts payload-1
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertTrue(self.cache.size <= self.cache.max_size)
+        self.server.num_requests = 0
+        conn.GetInstance(payload_path(0))
+        conn.GetInstance(payload_path(2))
+        self.assertEqual(self.server.num_requests, 0)
+        conn.GetInstance(payload_path(1))
+        self.assertEqual(self.server.num_requests, 1)
+
+        # Responses larger than the cache are not cached
+        self.cache.clear()
+        self.cache.max_size = size - 1
+        conn.GetInstance(payload_path(0))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidation(self):
+        conn = self.connect(ttls={'EnumerateInstances': 10})
+        conn.GetInstance(payload_path(0))
+        conn.GetInstance(payload_path(1))
+        conn.EnumerateInstances(PAYLOAD_CLASS)
+        conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 4)
+
+        inst = conn.GetInstance(payload_path(0))
+        inst['Index'] = Uint32(42)
+        conn.ModifyInstance(inst)
+        self.assertEqual(self.server.num_requests, 5)
+
+        self.assertEqual(conn.GetInstance(payload_path(0))['Index'], 42)
+        self.assertEqual(self.server.num_requests, 6)
+        self.assertEqual(
+            sorted([i['Index'] for i in
+                    conn.EnumerateInstances(PAYLOAD_CLASS)]), [1, 2, 42])
+        self.assertEqual(self.server.num_requests, 7)
+        conn.GetInstance(payload_path(1))
+        conn.GetClass(PAYLOAD_CLASS)
+        self.assertEqual(self.server.num_requests, 7)
+
+        conn.DeleteInstance(payload_path(1))
+        self.assertRaises(CIMError, conn.GetInstance, payload_path(1))
+        self.assertEqual(self.server.num_requests, 9)
+
+        # Failing modifications invalidate as well
+        conn.GetInstance(payload_path(2))
+        self.assertRaises(CIMError, conn.DeleteClass, PAYLOAD_CLASS)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_datetime_key(self):
+        path = CIMInstanceName(
+            PAYLOAD_CLASS,
+            {'InstanceID': 'payload-0',
+             'Created': CIMDateTime('20160101120000.000000+000')},
+            namespace=DEFAULT_NAMESPACE)
+        cache = ResponseCache()
+        key = cache.key('GetInstance', DEFAULT_NAMESPACE,
+                        {'InstanceName': path})
+        self.assertEqual(key, cache.key('GetInstance', DEFAULT_NAMESPACE,
+                                        {'InstanceName': path.copy()}))
+        self.assertEqual(hash(key), hash(cache.key(
+            'GetInstance', DEFAULT_NAMESPACE, {'InstanceName': path.copy()})))
+        path['Created'] = CIMDateTime('20160101120001.000000+000')
+        self.assertNotEqual(key, cache.key('GetInstance', DEFAULT_NAMESPACE,
+                                           {'InstanceName': path}))
+
+    def test_stale_response(self):
+        cache = ResponseCache()
+        params = {'InstanceName': payload_path(0)}
+        key = cache.key('GetInstance', DEFAULT_NAMESPACE, params)
+        generation = cache.generation
+        cache.invalidate('ModifyInstance', DEFAULT_NAMESPACE,
+                         {'ModifiedInstance': CIMInstance(
+                             PAYLOAD_CLASS, path=payload_path(1))})
+        cache.put(key, b'<CIM/>', params, generation)
+        self.assertEqual(cache.get(key), None)
+        cache.put(key, b'<CIM/>', params, cache.generation)
+        self.assertEqual(cache.get(key), b'<CIM/>')
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
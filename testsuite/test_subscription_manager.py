@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+#
+# Test the indication subscription manager.
+#
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from pywbem import CIMInstanceName, CIMError, CIM_ERR_NOT_FOUND, \
+                   CIM_ERR_ACCESS_DENIED, SubscriptionManager
+
+NAMESPACE = 'root/interop'
+
+
+class FakeConnection(object):
+    """
+    A stand-in for WBEMConnection that keeps the instances in memory and
+    records the operations issued against it.
+    """
+
+    def __init__(self, url, fail=False):
+        self.url = url
+        self.default_namespace = NAMESPACE
+        self.fail = fail
+        self.instances = []
+        self.operations = []
+        self.lock = threading.Lock()
+
+    def _record(self, operation):
+        with self.lock:
+            self.operations.append(operation)
+        if self.fail:
+            raise CIMError(CIM_ERR_ACCESS_DENIED, 'access denied')
+
+    def EnumerateInstanceNames(self, ClassName, namespace=None):
+        self._record(('EnumerateInstanceNames', ClassName))
+        return [inst.path for inst in self.instances
+                if inst.classname.lower() == ClassName.lower()]
+
+    def CreateInstance(self, NewInstance):
+        self._record(('CreateInstance', NewInstance.classname))
+        path = NewInstance.path.copy()
+        inst = NewInstance.copy()
+        inst.path = path
+        self.instances.append(inst)
+        return path
+
+    def DeleteInstance(self, InstanceName):
+        self._record(('DeleteInstance', InstanceName.classname))
+        for inst in self.instances:
+            if inst.path == InstanceName:
+                self.instances.remove(inst)
+                return
+        raise CIMError(CIM_ERR_NOT_FOUND, 'not found')
+
+    def count(self, operation):
+        return len([op for op in self.operations if op[0] == operation])
+
+
+QUERY = 'SELECT * FROM CIM_AlertIndication'
+DEST = 'https://listener.example.com:5989'
+
+
+class TestSubscriptionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = SubscriptionManager(name_prefix='test',
+                                           system_name='client.example.com',
+                                           max_workers=4)
+        self.conns = [FakeConnection('http://server%d' % i) for i in range(8)]
+        for conn in self.conns:
+            self.manager.add_server(conn)
+
+    def test_add(self):
+        results = self.manager.add_subscriptions(QUERY, DEST)
+        self.assertEqual(sorted(results.keys()),
+                         sorted([conn.url for conn in self.conns]))
+        for conn in self.conns:
+            sub_path = results[conn.url]
+            self.assertTrue(isinstance(sub_path, CIMInstanceName))
+            self.assertEqual(sub_path.classname, 'CIM_IndicationSubscription')
+            self.assertEqual(conn.count('CreateInstance'), 3)
+            self.assertEqual(conn.count('EnumerateInstanceNames'), 3)
+
+            filter_inst = conn.instances[0]
+            self.assertEqual(filter_inst['Query'], QUERY)
+            self.assertEqual(filter_inst['SystemName'], 'client.example.com')
+            self.assertTrue(filter_inst['Name'].startswith('test:filter:'))
+            self.assertEqual(conn.instances[1]['Destination'], DEST)
+            self.assertEqual(conn.instances[2]['Filter'], filter_inst.path)
+            self.assertEqual(conn.instances[2]['Handler'],
+                             conn.instances[1].path)
+
+    def test_add_idempotent(self):
+        self.manager.add_subscriptions(QUERY, DEST)
+        results = self.manager.add_subscriptions(QUERY, DEST)
+        for conn in self.conns:
+            # The cached state avoids enumerations and creations
+            self.assertEqual(conn.count('CreateInstance'), 3)
+            self.assertEqual(conn.count('EnumerateInstanceNames'), 3)
+            self.assertEqual(results[conn.url], conn.instances[2].path)
+
+        # A new query reuses the existing listener destination
+        self.manager.add_subscriptions('SELECT * FROM CIM_InstCreation', DEST)
+        for conn in self.conns:
+            self.assertEqual(conn.count('CreateInstance'), 5)
+
+    def test_existing_instances(self):
+        self.manager.add_subscriptions(QUERY, DEST)
+
+        # A new manager finds the instances created by the first one
+        manager = SubscriptionManager(name_prefix='test',
+                                      system_name='client.example.com')
+        conn = self.conns[0]
+        manager.add_server(conn)
+        results = manager.add_subscriptions(QUERY, DEST)
+        self.assertEqual(conn.count('CreateInstance'), 3)
+        self.assertEqual(results[conn.url], conn.instances[2].path)
+        self.assertEqual(manager.list_subscriptions(),
+                         {conn.url: [conn.instances[2].path]})
+
+    def test_remove(self):
+        self.manager.add_subscriptions(QUERY, DEST)
+        results = self.manager.remove_subscriptions()
+        for conn in self.conns:
+            self.assertEqual(results[conn.url], 3)
+            self.assertEqual(conn.instances, [])
+            ops = [op for op in conn.operations if op[0] == 'DeleteInstance']
+            self.assertEqual(ops[0][1], 'CIM_IndicationSubscription')
+
+        # Nothing left to remove
+        results = self.manager.remove_subscriptions()
+        self.assertEqual(set(results.values()), set([0]))
+
+    def test_remove_ignores_foreign(self):
+        conn = self.conns[0]
+        other = SubscriptionManager(name_prefix='other')
+        other.add_server(conn)
+        other.add_subscriptions(QUERY, DEST)
+
+        self.manager.add_subscriptions(QUERY, DEST, server_ids=[conn.url])
+        self.assertEqual(len(conn.instances), 6)
+        results = self.manager.remove_subscriptions(server_ids=[conn.url])
+        self.assertEqual(results, {conn.url: 3})
+        self.assertEqual(len(conn.instances), 3)
+
+    def test_remove_already_deleted(self):
+        self.manager.add_subscriptions(QUERY, DEST)
+        conn = self.conns[0]
+        del conn.instances[2]
+        results = self.manager.remove_subscriptions(server_ids=[conn.url])
+        self.assertEqual(results, {conn.url: 2})
+
+    def test_server_failure(self):
+        failing = FakeConnection('http://failing', fail=True)
+        self.manager.add_server(failing)
+        results = self.manager.add_subscriptions(QUERY, DEST)
+        self.assertTrue(isinstance(results['http://failing'], CIMError))
+        for conn in self.conns:
+            self.assertTrue(isinstance(results[conn.url], CIMInstanceName))
+
+    def test_unknown_server(self):
+        self.assertRaises(ValueError, self.manager.add_subscriptions,
+                          QUERY, DEST, server_ids=['http://unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
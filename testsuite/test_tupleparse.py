@@ -13,10 +13,11 @@ from __future__ import absolute_import
 
 import unittest
 
-from pywbem import tupletree, tupleparse
+from pywbem import tupletree, tupleparse, cim_xml
 from pywbem import CIMInstance, CIMInstanceName, CIMClass, \
-                   CIMProperty, CIMParameter, CIMQualifier, \
-                   Uint8, Uint16, Uint32
+                   CIMProperty, CIMParameter, CIMQualifier, CIMDateTime, \
+                   InstanceTable, Uint8, Uint16, Uint32, Sint32, Uint64, Real64
+from pywbem.instance_table import _InstanceTableBuilder
 
 
 class TupleTest(unittest.TestCase):
@@ -268,5 +269,115 @@ class ParseXMLKeyValue(RawXMLTest):
             1234)
 
 
+class ParseMultipleMessages(unittest.TestCase):
+    """Test parsing of MULTIREQ and MULTIRSP elements."""
+
+    def test_multirsp(self):
+
+        xml = '<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><MULTIRSP>' \
+              '<SIMPLERSP><IMETHODRESPONSE NAME="GetInstance">' \
+              '<IRETURNVALUE/></IMETHODRESPONSE></SIMPLERSP>' \
+              '<SIMPLERSP><IMETHODRESPONSE NAME="GetInstance">' \
+              '<ERROR CODE="6"/></IMETHODRESPONSE></SIMPLERSP>' \
+              '</MULTIRSP></MESSAGE>'
+        dummy_name, dummy_attrs, messages = tupleparse.parse_any(
+            tupletree.xml_to_tupletree(xml))
+        self.assertEqual([msg[0] for msg in messages],
+                         ['SIMPLERSP', 'SIMPLERSP'])
+        self.assertEqual(messages[1][2][2][0], 'ERROR')
+
+        xml = '<MULTIRSP><SIMPLERSP><IMETHODRESPONSE NAME="GetInstance">' \
+              '<IRETURNVALUE/></IMETHODRESPONSE></SIMPLERSP></MULTIRSP>'
+        self.assertRaises(tupleparse.ParseError, tupleparse.parse_any,
+                          tupletree.xml_to_tupletree(xml))
+
+    def test_multireq(self):
+
+        call = '<SIMPLEREQ><IMETHODCALL NAME="GetClass"><LOCALNAMESPACEPATH>' \
+               '<NAMESPACE NAME="root"/></LOCALNAMESPACEPATH>' \
+               '</IMETHODCALL></SIMPLEREQ>'
+        xml = '<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><MULTIREQ>%s%s' \
+              '</MULTIREQ></MESSAGE>' % (call, call)
+        dummy_name, dummy_attrs, messages = tupleparse.parse_any(
+            tupletree.xml_to_tupletree(xml))
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0][2][0], 'IMETHODCALL')
+
+
+class ParseInstanceColumns(unittest.TestCase):
+    """Test parsing of VALUE.NAMEDINSTANCE elements into columns."""
+
+    def response(self, instances):
+        data = cim_xml.IRETURNVALUE(None)
+        data.appendChildren([inst.tocimxml() for inst in instances])
+        return cim_xml.CIM(
+            cim_xml.MESSAGE(
+                cim_xml.SIMPLERSP(
+                    cim_xml.IMETHODRESPONSE('EnumerateInstances', data)),
+                '1001', '1.0'),
+            '2.0', '2.0').toxml()
+
+    def parse(self, xml, PropertyList=None):
+        builder = _InstanceTableBuilder(PropertyList)
+        result = tupleparse.parse_cim_columns(
+            tupletree.xml_to_tupletree(xml), builder)
+        return result, builder.table(use_numpy=False)
+
+    def test_all(self):
+
+        system = CIMInstanceName('CIM_System', {'Name': 'sys'})
+        instances = []
+        for i in range(3):
+            inst = CIMInstance('CIM_Stat', path=CIMInstanceName(
+                'CIM_Stat', {'InstanceID': 'stat-%d' % i}))
+            inst['InstanceID'] = 'stat-%d' % i
+            inst['KBytesRead'] = Uint64(2**40 + i)
+            inst['Errors'] = Sint32(-i)
+            inst['Ratio'] = Real64(i / 4.0)
+            inst['Sampled'] = bool(i % 2)
+            inst['Time'] = CIMDateTime('20160101120000.25000%d-060' % i)
+            inst['Samples'] = [Uint8(i), Uint8(7)]
+            inst['System'] = system
+            if i == 1:
+                inst['Errors'] = CIMProperty('Errors', None, type='sint32')
+                inst['Extra'] = 'extra'
+            instances.append(inst)
+        xml = self.response(instances)
+
+        result, table = self.parse(xml)
+        self.assertEqual(result[2][2][0][2][2][0], 'IRETURNVALUE')
+        expected = InstanceTable.from_instances(instances, use_numpy=False)
+        self.assertEqual(sorted(table.column_names),
+                         sorted(expected.column_names))
+        for column in expected:
+            self.assertEqual(table[column.name].type, column.type)
+            self.assertEqual(table[column.name].tolist(), column.tolist())
+        self.assertEqual(table['KBytesRead'].values.typecode,
+                         expected['KBytesRead'].values.typecode)
+        self.assertEqual(table['Time'].tolist()[0],
+                         1451653200.25)
+        self.assertEqual(table.paths, [inst.path for inst in instances])
+
+        # Properties that are not in the property list are not parsed
+        xml = xml.replace('<VALUE>1099511627778</VALUE>', '<VALUE>x</VALUE>')
+        dummy_result, table = self.parse(xml, ['Errors', 'extra'])
+        self.assertEqual(table.column_names, ['Errors', 'extra'])
+        self.assertEqual(table['Errors'].tolist(), [0, None, -2])
+        self.assertEqual(table['Extra'].tolist(), [None, 'extra', None])
+        self.assertRaises(tupleparse.ParseError, self.parse, xml)
+
+    def test_error(self):
+
+        xml = '<CIM CIMVERSION="2.0" DTDVERSION="2.0">' \
+              '<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>' \
+              '<IMETHODRESPONSE NAME="EnumerateInstances"><ERROR CODE="5"/>' \
+              '</IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>'
+        result, table = self.parse(xml)
+        self.assertEqual(result[2][2][0][2][2][0], 'ERROR')
+        self.assertEqual(len(table), 0)
+        self.assertRaises(tupleparse.ParseError, self.parse,
+                          xml.replace('SIMPLERSP', 'SIMPLEREQ'))
+
+
 if __name__ == '__main__':
     unittest.main()